@@ -16,6 +16,14 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    # Breaking news 수신 (pubsub = Redis Pub/Sub, stream = Redis Streams 컨슈머 그룹)
+    NEWS_TRANSPORT: str = "pubsub"
+    NEWS_CHANNEL: str = "news_breaking_kr"
+    NEWS_STREAM_KEY: str = "news_breaking_stream"
+    NEWS_STREAM_GROUP: str = ""  # 빈 값이면 stockagent-{hostname}
+    NEWS_MARKETS: str = "KR"  # stream 방식에서 처리할 시장 (콤마 구분)
+    NEWS_CALLBACK_QUEUE_SIZE: int = 1000  # 콜백별 대기 큐 크기 (포화 시 오래된 메시지 폐기)
+
     # Kiwoom API
     KIWOOM_APP_KEY: str = ""
     KIWOOM_APP_SECRET: str = ""
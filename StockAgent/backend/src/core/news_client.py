@@ -8,6 +8,9 @@ import httpx
 
 logger = logging.getLogger("stockagent.core.news")
 
+# StockNews /news/scores 1회 요청당 최대 종목 수
+MAX_BATCH_STOCKS = 300
+
 
 class NewsClient:
     """StockNews REST API 뉴스 점수 조회 (캐싱 지원)"""
@@ -55,3 +58,47 @@ class NewsClient:
         except (httpx.HTTPError, Exception) as e:
             logger.error("뉴스 서비스 연결 실패: %s", e)
             return 0
+
+    async def get_scores(self, stock_codes: list[str]) -> dict[str, int]:
+        """여러 종목 뉴스 점수 일괄 조회 (/news/scores 1회 요청). 실패 종목은 0."""
+        scores: dict[str, int] = {}
+        missing: list[str] = []
+        now = time.time()
+        for code in dict.fromkeys(stock_codes):
+            cached = self._cache.get(code) if self._cache_ttl > 0 else None
+            if cached and now - cached[1] < self._cache_ttl:
+                scores[code] = cached[0]
+            else:
+                missing.append(code)
+
+        if not missing:
+            return scores
+
+        try:
+            async with httpx.AsyncClient(base_url=self._base_url) as client:
+                for i in range(0, len(missing), MAX_BATCH_STOCKS):
+                    chunk = missing[i:i + MAX_BATCH_STOCKS]
+                    resp = await client.get(
+                        "/api/v1/news/scores",
+                        params={"stocks": ",".join(chunk)},
+                    )
+                    if resp.status_code != 200:
+                        logger.warning(
+                            "뉴스 점수 일괄 조회 실패: count=%d, status=%d",
+                            len(chunk), resp.status_code,
+                        )
+                        continue
+
+                    fetched_at = time.time()
+                    for item in resp.json():
+                        score = item.get("news_score", 0)
+                        scores[item["stock_code"]] = score
+                        if self._cache_ttl > 0:
+                            self._cache[item["stock_code"]] = (score, fetched_at)
+
+        except (httpx.HTTPError, Exception) as e:
+            logger.error("뉴스 서비스 연결 실패: %s", e)
+
+        for code in missing:
+            scores.setdefault(code, 0)
+        return scores
@@ -1,60 +1,347 @@
-"""Redis 뉴스 구독 클라이언트"""
+"""Redis 뉴스 구독 클라이언트
 
+두 가지 수신 방식을 지원한다 (NEWS_TRANSPORT).
+
+- pubsub: Redis Pub/Sub 채널 구독 (기본값). 에이전트가 내려가 있는 동안 발행된 속보는 유실된다.
+- stream: StockNews 가 기록하는 속보 Redis Stream 을 인스턴스별 컨슈머 그룹으로 읽는다.
+  XREADGROUP BLOCK 으로 도착 즉시 수신하고, 콜백 처리 후 XACK 한다. 재시작 시 ACK 되지 않은
+  자기 pending 엔트리부터 다시 처리하므로 재시작 중 발행된 속보도 받는다.
+
+수신 루프는 메시지를 파싱해 콜백별 고정 크기 큐에 넣기만 하고, 콜백은 각자의 워커
+태스크에서 실행된다 (async 콜백은 await, 동기 콜백은 스레드에서 실행). pubsub 은 큐가
+가득 차면 그 콜백의 가장 오래된 메시지를 버리고, stream 은 버리지 않고 큐에 자리가 날 때까지
+다음 엔트리 수신을 멈춘다 (읽지 않은 엔트리는 스트림에, 처리 전 엔트리는 pending 에 남는다).
+콜백별 수신→콜백 시작 지연과 콜백 실행 시간은 latency_stats() 로 확인한다.
+"""
+
+import asyncio
+import contextlib
+import inspect
 import json
 import logging
-from typing import Callable
+import socket
+import time
+from collections import deque
+from typing import Any, Callable
 
 import redis.asyncio as redis
+from redis.exceptions import ResponseError
 
 logger = logging.getLogger("stockagent.core.news_subscriber")
 
+# 콜백별 대기 큐 기본 크기
+DEFAULT_CALLBACK_QUEUE_SIZE = 1000
+
+
+def default_group_name() -> str:
+    """인스턴스별 컨슈머 그룹 이름 (재시작해도 유지되도록 호스트명 기반)"""
+    return f"stockagent-{socket.gethostname()}"
+
+
+class LatencyStats:
+    """최근 샘플 기반 지연 통계 (ms)"""
+
+    def __init__(self, window: int = 1000):
+        self._samples: deque[float] = deque(maxlen=window)
+        self.count = 0
+
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        self.count += 1
+
+    def summary(self) -> dict:
+        if not self._samples:
+            return {"count": self.count, "avg": 0.0, "p50": 0.0, "p99": 0.0, "max": 0.0}
+        ordered = sorted(self._samples)
+        n = len(ordered)
+        return {
+            "count": self.count,
+            "avg": round(sum(ordered) / n * 1000, 3),
+            "p50": round(ordered[n // 2] * 1000, 3),
+            "p99": round(ordered[min(n - 1, int(n * 0.99))] * 1000, 3),
+            "max": round(ordered[-1] * 1000, 3),
+        }
+
+
+class _CallbackWorker:
+    """콜백 1개의 대기 큐 + 실행 워커"""
+
+    def __init__(self, callback: Callable, queue_size: int):
+        self.callback = callback
+        self.name = getattr(callback, "__qualname__", repr(callback))
+        self.is_async = inspect.iscoroutinefunction(callback)
+        # (payload, 수신 시각, 처리 완료 통지)
+        self.queue: asyncio.Queue[tuple[dict, float, Callable[[], None]]] = asyncio.Queue(
+            maxsize=queue_size
+        )
+        self.task: asyncio.Task | None = None
+        self.wait = LatencyStats()
+        self.duration = LatencyStats()
+        self.dropped = 0
+
+    async def put_wait(self, payload: dict, received_at: float, on_done: Callable[[], None]) -> None:
+        """큐에 자리가 날 때까지 대기 후 적재 (stream: 폐기 없이 수신 속도 제한)"""
+        await self.queue.put((payload, received_at, on_done))
+
+    def put(self, payload: dict, received_at: float, on_done: Callable[[], None]) -> None:
+        """즉시 적재, 큐 포화 시 가장 오래된 메시지 폐기 (pubsub)"""
+        if self.queue.full():
+            _, _, dropped_done = self.queue.get_nowait()
+            self.queue.task_done()
+            dropped_done()
+            self.dropped += 1
+            logger.warning("콜백 큐 포화, 오래된 메시지 폐기: %s", self.name)
+        self.queue.put_nowait((payload, received_at, on_done))
+
+    async def run(self) -> None:
+        while True:
+            payload, received_at, on_done = await self.queue.get()
+            started = time.perf_counter()
+            self.wait.add(started - received_at)
+            try:
+                if self.is_async:
+                    await self.callback(payload)
+                else:
+                    result = await asyncio.to_thread(self.callback, payload)
+                    if inspect.isawaitable(result):
+                        await result
+            except Exception as e:
+                logger.error("콜백 실행 실패: %s", e)
+            finally:
+                self.duration.add(time.perf_counter() - started)
+                on_done()
+                self.queue.task_done()
+
 
 class NewsSubscriber:
-    """Redis pub/sub으로 속보 뉴스 수신"""
+    """Redis pub/sub 또는 Streams 컨슈머 그룹으로 속보 뉴스 수신"""
 
-    def __init__(self, redis: redis.Redis):
+    def __init__(self, redis: redis.Redis, queue_size: int = DEFAULT_CALLBACK_QUEUE_SIZE):
         self._redis = redis
+        self._queue_size = queue_size
         self._callbacks: list[Callable] = []
+        self._workers: list[_CallbackWorker] = []
+        self._ack_tasks: set[asyncio.Task] = set()
         self._running = False
+        self._stopped: asyncio.Event | None = None
 
     def on_breaking_news(self, callback: Callable) -> None:
-        """뉴스 수신 콜백 등록"""
+        """뉴스 수신 콜백 등록 (동기 함수 또는 async 함수)"""
         self._callbacks.append(callback)
 
+    async def run(self, settings) -> None:
+        """설정된 전송 방식으로 수신 시작 (blocking loop)"""
+        self._queue_size = settings.NEWS_CALLBACK_QUEUE_SIZE
+        if settings.NEWS_TRANSPORT == "stream":
+            group = settings.NEWS_STREAM_GROUP or default_group_name()
+            markets = {m.strip().upper() for m in settings.NEWS_MARKETS.split(",") if m.strip()}
+            await self.consume_stream(
+                settings.NEWS_STREAM_KEY, group, consumer=group, markets=markets or None,
+            )
+        else:
+            await self.subscribe(settings.NEWS_CHANNEL)
+
     async def subscribe(self, channel: str) -> None:
-        """채널 구독 시작 (blocking loop)"""
+        """채널 구독 시작 (blocking loop, stop() 시 대기 중인 콜백 처리 후 반환)"""
         pubsub = self._redis.pubsub()
         await pubsub.subscribe(channel)
-        self._running = True
         logger.info("Redis 채널 구독 시작: %s", channel)
 
-        try:
-            while self._running:
-                message = await pubsub.get_message(
-                    ignore_subscribe_messages=True, timeout=0.1
-                )
-                if message and message["type"] == "message":
+        async def listen() -> None:
+            async for message in pubsub.listen():
+                if not self._running:
+                    break
+                if message["type"] == "message":
                     await self._handle_message(message["data"])
+
+        try:
+            await self._run_until_stopped(listen())
         finally:
             await pubsub.unsubscribe(channel)
             await pubsub.aclose()
+            await self._drain()
+
+    async def consume_stream(
+        self,
+        stream: str,
+        group: str,
+        consumer: str,
+        markets: set[str] | None = None,
+        block_ms: int = 1000,
+        count: int = 100,
+    ) -> None:
+        """컨슈머 그룹으로 스트림 수신 시작 (blocking loop)
+
+        처음 만드는 그룹은 현재 시점($)부터 읽는다. 시작 시 ACK 되지 않은 pending 엔트리를
+        먼저 재처리한 뒤 신규 엔트리(>)를 기다린다. 한 번에 최대 count 건을 읽고, 엔트리는
+        모든 콜백 처리가 끝난 뒤 백그라운드로 XACK 한다. 콜백 큐가 가득 차면 자리가 날 때까지
+        수신을 멈추므로 엔트리를 버리거나 처리 전에 ACK 하지 않는다.
+
+        Args:
+            markets: 처리할 시장 (예: {"KR"}). 그 외 시장 메시지는 콜백 없이 ACK
+            block_ms: XREADGROUP 대기 시간
+        """
+        await self._ensure_group(stream, group)
+        logger.info("Redis 스트림 컨슈머 시작: %s (group=%s, consumer=%s)", stream, group, consumer)
+
+        async def consume() -> None:
+            # 재시작 복구: 이전 실행에서 ACK 하지 못한 pending 엔트리부터
+            last_id = "0"
+            while self._running:
+                entries = await self._redis.xreadgroup(
+                    group, consumer, {stream: last_id}, count=count,
+                    block=None if last_id == "0" else block_ms,
+                )
+                batch = entries[0][1] if entries else []
+                if last_id == "0" and not batch:
+                    last_id = ">"
+                    continue
+                if last_id == "0":
+                    logger.info("pending 속보 %d건 재처리", len(batch))
+
+                ids = []
+                deliveries = []
+                for entry_id, fields in batch:
+                    ids.append(entry_id)
+                    delivery = await self._handle_entry(fields, markets, block=True)
+                    if delivery is not None:
+                        deliveries.append(delivery)
+                if ids:
+                    task = asyncio.create_task(self._ack_when_done(stream, group, ids, deliveries))
+                    self._ack_tasks.add(task)
+                    task.add_done_callback(self._ack_tasks.discard)
+                    if last_id == "0":
+                        # pending 재처리는 ACK 완료 후 다음 페이지 조회 (같은 엔트리 재조회 방지)
+                        await task
+
+        try:
+            await self._run_until_stopped(consume())
+        finally:
+            await self._drain()
+
+    async def _ensure_group(self, stream: str, group: str) -> None:
+        """컨슈머 그룹 생성 (이미 있으면 무시)"""
+        try:
+            await self._redis.xgroup_create(stream, group, id="$", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _ack_when_done(
+        self, stream: str, group: str, ids: list, deliveries: list[asyncio.Future]
+    ) -> None:
+        await asyncio.gather(*deliveries)
+        await self._redis.xack(stream, group, *ids)
 
     def stop(self) -> None:
         """구독 중단"""
         self._running = False
+        if self._stopped is not None:
+            self._stopped.set()
+
+    async def _run_until_stopped(self, loop_coro) -> None:
+        """수신 루프를 stop() 호출 전까지 실행"""
+        self._running = True
+        self._stopped = asyncio.Event()
+        receiver = asyncio.ensure_future(loop_coro)
+        stopper = asyncio.ensure_future(self._stopped.wait())
+        try:
+            await asyncio.wait({receiver, stopper}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            receiver.cancel()
+            stopper.cancel()
+            await asyncio.gather(receiver, stopper, return_exceptions=True)
+            self._running = False
+            self._stopped = None
+        # 수신 루프 오류는 호출자에게 전달
+        if not receiver.cancelled() and receiver.exception() is not None:
+            raise receiver.exception()
+
+    def latency_stats(self) -> list[dict]:
+        """콜백별 수신→콜백 시작 대기(wait_ms) / 실행 시간(callback_ms) 통계"""
+        return [
+            {
+                "callback": worker.name,
+                "queued": worker.queue.qsize(),
+                "dropped": worker.dropped,
+                "wait_ms": worker.wait.summary(),
+                "callback_ms": worker.duration.summary(),
+            }
+            for worker in self._workers
+        ]
+
+    def _ensure_workers(self) -> None:
+        for callback in self._callbacks[len(self._workers):]:
+            self._workers.append(_CallbackWorker(callback, self._queue_size))
+        for worker in self._workers:
+            if worker.task is None or worker.task.done():
+                worker.task = asyncio.create_task(worker.run())
+
+    async def _drain(self) -> None:
+        """대기 중인 콜백 처리 및 ACK 완료 후 워커 종료"""
+        for worker in self._workers:
+            if worker.task is not None and not worker.task.done():
+                await worker.queue.join()
+        if self._ack_tasks:
+            await asyncio.gather(*self._ack_tasks, return_exceptions=True)
+        for worker in self._workers:
+            if worker.task is not None:
+                worker.task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await worker.task
+                worker.task = None
+
+    async def _dispatch(self, payload: dict, received_at: float, block: bool) -> asyncio.Future:
+        """콜백별 큐에 적재. 모든 콜백 처리(또는 폐기) 시 완료되는 Future 반환
+
+        block=True 이면 큐 포화 시 폐기하지 않고 자리가 날 때까지 대기한다.
+        """
+        self._ensure_workers()
+        done = asyncio.get_running_loop().create_future()
+        remaining = len(self._workers)
+        if remaining == 0:
+            done.set_result(None)
+            return done
 
-    async def _handle_message(self, data: bytes | str) -> None:
-        """메시지 파싱 및 콜백 호출"""
+        def on_done() -> None:
+            nonlocal remaining
+            remaining -= 1
+            if remaining == 0 and not done.done():
+                done.set_result(None)
+
+        for worker in self._workers:
+            if block:
+                await worker.put_wait(payload, received_at, on_done)
+            else:
+                worker.put(payload, received_at, on_done)
+        return done
+
+    async def _handle_entry(
+        self, fields: dict | None, markets: set[str] | None, block: bool = False
+    ) -> asyncio.Future | None:
+        """스트림 엔트리 처리 (길이 제한으로 삭제된 pending 엔트리는 fields 가 비어 있음)"""
+        if not fields:
+            return None
+        data = fields.get("data", fields.get(b"data"))
+        if data is None:
+            logger.warning("data 필드 없는 스트림 엔트리 무시")
+            return None
+        return await self._handle_message(data, markets, block)
+
+    async def _handle_message(
+        self, data: bytes | str, markets: set[str] | None = None, block: bool = False
+    ) -> asyncio.Future | None:
+        """메시지 파싱 후 콜백 큐에 적재"""
+        received_at = time.perf_counter()
         try:
             if isinstance(data, bytes):
                 data = data.decode("utf-8")
-            payload = json.loads(data)
+            payload: Any = json.loads(data)
         except (json.JSONDecodeError, UnicodeDecodeError) as e:
             logger.warning("잘못된 메시지 무시: %s", e)
-            return
+            return None
 
-        for callback in self._callbacks:
-            try:
-                callback(payload)
-            except Exception as e:
-                logger.error("콜백 실행 실패: %s", e)
+        if markets and payload.get("market") not in markets:
+            return None
+
+        return await self._dispatch(payload, received_at, block)
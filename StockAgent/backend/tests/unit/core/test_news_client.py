@@ -60,3 +60,31 @@ async def test_news_score_different_stocks(mock_stocknews):
     score2 = await client.get_score("000660")
     assert score1 == 75
     assert score2 == 45
+
+
+@pytest.mark.asyncio
+async def test_get_scores_single_request(mock_stocknews):
+    """여러 종목 점수를 /news/scores 1회 요청으로 조회"""
+    route = mock_stocknews.get("/api/v1/news/scores").respond(json=[
+        {"stock_code": "005930", "news_score": 75, "news_count": 5},
+        {"stock_code": "000660", "news_score": 45, "news_count": 2},
+    ])
+    client = NewsClient(base_url="http://localhost:8001", cache_ttl=60)
+    scores = await client.get_scores(["005930", "000660", "035720"])
+    assert scores == {"005930": 75, "000660": 45, "035720": 0}
+    assert route.call_count == 1
+    assert route.calls.last.request.url.params["stocks"] == "005930,000660,035720"
+
+    # 캐시된 종목은 재요청하지 않음
+    assert await client.get_score("005930") == 75
+    assert mock_stocknews.calls.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_scores_service_unavailable():
+    """뉴스 서비스 다운 시 전 종목 0 반환"""
+    with respx.mock(base_url="http://localhost:8001") as mock:
+        mock.get("/api/v1/news/scores").respond(status_code=503)
+        client = NewsClient(base_url="http://localhost:8001")
+        scores = await client.get_scores(["005930", "000660"])
+        assert scores == {"005930": 0, "000660": 0}
@@ -85,3 +85,211 @@ async def test_redis_invalid_json(fake_redis):
 
     assert len(received) == 1
     assert received[0]["score"] == 90
+
+
+STREAM = "news_breaking_stream"
+GROUP = "stockagent-test"
+
+
+async def _xadd(fake_redis, **payload):
+    return await fake_redis.xadd(STREAM, {"data": json.dumps(payload)}, maxlen=100)
+
+
+async def _run_consumer(subscriber, **kwargs):
+    task = asyncio.create_task(
+        subscriber.consume_stream(STREAM, GROUP, "c1", block_ms=50, **kwargs)
+    )
+    await asyncio.sleep(0.1)
+    return task
+
+
+async def _stop(subscriber, task):
+    await asyncio.sleep(0.1)
+    subscriber.stop()
+    await task
+
+
+@pytest.mark.asyncio
+async def test_stream_consume_and_ack(fake_redis):
+    """스트림 컨슈머 그룹 수신 후 ACK"""
+    subscriber = NewsSubscriber(redis=fake_redis)
+    received = []
+    subscriber.on_breaking_news(lambda msg: received.append(msg))
+
+    task = await _run_consumer(subscriber)
+    await _xadd(fake_redis, stock_code="005930", market="KR", news_score=85)
+    await _stop(subscriber, task)
+
+    assert [m["stock_code"] for m in received] == ["005930"]
+    pending = await fake_redis.xpending(STREAM, GROUP)
+    assert pending["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_market_filter(fake_redis):
+    """처리 대상 외 시장 메시지는 콜백 없이 ACK"""
+    subscriber = NewsSubscriber(redis=fake_redis)
+    received = []
+    subscriber.on_breaking_news(lambda msg: received.append(msg))
+
+    task = await _run_consumer(subscriber, markets={"KR"})
+    await _xadd(fake_redis, stock_code="NVDA", market="US", news_score=90)
+    await _xadd(fake_redis, stock_code="005930", market="KR", news_score=85)
+    await _stop(subscriber, task)
+
+    assert [m["stock_code"] for m in received] == ["005930"]
+    assert (await fake_redis.xpending(STREAM, GROUP))["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_recovers_pending_after_restart(fake_redis):
+    """재시작 전 ACK 하지 못한 엔트리 + 중단 중 발행된 엔트리 재처리"""
+    await fake_redis.xgroup_create(STREAM, GROUP, id="$", mkstream=True)
+    await _xadd(fake_redis, stock_code="005930", market="KR", news_score=85)
+    # 이전 실행: 읽었지만 ACK 전에 종료
+    await fake_redis.xreadgroup(GROUP, "c1", {STREAM: ">"}, count=10)
+    await _xadd(fake_redis, stock_code="000660", market="KR", news_score=88)
+
+    subscriber = NewsSubscriber(redis=fake_redis)
+    received = []
+    subscriber.on_breaking_news(lambda msg: received.append(msg))
+    task = await _run_consumer(subscriber)
+    await _stop(subscriber, task)
+
+    assert [m["stock_code"] for m in received] == ["005930", "000660"]
+    assert (await fake_redis.xpending(STREAM, GROUP))["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_async_callback(fake_redis):
+    """async 콜백 지원"""
+    subscriber = NewsSubscriber(redis=fake_redis)
+    received = []
+
+    async def on_news(msg):
+        await asyncio.sleep(0)
+        received.append(msg)
+
+    subscriber.on_breaking_news(on_news)
+    task = asyncio.create_task(subscriber.subscribe("news_breaking_kr"))
+    await asyncio.sleep(0.1)
+
+    await fake_redis.publish("news_breaking_kr", json.dumps({"code": "005930", "score": 85}))
+    await asyncio.sleep(0.1)
+    subscriber.stop()
+    await task
+
+    assert received == [{"code": "005930", "score": 85}]
+
+
+@pytest.mark.asyncio
+async def test_slow_callback_does_not_block_others(fake_redis):
+    """느린 콜백이 수신과 다른 콜백을 막지 않음"""
+    subscriber = NewsSubscriber(redis=fake_redis)
+    release = asyncio.Event()
+    fast, slow = [], []
+
+    async def slow_callback(msg):
+        await release.wait()
+        slow.append(msg)
+
+    subscriber.on_breaking_news(slow_callback)
+    subscriber.on_breaking_news(lambda msg: fast.append(msg))
+    task = asyncio.create_task(subscriber.subscribe("news_breaking_kr"))
+    await asyncio.sleep(0.1)
+
+    for i in range(3):
+        await fake_redis.publish("news_breaking_kr", json.dumps({"code": f"00{i}"}))
+    await asyncio.sleep(0.2)
+
+    assert len(fast) == 3
+    assert slow == []
+
+    release.set()
+    subscriber.stop()
+    await task
+    assert len(slow) == 3
+
+    stats = {s["callback"]: s for s in subscriber.latency_stats()}
+    assert stats[slow_callback.__qualname__]["callback_ms"]["count"] == 3
+    assert stats[slow_callback.__qualname__]["wait_ms"]["max"] > 0
+
+
+@pytest.mark.asyncio
+async def test_callback_queue_drops_oldest(fake_redis):
+    """콜백 큐 포화 시 가장 오래된 메시지 폐기"""
+    subscriber = NewsSubscriber(redis=fake_redis, queue_size=2)
+    release = asyncio.Event()
+    received = []
+
+    async def slow_callback(msg):
+        await release.wait()
+        received.append(msg["seq"])
+
+    subscriber.on_breaking_news(slow_callback)
+    task = asyncio.create_task(subscriber.subscribe("news_breaking_kr"))
+    await asyncio.sleep(0.1)
+
+    for i in range(5):
+        await fake_redis.publish("news_breaking_kr", json.dumps({"seq": i}))
+    await asyncio.sleep(0.1)
+    release.set()
+    subscriber.stop()
+    await task
+
+    # seq 0 은 처리 중, 1~2 는 폐기, 최신 2건 유지
+    assert received == [0, 3, 4]
+    assert subscriber.latency_stats()[0]["dropped"] == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_ack_after_callbacks_complete(fake_redis):
+    """스트림 엔트리는 콜백 처리가 끝난 뒤 ACK"""
+    subscriber = NewsSubscriber(redis=fake_redis)
+    release = asyncio.Event()
+
+    async def slow_callback(msg):
+        await release.wait()
+
+    subscriber.on_breaking_news(slow_callback)
+    task = await _run_consumer(subscriber)
+    await _xadd(fake_redis, stock_code="005930", market="KR", news_score=85)
+    await asyncio.sleep(0.2)
+
+    assert (await fake_redis.xpending(STREAM, GROUP))["pending"] == 1
+
+    release.set()
+    await _stop(subscriber, task)
+    assert (await fake_redis.xpending(STREAM, GROUP))["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_full_queue_keeps_entries_pending(fake_redis):
+    """스트림 모드는 콜백 큐가 가득 차도 폐기/조기 ACK 없이 pending 으로 유지"""
+    subscriber = NewsSubscriber(redis=fake_redis, queue_size=2)
+    release = asyncio.Event()
+    received = []
+
+    async def slow_callback(msg):
+        await release.wait()
+        received.append(msg["seq"])
+
+    subscriber.on_breaking_news(slow_callback)
+    task = await _run_consumer(subscriber)
+    for i in range(6):
+        await _xadd(fake_redis, seq=i, market="KR")
+    await asyncio.sleep(0.2)
+
+    # 처리되지 않은 엔트리는 하나도 ACK 되지 않음 (읽은 엔트리는 pending, 나머지는 미수신)
+    pending = (await fake_redis.xpending(STREAM, GROUP))["pending"]
+    last_delivered = (await fake_redis.xinfo_groups(STREAM))[0]["last-delivered-id"]
+    unread = await fake_redis.xrange(STREAM, min=b"(" + last_delivered)
+    assert pending >= 1
+    assert pending + len(unread) == 6
+    assert received == []
+    assert subscriber.latency_stats()[0]["dropped"] == 0
+
+    release.set()
+    await _stop(subscriber, task)
+    assert received == [0, 1, 2, 3, 4, 5]
+    assert (await fake_redis.xpending(STREAM, GROUP))["pending"] == 0
@@ -0,0 +1,104 @@
+"""Partition news_event by month on published_at (PostgreSQL only).
+
+Revision ID: f6g7h8i9j0k1
+Revises: e5f6g7h8i9j0
+Create Date: 2026-10-19 10:00:00.000000
+
+Converts news_event into a ``PARTITION BY RANGE (published_at)`` table with one
+partition per month plus a default partition. PostgreSQL requires the partition
+key in every unique constraint, so the primary key becomes (id, published_at)
+and source_url uniqueness becomes (source_url, published_at); URL dedup is
+still enforced by app.processing.dedup before insert. NULL published_at rows
+are backfilled from created_at. SQLite is left untouched.
+
+Future partitions and retention are handled at runtime by
+app.core.partitioning (scheduler job ``news_partition_maintenance``).
+"""
+from datetime import date
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.core.partitioning import add_months, create_partition_sql, month_partitions
+
+# revision identifiers, used by Alembic.
+revision = "f6g7h8i9j0k1"
+down_revision = "e5f6g7h8i9j0"
+branch_labels = None
+depends_on = None
+
+_INDEXES = [
+    ("ix_news_event_market", "market"),
+    ("ix_news_event_stock_code", "stock_code"),
+    ("ix_news_event_market_stock", "market, stock_code"),
+    ("ix_news_event_published", "published_at"),
+]
+
+
+def _drop_legacy_constraints(table: str) -> None:
+    op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS news_event_pkey")
+    op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS news_event_source_url_key")
+    for name, _ in _INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def _create_indexes() -> None:
+    for name, columns in _INDEXES:
+        op.execute(f"CREATE INDEX {name} ON news_event ({columns})")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.execute("ALTER TABLE news_event RENAME TO news_event_legacy")
+    op.execute("ALTER SEQUENCE news_event_id_seq OWNED BY NONE")
+    _drop_legacy_constraints("news_event_legacy")
+    op.execute(
+        "UPDATE news_event_legacy SET published_at = created_at WHERE published_at IS NULL"
+    )
+
+    op.execute(
+        "CREATE TABLE news_event (LIKE news_event_legacy INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (published_at)"
+    )
+    op.execute("ALTER TABLE news_event ALTER COLUMN published_at SET NOT NULL")
+    op.execute("ALTER TABLE news_event ADD CONSTRAINT news_event_pkey PRIMARY KEY (id, published_at)")
+    op.execute(
+        "ALTER TABLE news_event ADD CONSTRAINT news_event_source_url_key "
+        "UNIQUE (source_url, published_at)"
+    )
+    op.execute("ALTER SEQUENCE news_event_id_seq OWNED BY news_event.id")
+    _create_indexes()
+
+    # 기존 데이터 범위 + 2개월 앞까지 월 파티션 생성
+    oldest = bind.execute(sa.text("SELECT MIN(published_at) FROM news_event_legacy")).scalar()
+    today = date.today()
+    first = oldest.date() if oldest else today
+    for partition in month_partitions(first, add_months(today, 2)):
+        op.execute(create_partition_sql(partition))
+    op.execute("CREATE TABLE IF NOT EXISTS news_event_default PARTITION OF news_event DEFAULT")
+
+    op.execute("INSERT INTO news_event SELECT * FROM news_event_legacy")
+    op.execute("DROP TABLE news_event_legacy")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.execute("ALTER TABLE news_event RENAME TO news_event_partitioned")
+    op.execute("ALTER SEQUENCE news_event_id_seq OWNED BY NONE")
+    _drop_legacy_constraints("news_event_partitioned")
+
+    op.execute("CREATE TABLE news_event (LIKE news_event_partitioned INCLUDING DEFAULTS)")
+    op.execute("ALTER TABLE news_event ALTER COLUMN published_at DROP NOT NULL")
+    op.execute("INSERT INTO news_event SELECT * FROM news_event_partitioned")
+    op.execute("ALTER TABLE news_event ADD CONSTRAINT news_event_pkey PRIMARY KEY (id)")
+    op.execute("ALTER TABLE news_event ADD CONSTRAINT news_event_source_url_key UNIQUE (source_url)")
+    op.execute("ALTER SEQUENCE news_event_id_seq OWNED BY news_event.id")
+    _create_indexes()
+
+    op.execute("DROP TABLE news_event_partitioned CASCADE")
@@ -0,0 +1,78 @@
+"""Add news_daily_rollup / news_theme_daily_rollup tables.
+
+Revision ID: g7h8i9j0k1l2
+Revises: f6g7h8i9j0k1
+Create Date: 2026-10-19 12:00:00.000000
+
+Rollups are maintained incrementally by ORM listeners on NewsEvent. Existing
+rows are not backfilled here; run scripts/rebuild_news_rollup.py after upgrade.
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "g7h8i9j0k1l2"
+down_revision = "f6g7h8i9j0k1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "news_daily_rollup",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("stock_code", sa.String(length=20), nullable=False),
+        sa.Column("market", sa.String(length=5), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("stock_name", sa.String(length=100), nullable=True),
+        sa.Column("news_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("positive_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("neutral_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("negative_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("disclosure_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("score_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("sentiment_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("last_published_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "uq_news_rollup_stock_market_date",
+        "news_daily_rollup",
+        ["stock_code", "market", "date"],
+        unique=True,
+    )
+    op.create_index("ix_news_rollup_market_date", "news_daily_rollup", ["market", "date"])
+
+    op.create_table(
+        "news_theme_daily_rollup",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("stock_code", sa.String(length=20), nullable=False),
+        sa.Column("market", sa.String(length=5), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("theme", sa.String(length=100), nullable=False),
+        sa.Column("kind", sa.String(length=10), nullable=False),
+        sa.Column("news_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("score_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("sentiment_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "uq_theme_rollup_key",
+        "news_theme_daily_rollup",
+        ["stock_code", "market", "date", "theme", "kind"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_theme_rollup_date_theme", "news_theme_daily_rollup", ["date", "theme"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_theme_rollup_date_theme", table_name="news_theme_daily_rollup")
+    op.drop_index("uq_theme_rollup_key", table_name="news_theme_daily_rollup")
+    op.drop_table("news_theme_daily_rollup")
+    op.drop_index("ix_news_rollup_market_date", table_name="news_daily_rollup")
+    op.drop_index("uq_news_rollup_stock_market_date", table_name="news_daily_rollup")
+    op.drop_table("news_daily_rollup")
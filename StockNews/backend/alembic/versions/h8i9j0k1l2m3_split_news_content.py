@@ -0,0 +1,98 @@
+"""Move news_event.summary/content into news_content.
+
+Revision ID: h8i9j0k1l2m3
+Revises: g7h8i9j0k1l2
+Create Date: 2026-10-19 14:00:00.000000
+
+Article bodies are stored zlib-compressed in news_content (1:1 on news_id) so
+that scans over news_event touch only the small aggregation columns. No
+database FK is declared: on PostgreSQL news_event is partitioned with a
+composite (id, published_at) primary key. Deletion is cascaded by the ORM.
+"""
+import zlib
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "h8i9j0k1l2m3"
+down_revision = "g7h8i9j0k1l2"
+branch_labels = None
+depends_on = None
+
+_BATCH_SIZE = 2000
+
+
+def upgrade() -> None:
+    op.create_table(
+        "news_content",
+        sa.Column("news_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("summary", sa.Text(), nullable=True),
+        sa.Column("content_compressed", sa.LargeBinary(), nullable=True),
+        sa.PrimaryKeyConstraint("news_id"),
+    )
+
+    bind = op.get_bind()
+    news_content = sa.table(
+        "news_content",
+        sa.column("news_id", sa.Integer()),
+        sa.column("summary", sa.Text()),
+        sa.column("content_compressed", sa.LargeBinary()),
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT id, summary, content FROM news_event "
+                "WHERE id > :last_id AND (summary IS NOT NULL OR content IS NOT NULL) "
+                "ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": _BATCH_SIZE},
+        ).fetchall()
+        if not rows:
+            break
+        bind.execute(
+            news_content.insert(),
+            [
+                {
+                    "news_id": r.id,
+                    "summary": r.summary,
+                    "content_compressed": (
+                        zlib.compress(r.content.encode("utf-8"), 6) if r.content is not None else None
+                    ),
+                }
+                for r in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+    with op.batch_alter_table("news_event") as batch_op:
+        batch_op.drop_column("content")
+        batch_op.drop_column("summary")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("news_event") as batch_op:
+        batch_op.add_column(sa.Column("summary", sa.String(length=2000), nullable=True))
+        batch_op.add_column(sa.Column("content", sa.String(length=5000), nullable=True))
+
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text("SELECT news_id, summary, content_compressed FROM news_content")
+    ).fetchall()
+    for r in rows:
+        bind.execute(
+            sa.text("UPDATE news_event SET summary = :summary, content = :content WHERE id = :id"),
+            {
+                "id": r.news_id,
+                "summary": r.summary,
+                "content": (
+                    zlib.decompress(r.content_compressed).decode("utf-8")
+                    if r.content_compressed is not None
+                    else None
+                ),
+            },
+        )
+
+    op.drop_table("news_content")
@@ -0,0 +1,78 @@
+"""Add news_search full-text search index.
+
+Revision ID: i9j0k1l2m3n4
+Revises: h8i9j0k1l2m3
+Create Date: 2026-10-19 16:00:00.000000
+
+news_search holds n-gram token documents per news row. On SQLite an FTS5
+external-content table (news_search_fts) kept in sync by triggers indexes it;
+on PostgreSQL a GIN expression index over to_tsvector('simple', ...) does.
+Documents are written by an ORM after_flush listener. Existing rows are not
+backfilled here; run scripts/rebuild_search_index.py after upgrade.
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "i9j0k1l2m3n4"
+down_revision = "h8i9j0k1l2m3"
+branch_labels = None
+depends_on = None
+
+# app.models.news_search 의 DDL 과 동일하게 유지
+_PG_SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', news_search.title), 'A') || "
+    "setweight(to_tsvector('simple', news_search.body), 'B')"
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "news_search",
+        sa.Column("news_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("title", sa.Text(), nullable=False),
+        sa.Column("body", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("news_id"),
+    )
+
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute(
+            f"CREATE INDEX ix_news_search_vector ON news_search USING gin (({_PG_SEARCH_VECTOR}))"
+        )
+    elif bind.dialect.name == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE news_search_fts USING fts5("
+            "title, body, content='news_search', content_rowid='news_id', "
+            "tokenize='unicode61 remove_diacritics 0')"
+        )
+        op.execute(
+            "CREATE TRIGGER news_search_ai AFTER INSERT ON news_search BEGIN "
+            "INSERT INTO news_search_fts(rowid, title, body) VALUES (new.news_id, new.title, new.body); "
+            "END"
+        )
+        op.execute(
+            "CREATE TRIGGER news_search_ad AFTER DELETE ON news_search BEGIN "
+            "INSERT INTO news_search_fts(news_search_fts, rowid, title, body) "
+            "VALUES ('delete', old.news_id, old.title, old.body); "
+            "END"
+        )
+        op.execute(
+            "CREATE TRIGGER news_search_au AFTER UPDATE ON news_search BEGIN "
+            "INSERT INTO news_search_fts(news_search_fts, rowid, title, body) "
+            "VALUES ('delete', old.news_id, old.title, old.body); "
+            "INSERT INTO news_search_fts(rowid, title, body) VALUES (new.news_id, new.title, new.body); "
+            "END"
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_news_search_vector")
+    elif bind.dialect.name == "sqlite":
+        for trigger in ("news_search_ai", "news_search_ad", "news_search_au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS news_search_fts")
+    op.drop_table("news_search")
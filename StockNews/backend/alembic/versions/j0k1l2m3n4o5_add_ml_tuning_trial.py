@@ -0,0 +1,45 @@
+"""Add ml_tuning_trial table.
+
+Revision ID: j0k1l2m3n4o5
+Revises: i9j0k1l2m3n4
+Create Date: 2026-10-19 18:00:00.000000
+
+One row per hyperparameter search trial (including pruned trials), grouped
+by study_id. Written by ModelRegistry.record_trials.
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "j0k1l2m3n4o5"
+down_revision = "i9j0k1l2m3n4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ml_tuning_trial",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("study_id", sa.String(36), nullable=False),
+        sa.Column("model_type", sa.String(50), nullable=False),
+        sa.Column("market", sa.String(5), nullable=False),
+        sa.Column("feature_tier", sa.Integer(), nullable=False),
+        sa.Column("trial_number", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(10), nullable=False),
+        sa.Column("rung", sa.Integer(), nullable=False),
+        sa.Column("resource", sa.Integer(), nullable=False),
+        sa.Column("params", sa.Text(), nullable=False),
+        sa.Column("cv_accuracy", sa.Float(), nullable=True),
+        sa.Column("cv_std", sa.Float(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_ml_tuning_trial_study", "ml_tuning_trial", ["study_id", "trial_number"])
+    op.create_index("ix_ml_tuning_trial_market", "ml_tuning_trial", ["market", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ml_tuning_trial_market", "ml_tuning_trial")
+    op.drop_index("ix_ml_tuning_trial_study", "ml_tuning_trial")
+    op.drop_table("ml_tuning_trial")
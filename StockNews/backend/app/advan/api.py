@@ -42,6 +42,7 @@ from app.advan.schemas import (
     TemplateConfig,
 )
 from app.core.database import get_db
+from app.core.serialization import FastJSONResponse, rows_to_dicts
 from app.models.news_event import NewsEvent
 
 logger = logging.getLogger(__name__)
@@ -51,6 +52,11 @@ router = APIRouter(prefix="/advan", tags=["advan"])
 
 # ─── Event 엔드포인트 ───
 
+# AdvanEventResponse 필드와 동일한 순서의 컬럼 프로젝션
+_EVENT_FIELDS = tuple(AdvanEventResponse.model_fields)
+_EVENT_COLUMNS = tuple(getattr(AdvanEvent, f) for f in _EVENT_FIELDS)
+
+
 @router.get("/events", response_model=AdvanEventListResponse)
 def list_events(
     market: str = Query(default="KR"),
@@ -69,13 +75,16 @@ def list_events(
         query = query.filter(AdvanEvent.ticker == ticker)
 
     total = query.count()
-    events = query.order_by(AdvanEvent.event_timestamp.desc()).offset(offset).limit(limit).all()
-
-    return AdvanEventListResponse(
-        events=[_event_to_response(e) for e in events],
-        total=total,
+    rows = (
+        query.with_entities(*_EVENT_COLUMNS)
+        .order_by(AdvanEvent.event_timestamp.desc())
+        .offset(offset)
+        .limit(limit)
+        .all()
     )
 
+    return FastJSONResponse({"events": rows_to_dicts(rows, _EVENT_FIELDS), "total": total})
+
 
 @router.get("/events/summary")
 def event_type_summary(
@@ -582,30 +591,6 @@ def run_optimization(
 
 # ─── Helper 함수 ───
 
-def _event_to_response(e: AdvanEvent) -> AdvanEventResponse:
-    return AdvanEventResponse(
-        id=e.id,
-        source_news_id=e.source_news_id,
-        ticker=e.ticker,
-        stock_name=e.stock_name,
-        market=e.market,
-        event_type=e.event_type,
-        direction=e.direction,
-        magnitude=e.magnitude,
-        magnitude_detail=e.magnitude_detail,
-        novelty=e.novelty,
-        credibility=e.credibility,
-        is_disclosure=e.is_disclosure,
-        title=e.title,
-        summary=e.summary,
-        source=e.source,
-        confounders=e.confounders,
-        event_timestamp=e.event_timestamp,
-        is_after_market=e.is_after_market,
-        created_at=e.created_at,
-    )
-
-
 def _policy_to_response(p: AdvanPolicy) -> AdvanPolicyResponse:
     return AdvanPolicyResponse(
         id=p.id,
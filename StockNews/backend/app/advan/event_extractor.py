@@ -4,7 +4,7 @@ import logging
 from datetime import date, datetime
 
 from sqlalchemy import and_, func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.advan.models import AdvanEvent
 from app.models.news_event import NewsEvent
@@ -153,7 +153,11 @@ def extract_events(
         logger.info(f"force_rebuild: deleted existing AdvanEvent for market={market}")
 
     # NewsEvent 조회
-    query = db.query(NewsEvent).filter(NewsEvent.market == market)
+    query = (
+        db.query(NewsEvent)
+        .options(selectinload(NewsEvent.body))
+        .filter(NewsEvent.market == market)
+    )
     if date_from:
         query = query.filter(NewsEvent.published_at >= datetime.combine(date_from, datetime.min.time()))
     if date_to:
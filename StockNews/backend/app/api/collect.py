@@ -3,7 +3,7 @@
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.core.auth import verify_api_key
 from app.core.config import settings
@@ -218,6 +218,7 @@ async def analyze_cross_market(
 
     us_news = (
         db.query(NewsEvent)
+        .options(selectinload(NewsEvent.body))  # 스레드에서 content 지연 로드 방지
         .filter(
             NewsEvent.market == "US",
             NewsEvent.kr_impact_themes.is_(None),
@@ -267,6 +268,7 @@ async def reclassify_themes(
 
     news_list = (
         db.query(NewsEvent)
+        .options(selectinload(NewsEvent.body))
         .order_by(NewsEvent.created_at.desc())
         .limit(limit)
         .all()
@@ -1,14 +1,29 @@
 """뉴스 관련 REST 엔드포인트."""
 
-from fastapi import APIRouter, Depends, Query, Request, Response
-from sqlalchemy import func
+import base64
+import json
+from datetime import UTC, date, datetime, time, timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import Date, Float, and_, cast, func, literal, or_
 from sqlalchemy.orm import Session
 
 from app.core.auth import verify_api_key
 from app.core.database import get_db
 from app.core.limiter import limiter
+from app.core.response_cache import cached_response
+from app.core.serialization import FastJSONResponse
+from app.models.news_content import NewsContent, decompress_text
 from app.models.news_event import NewsEvent
-from app.schemas.news import NewsItem, NewsListResponse, NewsScoreResponse, NewsTopItem
+from app.models.news_rollup import NewsDailyRollup, NewsThemeDailyRollup, news_score_cache
+from app.processing.news_search import search_news
+from app.schemas.news import (
+    NewsListResponse,
+    NewsScoreResponse,
+    NewsSearchItem,
+    NewsSearchResponse,
+    NewsTopItem,
+)
 
 router = APIRouter(
     prefix="/news",
@@ -17,65 +32,184 @@ router = APIRouter(
 )
 
 
+def _dominant_sentiment(positive_count: int | None, neutral_count: int | None) -> str:
+    """집계 감성 라벨 (기존 max(sentiment) 문자열 비교와 동일한 우선순위)."""
+    if positive_count:
+        return "positive"
+    if neutral_count:
+        return "neutral"
+    return "negative"
+
+
+def _age_days(db: Session, ref_date: date):
+    """롤업 일자의 경과 일수 SQL 식 (dialect별 날짜 차이)."""
+    if db.get_bind().dialect.name == "sqlite":
+        return func.julianday(ref_date.isoformat()) - func.julianday(NewsDailyRollup.date)
+    return cast(literal(ref_date, Date) - NewsDailyRollup.date, Float)
+
+
+MAX_BATCH_STOCKS = 300
+
+
+def _compute_news_scores(
+    db: Session, stocks: list[str], days: int | None
+) -> dict[str, NewsScoreResponse]:
+    """종목 목록의 뉴스 스코어를 롤업 GROUP BY 2회 조회로 일괄 계산.
+
+    recency는 일자별 가중치 1/(1+경과일)로 가중 평균한 뉴스 스코어.
+    뉴스가 없는 종목도 기본값 응답을 포함합니다.
+    """
+    today = datetime.now(UTC).date()
+    filters = [NewsDailyRollup.stock_code.in_(stocks)]
+    if days is not None:
+        filters.append(NewsDailyRollup.date >= today - timedelta(days=days - 1))
+
+    weight = 1.0 / (1.0 + _age_days(db, today))
+    rows = (
+        db.query(
+            NewsDailyRollup.stock_code,
+            func.sum(NewsDailyRollup.news_count).label("news_count"),
+            func.sum(NewsDailyRollup.positive_count).label("positive_count"),
+            func.sum(NewsDailyRollup.negative_count).label("negative_count"),
+            func.sum(NewsDailyRollup.disclosure_count).label("disclosure_count"),
+            func.sum(NewsDailyRollup.score_sum).label("score_sum"),
+            func.sum(NewsDailyRollup.sentiment_sum).label("sentiment_sum"),
+            func.sum(NewsDailyRollup.score_sum * weight).label("weighted_score_sum"),
+            func.sum(NewsDailyRollup.news_count * weight).label("weighted_count"),
+            func.max(NewsDailyRollup.stock_name).label("stock_name"),
+            func.max(NewsDailyRollup.last_published_at).label("updated_at"),
+        )
+        .filter(*filters)
+        .group_by(NewsDailyRollup.stock_code)
+        .all()
+    )
+    totals_by_stock = {r.stock_code: r for r in rows if r.news_count}
+
+    # 종목별 Top 3 테마
+    top_themes: dict[str, list[str]] = {}
+    if totals_by_stock:
+        theme_count = func.sum(NewsThemeDailyRollup.news_count)
+        theme_filters = [
+            NewsThemeDailyRollup.stock_code.in_(list(totals_by_stock)),
+            NewsThemeDailyRollup.kind == "news",
+        ]
+        if days is not None:
+            theme_filters.append(NewsThemeDailyRollup.date >= today - timedelta(days=days - 1))
+        theme_rows = (
+            db.query(
+                NewsThemeDailyRollup.stock_code,
+                NewsThemeDailyRollup.theme,
+                theme_count.label("cnt"),
+            )
+            .filter(*theme_filters)
+            .group_by(NewsThemeDailyRollup.stock_code, NewsThemeDailyRollup.theme)
+            .order_by(theme_count.desc())
+            .all()
+        )
+        for r in theme_rows:
+            themes = top_themes.setdefault(r.stock_code, [])
+            if len(themes) < 3:
+                themes.append(r.theme)
+
+    results = {}
+    for stock in stocks:
+        totals = totals_by_stock.get(stock)
+        if totals is None:
+            results[stock] = NewsScoreResponse(stock_code=stock)
+            continue
+
+        news_count = totals.news_count
+        avg_score = (totals.score_sum or 0.0) / news_count
+        avg_sentiment = (totals.sentiment_sum or 0.0) / news_count
+        recency = (
+            totals.weighted_score_sum / totals.weighted_count
+            if totals.weighted_count
+            else avg_score
+        )
+
+        # 감성별 건수
+        positive_count = totals.positive_count or 0
+        negative_count = totals.negative_count or 0
+
+        results[stock] = NewsScoreResponse(
+            stock_code=stock,
+            stock_name=totals.stock_name,
+            news_score=round(avg_score, 2),
+            recency=round(recency, 2),
+            frequency=float(news_count),
+            sentiment_score=round(avg_sentiment, 2),
+            disclosure=float(totals.disclosure_count or 0),
+            news_count=news_count,
+            positive_count=positive_count,
+            neutral_count=news_count - positive_count - negative_count,
+            negative_count=negative_count,
+            top_themes=top_themes.get(stock, []),
+            updated_at=totals.updated_at,
+        )
+    return results
+
+
 @router.get("/score", response_model=NewsScoreResponse)
 @limiter.limit("60/minute")
 async def get_news_score(
     request: Request,
     response: Response,
     stock: str = Query(..., description="종목 코드"),
+    days: int | None = Query(None, ge=1, le=365, description="조회 기간 (일), 미지정 시 전체"),
     db: Session = Depends(get_db),
 ):
-    """종목별 뉴스 스코어 조회."""
-    rows = db.query(NewsEvent).filter(NewsEvent.stock_code == stock).all()
-
-    if not rows:
-        return NewsScoreResponse(stock_code=stock)
-
-    total_score = sum(r.news_score for r in rows)
-    avg_score = total_score / len(rows) if rows else 0.0
-    avg_sentiment = sum(r.sentiment_score for r in rows) / len(rows) if rows else 0.0
-
-    # 최신성: 최근 뉴스일수록 높은 점수 (MVP: 단순 평균)
-    recency = avg_score
-    frequency = float(len(rows))
-    disclosure = sum(1.0 for r in rows if r.is_disclosure)
-
-    stock_name = rows[0].stock_name if rows else None
-
-    # Top 3 themes
-    themes = [r.theme for r in rows if r.theme]
-    theme_counts = {}
-    for theme in themes:
-        theme_counts[theme] = theme_counts.get(theme, 0) + 1
-    top_themes = sorted(theme_counts.keys(), key=lambda t: theme_counts[t], reverse=True)[:3]
-
-    # Updated at: max published_at
-    updated_at = max((r.published_at for r in rows if r.published_at), default=None)
-
-    # 감성별 건수
-    positive_count = sum(1 for r in rows if r.sentiment == "positive")
-    negative_count = sum(1 for r in rows if r.sentiment == "negative")
-    neutral_count = len(rows) - positive_count - negative_count
-
-    return NewsScoreResponse(
-        stock_code=stock,
-        stock_name=stock_name,
-        news_score=round(avg_score, 2),
-        recency=round(recency, 2),
-        frequency=frequency,
-        sentiment_score=round(avg_sentiment, 2),
-        disclosure=disclosure,
-        news_count=len(rows),
-        positive_count=positive_count,
-        neutral_count=neutral_count,
-        negative_count=negative_count,
-        top_themes=top_themes,
-        updated_at=updated_at,
-    )
+    """종목별 뉴스 스코어 조회 (news_daily_rollup 단일 집계 + 단기 캐시)."""
+    cache_key = (stock, days)
+    cached = news_score_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    result = _compute_news_scores(db, [stock], days)[stock]
+    news_score_cache.set(cache_key, result)
+    return result
+
+
+@router.get("/scores", response_model=list[NewsScoreResponse])
+@limiter.limit("60/minute")
+async def get_news_scores(
+    request: Request,
+    response: Response,
+    stocks: str = Query(..., description="종목 코드 목록 (쉼표 구분, 최대 300개)"),
+    days: int | None = Query(None, ge=1, le=365, description="조회 기간 (일), 미지정 시 전체"),
+    db: Session = Depends(get_db),
+):
+    """여러 종목의 뉴스 스코어 일괄 조회 (요청 순서 유지, 중복 제거).
+
+    캐시에 없는 종목만 모아 GROUP BY 집계 한 번으로 계산합니다.
+    """
+    codes = list(dict.fromkeys(code.strip() for code in stocks.split(",") if code.strip()))
+    if not codes:
+        raise HTTPException(status_code=400, detail="stocks must not be empty")
+    if len(codes) > MAX_BATCH_STOCKS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many stocks (max {MAX_BATCH_STOCKS})",
+        )
+
+    results: dict[str, NewsScoreResponse] = {}
+    for code in codes:
+        cached = news_score_cache.get((code, days))
+        if cached is not None:
+            results[code] = cached
+
+    missing = [code for code in codes if code not in results]
+    if missing:
+        computed = _compute_news_scores(db, missing, days)
+        for code, result in computed.items():
+            news_score_cache.set((code, days), result)
+        results.update(computed)
+
+    return [results[code] for code in codes]
 
 
 @router.get("/top", response_model=list[NewsTopItem])
 @limiter.limit("60/minute")
+@cached_response("news_top", tags=lambda market, **_: [f"market:{market}"])
 async def get_top_news(
     request: Request,
     response: Response,
@@ -84,23 +218,25 @@ async def get_top_news(
     date_str: str | None = Query(None, alias="date", description="날짜 (YYYY-MM-DD)"),
     db: Session = Depends(get_db),
 ):
-    """마켓별 Top 종목 뉴스 조회."""
+    """마켓별 Top 종목 뉴스 조회 (news_daily_rollup 집계)."""
+    news_count = func.sum(NewsDailyRollup.news_count)
     base_q = db.query(
-        NewsEvent.stock_code,
-        NewsEvent.stock_name,
-        func.avg(NewsEvent.news_score).label("avg_score"),
-        func.avg(NewsEvent.sentiment_score).label("avg_sentiment"),
-        func.max(NewsEvent.sentiment).label("sentiment"),
-        func.count(NewsEvent.id).label("cnt"),
-        NewsEvent.market,
-    ).filter(NewsEvent.market == market)
+        NewsDailyRollup.stock_code,
+        func.max(NewsDailyRollup.stock_name).label("stock_name"),
+        (func.sum(NewsDailyRollup.score_sum) / news_count).label("avg_score"),
+        (func.sum(NewsDailyRollup.sentiment_sum) / news_count).label("avg_sentiment"),
+        func.sum(NewsDailyRollup.positive_count).label("positive_count"),
+        func.sum(NewsDailyRollup.neutral_count).label("neutral_count"),
+        news_count.label("cnt"),
+        NewsDailyRollup.market,
+    ).filter(NewsDailyRollup.market == market)
 
     if date_str:
         from datetime import datetime as dt
         target_date = dt.strptime(date_str, "%Y-%m-%d").date()
-        base_q = base_q.filter(func.date(NewsEvent.published_at) == target_date)
+        base_q = base_q.filter(NewsDailyRollup.date == target_date)
 
-    results = base_q.group_by(NewsEvent.stock_code, NewsEvent.stock_name, NewsEvent.market).all()
+    results = base_q.group_by(NewsDailyRollup.stock_code, NewsDailyRollup.market).all()
 
     # Calculate prediction scores and sort by them
     items = []
@@ -123,7 +259,7 @@ async def get_top_news(
                 stock_code=r.stock_code,
                 stock_name=r.stock_name,
                 news_score=round(avg_score, 2),
-                sentiment=r.sentiment,
+                sentiment=_dominant_sentiment(r.positive_count, r.neutral_count),
                 news_count=r.cnt,
                 market=r.market,
                 prediction_score=round(prediction_score, 1),
@@ -136,6 +272,48 @@ async def get_top_news(
     return items[:limit]
 
 
+def _encode_cursor(published_at: datetime, news_id: int) -> str:
+    """(published_at, id) → 불투명 커서 문자열."""
+    raw = json.dumps([published_at.isoformat(), news_id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        published_at, news_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(published_at), int(news_id)
+    except (ValueError, TypeError) as err:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from err
+
+
+# NewsItem 필드 순서의 컬럼 프로젝션 (본문은 news_content 에서 압축 해제)
+_NEWS_ITEM_COLUMNS = (
+    NewsEvent.id,
+    NewsEvent.title,
+    NewsEvent.stock_code,
+    NewsEvent.stock_name,
+    NewsEvent.sentiment,
+    NewsEvent.sentiment_score,
+    NewsEvent.news_score,
+    NewsEvent.source,
+    NewsEvent.source_url,
+    NewsEvent.market,
+    NewsEvent.theme,
+    NewsContent.content_compressed,
+    NewsContent.summary,
+    NewsEvent.published_at,
+)
+
+
+def _news_item_dict(row) -> dict:
+    """_NEWS_ITEM_COLUMNS 결과 행 → NewsItem 형식 dict."""
+    item = row._asdict()
+    item["content"] = decompress_text(item.pop("content_compressed"))
+    item["sentiment_score"] = item["sentiment_score"] or 0.0
+    return item
+
+
 @router.get("/latest", response_model=NewsListResponse)
 @limiter.limit("60/minute")
 async def get_latest_news(
@@ -149,9 +327,17 @@ async def get_latest_news(
     date_to: str | None = Query(None, description="종료일 (YYYY-MM-DD)"),
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="다음 페이지 커서 (응답의 next_cursor, 지정 시 offset 무시)"),
+    include_total: bool = Query(True, description="전체 건수 포함 여부 (false면 COUNT 생략)"),
     db: Session = Depends(get_db),
 ):
-    """최신 뉴스 리스트 (페이지네이션)."""
+    """최신 뉴스 리스트 (페이지네이션).
+
+    offset 방식과 커서(keyset) 방식을 모두 지원합니다. 모든 응답의 next_cursor 를
+    다음 요청의 cursor 로 넘기면 (published_at, id) 내림차순으로
+    ix_news_event_published 인덱스를 타며 페이지 깊이와 무관하게 일정한 비용으로
+    조회합니다 (published_at 없는 뉴스는 커서 페이지에서 제외).
+    """
     query = db.query(NewsEvent)
 
     if market:
@@ -171,29 +357,80 @@ async def get_latest_news(
         theme_term = f"%{theme}%"
         query = query.filter(NewsEvent.theme.ilike(theme_term))
 
+    # 날짜 필터는 인덱스를 타도록 범위 조건 사용
     if date_from:
-        from datetime import datetime
-
         date_from_obj = datetime.strptime(date_from, "%Y-%m-%d").date()
-        query = query.filter(func.date(NewsEvent.published_at) >= date_from_obj)
+        query = query.filter(
+            NewsEvent.published_at >= datetime.combine(date_from_obj, time.min, tzinfo=UTC)
+        )
 
     if date_to:
-        from datetime import datetime
-
         date_to_obj = datetime.strptime(date_to, "%Y-%m-%d").date()
-        query = query.filter(func.date(NewsEvent.published_at) <= date_to_obj)
+        query = query.filter(
+            NewsEvent.published_at
+            < datetime.combine(date_to_obj + timedelta(days=1), time.min, tzinfo=UTC)
+        )
+
+    total = query.order_by(None).count() if include_total else None
 
-    total = query.count()
-    items = (
-        query.order_by(NewsEvent.published_at.desc())
+    if cursor:
+        cursor_published_at, cursor_id = _decode_cursor(cursor)
+        query = query.filter(
+            or_(
+                NewsEvent.published_at < cursor_published_at,
+                and_(
+                    NewsEvent.published_at == cursor_published_at,
+                    NewsEvent.id < cursor_id,
+                ),
+            )
+        )
+        offset = 0
+
+    # limit+1 건 조회로 다음 페이지 존재 여부 판단 (ORM 객체 대신 컬럼 프로젝션)
+    rows = (
+        query.with_entities(*_NEWS_ITEM_COLUMNS)
+        .outerjoin(NewsContent, NewsContent.news_id == NewsEvent.id)
+        .order_by(NewsEvent.published_at.desc(), NewsEvent.id.desc())
         .offset(offset)
-        .limit(limit)
+        .limit(limit + 1)
         .all()
     )
+    items = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit and items[-1].published_at is not None:
+        next_cursor = _encode_cursor(items[-1].published_at, items[-1].id)
+
+    return FastJSONResponse({
+        "items": [_news_item_dict(row) for row in items],
+        "total": total,
+        "offset": offset,
+        "limit": limit,
+        "next_cursor": next_cursor,
+    })
 
-    return NewsListResponse(
+
+@router.get("/search", response_model=NewsSearchResponse)
+@limiter.limit("60/minute")
+async def search_news_endpoint(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (제목/요약/종목명/테마)"),
+    market: str | None = Query(None, description="마켓 필터 (KR/US)"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    include_total: bool = Query(True, description="전체 건수 포함 여부 (false면 COUNT 생략)"),
+    db: Session = Depends(get_db),
+):
+    """뉴스 전문 검색 (news_search 역색인, 관련도순).
+
+    한국어는 2-gram 단위로 매칭되므로 2자 이상 검색어를 권장합니다.
+    """
+    results, total = search_news(
+        db, q, market=market, offset=offset, limit=limit, include_total=include_total
+    )
+    return NewsSearchResponse(
         items=[
-            NewsItem(
+            NewsSearchItem(
                 id=row.id,
                 title=row.title,
                 stock_code=row.stock_code,
@@ -207,8 +444,9 @@ async def get_latest_news(
                 content=row.content,
                 summary=row.summary,
                 published_at=row.published_at,
+                rank=rank,
             )
-            for row in items
+            for row, rank in results
         ],
         total=total,
         offset=offset,
@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from app.core.auth import verify_api_key
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.limiter import limiter
 from app.processing.llm_predictor import predict_with_llm
 from app.processing.prediction_context_builder import (
@@ -68,9 +68,9 @@ async def rebuild_prediction_context(
     response: Response,
     days: int = Query(30, description="분석 기간 (일)", ge=1, le=365),
     market: str | None = Query(None, description="KR or US (optional)"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
-    """예측 컨텍스트 리빌드."""
+    """예측 컨텍스트 리빌드 (분석 쿼리 — read replica 사용)."""
     context = build_and_save_prediction_context(db, days=days, output_path=DEFAULT_CONTEXT_PATH)
 
     return ContextRebuildResponse(
@@ -49,6 +49,16 @@ JOB_METADATA = {
         "job_type": "verification",
         "schedule_description": "평일 21:30 UTC (16:30 EST)",
     },
+    "news_partition_maintenance": {
+        "name": "뉴스 파티션 관리",
+        "job_type": "maintenance",
+        "schedule_description": "매일 00:30 UTC",
+    },
+    "parquet_archive_export": {
+        "name": "분석 데이터 Parquet 아카이브",
+        "job_type": "maintenance",
+        "schedule_description": "매일 01:00 UTC",
+    },
 }
 
 router = APIRouter(
@@ -7,7 +7,8 @@ from sqlalchemy.orm import Session
 from app.core.auth import verify_api_key
 from app.core.database import get_db
 from app.core.limiter import limiter
-from app.models.news_event import NewsEvent
+from app.core.response_cache import cached_response
+from app.models.news_rollup import NewsDailyRollup
 from app.schemas.common import TimelinePoint
 
 router = APIRouter(
@@ -19,6 +20,7 @@ router = APIRouter(
 
 @router.get("/{stock_code}/timeline", response_model=list[TimelinePoint])
 @limiter.limit("60/minute")
+@cached_response("stock_timeline", tags=lambda stock_code, **_: [f"stock:{stock_code}"])
 async def get_stock_timeline(
     request: Request,
     response: Response,
@@ -26,17 +28,17 @@ async def get_stock_timeline(
     days: int = Query(7, ge=1, le=90, description="조회 일수"),
     db: Session = Depends(get_db),
 ):
-    """종목별 뉴스 스코어 타임라인."""
-    date_col = func.date(NewsEvent.published_at)
+    """종목별 뉴스 스코어 타임라인 (news_daily_rollup 일자별 집계)."""
     results = (
         db.query(
-            date_col.label("date"),
-            func.avg(NewsEvent.news_score).label("score"),
+            NewsDailyRollup.date,
+            (
+                func.sum(NewsDailyRollup.score_sum) / func.sum(NewsDailyRollup.news_count)
+            ).label("score"),
         )
-        .filter(NewsEvent.stock_code == stock_code)
-        .filter(NewsEvent.published_at.isnot(None))
-        .group_by(date_col)
-        .order_by(date_col.desc())
+        .filter(NewsDailyRollup.stock_code == stock_code)
+        .group_by(NewsDailyRollup.date)
+        .order_by(NewsDailyRollup.date.desc())
         .limit(days)
         .all()
     )
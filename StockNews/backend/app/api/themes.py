@@ -4,13 +4,14 @@ import json
 from datetime import date
 
 from fastapi import APIRouter, Depends, Query, Request, Response
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.core.auth import verify_api_key
 from app.core.database import get_db
 from app.core.limiter import limiter
+from app.core.response_cache import cached_response
 from app.models.news_event import NewsEvent
+from app.processing.theme_strength_engine import theme_strength_engine
 from app.schemas.theme import ThemeItem
 
 router = APIRouter(
@@ -30,130 +31,32 @@ async def get_theme_strength(
     date_str: str | None = Query(None, alias="date", description="날짜 (YYYY-MM-DD)"),
     db: Session = Depends(get_db),
 ):
-    """테마 강도 순위 조회 (news_event에서 실시간 집계, 복합 테마 분리).
+    """테마 강도 순위 조회 (인메모리 테마 강도 엔진, 복합 테마 분리).
 
     rise_index는 국내(KR)+국외(US) 뉴스를 모두 고려하여 0-100으로 산출.
     """
-    # Build base filter conditions
-    base_filters = [NewsEvent.theme.isnot(None), NewsEvent.theme != ""]
-    if date_str:
-        from datetime import datetime as dt
-        target_date = dt.strptime(date_str, "%Y-%m-%d").date()
-        base_filters.append(func.date(NewsEvent.published_at) == target_date)
-
-    # 1) 전체 뉴스 조회 (market 무관) — rise_index 계산용
-    all_rows = db.query(
-        NewsEvent.theme,
-        NewsEvent.sentiment_score,
-        NewsEvent.news_score,
-        NewsEvent.market,
-    ).filter(*base_filters).all()
-
-    # 전체 데이터에서 테마별 KR/US 분리 집계
-    global_data: dict[str, dict[str, list[tuple[float, float]]]] = {}
-    for theme_str, sentiment_score, news_score, mkt in all_rows:
-        for t in theme_str.split(","):
-            t = t.strip()
-            if not t:
-                continue
-            if t not in global_data:
-                global_data[t] = {"KR": [], "US": []}
-            key = mkt if mkt in ("KR", "US") else "KR"
-            global_data[t][key].append((sentiment_score, news_score))
-
-    # Also query US news with cross-market impact data
-    us_filter = [NewsEvent.market == "US", NewsEvent.kr_impact_themes.isnot(None)]
-    if date_str:
-        us_filter.append(func.date(NewsEvent.published_at) == target_date)
-
-    us_impact_rows = db.query(
-        NewsEvent.kr_impact_themes,
-        NewsEvent.news_score,
-    ).filter(*us_filter).all()
-
-    # Incorporate US cross-market impacts into global data
-    for kr_impact_json, news_score in us_impact_rows:
-        try:
-            impacts = json.loads(kr_impact_json)
-            for imp in impacts:
-                theme_name = imp.get("theme", "")
-                impact_val = imp.get("impact", 0)
-                direction = imp.get("direction", "neutral")
-                if not theme_name:
-                    continue
-                if direction == "up":
-                    sentiment = impact_val
-                elif direction == "down":
-                    sentiment = -impact_val
-                else:
-                    sentiment = 0.0
-                if theme_name not in global_data:
-                    global_data[theme_name] = {"KR": [], "US": []}
-                global_data[theme_name]["US"].append((sentiment, news_score * impact_val))
-        except (json.JSONDecodeError, TypeError):
-            continue
-
-    # rise_index 계산: KR 60% + US 40% 가중 (뉴스 없는 마켓은 0)
-    def calc_rise_index(theme_key: str) -> float:
-        d = global_data.get(theme_key, {"KR": [], "US": []})
-        kr, us = d["KR"], d["US"]
-
-        def market_score(items: list[tuple[float, float]]) -> float:
-            if not items:
-                return 0.0
-            avg_sent = sum(s for s, _ in items) / len(items)
-            avg_news = sum(n for _, n in items) / len(items)
-            return avg_news * 0.6 + (avg_sent + 1) * 20
-
-        kr_score = market_score(kr)
-        us_score = market_score(us)
-
-        # 가중 배합 (두 마켓 모두 데이터 있으면 KR 60% + US 40%)
-        if kr and us:
-            combined = kr_score * 0.6 + us_score * 0.4
-        elif kr:
-            combined = kr_score
-        else:
-            combined = us_score
-
-        return round(min(100, max(0, combined)), 1)
-
-    # 2) 마켓 필터 적용된 데이터로 표시 항목 구성
-    theme_data: dict[str, list[tuple[float, float]]] = {}
-    for theme_str, sentiment_score, news_score, mkt in all_rows:
-        if market and mkt != market:
-            continue
-        for t in theme_str.split(","):
-            t = t.strip()
-            if not t:
-                continue
-            if t not in theme_data:
-                theme_data[t] = []
-            theme_data[t].append((sentiment_score, news_score))
-
+    theme_strength_engine.ensure_loaded(db)
+    target_date = date.fromisoformat(date_str) if date_str else None
     result_date = date_str if date_str else str(date.today())
 
-    items = []
-    for theme, scores in theme_data.items():
-        news_count = len(scores)
-        avg_sentiment = sum(s for s, _ in scores) / news_count
-        avg_news_score = sum(n for _, n in scores) / news_count
-        items.append(ThemeItem(
-            theme=theme,
-            strength_score=round(avg_news_score, 2),
-            news_count=news_count,
-            sentiment_avg=round(avg_sentiment, 3),
-            rise_index=calc_rise_index(theme),
-            date=result_date,
-            market=market or "ALL",
-        ))
-
-    items.sort(key=lambda x: x.rise_index, reverse=True)
-    return items[:limit]
+    return [
+        ThemeItem(**item, date=result_date, market=market or "ALL")
+        for item in theme_strength_engine.strength(market=market, day=target_date)[:limit]
+    ]
+
+
+def _theme_news_tags(theme: str, **_) -> list[str]:
+    """/theme/news 캐시 태그.
+
+    조회가 ilike 부분 일치라 저장된 테마명 태그(theme:{정확한 이름})만으로는 무효화되지
+    않는 질의가 있으므로 모든 뉴스 저장 시 붙는 market:ALL 로도 태깅합니다.
+    """
+    return [f"theme:{theme}", "market:ALL"]
 
 
 @router.get("/news", response_model=dict)
 @limiter.limit("60/minute")
+@cached_response("theme_news", tags=_theme_news_tags)
 async def get_theme_news(
     request: Request,
     response: Response,
@@ -167,6 +70,7 @@ async def get_theme_news(
     # 1) 국내 뉴스: theme 컬럼에 해당 테마 포함
     kr_rows = (
         db.query(NewsEvent)
+        .options(selectinload(NewsEvent.body))
         .filter(NewsEvent.theme.ilike(f"%{theme}%"))
         .order_by(NewsEvent.published_at.desc())
         .limit(limit)
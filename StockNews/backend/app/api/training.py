@@ -1,22 +1,29 @@
 """학습 데이터 조회/내보내기 API."""
 
+import asyncio
 import json
 import logging
+import threading
 from datetime import date, timedelta
 
-from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.core.auth import verify_api_key
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.limiter import limiter
+from app.core.serialization import FastJSONResponse, rows_to_dicts
 from app.models.training import StockTrainingData
 from app.processing.feature_config import get_features_for_tier, get_min_samples_for_tier
 from app.processing.ml_evaluator import MLEvaluator
 from app.processing.ml_trainer import MLTrainer
 from app.processing.model_registry import ModelRegistry
-from app.processing.training_data_builder import export_training_csv
+from app.processing.model_server import get_model_server
+from app.processing.parquet_archive import require_pyarrow
+from app.processing.training_data_builder import iter_training_arrow, iter_training_csv
 from app.schemas.training import (
     TrainingDataItem,
     TrainingDataResponse,
@@ -32,6 +39,11 @@ router = APIRouter(
 )
 
 
+# TrainingDataItem 필드와 동일한 순서의 컬럼 프로젝션
+_TRAINING_DATA_FIELDS = tuple(TrainingDataItem.model_fields)
+_TRAINING_DATA_COLUMNS = tuple(getattr(StockTrainingData, f) for f in _TRAINING_DATA_FIELDS)
+
+
 @router.get("/data", response_model=TrainingDataResponse)
 @limiter.limit("30/minute")
 async def get_training_data(
@@ -47,8 +59,8 @@ async def get_training_data(
     ed = date.fromisoformat(end_date) if end_date else date.today()
     sd = date.fromisoformat(start_date) if start_date else ed - timedelta(days=30)
 
-    records = (
-        db.query(StockTrainingData)
+    rows = (
+        db.query(*_TRAINING_DATA_COLUMNS)
         .filter(
             StockTrainingData.market == market,
             StockTrainingData.prediction_date >= sd,
@@ -62,58 +74,23 @@ async def get_training_data(
         .all()
     )
 
-    data = [
-        TrainingDataItem(
-            prediction_date=r.prediction_date,
-            stock_code=r.stock_code,
-            stock_name=r.stock_name,
-            market=r.market,
-            news_score=r.news_score,
-            sentiment_score=r.sentiment_score,
-            news_count=r.news_count,
-            news_count_3d=r.news_count_3d,
-            avg_score_3d=r.avg_score_3d,
-            disclosure_ratio=r.disclosure_ratio,
-            sentiment_trend=r.sentiment_trend,
-            theme=r.theme,
-            prev_close=r.prev_close,
-            prev_change_pct=r.prev_change_pct,
-            prev_volume=r.prev_volume,
-            price_change_5d=r.price_change_5d,
-            volume_change_5d=r.volume_change_5d,
-            ma5_ratio=r.ma5_ratio,
-            ma20_ratio=r.ma20_ratio,
-            volatility_5d=r.volatility_5d,
-            rsi_14=r.rsi_14,
-            bb_position=r.bb_position,
-            market_index_change=r.market_index_change,
-            market_return=r.market_return,
-            vix_change=r.vix_change,
-            usd_krw_change=r.usd_krw_change,
-            has_earnings_disclosure=r.has_earnings_disclosure,
-            cross_theme_score=r.cross_theme_score,
-            foreign_net_ratio=r.foreign_net_ratio,
-            sector_index_change=r.sector_index_change,
-            day_of_week=r.day_of_week,
-            predicted_direction=r.predicted_direction,
-            predicted_score=r.predicted_score,
-            confidence=r.confidence,
-            actual_close=r.actual_close,
-            actual_change_pct=r.actual_change_pct,
-            actual_direction=r.actual_direction,
-            actual_volume=r.actual_volume,
-            is_correct=r.is_correct,
-        )
-        for r in records
-    ]
+    # 최대 10,000행 — 행별 Pydantic 모델 생성 없이 튜플 → dict → orjson
+    data = rows_to_dicts(rows, _TRAINING_DATA_FIELDS)
+    return FastJSONResponse({
+        "market": market,
+        "start_date": sd,
+        "end_date": ed,
+        "total": len(data),
+        "data": data,
+    })
 
-    return TrainingDataResponse(
-        market=market,
-        start_date=sd,
-        end_date=ed,
-        total=len(data),
-        data=data,
-    )
+
+# format → (media_type, 파일 확장자)
+_EXPORT_FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+}
 
 
 @router.get("/export")
@@ -124,19 +101,31 @@ async def export_training(
     market: str = Query("KR", description="KR or US"),
     start_date: str | None = Query(None, description="YYYY-MM-DD"),
     end_date: str | None = Query(None, description="YYYY-MM-DD"),
+    format: str = Query("csv", pattern="^(csv|parquet|arrow)$", description="csv, parquet, arrow (IPC stream)"),
     db: Session = Depends(get_db),
 ):
-    """학습 데이터 CSV 내보내기."""
+    """학습 데이터 스트리밍 내보내기 (CSV / Parquet / Arrow IPC stream).
+
+    서버 사이드 커서로 배치 단위 조회 후 바로 전송하므로 기간과 무관하게 메모리 사용량이 일정합니다.
+    """
     ed = date.fromisoformat(end_date) if end_date else date.today()
     sd = date.fromisoformat(start_date) if start_date else ed - timedelta(days=30)
 
-    csv_content = export_training_csv(db, market, sd, ed)
-
-    return Response(
-        content=csv_content,
-        media_type="text/csv",
+    if format == "csv":
+        content = iter_training_csv(db, market, sd, ed)
+    else:
+        try:
+            require_pyarrow()
+        except ImportError as e:
+            raise HTTPException(status_code=503, detail=str(e)) from e
+        content = iter_training_arrow(db, market, sd, ed, fmt=format)
+
+    media_type, extension = _EXPORT_FORMATS[format]
+    return StreamingResponse(
+        content,
+        media_type=media_type,
         headers={
-            "Content-Disposition": f"attachment; filename=training_{market}_{sd}_{ed}.csv"
+            "Content-Disposition": f"attachment; filename=training_{market}_{sd}_{ed}.{extension}"
         },
     )
 
@@ -234,6 +223,10 @@ async def trigger_backfill(
     }
 
 
+# tune=true 탐색 동시 실행 방지 (API worker 프로세스 단위)
+_tuning_lock = threading.Lock()
+
+
 @router.post("/train")
 @limiter.limit("5/minute")
 async def train_model(
@@ -242,9 +235,15 @@ async def train_model(
     market: str = Query("KR", description="KR or US"),
     model_type: str = Query("lightgbm", description="lightgbm or random_forest"),
     feature_tier: int = Query(1, ge=1, le=3, description="Feature tier"),
+    tune: bool = Query(False, description="Hyperparameter search before final fit"),
+    n_trials: int = Query(20, ge=1, le=200, description="Search trials (tune=true)"),
     db: Session = Depends(get_db),
 ):
-    """모델 학습 실행."""
+    """모델 학습 실행.
+
+    tune=true 이면 병렬 random search + successive halving 으로 하이퍼파라미터를 탐색하고
+    (trial 전체를 레지스트리에 기록) 최적 파라미터로 최종 학습합니다.
+    """
     features = get_features_for_tier(feature_tier)
     min_samples = get_min_samples_for_tier(feature_tier)
 
@@ -269,13 +268,41 @@ async def train_model(
             "feature_tier": feature_tier,
         }
 
+    registry = ModelRegistry()
+    params: dict = {}
+    tuning = None
+    if tune:
+        # 탐색은 프로세스 풀을 띄우므로 API worker 당 1건만 실행
+        if not _tuning_lock.acquire(blocking=False):
+            raise HTTPException(status_code=409, detail="Hyperparameter search already running")
+        try:
+            # 수 분 걸릴 수 있어 이벤트 루프를 막지 않도록 스레드에서 실행
+            search = await asyncio.to_thread(
+                trainer.search_hyperparameters, X, y, model_type=model_type, n_trials=n_trials,
+                n_jobs=settings.tuning_workers or None,
+            )
+        finally:
+            _tuning_lock.release()
+        params = search["best_params"]
+        study_id = registry.record_trials(
+            search["trials"],
+            {"model_type": model_type, "market": market, "feature_tier": feature_tier},
+            db,
+        )
+        tuning = {
+            "study_id": study_id,
+            "best_trial": search["best_trial"],
+            "best_cv_accuracy": search["best_accuracy"],
+            "n_trials_completed": search["n_trials_completed"],
+            "n_trials_pruned": search["n_trials_pruned"],
+        }
+
     if model_type == "lightgbm":
-        result = trainer.train_lightgbm(X, y)
+        result = trainer.train_lightgbm(X, y, **params)
     else:
-        result = trainer.train_random_forest(X, y)
+        result = trainer.train_random_forest(X, y, **params)
 
     # Save to registry
-    registry = ModelRegistry()
     model_id = registry.save(
         model=result["model"],
         metadata={
@@ -291,7 +318,9 @@ async def train_model(
             "cv_std": result["cv_std"],
             "train_samples": len(X),
             "test_samples": None,
-            "hyperparameters": {},
+            "train_start_date": trainer.sample_dates.min().astype(object),
+            "train_end_date": trainer.sample_dates.max().astype(object),
+            "hyperparameters": params,
             "feature_importances": result.get("feature_importances"),
         },
         db=db,
@@ -309,6 +338,7 @@ async def train_model(
         "cv_std": round(result["cv_std"], 4),
         "samples": len(X),
         "features": len(features),
+        "tuning": tuning,
     }
 
 
@@ -355,12 +385,10 @@ async def activate_model(
     model_id: int,
     db: Session = Depends(get_db),
 ):
-    """모델 활성화."""
-    registry = ModelRegistry()
+    """모델 활성화 (예측 서버 캐시에 선적재 후 교체)."""
     try:
-        registry.activate(model_id, db)
+        get_model_server().activate(model_id, db)
     except ValueError as e:
-        from fastapi import HTTPException
         raise HTTPException(status_code=404, detail=str(e)) from e
 
     return {"status": "activated", "model_id": model_id}
@@ -389,7 +417,7 @@ async def evaluate_model(
     if X.empty:
         return {"status": "no_data", "market": market}
 
-    model = registry.load(active.id, db)
+    model = get_model_server().get(active, db).model
     evaluator = MLEvaluator()
     result = evaluator.evaluate(model, X, y)
 
@@ -402,6 +430,49 @@ async def evaluate_model(
     }
 
 
+@router.post("/refresh")
+@limiter.limit("5/minute")
+async def refresh_model(
+    request: Request,
+    response: Response,
+    market: str = Query("KR", description="KR or US"),
+    n_estimators: int | None = Query(None, ge=1, le=1000, description="Boosting rounds to add"),
+    db: Session = Depends(get_db),
+):
+    """활성 LightGBM 모델 warm-start 갱신 (현재 모델보다 나을 때만 교체)."""
+    from app.processing.model_refresh import refresh_active_model
+
+    return refresh_active_model(db, market, n_estimators=n_estimators)
+
+
+@router.post("/predict")
+@limiter.limit("30/minute")
+async def predict_batch(
+    request: Request,
+    response: Response,
+    market: str = Query("KR", description="KR or US"),
+    prediction_date: date | None = Query(None, description="Feature snapshot date (default: today)"),
+    stock_codes: list[str] | None = Query(None, description="Stocks to predict (default: all)"),
+    db: Session = Depends(get_db),
+):
+    """활성 모델로 일자별 피처 스냅샷 일괄 예측 (종목 전체를 한 번의 추론으로)."""
+    target = prediction_date or date.today()
+    try:
+        result = get_model_server().predict_batch(db, market, target, stock_codes)
+    except ValueError as e:
+        raise HTTPException(status_code=503, detail=str(e)) from e
+
+    if result is None:
+        return {"status": "no_active_model", "market": market}
+
+    return {
+        "status": "predicted",
+        "market": market,
+        "prediction_date": target.isoformat(),
+        **result,
+    }
+
+
 @router.get("/monitor")
 @limiter.limit("30/minute")
 async def monitor_models(
@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 from app.core.auth import verify_api_key
 from app.core.database import get_db
 from app.core.limiter import limiter
+from app.core.response_cache import cached_response
 from app.models.verification import (
     DailyPredictionResult,
     ThemePredictionAccuracy,
@@ -90,6 +91,7 @@ async def get_daily_results(
 
 @router.get("/accuracy", response_model=AccuracyResponse)
 @limiter.limit("60/minute")
+@cached_response("verification_accuracy", tags=lambda **_: ["verification"])
 async def get_accuracy_summary(
     request: Request,
     response: Response,
@@ -1,13 +1,25 @@
-"""WebSocket 실시간 뉴스 스트림 엔드포인트."""
+"""WebSocket 실시간 뉴스 스트림 엔드포인트 (연결별 송신 큐 팬아웃, 구독 필터, 재접속 재생)."""
 
 import asyncio
 import contextlib
 import logging
+from collections import deque
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from prometheus_client import Counter
+from pydantic import ValidationError
 
-from app.core.pubsub import subscribe_and_broadcast
+from app.core.config import settings
+from app.core.pubsub import (
+    is_stream_id,
+    read_breaking_stream,
+    stream_id_key,
+    subscribe_and_broadcast,
+)
 from app.core.redis import get_async_redis
+from app.core.serialization import dumps
+from app.core.subscriptions import SubscriptionIndex
+from app.schemas.pubsub import SubscriptionFilter
 
 logger = logging.getLogger(__name__)
 
@@ -16,37 +28,182 @@ router = APIRouter()
 # Redis 구독 태스크
 _redis_task: asyncio.Task | None = None
 
-MAX_WS_CONNECTIONS = 100
+MAX_WS_CONNECTIONS = settings.ws_max_connections
 
-# 활성 연결 관리
-_active_connections: list[WebSocket] = []
+# 느린 소비자 연결 종료 코드 (1013 Try Again Later)
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+ws_dropped_messages_total = Counter(
+    "stocknews_ws_dropped_messages_total",
+    "WebSocket messages dropped because a client send queue was full",
+)
+ws_slow_clients_total = Counter(
+    "stocknews_ws_slow_clients_total",
+    "WebSocket clients disconnected as slow consumers",
+    ["reason"],
+)
+
+
+class ClientConnection:
+    """WebSocket 1개 연결의 송신 큐 + writer 태스크."""
+
+    def __init__(self, ws: WebSocket, queue_size: int):
+        self.ws = ws
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self.writer: asyncio.Task | None = None
+        # 재생 중 도착한 실시간 메시지 [(event_id, payload)] — None 이면 재생 중 아님
+        self._pending: deque[tuple[str | None, str]] | None = None
+
+    def start(self) -> None:
+        self.writer = asyncio.create_task(self._write_loop())
+
+    def enqueue(self, payload: str, event_id: str | None = None) -> bool:
+        """직렬화된 메시지 적재. 큐(재생 중이면 보류 버퍼) 포화 시 가장 오래된 메시지를 버림.
+
+        Returns:
+            드롭 누적이 한도 미만이면 True, 느린 소비자로 판정되면 False
+        """
+        if self._pending is not None:
+            if len(self._pending) >= self.queue.maxsize:
+                self._pending.popleft()
+                self._count_drop()
+            self._pending.append((event_id, payload))
+        else:
+            if self.queue.full():
+                self.queue.get_nowait()
+                self.queue.task_done()
+                self._count_drop()
+            self.queue.put_nowait(payload)
+        return self.dropped < settings.ws_max_dropped_messages
+
+    def _count_drop(self) -> None:
+        self.dropped += 1
+        ws_dropped_messages_total.inc()
+
+    def send(self, message: dict) -> bool:
+        return self.enqueue(dumps(message).decode())
+
+    def begin_replay(self) -> None:
+        """재생 시작 — 이후 실시간 메시지는 재생이 끝날 때까지 보류 (큐 크기까지)."""
+        self._pending = deque()
+
+    def end_replay(self, messages: list[dict], last_event_id: str | None) -> bool:
+        """재생 메시지 적재 후 보류된 실시간 메시지 중 last_event_id 이후 것만 이어서 적재.
+
+        Returns:
+            드롭 누적이 한도 미만이면 True, 느린 소비자로 판정되면 False
+        """
+        pending, self._pending = self._pending or deque(), None
+        for message in messages:
+            self.send(message)
+        for event_id, payload in pending:
+            if event_id and last_event_id and stream_id_key(event_id) <= stream_id_key(last_event_id):
+                continue
+            self.enqueue(payload)
+        return self.dropped < settings.ws_max_dropped_messages
+
+    async def _write_loop(self) -> None:
+        while True:
+            payload = await self.queue.get()
+            try:
+                async with asyncio.timeout(settings.ws_send_timeout):
+                    await self.ws.send_text(payload)
+            except TimeoutError:
+                logger.warning("WebSocket send timed out, disconnecting slow client")
+                ws_slow_clients_total.labels(reason="timeout").inc()
+                await _disconnect(self.ws, SLOW_CONSUMER_CLOSE_CODE)
+                return
+            except Exception:
+                await _remove_connection(self.ws)
+                return
+            finally:
+                self.queue.task_done()
+
+    async def stop(self) -> None:
+        """writer 태스크 취소 (writer 자신에서 호출된 경우 제외)."""
+        writer = self.writer
+        if writer is None or writer.done() or writer is asyncio.current_task():
+            return
+        writer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await writer
+
+
+# 활성 연결 관리 (WebSocket → ClientConnection)
+_active_connections: dict[WebSocket, ClientConnection] = {}
+
+# 연결별 구독 필터 (WebSocket → SubscriptionFilter | None)
+_subscriptions = SubscriptionIndex()
+
+# 팬아웃 경로 밖에서 진행 중인 연결 종료 태스크 (완료 전 GC 방지용 참조)
+_disconnect_tasks: set[asyncio.Task] = set()
 
 
 async def _add_connection(ws: WebSocket) -> bool:
-    """연결 추가. 최대치 초과 시 False 반환."""
+    """연결 추가 및 writer 시작. 최대치 초과 시 False 반환."""
     if len(_active_connections) >= MAX_WS_CONNECTIONS:
         return False
-    _active_connections.append(ws)
+    client = ClientConnection(ws, settings.ws_send_queue_size)
+    _active_connections[ws] = client
+    _subscriptions.assign(ws)
+    client.start()
     return True
 
 
 async def _remove_connection(ws: WebSocket):
-    """연결 제거."""
-    if ws in _active_connections:
-        _active_connections.remove(ws)
+    """연결 제거 (writer 태스크 정리)."""
+    client = _active_connections.pop(ws, None)
+    _subscriptions.remove(ws)
+    if client is not None:
+        await client.stop()
+
+
+async def _disconnect(ws: WebSocket, code: int):
+    """연결 제거 후 소켓 종료 (수신 루프가 끝나며 엔드포인트 정리)."""
+    await _remove_connection(ws)
+    with contextlib.suppress(Exception):
+        await ws.close(code=code)
+
+
+async def _close(ws: WebSocket, client: ClientConnection | None, code: int):
+    """이미 제거된 연결의 writer 정리 후 소켓 종료."""
+    if client is not None:
+        await client.stop()
+    with contextlib.suppress(Exception):
+        await ws.close(code=code)
+
+
+def _schedule_disconnect(ws: WebSocket, code: int) -> None:
+    """연결을 즉시 제거하고 소켓 종료는 백그라운드 태스크로 실행 (브로드캐스트 대기 없음)."""
+    client = _active_connections.pop(ws, None)
+    _subscriptions.remove(ws)
+    task = asyncio.create_task(_close(ws, client, code))
+    _disconnect_tasks.add(task)
+    task.add_done_callback(_disconnect_tasks.discard)
+
+
+def _disconnect_slow_consumer(ws: WebSocket) -> None:
+    """드롭 한도에 도달한 연결을 느린 소비자로 종료."""
+    logger.warning("WebSocket client dropped too many messages, disconnecting")
+    ws_slow_clients_total.labels(reason="queue_full").inc()
+    _schedule_disconnect(ws, SLOW_CONSUMER_CLOSE_CODE)
 
 
 async def broadcast(message: dict):
-    """모든 활성 WebSocket에 메시지 브로드캐스트."""
-    disconnected = []
-    for ws in _active_connections:
-        try:
-            await ws.send_json(message)
-        except Exception:
-            disconnected.append(ws)
-
-    for ws in disconnected:
-        await _remove_connection(ws)
+    """구독 필터에 맞는 WebSocket 송신 큐에 메시지 적재 (직렬화 1회, 송신 대기 없음)."""
+    targets = [
+        (ws, client) for ws in _subscriptions.match(message)
+        if (client := _active_connections.get(ws)) is not None
+    ]
+    if not targets:
+        return
+    payload = dumps(message).decode()
+    event_id = message.get("event_id")
+    slow = [ws for ws, client in targets if not client.enqueue(payload, event_id)]
+
+    for ws in slow:
+        _disconnect_slow_consumer(ws)
 
 
 async def _start_redis_subscriber():
@@ -70,8 +227,57 @@ async def _stop_redis_subscriber():
         logger.info("Stopped Redis subscriber task")
 
 
+def _subscribe(ws: WebSocket, client: ClientConnection, data: dict) -> None:
+    """subscribe 메시지 처리 — 필터 검증 후 인덱스 교체."""
+    try:
+        flt = SubscriptionFilter.model_validate(data)
+    except ValidationError as e:
+        client.send({
+            "type": "error",
+            "message": "invalid subscription filter",
+            "detail": e.errors(include_url=False, include_context=False, include_input=False),
+        })
+        return
+    if ws not in _active_connections:
+        return
+    _subscriptions.assign(ws, flt)
+    client.send({"type": "subscribed", "filters": flt.model_dump(mode="json")})
+
+
+async def _resume(ws: WebSocket, client: ClientConnection, last_event_id: str) -> None:
+    """last_event_id 이후 누락 속보 재생 후 실시간 전송 재개."""
+    if not is_stream_id(last_event_id):
+        client.send({"type": "error", "message": "invalid last_event_id"})
+        return
+
+    client.begin_replay()
+    messages: list[dict] = []
+    truncated = False
+    try:
+        messages, truncated = await read_breaking_stream(
+            get_async_redis(), last_event_id, settings.ws_replay_max_messages
+        )
+    except Exception as e:
+        logger.warning("Breaking stream replay failed: %s", e)
+        truncated = True
+
+    replayed = [m for m in messages if _subscriptions.accepts(ws, m)]
+    last_id = messages[-1]["event_id"] if messages else last_event_id
+    ok = client.end_replay(
+        [*replayed, {
+            "type": "replayed",
+            "count": len(replayed),
+            "last_event_id": last_id,
+            "truncated": truncated,
+        }],
+        last_id,
+    )
+    if not ok and ws in _active_connections:
+        _disconnect_slow_consumer(ws)
+
+
 @router.websocket("/ws/news")
-async def websocket_news(ws: WebSocket):
+async def websocket_news(ws: WebSocket, last_event_id: str | None = None):
     """실시간 뉴스 WebSocket 엔드포인트."""
     await ws.accept()
 
@@ -80,19 +286,33 @@ async def websocket_news(ws: WebSocket):
         await ws.close()
         return
 
+    # 이후 송신은 모두 writer 태스크 경유 (소켓 동시 송신 방지)
+    client = _active_connections[ws]
+
     # Redis 구독 시작 (첫 클라이언트 연결 시)
     if len(_active_connections) == 1:
         await _start_redis_subscriber()
 
     # Welcome 메시지
-    await ws.send_json({"type": "connected", "message": "StockNews WebSocket connected"})
+    client.send({"type": "connected", "message": "StockNews WebSocket connected"})
 
     try:
+        if last_event_id:
+            await _resume(ws, client, last_event_id)
+
         while True:
             data = await ws.receive_json()
 
-            if data.get("type") == "ping":
-                await ws.send_json({"type": "pong"})
+            msg_type = data.get("type")
+            if msg_type == "ping":
+                client.send({"type": "pong"})
+            elif msg_type == "subscribe":
+                _subscribe(ws, client, data)
+            elif msg_type == "unsubscribe":
+                _subscriptions.assign(ws)
+                client.send({"type": "unsubscribed"})
+            elif msg_type == "resume":
+                await _resume(ws, client, str(data.get("last_event_id") or ""))
 
     except WebSocketDisconnect:
         logger.info("WebSocket client disconnected")
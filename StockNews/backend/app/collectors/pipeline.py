@@ -15,6 +15,7 @@ from sqlalchemy.orm import Session
 
 from app.collectors.quality_tracker import ItemResult, tracker
 from app.core.config import settings
+from app.core.response_cache import invalidate_tags, news_event_tags
 from app.models.news_event import NewsEvent
 from app.processing.article_scraper import ArticleScraper
 from app.processing.dedup import deduplicate
@@ -164,6 +165,7 @@ async def _process_single_item(
     scraper: ArticleScraper,
     redis_client,
     semaphore: asyncio.Semaphore,
+    saved_events: list[NewsEvent] | None = None,
 ) -> bool:
     """단일 아이템의 전체 파이프라인 (스크래핑→분석→저장→발행).
 
@@ -256,6 +258,8 @@ async def _process_single_item(
             )
             db.add(event)
             db.flush()
+            if saved_events is not None:
+                saved_events.append(event)
 
             # Quality tracking
             tracker.record(ItemResult(
@@ -322,8 +326,9 @@ async def process_collected_items(
     redis_client = _get_redis_client()
     semaphore = asyncio.Semaphore(PIPELINE_CONCURRENCY)
 
+    saved_events: list[NewsEvent] = []
     tasks = [
-        _process_single_item(item, market, db, scraper, redis_client, semaphore)
+        _process_single_item(item, market, db, scraper, redis_client, semaphore, saved_events)
         for item in unique_items
     ]
     results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -333,6 +338,10 @@ async def process_collected_items(
     db.commit()
     logger.info("Pipeline complete: %d/%d items saved", saved_count, len(unique_items))
 
+    # 3. 응답 캐시 무효화 (저장된 뉴스의 market/stock/theme 태그)
+    if redis_client and saved_events:
+        invalidate_tags(news_event_tags(saved_events), client=redis_client)
+
     if redis_client:
         with contextlib.suppress(Exception):
             redis_client.close()
@@ -254,6 +254,61 @@ def _daily_stock_selection_job():
         raise
 
 
+def _partition_maintenance_job():
+    """news_event 파티션 사전 생성 + 보관 기간 지난 파티션 아카이브."""
+    import time
+
+    from app.core.database import SessionLocal
+    from app.core.partitioning import run_partition_maintenance
+    from app.core.scheduler_state import record_job_run
+
+    start = time.time()
+    db = SessionLocal()
+    try:
+        result = run_partition_maintenance(
+            db,
+            months_ahead=settings.news_partition_months_ahead,
+            retention_months=settings.news_retention_months,
+        )
+        logger.info(
+            "Partition maintenance: %d created, %d archived",
+            len(result["created"]),
+            len(result["archived"]),
+        )
+        record_job_run("news_partition_maintenance", "success", time.time() - start)
+    except Exception as e:
+        db.rollback()
+        record_job_run("news_partition_maintenance", "failed", time.time() - start, str(e))
+        logger.error("Partition maintenance failed: %s", e)
+    finally:
+        db.close()
+
+
+def _parquet_archive_job():
+    """분석용 테이블 전일자 Parquet 아카이브 내보내기."""
+    import time
+
+    from app.core.database import ReadSessionLocal
+    from app.core.scheduler_state import record_job_run
+    from app.processing.parquet_archive import run_nightly_export
+
+    if not settings.analytics_archive_dir:
+        logger.debug("Analytics archive dir not set, skipping Parquet export")
+        return
+
+    start = time.time()
+    db = ReadSessionLocal()
+    try:
+        exported = run_nightly_export(db, settings.analytics_archive_dir)
+        logger.info("Parquet archive export: %s", exported)
+        record_job_run("parquet_archive_export", "success", time.time() - start)
+    except Exception as e:
+        record_job_run("parquet_archive_export", "failed", time.time() - start, str(e))
+        logger.error("Parquet archive export failed: %s", e)
+    finally:
+        db.close()
+
+
 def _collect_rss_job(market_key: str):
     """RSS 피드 수집 작업."""
     feeds = _load_rss_feeds(market_key)
@@ -446,4 +501,26 @@ def create_scheduler() -> BackgroundScheduler:
         misfire_grace_time=300,
     )
 
+    # news_event partition maintenance (daily 00:30 UTC)
+    scheduler.add_job(
+        _partition_maintenance_job,
+        trigger=CronTrigger(hour=0, minute=30),
+        id="news_partition_maintenance",
+        name="News Partition Maintenance Job",
+        replace_existing=True,
+        max_instances=1,
+        misfire_grace_time=3600,
+    )
+
+    # Nightly Parquet archive export (daily 01:00 UTC, after US verification)
+    scheduler.add_job(
+        _parquet_archive_job,
+        trigger=CronTrigger(hour=1, minute=0),
+        id="parquet_archive_export",
+        name="Parquet Archive Export Job",
+        replace_existing=True,
+        max_instances=1,
+        misfire_grace_time=3600,
+    )
+
     return scheduler
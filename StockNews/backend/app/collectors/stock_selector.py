@@ -11,6 +11,7 @@ from sqlalchemy.orm import Session
 
 from app.core.scope_loader import load_scope
 from app.models.news_event import NewsEvent
+from app.models.news_rollup import NewsDailyRollup
 from app.models.theme_strength import ThemeStrength
 
 logger = logging.getLogger(__name__)
@@ -219,25 +220,29 @@ class DynamicStockSelector:
         return [(name, code) for name, code, _ in anomalies[:self.VOLUME_ANOMALY_LIMIT]]
 
     def _select_news_momentum(self, db: Session) -> list[tuple[str, str]]:
-        """전략 4: 최근 24h 뉴스 건수 급증 + 평균 스코어 상위."""
-        since = datetime.now(UTC) - timedelta(hours=24)
+        """전략 4: 최근 24h 뉴스 건수 급증 + 평균 스코어 상위.
+
+        news_daily_rollup 일자 단위로 집계하므로 24h 이전 시점이 속한 날짜부터 포함합니다.
+        """
+        since = (datetime.now(UTC) - timedelta(hours=24)).date()
+        news_count = func.sum(NewsDailyRollup.news_count)
+        avg_score = func.sum(NewsDailyRollup.score_sum) / news_count
 
         results = (
             db.query(
-                NewsEvent.stock_code,
-                NewsEvent.stock_name,
-                func.count(NewsEvent.id).label("news_count"),
-                func.avg(NewsEvent.news_score).label("avg_score"),
+                NewsDailyRollup.stock_code,
+                func.max(NewsDailyRollup.stock_name).label("stock_name"),
+                news_count.label("news_count"),
+                avg_score.label("avg_score"),
             )
             .filter(
-                NewsEvent.market == "KR",
-                NewsEvent.created_at >= since,
-                NewsEvent.stock_code.isnot(None),
-                NewsEvent.stock_code != "",
+                NewsDailyRollup.market == "KR",
+                NewsDailyRollup.date >= since,
+                NewsDailyRollup.stock_code != "",
             )
-            .group_by(NewsEvent.stock_code, NewsEvent.stock_name)
-            .having(func.count(NewsEvent.id) >= 3)  # Minimum 3 news items
-            .order_by(func.count(NewsEvent.id).desc(), func.avg(NewsEvent.news_score).desc())
+            .group_by(NewsDailyRollup.stock_code)
+            .having(news_count >= 3)  # Minimum 3 news items
+            .order_by(news_count.desc(), avg_score.desc())
             .limit(self.NEWS_MOMENTUM_LIMIT)
             .all()
         )
@@ -6,6 +6,7 @@ from datetime import date
 
 from apscheduler.triggers.cron import CronTrigger
 
+from app.core.config import settings
 from app.core.database import SessionLocal
 from app.processing.theme_aggregator import aggregate_theme_accuracy
 from app.processing.verification_engine import run_verification
@@ -13,6 +14,19 @@ from app.processing.verification_engine import run_verification
 logger = logging.getLogger(__name__)
 
 
+def _refresh_model(db, market: str) -> None:
+    """검증 후 활성 모델 warm-start 갱신 (MODEL_AUTO_REFRESH)."""
+    if not settings.model_auto_refresh:
+        return
+    try:
+        from app.processing.model_refresh import refresh_active_model
+
+        result = refresh_active_model(db, market)
+        logger.info("%s model refresh: %s", market, result["status"])
+    except Exception as e:
+        logger.warning("Failed to refresh %s model after verification: %s", market, e)
+
+
 def _verify_kr_job():
     """한국 시장 검증 (15:35 KST)."""
     logger.info("KR market verification started")
@@ -32,6 +46,7 @@ def _verify_kr_job():
                     logger.info("KR prediction context rebuilt")
                 except Exception as e:
                     logger.warning("Failed to rebuild prediction context after KR verification: %s", e)
+                _refresh_model(db, "KR")
             logger.info(
                 "KR verification: %s (verified=%d, failed=%d)",
                 log.status,
@@ -66,6 +81,7 @@ def _verify_us_job():
                     logger.info("US prediction context rebuilt")
                 except Exception as e:
                     logger.warning("Failed to rebuild prediction context after US verification: %s", e)
+                _refresh_model(db, "US")
             logger.info(
                 "US verification: %s (verified=%d, failed=%d)",
                 log.status,
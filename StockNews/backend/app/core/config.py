@@ -18,6 +18,49 @@ class Settings(BaseSettings):
     database_url: str = "sqlite+aiosqlite:///./stocknews.db"
     database_ssl_mode: str = ""  # "", "require", "verify-ca", "verify-full"
     database_ssl_ca: str = ""  # Path to CA certificate
+    database_replica_url: str = ""  # Read-only replica (빈 값이면 primary 사용)
+
+    # Database connection pool (PostgreSQL 전용, SQLite는 무시)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 1800  # seconds
+    db_pool_timeout: int = 30  # seconds
+
+    # news_event 파티션 (PostgreSQL 전용)
+    news_partition_months_ahead: int = 2  # 미리 생성할 미래 월 파티션 수
+    news_retention_months: int = 0  # 0 = 무기한 보관, N = N개월 지난 파티션 아카이브
+
+    # Analytics (Parquet 아카이브 + DuckDB)
+    analytics_archive_dir: str = ""  # 빈 값이면 아카이브/DuckDB 비활성화
+
+    # ML 학습 피처 행렬 캐시 (app/processing/feature_store.py)
+    feature_store_dir: str = ""  # 빈 값이면 비활성화 (매 학습마다 DB 에서 로드)
+    model_cache_size: int = 4  # 예측용으로 메모리에 유지할 모델 수 (checksum LRU)
+    model_compiled_inference: bool = True  # 트리 모델 컴파일 추론 (검증 실패 시 원본 모델 사용)
+    model_refresh_rounds: int = 50  # warm-start 갱신 시 추가 부스팅 라운드
+    model_refresh_min_validation: int = 100  # warm-start 후보 비교에 필요한 최소 검증 행 수
+    model_refresh_min_improvement: float = 0.01  # 교체에 필요한 최소 정확도 향상폭
+    model_auto_refresh: bool = False  # 검증 실행 후 활성 LightGBM 모델 warm-start 갱신
+    tuning_workers: int = 2  # /training/train?tune=true 탐색 worker 프로세스 수, 0 = CPU 수
+
+    # 학습 데이터 병렬 백필 (app/processing/parallel_backfill.py)
+    backfill_workers: int = 0  # worker 프로세스 수, 0 = CPU 수
+    backfill_checkpoint_dir: str = "backfill_checkpoints"  # 빈 값이면 체크포인트 미사용
+
+    # API 응답 캐시
+    news_score_cache_ttl: int = 30  # /news/score 캐시 TTL (초), 0 = 비활성화
+    response_cache_enabled: bool = True  # Redis GET 응답 캐시
+    response_cache_ttl: int = 60  # 신선 기간 (초)
+    response_cache_stale_ttl: int = 300  # 재계산 실패 시 stale 응답 허용 기간 (초)
+    theme_strength_resync_seconds: int = 300  # 인메모리 테마 강도 엔진 DB 재동기화 주기 (초), 0 = 비활성화
+
+    # WebSocket (/ws/news)
+    ws_max_connections: int = 1000
+    ws_send_queue_size: int = 256  # 클라이언트별 송신 대기 메시지 수
+    ws_send_timeout: float = 5.0  # 메시지 1건 송신 제한 시간 (초), 초과 시 연결 종료
+    ws_max_dropped_messages: int = 100  # 큐 포화로 버린 메시지가 이 수에 도달하면 연결 종료
+    ws_replay_max_messages: int = 1000  # 재접속(last_event_id) 시 재생할 최대 메시지 수
+    breaking_stream_maxlen: int = 10000  # 속보 Redis Stream 보관 길이 (근사), 0 = 기록 비활성화
 
     # Redis
     redis_url: str = "redis://localhost:6379/0"
@@ -105,6 +148,7 @@ def _load_settings_with_secrets() -> Settings:
             "newsapi_api_key",
             "redis_password",
             "database_url",
+            "database_replica_url",
             "sentry_dsn",
         ]
 
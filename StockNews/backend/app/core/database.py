@@ -1,10 +1,21 @@
-"""DB 엔진 + 세션 팩토리."""
+"""DB 엔진 + 세션 팩토리.
 
+Primary 엔진은 쓰기(파이프라인, 검증, 백필)를 담당하고, ``database_replica_url``이
+설정되면 읽기 전용 replica 엔진이 GET 엔드포인트와 분석 쿼리를 담당합니다.
+"""
+
+from collections.abc import Iterator
+
+from fastapi import Request
 from sqlalchemy import create_engine, event
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
 
+# replica로 라우팅되는 HTTP 메서드 (상태 변경 없음)
+READ_ONLY_METHODS = frozenset({"GET", "HEAD"})
+
 
 def _get_engine_url(url: str) -> str:
     """Convert config URL to sync engine URL."""
@@ -15,29 +26,72 @@ def _get_engine_url(url: str) -> str:
     return url
 
 
-# Sync engine for MVP (SQLite) and production (PostgreSQL)
-engine = create_engine(
-    _get_engine_url(settings.database_url),
-    echo=settings.debug,
-    pool_pre_ping=True,
-)
+def _pool_kwargs(url: str) -> dict:
+    """커넥션 풀 설정 (SQLite는 드라이버 기본 풀 사용)."""
+    if "sqlite" in url:
+        return {}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_timeout": settings.db_pool_timeout,
+    }
 
 
-@event.listens_for(engine, "connect")
-def set_sqlite_pragma(dbapi_connection, connection_record):
+def _set_sqlite_pragma(dbapi_connection, connection_record):
     """SQLite WAL 모드 + busy timeout 설정."""
-    if engine.url.get_backend_name() == "sqlite":
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA journal_mode=WAL")
-        cursor.execute("PRAGMA busy_timeout=5000")
-        cursor.close()
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+
+def create_db_engine(url: str) -> Engine:
+    """설정된 풀 옵션으로 sync 엔진 생성."""
+    engine_url = _get_engine_url(url)
+    db_engine = create_engine(
+        engine_url,
+        echo=settings.debug,
+        pool_pre_ping=True,
+        **_pool_kwargs(engine_url),
+    )
+    if db_engine.url.get_backend_name() == "sqlite":
+        event.listen(db_engine, "connect", _set_sqlite_pragma)
+    return db_engine
+
+
+# Sync engine for MVP (SQLite) and production (PostgreSQL)
+engine = create_db_engine(settings.database_url)
+
+# Read replica — 미설정 시 primary 엔진 공유
+read_engine = (
+    create_db_engine(settings.database_replica_url)
+    if settings.database_replica_url
+    else engine
+)
 
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+ReadSessionLocal = sessionmaker(bind=read_engine, autocommit=False, autoflush=False)
+
+
+def get_db(request: Request = None) -> Iterator[Session]:
+    """FastAPI dependency — DB 세션 제공.
+
+    GET/HEAD 요청은 read replica 세션, 그 외 요청은 primary 세션을 사용합니다.
+    """
+    if request is not None and request.method in READ_ONLY_METHODS:
+        db = ReadSessionLocal()
+    else:
+        db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
 
 
-def get_db():
-    """FastAPI dependency — DB 세션 제공."""
-    db = SessionLocal()
+def get_read_db() -> Iterator[Session]:
+    """분석 쿼리용 read replica 세션 (HTTP 메서드와 무관)."""
+    db = ReadSessionLocal()
     try:
         yield db
     finally:
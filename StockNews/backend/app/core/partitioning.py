@@ -0,0 +1,192 @@
+"""news_event 월 단위 파티션 관리 + 보관 기간(retention) 정책.
+
+PostgreSQL declarative partitioning(``PARTITION BY RANGE (published_at)``)은
+Alembic 마이그레이션(f6g7h8i9j0k1)이 생성하고, 이 모듈은 다음을 담당합니다:
+
+- 미래 월 파티션 사전 생성 (INSERT 시 default 파티션으로 떨어지지 않도록)
+- 보관 기간이 지난 파티션 DETACH 후 archive 스키마로 이동
+
+SQLite 또는 파티션되지 않은 테이블에서는 모든 작업이 no-op 입니다.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+PARTITIONED_TABLE = "news_event"
+DEFAULT_PARTITION = f"{PARTITIONED_TABLE}_default"
+ARCHIVE_SCHEMA = "news_archive"
+
+
+@dataclass(frozen=True)
+class MonthPartition:
+    """월 단위 파티션 범위 [start, end)."""
+
+    start: date
+    end: date
+
+    @property
+    def name(self) -> str:
+        return partition_name(self.start)
+
+
+def month_start(d: date) -> date:
+    """해당 월의 1일."""
+    return d.replace(day=1)
+
+
+def add_months(d: date, months: int) -> date:
+    """월 단위 이동 (결과는 항상 1일)."""
+    index = d.year * 12 + (d.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """월 파티션 테이블명 (예: news_event_p2026_01)."""
+    return f"{PARTITIONED_TABLE}_p{month.year:04d}_{month.month:02d}"
+
+
+def month_partitions(start: date, end: date) -> list[MonthPartition]:
+    """start가 속한 월부터 end가 속한 월까지의 파티션 범위 목록."""
+    partitions = []
+    current = month_start(start)
+    last = month_start(end)
+    while current <= last:
+        nxt = add_months(current, 1)
+        partitions.append(MonthPartition(start=current, end=nxt))
+        current = nxt
+    return partitions
+
+
+def create_partition_sql(partition: MonthPartition) -> str:
+    """월 파티션 생성 DDL."""
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition.name} "
+        f"PARTITION OF {PARTITIONED_TABLE} "
+        f"FOR VALUES FROM ('{partition.start.isoformat()}') TO ('{partition.end.isoformat()}')"
+    )
+
+
+def expired_partitions(
+    partition_names: list[str], retention_months: int, today: date | None = None
+) -> list[str]:
+    """보관 기간이 지난 월 파티션명 반환.
+
+    파티션의 상한(다음 달 1일)이 cutoff(이번 달 1일 - retention_months) 이하이면 만료.
+    retention_months <= 0 이면 무기한 보관.
+    """
+    if retention_months <= 0:
+        return []
+
+    cutoff = add_months(month_start(today or date.today()), -retention_months)
+    prefix = f"{PARTITIONED_TABLE}_p"
+    expired = []
+    for name in partition_names:
+        if not name.startswith(prefix):
+            continue
+        try:
+            year, month = name[len(prefix):].split("_")
+            start = date(int(year), int(month), 1)
+        except ValueError:
+            continue
+        if add_months(start, 1) <= cutoff:
+            expired.append(name)
+    return sorted(expired)
+
+
+def is_partitioned(db: Session) -> bool:
+    """news_event가 PostgreSQL 파티션 테이블인지 확인."""
+    if db.get_bind().dialect.name != "postgresql":
+        return False
+    row = db.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table p "
+            "JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = :table AND pg_table_is_visible(c.oid)"
+        ),
+        {"table": PARTITIONED_TABLE},
+    ).first()
+    return row is not None
+
+
+def list_partitions(db: Session) -> list[str]:
+    """news_event에 attach된 파티션명 목록."""
+    rows = db.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits i "
+            "JOIN pg_class parent ON parent.oid = i.inhparent "
+            "JOIN pg_class child ON child.oid = i.inhrelid "
+            "WHERE parent.relname = :table AND pg_table_is_visible(parent.oid) "
+            "ORDER BY child.relname"
+        ),
+        {"table": PARTITIONED_TABLE},
+    ).all()
+    return [r[0] for r in rows]
+
+
+def ensure_partitions(
+    db: Session, months_ahead: int = 2, today: date | None = None
+) -> list[str]:
+    """이번 달부터 months_ahead 개월 뒤까지 파티션 사전 생성.
+
+    Returns:
+        새로 생성된 파티션명 목록 (파티션 미지원 환경에서는 빈 리스트)
+    """
+    if not is_partitioned(db):
+        return []
+
+    current = month_start(today or date.today())
+    existing = set(list_partitions(db))
+    created = []
+    for partition in month_partitions(current, add_months(current, months_ahead)):
+        if partition.name in existing:
+            continue
+        db.execute(text(create_partition_sql(partition)))
+        created.append(partition.name)
+
+    db.commit()
+    if created:
+        logger.info("Created news_event partitions: %s", created)
+    return created
+
+
+def detach_expired_partitions(
+    db: Session, retention_months: int, today: date | None = None
+) -> list[str]:
+    """만료 파티션을 DETACH 하고 archive 스키마로 이동.
+
+    DETACH 된 파티션은 news_event 스캔/인덱스/vacuum 대상에서 제외되지만
+    ``news_archive.<partition>`` 으로 조회 가능하게 남습니다.
+
+    Returns:
+        아카이브된 파티션명 목록
+    """
+    if retention_months <= 0 or not is_partitioned(db):
+        return []
+
+    expired = expired_partitions(list_partitions(db), retention_months, today)
+    if not expired:
+        return []
+
+    db.execute(text(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}"))
+    for name in expired:
+        db.execute(text(f"ALTER TABLE {PARTITIONED_TABLE} DETACH PARTITION {name}"))
+        db.execute(text(f"ALTER TABLE {name} SET SCHEMA {ARCHIVE_SCHEMA}"))
+    db.commit()
+
+    logger.info("Archived %d news_event partitions to %s: %s", len(expired), ARCHIVE_SCHEMA, expired)
+    return expired
+
+
+def run_partition_maintenance(
+    db: Session, months_ahead: int, retention_months: int
+) -> dict:
+    """파티션 사전 생성 + retention 적용."""
+    created = ensure_partitions(db, months_ahead=months_ahead)
+    archived = detach_expired_partitions(db, retention_months=retention_months)
+    return {"created": created, "archived": archived}
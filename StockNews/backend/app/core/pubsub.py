@@ -1,11 +1,18 @@
-"""Redis Pub/Sub 속보 발행/구독."""
+"""Redis Pub/Sub 속보 발행/구독.
+
+속보는 Pub/Sub 발행 전에 길이 제한 Redis Stream 에도 기록(XADD)하고, 스트림 엔트리 ID 를
+메시지 event_id 로 실어 보냅니다. 재접속한 WebSocket 클라이언트는 마지막으로 받은
+event_id 이후의 누락분을 스트림에서 재생(read_breaking_stream)받을 수 있습니다.
+"""
 
 import json
 import logging
+import re
 from typing import TYPE_CHECKING
 
 from pydantic import ValidationError
 
+from app.core.config import settings
 from app.core.scope_loader import load_scope
 from app.schemas.pubsub import BreakingNewsMessage, Market, validate_message
 
@@ -20,6 +27,9 @@ _breaking_cfg = _scope.get("breaking_news", {})
 
 CHANNEL_PREFIX = _breaking_cfg.get("channel_prefix", "news_breaking_")
 BREAKING_THRESHOLD = _breaking_cfg.get("threshold", 80.0)
+BREAKING_STREAM = _breaking_cfg.get("stream_key", f"{CHANNEL_PREFIX}stream")
+
+_STREAM_ID_RE = re.compile(r"^\d+(-\d+)?$")
 
 
 def get_channel_name(market: str) -> str:
@@ -32,6 +42,36 @@ def should_publish_breaking(score: float) -> bool:
     return score >= BREAKING_THRESHOLD
 
 
+def is_stream_id(value: str) -> bool:
+    """Redis Stream 엔트리 ID 형식 (ms 또는 ms-seq) 여부."""
+    return bool(_STREAM_ID_RE.match(value))
+
+
+def stream_id_key(value: str) -> tuple[int, int]:
+    """스트림 ID 비교용 키."""
+    ms, _, seq = value.partition("-")
+    return int(ms), int(seq or 0)
+
+
+def _append_to_stream(redis_client, payload: str) -> str | None:
+    """속보 payload 를 길이 제한 스트림에 기록. 엔트리 ID 반환 (비활성/실패 시 None)."""
+    if settings.breaking_stream_maxlen <= 0:
+        return None
+    try:
+        entry_id = redis_client.xadd(
+            BREAKING_STREAM,
+            {"data": payload},
+            maxlen=settings.breaking_stream_maxlen,
+            approximate=True,
+        )
+    except Exception as e:
+        logger.warning("Failed to append breaking news to stream: %s", e)
+        return None
+    if isinstance(entry_id, bytes):
+        entry_id = entry_id.decode()
+    return entry_id if isinstance(entry_id, str) else None
+
+
 def publish_breaking_news(
     redis_client,
     stock_code: str,
@@ -78,6 +118,10 @@ def publish_breaking_news(
         logger.error("Invalid message schema: %s", e)
         return False
 
+    event_id = _append_to_stream(redis_client, payload)
+    if event_id:
+        payload = message.model_copy(update={"event_id": event_id}).model_dump_json()
+
     try:
         redis_client.publish(channel, payload)
         logger.info("Published breaking news to %s: %s", channel, title)
@@ -114,6 +158,35 @@ def publish_news_event(redis_client, news_event: "NewsEvent", score: float) -> b
     )
 
 
+async def read_breaking_stream(
+    redis_client, after_id: str, count: int
+) -> tuple[list[dict], bool]:
+    """after_id 이후 스트림에 기록된 속보 (오래된 순, event_id 포함).
+
+    Returns:
+        (검증된 메시지 dict 목록, truncated) — truncated 는 after_id 직후 구간이 스트림
+        길이 제한으로 잘렸을 수 있거나 count 에 걸려 일부만 반환된 경우 True
+    """
+    entries = await redis_client.xrange(BREAKING_STREAM, min=f"({after_id}", max="+", count=count)
+    oldest = await redis_client.xrange(BREAKING_STREAM, min="-", max="+", count=1)
+    truncated = len(entries) >= count or bool(
+        oldest and stream_id_key(oldest[0][0]) > stream_id_key(after_id)
+    )
+
+    messages = []
+    for entry_id, fields in entries:
+        try:
+            raw_data = json.loads(fields["data"])
+            raw_data["event_id"] = entry_id
+            validated = validate_message(raw_data)
+        except (KeyError, json.JSONDecodeError, ValidationError) as e:
+            logger.warning("Invalid stream entry %s: %s", entry_id, e)
+            continue
+        if validated:
+            messages.append(validated.model_dump())
+    return messages, truncated
+
+
 async def subscribe_and_broadcast(redis_client, broadcast_callback):
     """Redis 채널 구독 후 WebSocket으로 브로드캐스트.
 
@@ -0,0 +1,182 @@
+"""Redis 기반 GET 응답 캐시 + 태그 무효화.
+
+엔드포인트에 ``@cached_response`` 를 붙이면 라우트 네임스페이스와 정규화된
+path/query 파라미터로 키를 만들어 JSON 응답을 Redis에 저장합니다.
+각 항목은 태그(market:KR, stock:005930, theme:반도체, verification 등)에 등록되며,
+파이프라인 저장/검증 완료 시 ``invalidate_tags()`` 로 관련 항목만 삭제합니다.
+
+신선 기간(ttl)이 지난 항목은 grace 기간(stale_ttl) 동안 보관되어, 재계산이
+실패(DB 장애 등)할 때만 stale 응답으로 제공됩니다.
+
+Prometheus 메트릭:
+    stocknews_response_cache_requests_total{route, result}  # hit/miss/stale/error
+    stocknews_response_cache_invalidations_total             # 삭제된 캐시 키 수
+    hit ratio = sum(rate(...{result="hit"}[5m])) / sum(rate(...[5m]))
+"""
+
+import functools
+import json
+import logging
+import time
+from collections.abc import Callable, Iterable
+from urllib.parse import urlencode
+
+from fastapi import HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from prometheus_client import Counter
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "respcache:"
+TAG_PREFIX = "respcache:tag:"
+
+# 캐시 키에서 제외할 파라미터 (인증 정보)
+_IGNORED_PARAMS = {"api_key"}
+
+cache_requests_total = Counter(
+    "stocknews_response_cache_requests_total",
+    "Response cache lookups by result (hit/miss/stale/error)",
+    ["route", "result"],
+)
+cache_invalidations_total = Counter(
+    "stocknews_response_cache_invalidations_total",
+    "Response cache keys deleted by tag invalidation",
+)
+
+
+def _get_async_client():
+    from app.core.redis import async_redis_client
+
+    return async_redis_client
+
+
+def _get_sync_client():
+    from app.core.redis import redis_client
+
+    return redis_client
+
+
+def build_cache_key(namespace: str, request: Request) -> str:
+    """라우트 네임스페이스 + 정렬된 path/query 파라미터로 캐시 키 생성."""
+    path_params = sorted((k, str(v)) for k, v in request.path_params.items())
+    query_params = sorted(
+        (k, v) for k, v in request.query_params.multi_items() if k not in _IGNORED_PARAMS
+    )
+    return f"{CACHE_PREFIX}{namespace}:{urlencode(path_params + query_params)}"
+
+
+def news_event_tags(events: Iterable) -> set[str]:
+    """저장된 뉴스 이벤트가 영향을 주는 캐시 태그."""
+    tags: set[str] = set()
+    for event in events:
+        tags.add(f"market:{event.market}")
+        tags.add("market:ALL")
+        if event.stock_code:
+            tags.add(f"stock:{event.stock_code}")
+        for theme in (event.theme or "").split(","):
+            if theme.strip():
+                tags.add(f"theme:{theme.strip()}")
+        if getattr(event, "kr_impact_themes", None):
+            from app.models.news_rollup import parse_impact_themes
+
+            for theme, _, _ in parse_impact_themes(event.kr_impact_themes):
+                tags.add(f"theme:{theme}")
+    return tags
+
+
+async def _store(client, key: str, data, tags: Iterable[str], ttl: int) -> None:
+    expire = ttl + settings.response_cache_stale_ttl
+    envelope = json.dumps(
+        {"fresh_until": time.time() + ttl, "data": data},
+        ensure_ascii=False,
+    )
+    pipe = client.pipeline()
+    pipe.set(key, envelope, ex=expire)
+    for tag in tags:
+        pipe.sadd(f"{TAG_PREFIX}{tag}", key)
+        pipe.expire(f"{TAG_PREFIX}{tag}", expire)
+    await pipe.execute()
+
+
+def cached_response(
+    namespace: str,
+    tags: Callable[..., Iterable[str]],
+    ttl: int | None = None,
+):
+    """async GET 엔드포인트 응답 캐시 데코레이터.
+
+    ``@limiter.limit`` 아래(함수에 더 가깝게)에 선언합니다. 엔드포인트는
+    ``request: Request`` 인자를 받아야 하며, tags 는 엔드포인트 kwargs 를 받아
+    태그 목록을 반환합니다. Redis 장애 시 캐시 없이 원래 함수를 실행합니다.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            request = kwargs.get("request")
+            if not settings.response_cache_enabled or request is None:
+                return await func(*args, **kwargs)
+
+            client = _get_async_client()
+            key = build_cache_key(namespace, request)
+            try:
+                raw = await client.get(key)
+            except Exception as e:
+                logger.warning("Response cache unavailable (%s): %s", namespace, e)
+                cache_requests_total.labels(route=namespace, result="error").inc()
+                return await func(*args, **kwargs)
+
+            envelope = json.loads(raw) if raw else None
+            if envelope and envelope["fresh_until"] > time.time():
+                cache_requests_total.labels(route=namespace, result="hit").inc()
+                return envelope["data"]
+
+            try:
+                result = await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception:
+                if envelope is None:
+                    raise
+                logger.warning("Serving stale cached response for %s", key, exc_info=True)
+                cache_requests_total.labels(route=namespace, result="stale").inc()
+                return envelope["data"]
+
+            cache_requests_total.labels(route=namespace, result="miss").inc()
+            try:
+                await _store(
+                    client, key, jsonable_encoder(result), tags(**kwargs),
+                    ttl if ttl is not None else settings.response_cache_ttl,
+                )
+            except Exception as e:
+                logger.warning("Response cache store failed (%s): %s", namespace, e)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate_tags(tags: Iterable[str], client=None) -> int:
+    """태그에 등록된 캐시 항목 삭제 (동기). 삭제된 키 수 반환, Redis 장애 시 0."""
+    tags = list(tags)
+    if not tags or not settings.response_cache_enabled:
+        return 0
+    client = client or _get_sync_client()
+    deleted = 0
+    try:
+        for tag in tags:
+            tag_key = f"{TAG_PREFIX}{tag}"
+            members = client.smembers(tag_key)
+            if members:
+                deleted += client.delete(*members)
+            client.delete(tag_key)
+    except Exception as e:
+        logger.warning("Response cache invalidation failed for %s: %s", tags, e)
+        return deleted
+    if deleted:
+        cache_invalidations_total.inc(deleted)
+        logger.debug("Invalidated %d cached responses for tags %s", deleted, tags)
+    return deleted
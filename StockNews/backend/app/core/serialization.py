@@ -0,0 +1,62 @@
+"""대용량 목록 응답용 고속 JSON 직렬화.
+
+행마다 Pydantic 모델을 생성/검증하는 대신 SQL 결과 행(컬럼 프로젝션)을 dict 로 바로
+변환하고 orjson 으로 직렬화합니다. 엔드포인트의 ``response_model`` 은 그대로 두므로
+OpenAPI 스키마는 유지되며, Response 를 직접 반환하면 FastAPI 는 응답 검증/변환을
+생략합니다. 따라서 프로젝션 컬럼명과 타입은 response_model 필드와 일치해야 합니다.
+
+orjson 은 선택 의존성입니다 (pip install orjson>=3.9.0). 미설치 시 표준 json 으로
+같은 형식(UTC datetime 은 ``Z`` 접미사, Pydantic 과 동일)을 출력합니다.
+"""
+
+import functools
+import json
+from collections.abc import Iterable, Sequence
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+
+@functools.cache
+def _orjson():
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _default(value: Any):
+    """표준 json 폴백용 변환 (Pydantic JSON 모드와 동일한 datetime 표기)."""
+    if isinstance(value, datetime):
+        text = value.isoformat()
+        if value.utcoffset() == timedelta(0):
+            text = text.removesuffix("+00:00") + "Z"
+        return text
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """content → JSON bytes (orjson 우선)."""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content, default=_default, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """dict/list/date/datetime 으로 구성된 content 를 바로 직렬화하는 JSON 응답."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def rows_to_dicts(rows: Iterable[Sequence], fields: Sequence[str]) -> list[dict]:
+    """SQL 결과 튜플 → 응답 dict 목록 (fields 순서 = 프로젝션 컬럼 순서)."""
+    return [dict(zip(fields, row, strict=True)) for row in rows]
+
@@ -0,0 +1,106 @@
+"""WebSocket 구독 필터 라우팅 인덱스.
+
+종목 코드 / 테마 → 구독자 역색인으로 메시지 수신 후보를 좁힌 뒤 후보에 대해서만
+market / min_score 조건을 확인합니다. 필터가 없거나 종목/테마 제한이 없는 구독자는
+와일드카드 집합에 둡니다.
+"""
+
+from collections import defaultdict
+from collections.abc import Hashable
+
+from app.models.news_rollup import split_themes
+from app.schemas.pubsub import SubscriptionFilter
+
+
+class SubscriptionIndex:
+    """구독자(key) → 필터 인덱스."""
+
+    def __init__(self):
+        self._filters: dict[Hashable, SubscriptionFilter | None] = {}
+        self._wildcard: set[Hashable] = set()
+        self._by_stock: dict[str, set[Hashable]] = defaultdict(set)
+        self._by_theme: dict[str, set[Hashable]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._filters)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._filters
+
+    def get(self, key: Hashable) -> SubscriptionFilter | None:
+        return self._filters.get(key)
+
+    def assign(self, key: Hashable, flt: SubscriptionFilter | None = None) -> None:
+        """구독자 필터 등록/교체 (None = 전체 수신)."""
+        self.remove(key)
+        self._filters[key] = flt
+        if flt is None or not (flt.stock_codes or flt.themes):
+            self._wildcard.add(key)
+            return
+        for code in flt.stock_codes:
+            self._by_stock[code].add(key)
+        for theme in flt.themes:
+            self._by_theme[theme].add(key)
+
+    def remove(self, key: Hashable) -> None:
+        flt = self._filters.pop(key, None)
+        self._wildcard.discard(key)
+        if flt is None:
+            return
+        for code in flt.stock_codes:
+            _discard(self._by_stock, code, key)
+        for theme in flt.themes:
+            _discard(self._by_theme, theme, key)
+
+    def clear(self) -> None:
+        self._filters.clear()
+        self._wildcard.clear()
+        self._by_stock.clear()
+        self._by_theme.clear()
+
+    def match(self, message: dict) -> set[Hashable]:
+        """메시지를 수신할 구독자 집합."""
+        candidates = set(self._wildcard)
+        stock_code = message.get("stock_code")
+        if stock_code and self._by_stock:
+            candidates |= self._by_stock.get(str(stock_code).upper(), set())
+        if self._by_theme:
+            for theme in split_themes(message.get("theme")):
+                candidates |= self._by_theme.get(theme, set())
+
+        market = message.get("market")
+        score = message.get("news_score")
+        return {
+            key for key in candidates
+            if _passes(self._filters[key], market, score)
+        }
+
+    def accepts(self, key: Hashable, message: dict) -> bool:
+        """구독자 1명에 대한 필터 일치 여부 (재생 메시지 필터링용)."""
+        if key not in self._filters:
+            return False
+        flt = self._filters[key]
+        if flt is not None and (flt.stock_codes or flt.themes):
+            stock_code = str(message.get("stock_code") or "").upper()
+            themes = split_themes(message.get("theme"))
+            if stock_code not in flt.stock_codes and not any(t in flt.themes for t in themes):
+                return False
+        return _passes(flt, message.get("market"), message.get("news_score"))
+
+
+def _passes(flt: SubscriptionFilter | None, market, score) -> bool:
+    """market / min_score 조건 (메시지에 해당 필드가 없으면 통과)."""
+    if flt is None:
+        return True
+    if flt.markets and market is not None and market not in flt.markets:
+        return False
+    return not (flt.min_score and score is not None and score < flt.min_score)
+
+
+def _discard(index: dict[str, set[Hashable]], value: str, key: Hashable) -> None:
+    keys = index.get(value)
+    if keys is None:
+        return
+    keys.discard(key)
+    if not keys:
+        del index[value]
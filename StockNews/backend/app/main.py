@@ -50,8 +50,31 @@ async def lifespan(application: FastAPI):
     # Startup: 테이블 생성 (MVP — production에서는 Alembic 사용)
     Base.metadata.create_all(bind=engine)
 
-    # Startup: 초기 전략 시딩 (V1)
     from app.core.database import SessionLocal
+
+    # Startup: news_event 월 파티션 사전 생성 (PostgreSQL 파티션 테이블인 경우)
+    from app.core.partitioning import ensure_partitions
+
+    partition_db = SessionLocal()
+    try:
+        ensure_partitions(partition_db, months_ahead=settings.news_partition_months_ahead)
+    except Exception as e:
+        logger.warning("Partition pre-creation failed: %s", e)
+    finally:
+        partition_db.close()
+
+    # Startup: 인메모리 테마 강도 엔진 재생 (news_theme_daily_rollup)
+    from app.processing.theme_strength_engine import theme_strength_engine
+
+    theme_db = SessionLocal()
+    try:
+        theme_strength_engine.load(theme_db)
+    except Exception as e:
+        logger.warning("Theme strength engine load failed: %s", e)
+    finally:
+        theme_db.close()
+
+    # Startup: 초기 전략 시딩 (V1)
     from app.processing.strategy_config import StrategyConfig
     from app.processing.strategy_registry import StrategyRegistry
 
@@ -10,8 +10,11 @@ from app.advan.models import (
     AdvanSimulationRun,
 )
 from app.models.base import Base
-from app.models.ml_model import MLModel
+from app.models.ml_model import MLModel, MLTuningTrial
+from app.models.news_content import NewsContent
 from app.models.news_event import NewsEvent
+from app.models.news_rollup import NewsDailyRollup, NewsThemeDailyRollup
+from app.models.news_search import NewsSearchDocument
 from app.models.stock_price import StockPrice
 from app.models.theme_strength import ThemeStrength
 from app.models.training import StockTrainingData
@@ -24,7 +27,12 @@ from app.models.verification import (
 __all__ = [
     "Base",
     "MLModel",
+    "MLTuningTrial",
     "NewsEvent",
+    "NewsContent",
+    "NewsDailyRollup",
+    "NewsThemeDailyRollup",
+    "NewsSearchDocument",
     "StockPrice",
     "ThemeStrength",
     "StockTrainingData",
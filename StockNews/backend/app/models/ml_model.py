@@ -51,3 +51,37 @@ class MLModel(Base):
 
     def __repr__(self) -> str:
         return f"<MLModel(name={self.model_name}, version={self.model_version}, market={self.market}, active={self.is_active})>"
+
+
+class MLTuningTrial(Base):
+    """하이퍼파라미터 탐색 trial 기록 (study 단위, pruned 포함)."""
+
+    __tablename__ = "ml_tuning_trial"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    study_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    model_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    market: Mapped[str] = mapped_column(String(5), nullable=False)
+    feature_tier: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    trial_number: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[str] = mapped_column(String(10), nullable=False)  # "complete" or "pruned"
+    rung: Mapped[int] = mapped_column(Integer, nullable=False)  # 마지막으로 평가된 successive halving 단계
+    resource: Mapped[int] = mapped_column(Integer, nullable=False)  # 해당 단계 트리/부스팅 라운드 수
+    params: Mapped[str] = mapped_column(Text, nullable=False)  # JSON
+    cv_accuracy: Mapped[float | None] = mapped_column(Float, nullable=True)
+    cv_std: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+    )
+
+    __table_args__ = (
+        Index("ix_ml_tuning_trial_study", "study_id", "trial_number"),
+        Index("ix_ml_tuning_trial_market", "market", "created_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<MLTuningTrial(study={self.study_id}, trial={self.trial_number}, status={self.status})>"
@@ -0,0 +1,59 @@
+"""NewsContent SQLAlchemy 모델 — 뉴스 본문/요약 분리 저장.
+
+집계 쿼리가 스캔하는 news_event 행을 작게 유지하기 위해 본문(content)과 요약(summary)을
+별도 테이블에 둡니다. 본문은 zlib 압축 바이트로 저장하며, NewsEvent.content /
+NewsEvent.summary 프로퍼티 접근 시에만 지연 로드됩니다.
+"""
+
+import zlib
+
+from sqlalchemy import Integer, LargeBinary, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.models.base import Base
+
+COMPRESSION_LEVEL = 6
+
+
+def compress_text(text: str | None) -> bytes | None:
+    """문자열 → zlib 압축 바이트 (None/빈 문자열은 그대로 None/b"")."""
+    if text is None:
+        return None
+    return zlib.compress(text.encode("utf-8"), COMPRESSION_LEVEL)
+
+
+def decompress_text(data: bytes | None) -> str | None:
+    """zlib 압축 바이트 → 문자열."""
+    if data is None:
+        return None
+    return zlib.decompress(data).decode("utf-8")
+
+
+class NewsContent(Base):
+    """뉴스 본문 테이블 (news_event 1:1)."""
+
+    __tablename__ = "news_content"
+
+    # news_event 는 PostgreSQL 에서 (id, published_at) 복합 PK 파티션 테이블이므로
+    # DB 레벨 FK 대신 ORM relationship 으로 1:1 관계와 삭제 전파를 관리
+    news_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    summary: Mapped[str | None] = mapped_column(Text, nullable=True)
+    content_compressed: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+
+    event: Mapped["NewsEvent"] = relationship(  # noqa: F821
+        "NewsEvent",
+        primaryjoin="foreign(NewsContent.news_id) == NewsEvent.id",
+        back_populates="body",
+    )
+
+    @property
+    def content(self) -> str | None:
+        return decompress_text(self.content_compressed)
+
+    @content.setter
+    def content(self, value: str | None) -> None:
+        self.content_compressed = compress_text(value)
+
+    def __repr__(self) -> str:
+        size = len(self.content_compressed) if self.content_compressed else 0
+        return f"<NewsContent(news_id={self.news_id}, compressed={size}B)>"
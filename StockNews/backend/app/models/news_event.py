@@ -4,7 +4,7 @@ from datetime import UTC, datetime
 from enum import StrEnum
 
 from sqlalchemy import Boolean, DateTime, Float, Index, Integer, String
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
 
@@ -27,8 +27,6 @@ class NewsEvent(Base):
     stock_code: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
     stock_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
     title: Mapped[str] = mapped_column(String(500), nullable=False)
-    summary: Mapped[str | None] = mapped_column(String(2000), nullable=True)
-    content: Mapped[str | None] = mapped_column(String(5000), nullable=True)
     sentiment: Mapped[str] = mapped_column(
         String(10), nullable=False, default=SentimentEnum.neutral.value
     )
@@ -48,10 +46,48 @@ class NewsEvent(Base):
         default=lambda: datetime.now(UTC),
     )
 
+
+    # 본문/요약은 news_content 로 분리 (지연 로드, content/summary 프로퍼티로 접근)
+    body: Mapped["NewsContent | None"] = relationship(  # noqa: F821
+        "NewsContent",
+        primaryjoin="NewsEvent.id == foreign(NewsContent.news_id)",
+        back_populates="event",
+        uselist=False,
+        lazy="select",
+        cascade="all, delete-orphan",
+    )
+
     __table_args__ = (
         Index("ix_news_event_market_stock", "market", "stock_code"),
         Index("ix_news_event_published", "published_at"),
     )
 
+    def _ensure_body(self):
+        if self.body is None:
+            from app.models.news_content import NewsContent
+
+            self.body = NewsContent()
+        return self.body
+
+    @property
+    def summary(self) -> str | None:
+        return self.body.summary if self.body is not None else None
+
+    @summary.setter
+    def summary(self, value: str | None) -> None:
+        if value is None and self.body is None:
+            return
+        self._ensure_body().summary = value
+
+    @property
+    def content(self) -> str | None:
+        return self.body.content if self.body is not None else None
+
+    @content.setter
+    def content(self, value: str | None) -> None:
+        if value is None and self.body is None:
+            return
+        self._ensure_body().content = value
+
     def __repr__(self) -> str:
         return f"<NewsEvent(id={self.id}, market={self.market}, stock={self.stock_code}, title={self.title[:30]})>"
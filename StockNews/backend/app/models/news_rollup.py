@@ -0,0 +1,381 @@
+"""뉴스 일별 롤업 SQLAlchemy 모델 + 증분 갱신 리스너.
+
+news_event INSERT/UPDATE/DELETE 시 같은 트랜잭션 안에서 롤업 행을 upsert 합니다.
+조회 API(/news/score, /news/top, /stocks/{code}/timeline, /theme/strength 등)는
+수천 건의 이벤트 대신 종목×일자 롤업 몇 행만 읽습니다.
+
+벌크 DML(query.delete(), 파티션 DETACH 등)은 ORM 이벤트를 거치지 않으므로
+app.processing.news_rollup.rebuild_news_rollups 로 재구성합니다.
+"""
+
+import json
+import logging
+from collections.abc import Callable
+from datetime import UTC, date, datetime
+
+from sqlalchemy import (
+    Date,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    case,
+    delete,
+    event,
+    func,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Mapped, Session, mapped_column, object_session
+from sqlalchemy.orm.attributes import get_history
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.base import Base
+from app.models.news_event import NewsEvent
+
+logger = logging.getLogger(__name__)
+
+
+class NewsDailyRollup(Base):
+    """종목×마켓×일자 뉴스 집계."""
+
+    __tablename__ = "news_daily_rollup"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    stock_code: Mapped[str] = mapped_column(String(20), nullable=False)
+    market: Mapped[str] = mapped_column(String(5), nullable=False)
+    date: Mapped[date] = mapped_column(Date, nullable=False)
+    stock_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    news_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    positive_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    neutral_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    negative_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    disclosure_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    score_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    sentiment_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    last_published_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+    )
+
+    __table_args__ = (
+        Index("uq_news_rollup_stock_market_date", "stock_code", "market", "date", unique=True),
+        Index("ix_news_rollup_market_date", "market", "date"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<NewsDailyRollup(stock={self.stock_code}, market={self.market}, date={self.date}, count={self.news_count})>"
+
+
+class NewsThemeDailyRollup(Base):
+    """종목×마켓×일자×테마 집계.
+
+    kind="news": news_event.theme(콤마 구분) 기여분
+    kind="impact": US 뉴스의 kr_impact_themes 기여분 (sentiment=±impact, score=news_score×impact)
+    """
+
+    __tablename__ = "news_theme_daily_rollup"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    stock_code: Mapped[str] = mapped_column(String(20), nullable=False)
+    market: Mapped[str] = mapped_column(String(5), nullable=False)
+    date: Mapped[date] = mapped_column(Date, nullable=False)
+    theme: Mapped[str] = mapped_column(String(100), nullable=False)
+    kind: Mapped[str] = mapped_column(String(10), nullable=False, default="news")
+    news_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    score_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    sentiment_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+    __table_args__ = (
+        Index(
+            "uq_theme_rollup_key", "stock_code", "market", "date", "theme", "kind", unique=True
+        ),
+        Index("ix_theme_rollup_date_theme", "date", "theme"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<NewsThemeDailyRollup(theme={self.theme}, kind={self.kind}, market={self.market}, date={self.date}, count={self.news_count})>"
+
+
+# ── 증분 갱신 ──────────────────────────────────────────────
+
+ROLLUP_SOURCE_FIELDS = (
+    "stock_code", "market", "stock_name", "sentiment", "sentiment_score",
+    "news_score", "theme", "kr_impact_themes", "is_disclosure",
+    "published_at", "created_at",
+)
+
+
+def rollup_date(published_at: datetime | None, created_at: datetime | None) -> date:
+    """롤업 기준 일자 (UTC). published_at 없으면 created_at 사용."""
+    ts = published_at or created_at or datetime.now(UTC)
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(UTC)
+    return ts.date()
+
+
+def split_themes(theme: str | None) -> list[str]:
+    """콤마 구분 테마 문자열 분리."""
+    if not theme:
+        return []
+    return [t.strip() for t in theme.split(",") if t.strip()]
+
+
+def parse_impact_themes(kr_impact_json: str | None) -> list[tuple[str, float, float]]:
+    """kr_impact_themes JSON → [(theme, impact, sentiment)] (sentiment: up=+impact, down=-impact)."""
+    if not kr_impact_json:
+        return []
+    try:
+        impacts = json.loads(kr_impact_json)
+        out = []
+        for imp in impacts:
+            theme_name = imp.get("theme", "")
+            if not theme_name:
+                continue
+            impact_val = imp.get("impact", 0)
+            direction = imp.get("direction", "neutral")
+            if direction == "up":
+                sentiment = impact_val
+            elif direction == "down":
+                sentiment = -impact_val
+            else:
+                sentiment = 0.0
+            out.append((theme_name, impact_val, sentiment))
+        return out
+    except (json.JSONDecodeError, TypeError, AttributeError):
+        return []
+
+
+def event_contributions(values: dict) -> tuple[dict, list[dict]]:
+    """이벤트 1건이 롤업에 기여하는 값 계산.
+
+    Returns:
+        (stock_row, theme_rows) — 각 dict에 키 컬럼과 증분 값 포함
+    """
+    stock_code = values["stock_code"] or ""
+    market = values["market"]
+    day = rollup_date(values["published_at"], values["created_at"])
+    sentiment = values["sentiment"]
+    news_score = values["news_score"] or 0.0
+    sentiment_score = values["sentiment_score"] or 0.0
+
+    stock_row = {
+        "stock_code": stock_code,
+        "market": market,
+        "date": day,
+        "stock_name": values["stock_name"],
+        "news_count": 1,
+        "positive_count": 1 if sentiment == "positive" else 0,
+        "negative_count": 1 if sentiment == "negative" else 0,
+        "neutral_count": 0 if sentiment in ("positive", "negative") else 1,
+        "disclosure_count": 1 if values["is_disclosure"] else 0,
+        "score_sum": news_score,
+        "sentiment_sum": sentiment_score,
+        "last_published_at": values["published_at"],
+    }
+
+    theme_rows = [
+        {
+            "stock_code": stock_code, "market": market, "date": day, "theme": theme,
+            "kind": "news", "news_count": 1,
+            "score_sum": news_score, "sentiment_sum": sentiment_score,
+        }
+        for theme in split_themes(values["theme"])
+    ]
+    if market == "US":
+        theme_rows.extend(
+            {
+                "stock_code": stock_code, "market": market, "date": day, "theme": theme,
+                "kind": "impact", "news_count": 1,
+                "score_sum": news_score * impact, "sentiment_sum": sentiment,
+            }
+            for theme, impact, sentiment in parse_impact_themes(values["kr_impact_themes"])
+        )
+    return stock_row, theme_rows
+
+
+_STOCK_KEYS = ("stock_code", "market", "date")
+_STOCK_COUNTERS = (
+    "news_count", "positive_count", "neutral_count", "negative_count",
+    "disclosure_count", "score_sum", "sentiment_sum",
+)
+_THEME_KEYS = ("stock_code", "market", "date", "theme", "kind")
+_THEME_COUNTERS = ("news_count", "score_sum", "sentiment_sum")
+
+
+def _upsert(connection, model: type, keys: tuple, counters: tuple, row: dict, sign: int) -> None:
+    """키 기준 upsert — 카운터 컬럼에 sign × 값 누적."""
+    table = model.__table__
+    values = {k: row[k] for k in keys}
+    values.update({c: sign * row[c] for c in counters})
+    is_stock_row = model is NewsDailyRollup
+    if is_stock_row:
+        values["stock_name"] = row["stock_name"]
+        values["last_published_at"] = row["last_published_at"] if sign > 0 else None
+        values["updated_at"] = datetime.now(UTC)
+
+    dialect = connection.dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        insert = sqlite_insert if dialect == "sqlite" else pg_insert
+        stmt = insert(table).values(**values)
+        excluded = stmt.excluded
+        set_ = {c: table.c[c] + excluded[c] for c in counters}
+        if is_stock_row:
+            set_["stock_name"] = func.coalesce(excluded.stock_name, table.c.stock_name)
+            set_["updated_at"] = excluded.updated_at
+            if sign > 0:
+                set_["last_published_at"] = case(
+                    (table.c.last_published_at.is_(None), excluded.last_published_at),
+                    (excluded.last_published_at > table.c.last_published_at, excluded.last_published_at),
+                    else_=table.c.last_published_at,
+                )
+        connection.execute(stmt.on_conflict_do_update(index_elements=list(keys), set_=set_))
+        return
+
+    # 기타 dialect: UPDATE 후 없으면 INSERT
+    where = [table.c[k] == row[k] for k in keys]
+    result = connection.execute(
+        update(table).where(*where).values({c: table.c[c] + values[c] for c in counters})
+    )
+    if result.rowcount == 0:
+        connection.execute(table.insert().values(**values))
+
+
+def _delete_if_empty(connection, model: type, keys: tuple, row: dict) -> None:
+    table = model.__table__
+    connection.execute(
+        delete(table).where(*[table.c[k] == row[k] for k in keys], table.c.news_count <= 0)
+    )
+
+
+def apply_event_to_rollup(connection, values: dict, sign: int = 1) -> list[dict]:
+    """이벤트 값을 롤업에 반영 (sign=-1 이면 차감, 건수가 0이 된 행은 삭제).
+
+    차감 시 last_published_at 은 재계산하지 않습니다 (정확한 값은 rebuild 로 복원).
+
+    Returns:
+        반영된 테마 롤업 증분 행 (sign 미적용)
+    """
+    stock_row, theme_rows = event_contributions(values)
+    _upsert(connection, NewsDailyRollup, _STOCK_KEYS, _STOCK_COUNTERS, stock_row, sign)
+    for theme_row in theme_rows:
+        _upsert(connection, NewsThemeDailyRollup, _THEME_KEYS, _THEME_COUNTERS, theme_row, sign)
+    if sign < 0:
+        _delete_if_empty(connection, NewsDailyRollup, _STOCK_KEYS, stock_row)
+        for theme_row in theme_rows:
+            _delete_if_empty(connection, NewsThemeDailyRollup, _THEME_KEYS, theme_row)
+    return theme_rows
+
+
+# 커밋된 테마 롤업 증분 구독자 — callback([(theme_rows, sign), ...])
+# (예: app.processing.theme_strength_engine 의 인메모리 엔진)
+theme_delta_subscribers: list[Callable[[list[tuple[list[dict], int]]], None]] = []
+_THEME_DELTAS_KEY = "news_theme_rollup_deltas"
+
+
+def _stash_theme_deltas(target: NewsEvent, theme_rows: list[dict], sign: int) -> None:
+    session = object_session(target)
+    if session is not None and theme_rows and theme_delta_subscribers:
+        session.info.setdefault(_THEME_DELTAS_KEY, []).append((theme_rows, sign))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_theme_deltas(session):
+    deltas = session.info.pop(_THEME_DELTAS_KEY, None)
+    if not deltas:
+        return
+    for callback in theme_delta_subscribers:
+        try:
+            callback(deltas)
+        except Exception:
+            logger.exception("Theme delta subscriber failed")
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_theme_deltas(session):
+    session.info.pop(_THEME_DELTAS_KEY, None)
+
+
+# /news/score 응답 캐시 — 커밋된 뉴스 이벤트의 종목 키만 무효화
+news_score_cache = TTLCache(settings.news_score_cache_ttl, maxsize=4096)
+_DIRTY_STOCKS_KEY = "news_score_dirty_stocks"
+
+
+def _mark_stock_dirty(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_DIRTY_STOCKS_KEY, set()).add(target.stock_code)
+
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(NewsEvent, _event_name, _mark_stock_dirty)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_news_score_cache(session):
+    """커밋된 뉴스 이벤트의 종목 스코어 캐시 무효화."""
+    dirty = session.info.pop(_DIRTY_STOCKS_KEY, None)
+    if dirty:
+        news_score_cache.invalidate(lambda key: key[0] in dirty)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_dirty_stocks(session):
+    session.info.pop(_DIRTY_STOCKS_KEY, None)
+
+
+def _current_values(target: NewsEvent) -> dict:
+    return {f: getattr(target, f) for f in ROLLUP_SOURCE_FIELDS}
+
+
+def _previous_values(target: NewsEvent) -> dict:
+    """flush 직전(변경 전) 값."""
+    values = {}
+    for f in ROLLUP_SOURCE_FIELDS:
+        hist = get_history(target, f)
+        if hist.deleted:
+            values[f] = hist.deleted[0]
+        else:
+            values[f] = getattr(target, f)
+    return values
+
+
+def _track_previous_value(target, value, oldvalue, initiator):
+    return value
+
+
+# 만료된 속성도 변경 전 값을 로드하도록 active_history 활성화 (after_update 차감용)
+for _field in ROLLUP_SOURCE_FIELDS:
+    event.listen(
+        getattr(NewsEvent, _field), "set", _track_previous_value,
+        active_history=True, retval=True,
+    )
+
+
+@event.listens_for(NewsEvent, "after_insert")
+def _rollup_after_insert(mapper, connection, target):
+    theme_rows = apply_event_to_rollup(connection, _current_values(target), sign=1)
+    _stash_theme_deltas(target, theme_rows, 1)
+
+
+@event.listens_for(NewsEvent, "after_update")
+def _rollup_after_update(mapper, connection, target):
+    previous = _previous_values(target)
+    current = _current_values(target)
+    if previous == current:
+        return
+    _stash_theme_deltas(target, apply_event_to_rollup(connection, previous, sign=-1), -1)
+    _stash_theme_deltas(target, apply_event_to_rollup(connection, current, sign=1), 1)
+
+
+@event.listens_for(NewsEvent, "after_delete")
+def _rollup_after_delete(mapper, connection, target):
+    theme_rows = apply_event_to_rollup(connection, _previous_values(target), sign=-1)
+    _stash_theme_deltas(target, theme_rows, -1)
@@ -0,0 +1,180 @@
+"""뉴스 전문 검색(full-text search) 인덱스 모델 + 동기화 리스너.
+
+news_search 테이블에 뉴스별 n-gram 토큰 문서(title/body)를 저장하고, 그 위에
+dialect별 역색인을 둡니다.
+
+- SQLite: FTS5 external-content 가상 테이블(news_search_fts) + 트리거
+- PostgreSQL: ``to_tsvector('simple', ...)`` 표현식 GIN 인덱스
+
+한국어는 형태소 분석 없이 2-gram 으로 분해하므로 "삼성전자" 검색 시
+"삼성/성전/전자" 토큰이 모두 포함된 문서가 매칭됩니다. 영문/숫자는 단어 단위입니다.
+
+문서는 Session after_flush 에서 같은 트랜잭션 안에 갱신됩니다. 벌크 DML 이후에는
+app.processing.news_search.rebuild_search_index 로 재구성합니다.
+"""
+
+import re
+
+from sqlalchemy import DDL, Integer, Text, delete, event, insert, inspect, select
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from app.models.base import Base
+from app.models.news_content import NewsContent
+from app.models.news_event import NewsEvent
+
+NGRAM_SIZE = 2
+
+# 제목 문서에 포함되는 NewsEvent 필드 (변경 시 재색인)
+SEARCH_TITLE_FIELDS = ("title", "stock_code", "stock_name", "theme")
+
+# 영문/숫자 단어 또는 그 외 문자(한글 등) 연속 구간
+_TOKEN_RE = re.compile(r"[a-z0-9]+|[^\W\da-z_]+")
+
+
+def ngram_tokens(text: str | None, n: int = NGRAM_SIZE) -> list[str]:
+    """검색 토큰 분해 (영문/숫자: 단어, 한글 등: n-gram, n자 이하 단어는 그대로)."""
+    if not text:
+        return []
+    tokens: list[str] = []
+    for word in _TOKEN_RE.findall(text.lower()):
+        if word.isascii() or len(word) <= n:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + n] for i in range(len(word) - n + 1))
+    return tokens
+
+
+def build_search_document(
+    title: str | None,
+    stock_code: str | None,
+    stock_name: str | None,
+    theme: str | None,
+    summary: str | None,
+) -> dict[str, str]:
+    """news_search 행 값 (title: 제목/종목/테마, body: 요약)."""
+    title_tokens = ngram_tokens(" ".join(filter(None, (title, stock_code, stock_name, theme))))
+    return {"title": " ".join(title_tokens), "body": " ".join(ngram_tokens(summary))}
+
+
+class NewsSearchDocument(Base):
+    """뉴스 검색 토큰 문서 (news_event 1:1)."""
+
+    __tablename__ = "news_search"
+
+    # news_content 와 동일하게 파티션 테이블(news_event) 대신 ORM 에서 관계 관리
+    news_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    title: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    body: Mapped[str] = mapped_column(Text, nullable=False, default="")
+
+    def __repr__(self) -> str:
+        return f"<NewsSearchDocument(news_id={self.news_id})>"
+
+
+# PostgreSQL 검색 벡터 식 (GIN 인덱스와 조회 쿼리가 동일한 식을 사용해야 인덱스를 탐)
+PG_SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', news_search.title), 'A') || "
+    "setweight(to_tsvector('simple', news_search.body), 'B')"
+)
+
+_SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS news_search_fts USING fts5("
+    "title, body, content='news_search', content_rowid='news_id', "
+    "tokenize='unicode61 remove_diacritics 0')",
+    "CREATE TRIGGER IF NOT EXISTS news_search_ai AFTER INSERT ON news_search BEGIN "
+    "INSERT INTO news_search_fts(rowid, title, body) VALUES (new.news_id, new.title, new.body); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS news_search_ad AFTER DELETE ON news_search BEGIN "
+    "INSERT INTO news_search_fts(news_search_fts, rowid, title, body) "
+    "VALUES ('delete', old.news_id, old.title, old.body); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS news_search_au AFTER UPDATE ON news_search BEGIN "
+    "INSERT INTO news_search_fts(news_search_fts, rowid, title, body) "
+    "VALUES ('delete', old.news_id, old.title, old.body); "
+    "INSERT INTO news_search_fts(rowid, title, body) VALUES (new.news_id, new.title, new.body); "
+    "END",
+]
+_PG_DDL = [
+    "CREATE INDEX IF NOT EXISTS ix_news_search_vector ON news_search "
+    f"USING gin (({PG_SEARCH_VECTOR}))",
+]
+
+for _statement in _SQLITE_DDL:
+    event.listen(
+        NewsSearchDocument.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite")
+    )
+for _statement in _PG_DDL:
+    event.listen(
+        NewsSearchDocument.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql")
+    )
+event.listen(
+    NewsSearchDocument.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS news_search_fts").execute_if(dialect="sqlite"),
+)
+
+
+def search_source_query(news_ids):
+    """검색 문서 생성에 필요한 컬럼 조회 (요약은 news_content)."""
+    return (
+        select(
+            NewsEvent.id,
+            NewsEvent.title,
+            NewsEvent.stock_code,
+            NewsEvent.stock_name,
+            NewsEvent.theme,
+            NewsContent.summary,
+        )
+        .outerjoin(NewsContent, NewsContent.news_id == NewsEvent.id)
+        .where(NewsEvent.id.in_(news_ids))
+    )
+
+
+def search_rows(rows) -> list[dict]:
+    """search_source_query 결과 → news_search INSERT 파라미터."""
+    return [
+        {
+            "news_id": row.id,
+            **build_search_document(
+                row.title, row.stock_code, row.stock_name, row.theme, row.summary
+            ),
+        }
+        for row in rows
+    ]
+
+
+def _title_changed(obj: NewsEvent) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[f].history.has_changes() for f in SEARCH_TITLE_FIELDS)
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_search_index(session, flush_context):
+    """flush 된 뉴스/요약 변경을 news_search 에 반영 (flush 당 SELECT 1회)."""
+    changed: set[int] = set()
+    removed: set[int] = set()
+    for obj in session.new:
+        if isinstance(obj, NewsEvent):
+            changed.add(obj.id)
+        elif isinstance(obj, NewsContent):
+            changed.add(obj.news_id)
+    for obj in session.dirty:
+        if isinstance(obj, NewsEvent) and _title_changed(obj):
+            changed.add(obj.id)
+        elif isinstance(obj, NewsContent) and inspect(obj).attrs.summary.history.has_changes():
+            changed.add(obj.news_id)
+    for obj in session.deleted:
+        if isinstance(obj, NewsEvent):
+            removed.add(obj.id)
+
+    changed.discard(None)
+    if not changed and not removed:
+        return
+
+    table = NewsSearchDocument.__table__
+    connection = session.connection()
+    connection.execute(delete(table).where(table.c.news_id.in_(changed | removed)))
+    changed -= removed
+    if changed:
+        rows = search_rows(connection.execute(search_source_query(changed)))
+        if rows:
+            connection.execute(insert(table), rows)
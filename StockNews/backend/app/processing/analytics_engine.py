@@ -0,0 +1,128 @@
+"""DuckDB 기반 분석 쿼리 레이어 — Parquet 아카이브 위에서 대용량 기간 스캔.
+
+app.processing.parquet_archive 가 내보낸 파일을 테이블명 그대로의 view로 노출합니다.
+호출자는 ``covers()``로 요청 기간이 아카이브에 완전히 포함되는지 확인한 뒤
+DuckDB로 조회하고, 그렇지 않으면 기존 ORM 경로를 사용합니다.
+
+duckdb는 선택 의존성입니다 (pip install duckdb>=1.0.0).
+"""
+
+import logging
+import threading
+from collections.abc import Iterator
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+from app.core.config import settings
+from app.processing.parquet_archive import ARCHIVE_TABLES, archive_coverage
+
+logger = logging.getLogger(__name__)
+
+
+class AnalyticsEngine:
+    """Parquet 아카이브를 조회하는 DuckDB in-memory 엔진."""
+
+    def __init__(self, archive_dir: str | Path):
+        try:
+            import duckdb
+        except ImportError as err:
+            raise ImportError("duckdb is required. Install: pip install duckdb>=1.0.0") from err
+
+        self.archive_dir = Path(archive_dir)
+        self._conn = duckdb.connect(":memory:")
+        self._views: set[str] = set()
+        self._lock = threading.Lock()
+
+    def _ensure_view(self, table: str) -> bool:
+        """테이블 파일이 존재하면 view 등록. 새 파티션은 glob이 쿼리 시점에 반영."""
+        if table in self._views:
+            return True
+        if table not in ARCHIVE_TABLES:
+            raise ValueError(f"Unknown archive table: {table}")
+        table_dir = self.archive_dir / table
+        if not any(table_dir.glob("date=*/*.parquet")):
+            return False
+
+        pattern = (table_dir / "date=*" / "*.parquet").as_posix().replace("'", "''")
+        with self._lock:
+            self._conn.execute(
+                f"CREATE OR REPLACE VIEW {table} AS "
+                f"SELECT * FROM read_parquet('{pattern}', hive_partitioning = false)"
+            )
+            self._views.add(table)
+        return True
+
+    def archived_through(self, table: str, start: date, end: date) -> date | None:
+        """start 부터 아카이브로 연속 조회 가능한 마지막 일자 (end 이하). 불가 시 None.
+
+        내보내지 않은 최근 일자나 stale 일자부터는 호출자가 DB 에서 조회합니다.
+        """
+        coverage = archive_coverage(self.archive_dir, table)
+        if coverage is None:
+            return None
+        exported_from, exported_through, stale = coverage
+        if start < exported_from:
+            return None
+        last = min(end, exported_through)
+        blocked = [day for day in stale if start <= day <= last]
+        if blocked:
+            last = min(blocked) - timedelta(days=1)
+        if last < start or not self._ensure_view(table):
+            return None
+        return last
+
+    def covers(self, table: str, start: date, end: date) -> bool:
+        """[start, end] 기간이 아카이브에 모두 포함되는지 확인 (stale 일자 없음)."""
+        return self.archived_through(table, start, end) == end
+
+    def query(self, sql: str, params: list | None = None) -> pd.DataFrame:
+        """SQL 실행 후 DataFrame 반환. 참조 테이블 view는 사전에 covers()로 등록."""
+        cursor = self._conn.cursor()
+        try:
+            return cursor.execute(sql, params or []).df()
+        finally:
+            cursor.close()
+
+    def fetch_rows(self, sql: str, params: list | None = None) -> list[tuple]:
+        """SQL 실행 후 튜플 리스트 반환."""
+        cursor = self._conn.cursor()
+        try:
+            return cursor.execute(sql, params or []).fetchall()
+        finally:
+            cursor.close()
+
+    def iter_batches(
+        self, sql: str, params: list | None = None, batch_size: int = 5000
+    ) -> Iterator[list[tuple]]:
+        """SQL 결과를 batch_size 행 단위로 순차 반환 (전체 결과를 메모리에 올리지 않음)."""
+        cursor = self._conn.cursor()
+        try:
+            cursor.execute(sql, params or [])
+            while batch := cursor.fetchmany(batch_size):
+                yield batch
+        finally:
+            cursor.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+_engine: AnalyticsEngine | None = None
+_engine_lock = threading.Lock()
+
+
+def get_analytics_engine() -> AnalyticsEngine | None:
+    """설정된 아카이브의 공유 엔진. 미설정 또는 duckdb 미설치 시 None."""
+    global _engine
+    if not settings.analytics_archive_dir:
+        return None
+    with _engine_lock:
+        if _engine is None:
+            try:
+                _engine = AnalyticsEngine(settings.analytics_archive_dir)
+            except ImportError as e:
+                logger.warning("Analytics engine disabled: %s", e)
+                return None
+    return _engine
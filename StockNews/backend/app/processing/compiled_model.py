@@ -0,0 +1,247 @@
+"""트리 모델 컴파일 추론 — sklearn API 오버헤드 없는 predict_proba.
+
+sklearn predict_proba 는 호출마다 입력 검증, feature name 확인, joblib 병렬 디스패치를 거쳐
+단일 행 예측에도 수 ms 가 걸립니다. 여기서는 학습된 모델을 추론 전용 표현으로 변환합니다.
+
+백엔드:
+- "forest": RandomForestClassifier → 전체 트리 노드를 NumPy 배열로 평탄화하고
+  (행 × 트리) 노드 인덱스를 깊이만큼 벡터화 순회
+- "lightgbm": LGBMClassifier → 네이티브 Booster 직접 호출 (sklearn 래퍼 생략)
+
+compile_model() 은 변환 직후 검증 샘플에서 원본 predict_proba 와 비교하고, 지원하지 않는
+모델이거나 오차가 허용치를 넘으면 None 을 반환합니다 (호출 측은 원본 모델로 fallback).
+export_compiled() / load_compiled() 는 pickle 없이 읽을 수 있는 .npz 로 저장/복원합니다.
+"""
+
+import logging
+import time
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+VALIDATION_ROWS = 256
+VALIDATION_ATOL = 1e-6
+
+
+class ForestArrays:
+    """RandomForestClassifier 의 평탄화된 트리 배열."""
+
+    backend = "forest"
+
+    def __init__(
+        self,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        proba: np.ndarray,
+        roots: np.ndarray,
+        max_depth: int,
+        classes: np.ndarray,
+    ):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.proba = proba
+        self.roots = roots
+        self.max_depth = max_depth
+        self.classes_ = classes
+
+    @classmethod
+    def from_sklearn(cls, model) -> "ForestArrays":
+        features, thresholds, lefts, rights, probas, roots = [], [], [], [], [], []
+        offset = 0
+        max_depth = 0
+        for estimator in model.estimators_:
+            tree = estimator.tree_
+            is_leaf = tree.children_left < 0
+            # 리프는 자기 자신을 가리키게 해 깊이가 다른 트리도 같은 반복 횟수로 순회
+            own = np.arange(tree.node_count) + offset
+            features.append(np.where(is_leaf, 0, tree.feature))
+            thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+            lefts.append(np.where(is_leaf, own, tree.children_left + offset))
+            rights.append(np.where(is_leaf, own, tree.children_right + offset))
+            value = tree.value[:, 0, :]
+            totals = value.sum(axis=1, keepdims=True)
+            probas.append(np.divide(value, totals, out=np.zeros_like(value), where=totals > 0))
+            roots.append(offset)
+            offset += tree.node_count
+            max_depth = max(max_depth, tree.max_depth)
+
+        return cls(
+            feature=np.concatenate(features).astype(np.intp),
+            threshold=np.concatenate(thresholds),
+            left=np.concatenate(lefts).astype(np.intp),
+            right=np.concatenate(rights).astype(np.intp),
+            proba=np.concatenate(probas),
+            roots=np.asarray(roots, dtype=np.intp),
+            max_depth=int(max_depth),
+            classes=np.asarray(model.classes_),
+        )
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        # sklearn 트리와 같은 비교: 입력을 float32 로 내린 뒤 임계값과 비교
+        X = np.asarray(X, dtype=np.float32).astype(np.float64)
+        rows = np.arange(len(X))[:, None]
+        nodes = np.broadcast_to(self.roots, (len(X), len(self.roots))).copy()
+        for _ in range(self.max_depth):
+            go_left = X[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return self.proba[nodes].mean(axis=1)
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        return {
+            "feature": self.feature, "threshold": self.threshold,
+            "left": self.left, "right": self.right, "proba": self.proba,
+            "roots": self.roots, "max_depth": np.asarray(self.max_depth),
+        }
+
+
+class NativeBooster:
+    """LGBMClassifier 의 네이티브 Booster 래퍼."""
+
+    backend = "lightgbm"
+
+    def __init__(self, booster, classes: np.ndarray):
+        self.booster = booster
+        self.classes_ = classes
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        proba = self.booster.predict(np.asarray(X, dtype=np.float64))
+        if proba.ndim == 1:  # binary → (n, 2)
+            proba = np.column_stack([1.0 - proba, proba])
+        return proba
+
+
+def _is_lightgbm(model) -> bool:
+    return type(model).__module__.startswith("lightgbm") and hasattr(model, "booster_")
+
+
+def _validation_sample(model, n_features: int, compiled) -> np.ndarray:
+    """분기 양쪽을 모두 지나도록 임계값 범위에서 뽑은 검증 입력."""
+    rng = np.random.default_rng(0)
+    low = np.full(n_features, -3.0)
+    high = np.full(n_features, 3.0)
+    if isinstance(compiled, ForestArrays):
+        finite = np.isfinite(compiled.threshold)
+        for col in range(n_features):
+            values = compiled.threshold[finite & (compiled.feature == col)]
+            if len(values):
+                low[col], high[col] = values.min() - 1.0, values.max() + 1.0
+    return rng.uniform(low, high, size=(VALIDATION_ROWS, n_features))
+
+
+def compile_model(model, X_check: np.ndarray | None = None):
+    """추론 전용 표현으로 변환. 미지원/검증 실패 시 None.
+
+    Args:
+        model: 학습된 RandomForestClassifier 또는 LGBMClassifier
+        X_check: 검증 입력 (기본: 모델 임계값 범위에서 샘플링)
+    """
+    try:
+        if _is_lightgbm(model):
+            compiled = NativeBooster(model.booster_, np.asarray(model.classes_))
+        elif hasattr(model, "estimators_") and hasattr(model.estimators_[0], "tree_"):
+            compiled = ForestArrays.from_sklearn(model)
+        else:
+            return None
+
+        n_features = int(model.n_features_in_)
+        X = X_check if X_check is not None else _validation_sample(model, n_features, compiled)
+        X = np.asarray(X, dtype=np.float64)
+        expected = _reference_proba(model, X)
+        actual = compiled.predict_proba(X)
+    except Exception as e:  # 변환 실패는 원본 모델 사용으로 대체
+        logger.warning("Model compilation failed, using original model: %s", e)
+        return None
+
+    if actual.shape != expected.shape or not np.allclose(actual, expected, atol=VALIDATION_ATOL):
+        logger.warning(
+            "Compiled %s model disagrees with original (max diff %.2e), using original model",
+            compiled.backend,
+            float(np.max(np.abs(actual - expected))) if actual.shape == expected.shape else float("nan"),
+        )
+        return None
+    return compiled
+
+
+def _reference_proba(model, X: np.ndarray) -> np.ndarray:
+    """원본 모델 predict_proba (학습 시 feature name 이 있으면 DataFrame 으로 전달)."""
+    names = getattr(model, "feature_names_in_", None)
+    if names is not None:
+        import pandas as pd
+
+        return model.predict_proba(pd.DataFrame(X, columns=list(names)))
+    return model.predict_proba(X)
+
+
+def export_compiled(compiled, path: str | Path) -> Path:
+    """pickle 없이 복원 가능한 .npz 로 저장."""
+    path = Path(path).with_suffix(".npz")
+    classes = np.asarray(compiled.classes_).astype(str)
+    if isinstance(compiled, ForestArrays):
+        np.savez(path, backend=np.asarray("forest"), classes=classes, **compiled.to_arrays())
+    else:
+        np.savez(
+            path, backend=np.asarray("lightgbm"), classes=classes,
+            booster=np.asarray(compiled.booster.model_to_string()),
+        )
+    return path
+
+
+def load_compiled(path: str | Path):
+    """export_compiled() 로 저장한 모델 복원."""
+    with np.load(path, allow_pickle=False) as data:
+        backend = str(data["backend"])
+        classes = data["classes"]
+        if backend == "forest":
+            return ForestArrays(
+                feature=data["feature"], threshold=data["threshold"],
+                left=data["left"], right=data["right"], proba=data["proba"],
+                roots=data["roots"], max_depth=int(data["max_depth"]), classes=classes,
+            )
+        if backend == "lightgbm":
+            try:
+                import lightgbm as lgb
+            except ImportError as err:
+                raise ImportError("lightgbm is required. Install: pip install lightgbm>=4.0.0") from err
+            return NativeBooster(lgb.Booster(model_str=str(data["booster"])), classes)
+    raise ValueError(f"Unknown compiled model backend: {backend}")
+
+
+def benchmark(model, compiled, X: np.ndarray, single_rows: int = 200, repeats: int = 20) -> dict:
+    """원본 vs 컴파일 모델 지연 시간 비교 (ms).
+
+    Returns:
+        {"original": {"row_p50_ms", "row_p99_ms", "batch_ms"},
+         "compiled": {...}, "batch_size": int, "backend": str}
+    """
+    X = np.asarray(X, dtype=np.float64)
+
+    def measure(predict) -> dict:
+        row_times = []
+        for i in range(min(single_rows, len(X))):
+            row = X[i:i + 1]
+            start = time.perf_counter()
+            predict(row)
+            row_times.append((time.perf_counter() - start) * 1000)
+        batch_times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            predict(X)
+            batch_times.append((time.perf_counter() - start) * 1000)
+        return {
+            "row_p50_ms": round(float(np.percentile(row_times, 50)), 4),
+            "row_p99_ms": round(float(np.percentile(row_times, 99)), 4),
+            "batch_ms": round(float(np.median(batch_times)), 4),
+        }
+
+    return {
+        "backend": compiled.backend,
+        "batch_size": len(X),
+        "original": measure(lambda rows: _reference_proba(model, rows)),
+        "compiled": measure(compiled.predict_proba),
+    }
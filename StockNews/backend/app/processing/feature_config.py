@@ -3,6 +3,11 @@
 Metadata-only module. 피처 계산 로직 없음. 이름과 그룹 정의만.
 """
 
+import hashlib
+
+# 피처 정의/계산 방식이 바뀌면 올림 → 피처 행렬 캐시(feature_store) 무효화
+FEATURE_CONFIG_VERSION = 1
+
 TIER_1_FEATURES = [
     "news_score", "sentiment_score", "rsi_14",
     "prev_change_pct", "price_change_5d", "volume_change_5d",
@@ -69,3 +74,14 @@ def get_min_samples_for_tier(tier: int) -> int:
 def get_feature_count_for_tier(tier: int) -> int:
     """Tier별 피처 수."""
     return len(get_features_for_tier(tier))
+
+
+def get_feature_config_checksum(features: list[str] | None = None) -> str:
+    """피처 설정 체크섬 (FEATURE_CONFIG_VERSION + 피처 이름/순서).
+
+    Args:
+        features: 대상 피처 목록 (기본: Tier 3 전체)
+    """
+    names = TIER_3_FEATURES if features is None else features
+    payload = f"v{FEATURE_CONFIG_VERSION}:" + ",".join(names)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
@@ -32,9 +32,14 @@ def extract_news_features(
     """
     cutoff_date = datetime.now(UTC) - timedelta(days=days)
 
-    # 전체 기간 뉴스
+    # 전체 기간 뉴스 (집계에 필요한 컬럼만 조회)
     news = (
-        db.query(NewsEvent)
+        db.query(
+            NewsEvent.news_score,
+            NewsEvent.sentiment_score,
+            NewsEvent.is_disclosure,
+            NewsEvent.created_at,
+        )
         .filter(
             NewsEvent.stock_code == stock_code, NewsEvent.created_at >= cutoff_date
         )
@@ -0,0 +1,260 @@
+"""ML 학습용 피처 행렬 디스크 캐시 — 시장별 예측일 단위 .npy 파티션 (증분 갱신 + 메모리 매핑 로드).
+
+레이아웃: {feature_store_dir}/{market}/manifest.json, {date}.X.npy (Tier 3 피처), {date}.y.npy (라벨)
+"""
+
+import json
+import logging
+import os
+import threading
+from collections.abc import Iterable
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.training import StockTrainingData
+from app.processing.feature_config import TIER_3_FEATURES, get_feature_config_checksum
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+SYNC_BATCH_SIZE = 50_000
+LABEL_DTYPE = "<U8"  # "neutral" 까지 수용
+
+
+class FeatureStore:
+    """시장별 피처 행렬 파티션 저장소."""
+
+    def __init__(self, root: str | Path, market: str):
+        self.market = market
+        self.path = Path(root) / market
+        self.columns = list(TIER_3_FEATURES)
+        self.checksum = get_feature_config_checksum(self.columns)
+        self._lock = threading.Lock()
+
+    # ── manifest ──
+
+    def _read_manifest(self) -> dict[str, dict] | None:
+        """일자(ISO) → fingerprint ({"rows", "max_id", "label_sum"}). 없음/손상/체크섬 불일치 시 None."""
+        path = self.path / MANIFEST_FILE
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            logger.warning("Corrupt feature store manifest: %s", path)
+            return None
+        if data.get("feature_checksum") != self.checksum or data.get("columns") != self.columns:
+            logger.info("Feature config changed, rebuilding feature store: %s", self.path)
+            return None
+        partitions = {}
+        for day, fingerprint in data.get("partitions", {}).items():
+            # 이전 형식 (행 수만 기록) 은 fingerprint 불일치로 다음 sync 에서 다시 씀
+            partitions[day] = (
+                fingerprint if isinstance(fingerprint, dict) else {"rows": int(fingerprint)}
+            )
+        return partitions
+
+    def _write_manifest(self, partitions: dict[str, dict]) -> None:
+        data = {
+            "feature_checksum": self.checksum,
+            "columns": self.columns,
+            "partitions": dict(sorted(partitions.items())),
+        }
+        tmp = self.path / f"{MANIFEST_FILE}.{os.getpid()}.tmp"
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, self.path / MANIFEST_FILE)
+
+    def partitions(self) -> dict[date, int]:
+        """저장된 일자별 행 수."""
+        stored = self._read_manifest() or {}
+        return {date.fromisoformat(day): int(fp["rows"]) for day, fp in stored.items()}
+
+    # ── 파티션 파일 ──
+
+    def _file(self, day: str, kind: str) -> Path:
+        return self.path / f"{day}.{kind}.npy"
+
+    def _save(self, path: Path, array: np.ndarray) -> None:
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, array, allow_pickle=False)
+        os.replace(tmp, path)
+
+    def _delete_partition(self, day: str) -> None:
+        for kind in ("X", "y"):
+            self._file(day, kind).unlink(missing_ok=True)
+
+    def _clear(self) -> None:
+        for path in self.path.glob("*.npy"):
+            path.unlink()
+
+    # ── 갱신 ──
+
+    def _labeled_fingerprints(self, db: Session) -> dict[str, dict]:
+        """일자별 labeled 행 fingerprint — 행 수, max(id), 라벨 체크섬 (up:+id, down:-id)."""
+        label_sum = func.sum(case(
+            (StockTrainingData.actual_direction == "up", StockTrainingData.id),
+            (StockTrainingData.actual_direction == "down", -StockTrainingData.id),
+            else_=0,
+        ))
+        rows = db.execute(
+            select(
+                StockTrainingData.prediction_date, func.count(),
+                func.max(StockTrainingData.id), label_sum,
+            )
+            .where(
+                StockTrainingData.market == self.market,
+                StockTrainingData.actual_direction.isnot(None),
+            )
+            .group_by(StockTrainingData.prediction_date)
+        ).all()
+        return {
+            day.isoformat(): {"rows": int(count), "max_id": int(max_id), "label_sum": int(labels)}
+            for day, count, max_id, labels in rows
+        }
+
+    def _write_partitions(self, db: Session, days: list[str], all_days: bool) -> None:
+        """지정 일자 파티션을 DB 에서 다시 생성 (일자 순 서버 사이드 커서 스트리밍)."""
+        n_features = len(self.columns)
+        stmt = select(
+            StockTrainingData.prediction_date,
+            *(getattr(StockTrainingData, col) for col in self.columns),
+            StockTrainingData.actual_direction,
+        ).where(
+            StockTrainingData.market == self.market,
+            StockTrainingData.actual_direction.isnot(None),
+        )
+        if not all_days:
+            stmt = stmt.where(
+                StockTrainingData.prediction_date.in_([date.fromisoformat(d) for d in days])
+            )
+        stmt = stmt.order_by(
+            StockTrainingData.prediction_date, StockTrainingData.id
+        ).execution_options(yield_per=SYNC_BATCH_SIZE)
+
+        def flush(day: date, rows: list[tuple]) -> None:
+            block = np.array(rows, dtype=object)
+            self._save(self._file(day.isoformat(), "X"), block[:, :n_features].astype(np.float64))
+            self._save(self._file(day.isoformat(), "y"), block[:, n_features].astype(LABEL_DTYPE))
+
+        current: date | None = None
+        rows: list[tuple] = []
+        for partition in db.execute(stmt).partitions():
+            for row in partition:
+                if row[0] != current:
+                    if rows:
+                        flush(current, rows)
+                    current, rows = row[0], []
+                rows.append(tuple(row)[1:])
+        if rows:
+            flush(current, rows)
+
+    def sync(self, db: Session, force_dates: Iterable[date] = ()) -> int:
+        """DB 와 저장소 동기화 — fingerprint 가 달라진 일자 (+ force_dates) 만 다시 씁니다.
+
+        Returns:
+            다시 쓴 파티션 수
+        """
+        forced = {d.isoformat() for d in force_dates}
+        with self._lock:
+            self.path.mkdir(parents=True, exist_ok=True)
+            stored = self._read_manifest()
+            if stored is None:
+                self._clear()
+                stored = {}
+
+            fingerprints = self._labeled_fingerprints(db)
+            stale = sorted(
+                day for day, fingerprint in fingerprints.items()
+                if stored.get(day) != fingerprint or day in forced
+            )
+            removed = [day for day in stored if day not in fingerprints]
+
+            if stale:
+                self._write_partitions(db, stale, all_days=len(stale) == len(fingerprints))
+            for day in removed:
+                self._delete_partition(day)
+            if stale or removed or not (self.path / MANIFEST_FILE).exists():
+                self._write_manifest(fingerprints)
+
+        if stale or removed:
+            logger.info(
+                "Feature store %s synced: %d partitions written, %d removed",
+                self.market, len(stale), len(removed),
+            )
+        return len(stale)
+
+    # ── 로드 ──
+
+    def load(
+        self, columns: list[str], dtype: np.dtype | type = np.float64, with_dates: bool = False
+    ) -> tuple:
+        """파티션을 메모리 매핑으로 읽어 (X, y) 구성. NULL 은 0.0 으로 채웁니다.
+
+        Args:
+            columns: 로드할 피처 (저장된 Tier 3 피처의 부분집합)
+            dtype: 피처 배열 dtype
+            with_dates: True 이면 행별 prediction_date (datetime64[D]) 를 함께 반환 (X, y, dates)
+
+        Raises:
+            ValueError: 저장되지 않은 피처 요청 또는 파티션 행 수 불일치
+        """
+        missing = [col for col in columns if col not in self.columns]
+        if missing:
+            raise ValueError(f"Features not in store: {missing}")
+        index = [self.columns.index(col) for col in columns]
+
+        with self._lock:
+            stored = self._read_manifest() or {}
+            n_samples = sum(int(fp["rows"]) for fp in stored.values())
+            values = np.empty((n_samples, len(columns)), dtype=dtype)
+            labels = np.empty(n_samples, dtype=object)
+            dates = np.empty(n_samples, dtype="datetime64[D]")
+
+            offset = 0
+            for day in sorted(stored):
+                X = np.load(self._file(day, "X"), mmap_mode="r")
+                y = np.load(self._file(day, "y"), mmap_mode="r")
+                rows = int(stored[day]["rows"])
+                if len(X) != rows or len(y) != rows:
+                    raise ValueError(f"Feature store partition {day} is inconsistent")
+                values[offset:offset + rows] = X[:, index]
+                labels[offset:offset + rows] = y.tolist()
+                dates[offset:offset + rows] = np.datetime64(day, "D")
+                offset += rows
+
+        values[np.isnan(values)] = 0.0
+        X = pd.DataFrame(values, columns=list(columns), copy=False)
+        y = pd.Series(labels, dtype=object)
+        if with_dates:
+            return X, y, dates
+        return X, y
+
+
+_stores: dict[tuple[str, str], FeatureStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_feature_store(market: str) -> FeatureStore | None:
+    """설정된 디렉터리의 시장별 공유 저장소. 미설정 시 None."""
+    if not settings.feature_store_dir:
+        return None
+    key = (settings.feature_store_dir, market)
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = FeatureStore(settings.feature_store_dir, market)
+        return _stores[key]
+
+
+def sync_feature_store(db: Session, market: str, force_dates: Iterable[date] = ()) -> int:
+    """검증 실행 후 증분 갱신. 비활성화 시 0."""
+    store = get_feature_store(market)
+    if store is None:
+        return 0
+    return store.sync(db, force_dates)
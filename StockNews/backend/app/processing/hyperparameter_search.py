@@ -0,0 +1,268 @@
+"""병렬 하이퍼파라미터 탐색 — random search + successive halving.
+
+MLTrainer.tune_hyperparameters (Optuna, 직렬 CV) 의 의존성 없는 병렬 대안입니다.
+
+- 평가: TimeSeriesSplit fold 만 사용 (random split 금지). fold 인덱스는 탐색 시작 시 1회 계산.
+- 병렬: spawn 기반 ProcessPoolExecutor. 학습 행렬/fold 는 worker initializer 로 1회만 전달하고,
+  LightGBM Dataset 은 worker 별로 fold 당 1회 구성해 이후 모든 trial 이 재사용합니다.
+- 조기 중단: 단계(rung)마다 자원(트리/부스팅 라운드 수)을 eta 배씩 늘리며 상위 1/eta trial 만
+  다음 단계로 진행하고 나머지는 pruned 로 기록합니다. LightGBM 은 단계 안에서도 early stopping
+  으로 불필요한 라운드를 생략합니다. early stopping 은 각 fold 학습 구간의 마지막
+  EARLY_STOPPING_FRACTION (시간순) 을 내부 검증으로 떼어 판단하고, 점수는 학습/조기 중단에
+  쓰지 않은 검증 fold 로만 계산합니다.
+"""
+
+import logging
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.model_selection import TimeSeriesSplit
+
+logger = logging.getLogger(__name__)
+
+MODEL_TYPES = ("lightgbm", "random_forest")
+DEFAULT_MIN_RESOURCE = 30
+DEFAULT_MAX_RESOURCE = 300
+EARLY_STOPPING_ROUNDS = 20
+EARLY_STOPPING_FRACTION = 0.15  # fold 학습 구간 중 early stopping 내부 검증 비율
+MIN_EARLY_STOPPING_SAMPLES = 10  # 내부 검증 구간이 이보다 작으면 early stopping 생략
+
+# fold Dataset 재사용: min_child_samples 등 trial 마다 바뀌는 파라미터가 구성된 Dataset 과
+# 충돌하지 않도록 feature_pre_filter 비활성화
+_LGB_DATASET_PARAMS = {"feature_pre_filter": False, "verbose": -1}
+_LGB_BASE_PARAMS = {
+    "objective": "multiclass",
+    "metric": "multi_logloss",
+    "random_state": 42,
+    "verbose": -1,
+    "num_threads": 1,  # 프로세스 단위 병렬 — worker 내부 스레드 과다 방지
+}
+
+
+def sample_params(model_type: str, rng: np.random.Generator) -> dict:
+    """탐색 공간에서 파라미터 1세트 샘플링 (tune_hyperparameters 와 같은 범위)."""
+    if model_type == "lightgbm":
+        return {
+            "max_depth": int(rng.integers(3, 11)),
+            "learning_rate": round(float(np.exp(rng.uniform(np.log(0.01), np.log(0.3)))), 5),
+            "num_leaves": int(rng.integers(15, 64)),
+            "min_child_samples": int(rng.integers(5, 51)),
+            "subsample": round(float(rng.uniform(0.6, 1.0)), 4),
+            "subsample_freq": 1,
+            "colsample_bytree": round(float(rng.uniform(0.6, 1.0)), 4),
+        }
+    return {
+        "max_depth": int(rng.integers(3, 16)),
+        "min_samples_split": int(rng.integers(2, 21)),
+        "min_samples_leaf": int(rng.integers(1, 11)),
+        "max_features": ["sqrt", "log2", None][int(rng.integers(3))],
+    }
+
+
+def rung_resources(min_resource: int, max_resource: int, eta: int) -> list[int]:
+    """단계별 자원 (마지막 단계 = max_resource, 이전 단계는 1/eta 씩)."""
+    if min_resource < 1 or max_resource < min_resource or eta < 2:
+        raise ValueError("Require 1 <= min_resource <= max_resource and eta >= 2")
+    n_rungs = int(math.floor(math.log(max_resource / min_resource, eta) + 1e-9)) + 1
+    return [max(1, round(max_resource / eta ** (n_rungs - 1 - k))) for k in range(n_rungs)]
+
+
+# ── worker (프로세스별 상태) ──
+
+_worker: dict = {}
+
+
+def _init_worker(X: np.ndarray, y: np.ndarray, folds: list, n_classes: int) -> None:
+    _worker.clear()
+    _worker.update(X=X, y=y, folds=folds, n_classes=n_classes, lgb_folds=None)
+
+
+def _split_early_stopping(train_idx: np.ndarray) -> tuple[np.ndarray, np.ndarray | None]:
+    """fold 학습 구간을 (학습, early stopping 내부 검증) 으로 시간순 분할."""
+    n_stop = int(len(train_idx) * EARLY_STOPPING_FRACTION)
+    if n_stop < MIN_EARLY_STOPPING_SAMPLES or len(train_idx) - n_stop < MIN_EARLY_STOPPING_SAMPLES:
+        return train_idx, None
+    return train_idx[:-n_stop], train_idx[-n_stop:]
+
+
+def _lgb_fold_datasets() -> list:
+    """fold 별 (train Dataset, early stopping Dataset | None, X_val, y_val) — worker 당 1회 구성."""
+    if _worker["lgb_folds"] is None:
+        import lightgbm as lgb
+
+        X, y = _worker["X"], _worker["y"]
+        datasets = []
+        for train_idx, val_idx in _worker["folds"]:
+            fit_idx, stop_idx = _split_early_stopping(train_idx)
+            train = lgb.Dataset(
+                X[fit_idx], y[fit_idx], params=_LGB_DATASET_PARAMS, free_raw_data=False,
+            ).construct()
+            stop = None
+            if stop_idx is not None:
+                stop = lgb.Dataset(
+                    X[stop_idx], y[stop_idx], params=_LGB_DATASET_PARAMS, reference=train,
+                ).construct()
+            datasets.append((train, stop, X[val_idx], y[val_idx]))
+        _worker["lgb_folds"] = datasets
+    return _worker["lgb_folds"]
+
+
+def _evaluate(model_type: str, params: dict, resource: int) -> dict:
+    """trial 1건을 주어진 자원으로 fold 별 평가."""
+    scores = []
+    iterations = []
+    if model_type == "lightgbm":
+        import lightgbm as lgb
+
+        train_params = {**_LGB_BASE_PARAMS, **params, "num_class": _worker["n_classes"]}
+        for train, stop, X_val, y_val in _lgb_fold_datasets():
+            if stop is None:
+                booster = lgb.train(train_params, train, num_boost_round=resource)
+            else:
+                booster = lgb.train(
+                    train_params, train, num_boost_round=resource, valid_sets=[stop],
+                    callbacks=[lgb.early_stopping(EARLY_STOPPING_ROUNDS, verbose=False)],
+                )
+            best_iteration = booster.best_iteration or resource
+            proba = booster.predict(X_val, num_iteration=best_iteration)
+            scores.append(float(np.mean(proba.argmax(axis=1) == y_val)))
+            iterations.append(best_iteration)
+    else:
+        X, y = _worker["X"], _worker["y"]
+        for train_idx, val_idx in _worker["folds"]:
+            model = RandomForestClassifier(
+                n_estimators=resource, random_state=42, n_jobs=1, **params,
+            )
+            model.fit(X[train_idx], y[train_idx])
+            scores.append(float(model.score(X[val_idx], y[val_idx])))
+            iterations.append(resource)
+    return {"scores": scores, "n_estimators": int(round(np.mean(iterations)))}
+
+
+# ── 탐색 ──
+
+def search_hyperparameters(
+    X: np.ndarray,
+    y: np.ndarray,
+    model_type: str = "lightgbm",
+    n_trials: int = 20,
+    n_splits: int = 5,
+    n_jobs: int | None = None,
+    min_resource: int = DEFAULT_MIN_RESOURCE,
+    max_resource: int = DEFAULT_MAX_RESOURCE,
+    eta: int = 3,
+    seed: int = 42,
+) -> dict:
+    """Random search + successive halving.
+
+    Args:
+        X: 피처 행렬 (prediction_date 오름차순)
+        y: 라벨
+        model_type: "lightgbm" or "random_forest"
+        n_trials: 샘플링할 파라미터 세트 수
+        n_splits: TimeSeriesSplit folds
+        n_jobs: worker 프로세스 수 (None = CPU 수, 1 = 현재 프로세스에서 직렬 실행)
+        min_resource / max_resource: 첫/마지막 단계 트리(부스팅 라운드) 수
+        eta: 단계별 생존 비율의 역수 및 자원 증가 배수
+
+    Returns:
+        {
+            "best_params": dict (n_estimators 포함, train_lightgbm/train_random_forest 에 그대로 전달),
+            "best_accuracy": float,
+            "best_trial": int,
+            "n_trials_completed": int,
+            "n_trials_pruned": int,
+            "trials": [{"trial", "params", "status", "rung", "resource",
+                        "cv_accuracy", "cv_std", "cv_scores", "n_estimators"}, ...],
+        }
+    """
+    if model_type not in MODEL_TYPES:
+        raise ValueError(f"Invalid model_type: {model_type}")
+    if model_type == "lightgbm":
+        try:
+            import lightgbm  # noqa: F401
+        except ImportError as err:
+            raise ImportError("lightgbm is required. Install: pip install lightgbm>=4.0.0") from err
+    if n_trials < 1:
+        raise ValueError("n_trials must be >= 1")
+
+    labels, codes = np.unique(np.asarray(y), return_inverse=True)
+    if len(labels) < 2:
+        raise ValueError("At least two label classes are required")
+    X = np.ascontiguousarray(X, dtype=np.float64)
+
+    n_splits = max(2, min(n_splits, len(X) // 2))
+    folds = list(TimeSeriesSplit(n_splits=n_splits).split(X))
+    resources = rung_resources(min_resource, max_resource, eta)
+
+    rng = np.random.default_rng(seed)
+    trials = [
+        {"trial": i, "params": sample_params(model_type, rng), "status": "pruned"}
+        for i in range(n_trials)
+    ]
+
+    n_workers = min(n_jobs or os.cpu_count() or 1, n_trials)
+    initargs = (X, codes, folds, len(labels))
+    pool = None
+    if n_workers > 1:
+        pool = ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=initargs,
+        )
+    else:
+        _init_worker(*initargs)
+
+    try:
+        survivors = trials
+        for rung, resource in enumerate(resources):
+            if pool is None:
+                results = [_evaluate(model_type, t["params"], resource) for t in survivors]
+            else:
+                futures = [
+                    pool.submit(_evaluate, model_type, t["params"], resource) for t in survivors
+                ]
+                results = [f.result() for f in futures]
+
+            for trial, result in zip(survivors, results, strict=True):
+                scores = result["scores"]
+                trial.update(
+                    rung=rung,
+                    resource=resource,
+                    cv_accuracy=round(float(np.mean(scores)), 4),
+                    cv_std=round(float(np.std(scores)), 4),
+                    cv_scores=[round(s, 4) for s in scores],
+                    n_estimators=result["n_estimators"],
+                )
+
+            if rung == len(resources) - 1:
+                for trial in survivors:
+                    trial["status"] = "complete"
+                break
+            survivors = sorted(survivors, key=lambda t: -t["cv_accuracy"])
+            survivors = survivors[:max(1, len(survivors) // eta)]
+            logger.info(
+                "Hyperparameter search rung %d (resource=%d): %d trials advance",
+                rung, resource, len(survivors),
+            )
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        else:
+            _worker.clear()
+
+    completed = [t for t in trials if t["status"] == "complete"]
+    best = max(completed, key=lambda t: t["cv_accuracy"])
+    return {
+        "best_params": {**best["params"], "n_estimators": best["n_estimators"]},
+        "best_accuracy": best["cv_accuracy"],
+        "best_trial": best["trial"],
+        "n_trials_completed": len(completed),
+        "n_trials_pruned": len(trials) - len(completed),
+        "trials": trials,
+    }
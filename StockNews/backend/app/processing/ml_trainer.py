@@ -13,10 +13,13 @@ import numpy as np
 import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import TimeSeriesSplit, cross_val_score
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.models.training import StockTrainingData
 from app.processing.feature_config import get_features_for_tier, get_min_samples_for_tier
+from app.processing.feature_store import get_feature_store
+from app.processing.hyperparameter_search import search_hyperparameters
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +27,9 @@ logger = logging.getLogger(__name__)
 DIRECTION_MAP = {"up": 0, "neutral": 1, "down": 2}
 DIRECTION_LABELS = ["up", "neutral", "down"]
 
+# load_training_data 서버 사이드 커서 배치 크기
+LOAD_BATCH_SIZE = 50_000
+
 
 class MLTrainer:
     """LightGBM + RandomForest 학습 파이프라인."""
@@ -33,10 +39,22 @@ class MLTrainer:
         self.tier = tier
         self.feature_columns = get_features_for_tier(tier)
         self.min_samples = get_min_samples_for_tier(tier)
+        # load_training_data 가 채움: 행별 prediction_date (datetime64[D])
+        self.sample_dates: np.ndarray | None = None
 
-    def load_training_data(self, db: Session) -> tuple[pd.DataFrame, pd.Series]:
+    def load_training_data(
+        self, db: Session, dtype: np.dtype | type = np.float64
+    ) -> tuple[pd.DataFrame, pd.Series]:
         """DB에서 labeled data 로드. TimeSeriesSplit 준비.
 
+        Tier 피처 컬럼과 라벨만 SQL 로 선택해 서버 사이드 커서(yield_per) 배치 단위로
+        NumPy 배열에 바로 적재합니다 (ORM 객체/행별 dict 생성 없음). NULL 은 0.0 으로 채웁니다.
+        피처 행렬 캐시(settings.feature_store_dir)가 설정되어 있으면 변경된 일자만 동기화한 뒤
+        캐시 파티션을 메모리 매핑으로 읽습니다. 행별 prediction_date 는 self.sample_dates 에 둡니다.
+
+        Args:
+            dtype: 피처 배열 dtype (메모리 절감이 필요하면 np.float32)
+
         Returns:
             (X, y) — features DataFrame and direction labels Series.
             Sorted by prediction_date for TimeSeriesSplit.
@@ -44,37 +62,61 @@ class MLTrainer:
         Raises:
             ValueError: If insufficient labeled samples.
         """
-        records = (
-            db.query(StockTrainingData)
-            .filter(
+        store = get_feature_store(self.market)
+        if store is not None:
+            try:
+                store.sync(db)
+                X, y, dates = store.load(self.feature_columns, dtype, with_dates=True)
+            except (OSError, ValueError) as e:
+                logger.warning("Feature store unavailable, loading from DB: %s", e)
+            else:
+                self._check_sample_count(len(y))
+                self.sample_dates = dates
+                return X, y
+
+        n_features = len(self.feature_columns)
+        stmt = (
+            select(
+                *(getattr(StockTrainingData, col) for col in self.feature_columns),
+                StockTrainingData.actual_direction,
+                StockTrainingData.prediction_date,
+            )
+            .where(
                 StockTrainingData.market == self.market,
                 StockTrainingData.actual_direction.isnot(None),
             )
-            .order_by(StockTrainingData.prediction_date)
-            .all()
+            .order_by(StockTrainingData.prediction_date, StockTrainingData.id)
+            .execution_options(yield_per=LOAD_BATCH_SIZE)
         )
 
-        if len(records) < self.min_samples:
-            raise ValueError(
-                f"Insufficient samples: {len(records)} < {self.min_samples} "
-                f"(required for Tier {self.tier})"
-            )
+        feature_blocks = []
+        label_blocks = []
+        date_blocks = []
+        for partition in db.execute(stmt).partitions():
+            block = np.array([tuple(row) for row in partition], dtype=object)
+            # None → NaN (float 변환 시), bool → 0/1
+            feature_blocks.append(block[:, :n_features].astype(dtype))
+            label_blocks.append(block[:, n_features])
+            date_blocks.append(block[:, n_features + 1].astype("datetime64[D]"))
 
-        rows = []
-        labels = []
-        for r in records:
-            row = {}
-            for col in self.feature_columns:
-                val = getattr(r, col, None)
-                row[col] = float(val) if val is not None else 0.0
-            rows.append(row)
-            labels.append(r.actual_direction)
+        self._check_sample_count(sum(len(labels) for labels in label_blocks))
 
-        X = pd.DataFrame(rows, columns=self.feature_columns)
-        y = pd.Series(labels)
+        values = feature_blocks[0] if len(feature_blocks) == 1 else np.concatenate(feature_blocks)
+        values[np.isnan(values)] = 0.0
+
+        X = pd.DataFrame(values, columns=self.feature_columns, copy=False)
+        y = pd.Series(np.concatenate(label_blocks), dtype=object)
+        self.sample_dates = np.concatenate(date_blocks)
 
         return X, y
 
+    def _check_sample_count(self, n_samples: int) -> None:
+        if n_samples < self.min_samples:
+            raise ValueError(
+                f"Insufficient samples: {n_samples} < {self.min_samples} "
+                f"(required for Tier {self.tier})"
+            )
+
     def train_lightgbm(self, X: pd.DataFrame, y: pd.Series, **params) -> dict:
         """LightGBM 학습.
 
@@ -120,6 +162,100 @@ class MLTrainer:
             "feature_importances": importances,
         }
 
+    def train_incremental(
+        self,
+        X: pd.DataFrame,
+        y: pd.Series,
+        base_model,
+        new_mask: np.ndarray,
+        n_estimators: int = 50,
+        n_splits: int = 3,
+        min_new_samples: int = 30,
+        min_validation_samples: int = 100,
+        min_improvement: float = 0.01,
+    ) -> dict:
+        """활성 LightGBM 모델에서 이어서 부스팅 (warm start, init_model).
+
+        base_model 이 학습하지 않은 최근 구간(new_mask) 으로 n_estimators 라운드만 추가합니다.
+        평가는 최근 구간 walk-forward (TimeSeriesSplit): fold 마다 앞부분으로 이어서 학습한
+        후보와 base_model 을 같은 뒷부분에서 비교합니다. Random split 금지.
+        base_model 이 본 적 없는 행만 검증에 쓰므로 검증 행 합계가 min_validation_samples
+        미만이면 거부하고 (새 라벨이 더 쌓일 때까지 대기), 정확도는 검증 행 전체 기준으로
+        집계해 base 보다 min_improvement 이상 높을 때만 improved 입니다.
+
+        Returns:
+            {"model": model, "accuracy": float, "cv_accuracy": float, "cv_std": float,
+             "base_cv_accuracy": float, "improved": bool, "new_samples": int,
+             "validation_samples": int, "feature_importances": dict}
+
+        Raises:
+            ValueError: LightGBM 모델이 아니거나, 새 샘플 / 검증 샘플 부족, 라벨 클래스 누락
+        """
+        try:
+            import lightgbm as lgb
+        except ImportError as err:
+            raise ImportError("lightgbm is required. Install: pip install lightgbm>=4.0.0") from err
+
+        if not hasattr(base_model, "booster_"):
+            raise ValueError("Warm start requires a fitted LightGBM model")
+
+        X_new = X.loc[new_mask].reset_index(drop=True)
+        y_new = y.loc[new_mask].reset_index(drop=True)
+        if len(X_new) < min_new_samples:
+            raise ValueError(f"Insufficient new samples: {len(X_new)} < {min_new_samples}")
+        classes = set(base_model.classes_)
+        if set(y_new) != classes:
+            raise ValueError(f"New samples must cover all model classes: {sorted(classes)}")
+
+        params = {**base_model.get_params(), "n_estimators": n_estimators}
+
+        def warm_fit(X_part: pd.DataFrame, y_part: pd.Series):
+            model = lgb.LGBMClassifier(**params)
+            model.fit(X_part, y_part, init_model=base_model.booster_)
+            return model
+
+        n_splits = max(2, min(n_splits, len(X_new) // 2))
+        scores = []
+        correct = 0
+        base_correct = 0
+        validation_samples = 0
+        for train_idx, val_idx in TimeSeriesSplit(n_splits=n_splits).split(X_new):
+            y_train = y_new.iloc[train_idx]
+            if set(y_train) != classes:
+                continue  # 클래스가 빠진 fold 는 같은 라벨 인코딩으로 이어서 학습 불가
+            X_val, y_val = X_new.iloc[val_idx], y_new.iloc[val_idx]
+            score = warm_fit(X_new.iloc[train_idx], y_train).score(X_val, y_val)
+            scores.append(score)
+            correct += score * len(val_idx)
+            base_correct += base_model.score(X_val, y_val) * len(val_idx)
+            validation_samples += len(val_idx)
+        if not scores:
+            raise ValueError("No walk-forward fold covers all model classes")
+        if validation_samples < min_validation_samples:
+            raise ValueError(
+                f"Insufficient validation samples: {validation_samples} < {min_validation_samples}"
+            )
+
+        model = warm_fit(X_new, y_new)
+        importances = dict(zip(
+            self.feature_columns,
+            [float(v) for v in model.feature_importances_], strict=False,
+        ))
+        cv_accuracy = round(correct / validation_samples, 4)
+        base_cv_accuracy = round(base_correct / validation_samples, 4)
+
+        return {
+            "model": model,
+            "accuracy": float(model.score(X_new, y_new)),
+            "cv_accuracy": cv_accuracy,
+            "cv_std": round(float(np.std(scores)), 4),
+            "base_cv_accuracy": base_cv_accuracy,
+            "improved": cv_accuracy - base_cv_accuracy >= min_improvement,
+            "new_samples": len(X_new),
+            "validation_samples": validation_samples,
+            "feature_importances": importances,
+        }
+
     def train_random_forest(self, X: pd.DataFrame, y: pd.Series, **params) -> dict:
         """RandomForest 학습.
 
@@ -155,6 +291,31 @@ class MLTrainer:
             "feature_importances": importances,
         }
 
+    def search_hyperparameters(
+        self,
+        X: pd.DataFrame,
+        y: pd.Series,
+        model_type: str = "lightgbm",
+        n_trials: int = 20,
+        n_splits: int = 5,
+        n_jobs: int | None = None,
+        **kwargs,
+    ) -> dict:
+        """병렬 random search + successive halving (TimeSeriesSplit CV, 조기 pruning).
+
+        자세한 동작과 반환 형식은 hyperparameter_search.search_hyperparameters 참고.
+        best_params 는 train_lightgbm / train_random_forest 에 그대로 전달할 수 있습니다.
+        """
+        return search_hyperparameters(
+            X[self.feature_columns].to_numpy(),
+            y.to_numpy(),
+            model_type=model_type,
+            n_trials=n_trials,
+            n_splits=n_splits,
+            n_jobs=n_jobs,
+            **kwargs,
+        )
+
     def cross_validate(
         self, model, X: pd.DataFrame, y: pd.Series, n_splits: int = 5
     ) -> dict:
@@ -0,0 +1,103 @@
+"""일일 모델 갱신 — 활성 LightGBM 모델 warm-start 재학습 후 개선 시에만 교체.
+
+전체 재학습 대신 활성 모델의 train_end_date 이후 새로 라벨링된 행으로 부스팅 라운드만
+추가합니다 (MLTrainer.train_incremental). 새 구간 walk-forward 검증 행이
+MODEL_REFRESH_MIN_VALIDATION 개 이상이고 정확도가 현재 모델보다 MODEL_REFRESH_MIN_IMPROVEMENT
+이상 높을 때만 레지스트리에 새 버전으로 저장하고 모델 서버를 통해 활성화합니다.
+"""
+
+import json
+import logging
+from datetime import UTC, datetime
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.processing.ml_trainer import MLTrainer
+from app.processing.model_server import get_model_server
+
+logger = logging.getLogger(__name__)
+
+
+def refresh_active_model(db: Session, market: str, n_estimators: int | None = None) -> dict:
+    """활성 모델 warm-start 갱신.
+
+    Returns:
+        {"status": "promoted" | "rejected" | "skipped" | "no_active_model", ...}
+    """
+    server = get_model_server()
+    registry = server.registry
+    active = registry.get_active(market, db)
+    if active is None:
+        return {"status": "no_active_model", "market": market}
+    if active.model_type != "lightgbm":
+        return {"status": "skipped", "market": market, "reason": "warm start supports lightgbm only"}
+    if active.train_end_date is None:
+        return {
+            "status": "skipped", "market": market,
+            "reason": "active model has no train_end_date; run a full /training/train first",
+        }
+
+    trainer = MLTrainer(market=market, tier=active.feature_tier)
+    try:
+        X, y = trainer.load_training_data(db)
+        new_mask = trainer.sample_dates > np.datetime64(active.train_end_date, "D")
+        result = trainer.train_incremental(
+            X, y,
+            base_model=server.get(active, db).model,
+            new_mask=new_mask,
+            n_estimators=n_estimators or settings.model_refresh_rounds,
+            min_validation_samples=settings.model_refresh_min_validation,
+            min_improvement=settings.model_refresh_min_improvement,
+        )
+    except ValueError as e:
+        return {"status": "skipped", "market": market, "reason": str(e)}
+
+    summary = {
+        "market": market,
+        "base_model_id": active.id,
+        "new_samples": result["new_samples"],
+        "validation_samples": result["validation_samples"],
+        "cv_accuracy": result["cv_accuracy"],
+        "base_cv_accuracy": result["base_cv_accuracy"],
+    }
+    if not result["improved"]:
+        logger.info(
+            "Warm-start refresh rejected for %s: %.4f vs base %.4f (margin %.4f, %d rows)",
+            market, result["cv_accuracy"], result["base_cv_accuracy"],
+            settings.model_refresh_min_improvement, result["validation_samples"],
+        )
+        return {"status": "rejected", **summary}
+
+    model_id = registry.save(
+        model=result["model"],
+        metadata={
+            "model_name": active.model_name,
+            "model_version": f"w{datetime.now(UTC):%Y%m%d%H%M%S}",
+            "model_type": active.model_type,
+            "market": market,
+            "feature_tier": active.feature_tier,
+            "feature_list": json.loads(active.feature_list),
+            "train_accuracy": result["accuracy"],
+            "test_accuracy": None,
+            "cv_accuracy": result["cv_accuracy"],
+            "cv_std": result["cv_std"],
+            "train_samples": (active.train_samples or 0) + result["new_samples"],
+            "test_samples": None,
+            "train_start_date": active.train_start_date,
+            "train_end_date": trainer.sample_dates[new_mask].max().astype(object),
+            "hyperparameters": {
+                "warm_start_from": active.id,
+                "n_estimators": int(result["model"].booster_.current_iteration()),
+            },
+            "feature_importances": result["feature_importances"],
+        },
+        db=db,
+    )
+    server.activate(model_id, db)
+    logger.info(
+        "Warm-start refresh promoted model %d for %s (%.4f > %.4f)",
+        model_id, market, result["cv_accuracy"], result["base_cv_accuracy"],
+    )
+    return {"status": "promoted", "model_id": model_id, **summary}
@@ -8,11 +8,12 @@ import hashlib
 import json
 import logging
 import pickle
+import uuid
 from pathlib import Path
 
 from sqlalchemy.orm import Session
 
-from app.models.ml_model import MLModel
+from app.models.ml_model import MLModel, MLTuningTrial
 
 logger = logging.getLogger(__name__)
 
@@ -98,6 +99,53 @@ class ModelRegistry:
         logger.info("Saved model %s v%s (id=%d) to %s", metadata["model_name"], metadata["model_version"], record.id, filepath)
         return record.id
 
+    def record_trials(
+        self,
+        trials: list[dict],
+        metadata: dict,
+        db: Session,
+    ) -> str:
+        """하이퍼파라미터 탐색 trial 전체 기록 (pruned 포함).
+
+        Args:
+            trials: search_hyperparameters()["trials"]
+            metadata: {"model_type": str, "market": str, "feature_tier": int}
+            db: Database session
+
+        Returns:
+            study_id (str)
+        """
+        study_id = str(uuid.uuid4())
+        db.add_all([
+            MLTuningTrial(
+                study_id=study_id,
+                model_type=metadata["model_type"],
+                market=metadata["market"],
+                feature_tier=metadata["feature_tier"],
+                trial_number=trial["trial"],
+                status=trial["status"],
+                rung=trial["rung"],
+                resource=trial["resource"],
+                params=json.dumps(trial["params"]),
+                cv_accuracy=trial.get("cv_accuracy"),
+                cv_std=trial.get("cv_std"),
+            )
+            for trial in trials
+        ])
+        db.commit()
+
+        logger.info("Recorded %d tuning trials (study=%s) for market %s", len(trials), study_id, metadata["market"])
+        return study_id
+
+    def list_trials(self, study_id: str, db: Session) -> list[MLTuningTrial]:
+        """study 의 trial 목록 (정확도 내림차순)."""
+        return (
+            db.query(MLTuningTrial)
+            .filter(MLTuningTrial.study_id == study_id)
+            .order_by(MLTuningTrial.cv_accuracy.desc(), MLTuningTrial.trial_number)
+            .all()
+        )
+
     def load(self, model_id: int, db: Session):
         """모델 로드 (ID 기반). Checksum 검증.
 
@@ -121,6 +169,26 @@ class ModelRegistry:
 
         return pickle.loads(data)
 
+    def export_compiled(self, model_id: int, db: Session) -> dict | None:
+        """모델을 컴파일 추론 형식(.npz, pickle 불필요)으로 내보내기.
+
+        Returns:
+            {"path": str, "backend": str} — 지원하지 않는 모델이면 None
+        """
+        from app.processing.compiled_model import compile_model, export_compiled
+
+        record = db.query(MLModel).filter(MLModel.id == model_id).first()
+        if not record:
+            raise ValueError(f"Model ID {model_id} not found")
+
+        compiled = compile_model(self.load(model_id, db))
+        if compiled is None:
+            return None
+
+        path = export_compiled(compiled, Path(record.model_path).with_suffix(".npz"))
+        logger.info("Exported compiled model %d (%s) to %s", model_id, compiled.backend, path)
+        return {"path": str(path), "backend": compiled.backend}
+
     def activate(self, model_id: int, db: Session) -> None:
         """모델 활성화 (같은 시장의 다른 모델은 비활성화).
 
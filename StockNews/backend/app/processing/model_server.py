@@ -0,0 +1,244 @@
+"""인프로세스 ML 모델 서빙 — 활성 모델 LRU 캐시 + 배치 예측.
+
+ModelRegistry 는 모델을 pickle 파일로 저장하므로 예측 때마다 파일을 읽고 역직렬화하면
+수십~수백 ms 가 듭니다. ModelServer 는 로드된 모델을 checksum 키 LRU 캐시에 보관하고,
+예측 요청마다 활성 모델 레코드만 조회 (인덱스 조회 1회) 해 캐시에서 꺼냅니다.
+
+- 활성화(/training/models/{id}/activate) 시 새 모델을 미리 로드 → 다음 요청부터 즉시 교체
+- 다른 worker 프로세스에서 활성화해도 레코드 checksum 이 바뀌므로 자동 반영
+- 이전 모델도 캐시에 남아 롤백 시 재로드 없음
+- 종목 N개 예측은 피처 행렬 1개에 대한 predict_proba 1회
+- 로드 시 컴파일 추론 모델 (compiled_model) 로 변환해 sklearn 호출 오버헤드 제거,
+  변환/검증/추론 실패 시 원본 모델로 fallback
+"""
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.ml_model import MLModel
+from app.models.training import StockTrainingData
+from app.processing.compiled_model import compile_model
+from app.processing.model_registry import ModelRegistry
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ServedModel:
+    """캐시된 모델 + 예측에 필요한 메타데이터."""
+
+    model_id: int
+    model_name: str
+    market: str
+    feature_tier: int
+    feature_list: tuple[str, ...]
+    checksum: str
+    model: Any
+    compiled: Any = None  # compiled_model.ForestArrays / NativeBooster, None = 원본 사용
+
+
+class ModelServer:
+    """활성 모델 캐시 및 배치 예측."""
+
+    def __init__(self, registry: ModelRegistry | None = None, capacity: int | None = None):
+        self._registry = registry
+        self.capacity = capacity if capacity is not None else settings.model_cache_size
+        self._models: OrderedDict[str, ServedModel] = OrderedDict()
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    @property
+    def registry(self) -> ModelRegistry:
+        if self._registry is None:
+            self._registry = ModelRegistry()
+        return self._registry
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def _cache_key(self, record: MLModel) -> str:
+        return record.model_checksum or f"id:{record.id}"
+
+    def get(self, record: MLModel, db: Session) -> ServedModel:
+        """레코드의 모델 (캐시 hit 시 역직렬화 없음)."""
+        key = self._cache_key(record)
+        with self._lock:
+            served = self._models.get(key)
+            if served is not None:
+                self._models.move_to_end(key)
+                return served
+
+            model = self.registry.load(record.id, db)  # checksum 검증 포함
+            self.loads += 1
+            compiled = compile_model(model) if settings.model_compiled_inference else None
+            served = ServedModel(
+                model_id=record.id,
+                model_name=record.model_name,
+                market=record.market,
+                feature_tier=record.feature_tier,
+                feature_list=tuple(json.loads(record.feature_list)),
+                checksum=key,
+                model=model,
+                compiled=compiled,
+            )
+            self._models[key] = served
+            while len(self._models) > max(self.capacity, 1):
+                self._models.popitem(last=False)
+        logger.info(
+            "Model %s (id=%d) loaded into serving cache (inference=%s)",
+            record.model_name, record.id, compiled.backend if compiled else "original",
+        )
+        return served
+
+    def get_active(self, market: str, db: Session) -> ServedModel | None:
+        """시장의 활성 모델. 없으면 None."""
+        record = self.registry.get_active(market, db)
+        if record is None:
+            return None
+        return self.get(record, db)
+
+    def activate(self, model_id: int, db: Session) -> ServedModel:
+        """모델 활성화 + 캐시 선적재 (hot-swap).
+
+        Raises:
+            ValueError: If model not found or checksum mismatch.
+        """
+        record = db.query(MLModel).filter(MLModel.id == model_id).first()
+        if not record:
+            raise ValueError(f"Model ID {model_id} not found")
+        served = self.get(record, db)  # 로드 실패 시 활성화하지 않음
+        self.registry.activate(model_id, db)
+        return served
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+
+    # ── 예측 ──
+
+    @staticmethod
+    def _predict_proba(served: ServedModel, values: np.ndarray) -> np.ndarray:
+        if served.compiled is not None:
+            try:
+                return served.compiled.predict_proba(values)
+            except Exception as e:
+                logger.warning("Compiled inference failed for model %d, falling back: %s", served.model_id, e)
+        return served.model.predict_proba(pd.DataFrame(values, columns=list(served.feature_list)))
+
+    @classmethod
+    def _format(cls, served: ServedModel, values: np.ndarray) -> list[dict]:
+        proba = cls._predict_proba(served, values)
+        classes = [str(c) for c in served.model.classes_]
+        best = proba.argmax(axis=1)
+        return [
+            {
+                "direction": classes[idx],
+                "confidence": round(float(row[idx]), 4),
+                "probabilities": {c: round(float(p), 4) for c, p in zip(classes, row, strict=True)},
+            }
+            for idx, row in zip(best, proba, strict=True)
+        ]
+
+    @classmethod
+    def predict_matrix(cls, served: ServedModel, X: pd.DataFrame) -> list[dict]:
+        """피처 행렬 전체를 predict_proba 1회로 예측.
+
+        Returns:
+            [{"direction": str, "confidence": float, "probabilities": {label: float}}, ...]
+        """
+        missing = [col for col in served.feature_list if col not in X.columns]
+        if missing:
+            raise ValueError(f"Missing features for model {served.model_id}: {missing}")
+        if X.empty:
+            return []
+
+        # 학습 시 (MLTrainer.load_training_data) 와 같은 컬럼 순서 / NULL 처리
+        # pandas 3.x 는 읽기 전용 뷰를 반환할 수 있으므로 복사본에서 NULL 을 0.0 으로 채움
+        values = np.nan_to_num(
+            X.loc[:, list(served.feature_list)].to_numpy(dtype=np.float64, na_value=np.nan),
+            nan=0.0, copy=True,
+        )
+        return cls._format(served, values)
+
+    @classmethod
+    def predict_one(cls, served: ServedModel, features: Mapping[str, float | None]) -> dict:
+        """단일 종목 예측 (장중 틱 단위 피처 갱신용, DataFrame 생성 없음).
+
+        누락/None/NaN 피처는 predict_matrix 와 같이 0.0 으로 처리합니다.
+        """
+        values = np.array(
+            [[np.nan if features.get(col) is None else features[col] for col in served.feature_list]],
+            dtype=np.float64,
+        )
+        return cls._format(served, np.nan_to_num(values, nan=0.0, copy=False))[0]
+
+    def predict_batch(
+        self,
+        db: Session,
+        market: str,
+        prediction_date: date,
+        stock_codes: list[str] | None = None,
+    ) -> dict | None:
+        """일자별 피처 스냅샷(stock_training_data)으로 선택 종목 일괄 예측.
+
+        Returns:
+            {"model_id", "model_name", "feature_tier", "predictions": [{"stock_code", ...}]}
+            활성 모델이 없으면 None.
+        """
+        served = self.get_active(market, db)
+        if served is None:
+            return None
+
+        stmt = (
+            select(
+                StockTrainingData.stock_code,
+                *(getattr(StockTrainingData, col) for col in served.feature_list),
+            )
+            .where(
+                StockTrainingData.market == market,
+                StockTrainingData.prediction_date == prediction_date,
+            )
+            .order_by(StockTrainingData.stock_code)
+        )
+        if stock_codes:
+            stmt = stmt.where(StockTrainingData.stock_code.in_(stock_codes))
+        rows = db.execute(stmt).all()
+
+        codes = [row[0] for row in rows]
+        X = pd.DataFrame([tuple(row)[1:] for row in rows], columns=list(served.feature_list))
+        predictions = self.predict_matrix(served, X)
+
+        return {
+            "model_id": served.model_id,
+            "model_name": served.model_name,
+            "feature_tier": served.feature_tier,
+            "predictions": [
+                {"stock_code": code, **pred}
+                for code, pred in zip(codes, predictions, strict=True)
+            ],
+        }
+
+
+_server: ModelServer | None = None
+_server_lock = threading.Lock()
+
+
+def get_model_server() -> ModelServer:
+    """프로세스 공유 모델 서버."""
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = ModelServer()
+        return _server
@@ -0,0 +1,127 @@
+"""뉴스 일별 롤업 재구성.
+
+평상시 롤업은 app.models.news_rollup 의 ORM 리스너가 INSERT/UPDATE/DELETE 와 같은
+트랜잭션에서 증분 갱신합니다. 마이그레이션 직후, 벌크 DML 이후, 또는 불일치가 의심될 때
+이 모듈로 기간 단위 재구성을 수행합니다 (scripts/rebuild_news_rollup.py).
+"""
+
+import logging
+from collections import defaultdict
+from datetime import UTC, date, datetime, time, timedelta
+
+from sqlalchemy import and_, delete, insert, or_, select
+from sqlalchemy.orm import Session
+
+from app.models.news_event import NewsEvent
+from app.models.news_rollup import (
+    ROLLUP_SOURCE_FIELDS,
+    NewsDailyRollup,
+    NewsThemeDailyRollup,
+    event_contributions,
+)
+
+logger = logging.getLogger(__name__)
+
+_STREAM_BATCH_SIZE = 5000
+
+
+def _event_range_filter(start: date | None, end: date | None):
+    """롤업 일자 기준과 동일하게 published_at(없으면 created_at)으로 기간 필터."""
+    conditions = []
+    if start is not None:
+        lo = datetime.combine(start, time.min, tzinfo=UTC)
+        conditions.append(
+            or_(
+                NewsEvent.published_at >= lo,
+                and_(NewsEvent.published_at.is_(None), NewsEvent.created_at >= lo),
+            )
+        )
+    if end is not None:
+        hi = datetime.combine(end + timedelta(days=1), time.min, tzinfo=UTC)
+        conditions.append(
+            or_(
+                NewsEvent.published_at < hi,
+                and_(NewsEvent.published_at.is_(None), NewsEvent.created_at < hi),
+            )
+        )
+    return conditions
+
+
+def rebuild_news_rollups(
+    db: Session, start: date | None = None, end: date | None = None
+) -> dict[str, int]:
+    """[start, end] 기간 롤업을 news_event 로부터 다시 계산 (기간 미지정 시 전체).
+
+    기존 롤업 행을 삭제한 뒤 이벤트를 스트리밍 집계하여 일괄 INSERT 합니다.
+
+    Returns:
+        {"events": 처리 이벤트 수, "stock_rows": 종목 롤업 행 수, "theme_rows": 테마 롤업 행 수}
+    """
+    stock_acc: dict[tuple, dict] = {}
+    theme_acc: dict[tuple, dict] = defaultdict(
+        lambda: {"news_count": 0, "score_sum": 0.0, "sentiment_sum": 0.0}
+    )
+
+    columns = [getattr(NewsEvent, f) for f in ROLLUP_SOURCE_FIELDS]
+    stmt = select(*columns).where(*_event_range_filter(start, end))
+    events = 0
+    for row in db.execute(stmt.execution_options(yield_per=_STREAM_BATCH_SIZE)).mappings():
+        events += 1
+        stock_row, theme_rows = event_contributions(dict(row))
+
+        key = (stock_row["stock_code"], stock_row["market"], stock_row["date"])
+        acc = stock_acc.get(key)
+        if acc is None:
+            stock_acc[key] = dict(stock_row)
+        else:
+            for c in (
+                "news_count", "positive_count", "neutral_count", "negative_count",
+                "disclosure_count", "score_sum", "sentiment_sum",
+            ):
+                acc[c] += stock_row[c]
+            if stock_row["stock_name"]:
+                acc["stock_name"] = stock_row["stock_name"]
+            published = stock_row["last_published_at"]
+            if published and (acc["last_published_at"] is None or published > acc["last_published_at"]):
+                acc["last_published_at"] = published
+
+        for theme_row in theme_rows:
+            tkey = (
+                theme_row["stock_code"], theme_row["market"], theme_row["date"],
+                theme_row["theme"], theme_row["kind"],
+            )
+            tacc = theme_acc[tkey]
+            tacc["news_count"] += 1
+            tacc["score_sum"] += theme_row["score_sum"]
+            tacc["sentiment_sum"] += theme_row["sentiment_sum"]
+
+    for model in (NewsDailyRollup, NewsThemeDailyRollup):
+        clear = delete(model)
+        if start is not None:
+            clear = clear.where(model.date >= start)
+        if end is not None:
+            clear = clear.where(model.date <= end)
+        db.execute(clear)
+
+    now = datetime.now(UTC)
+    if stock_acc:
+        db.execute(
+            insert(NewsDailyRollup),
+            [{**row, "updated_at": now} for row in stock_acc.values()],
+        )
+    if theme_acc:
+        db.execute(
+            insert(NewsThemeDailyRollup),
+            [
+                {
+                    "stock_code": k[0], "market": k[1], "date": k[2],
+                    "theme": k[3], "kind": k[4], **v,
+                }
+                for k, v in theme_acc.items()
+            ],
+        )
+    db.commit()
+
+    result = {"events": events, "stock_rows": len(stock_acc), "theme_rows": len(theme_acc)}
+    logger.info("News rollup rebuilt (%s ~ %s): %s", start or "-", end or "-", result)
+    return result
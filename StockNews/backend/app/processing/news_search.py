@@ -0,0 +1,136 @@
+"""뉴스 전문 검색 조회 + 인덱스 재구성.
+
+검색 문서(news_search)는 app.models.news_search 의 after_flush 리스너가 유지합니다.
+마이그레이션 직후나 벌크 DML 이후에는 rebuild_search_index 로 재구성합니다
+(scripts/rebuild_search_index.py).
+"""
+
+import logging
+
+from sqlalchemy import Float, Integer, delete, func, insert, select, text
+from sqlalchemy.orm import Session, selectinload
+
+from app.models.news_event import NewsEvent
+from app.models.news_search import (
+    PG_SEARCH_VECTOR,
+    NewsSearchDocument,
+    ngram_tokens,
+    search_rows,
+    search_source_query,
+)
+
+logger = logging.getLogger(__name__)
+
+_REBUILD_BATCH_SIZE = 2000
+
+# bm25 컬럼 가중치 (제목/종목/테마가 요약보다 중요)
+_SQLITE_BM25 = "bm25(news_search_fts, 2.0, 1.0)"
+
+
+def search_query_tokens(query: str) -> list[str]:
+    """검색어 → 중복 제거된 토큰 (모두 포함해야 매칭, AND)."""
+    return list(dict.fromkeys(ngram_tokens(query)))
+
+
+def search_news(
+    db: Session,
+    query: str,
+    market: str | None = None,
+    offset: int = 0,
+    limit: int = 20,
+    include_total: bool = True,
+) -> tuple[list[tuple[NewsEvent, float]], int | None]:
+    """검색어와 매칭되는 뉴스를 관련도(rank) 내림차순, 최신순으로 조회.
+
+    rank 는 dialect별 점수(SQLite: -bm25, PostgreSQL: ts_rank)로 클수록 관련도가 높습니다.
+
+    Returns:
+        ([(NewsEvent, rank), ...], total) — 토큰이 없으면 ([], 0)
+    """
+    tokens = search_query_tokens(query)
+    if not tokens:
+        return [], 0
+
+    if db.get_bind().dialect.name == "sqlite":
+        # 토큰은 영숫자/한글 구간이므로 큰따옴표로 감싸 FTS5 구문과 충돌하지 않음
+        match = " ".join(f'"{t}"' for t in tokens)
+        source = text(
+            f"SELECT rowid AS news_id, -{_SQLITE_BM25} AS rank "
+            "FROM news_search_fts WHERE news_search_fts MATCH :match"
+        )
+    else:
+        match = " ".join(tokens)
+        source = text(
+            f"SELECT news_id, ts_rank({PG_SEARCH_VECTOR}, plainto_tsquery('simple', :match)) AS rank "
+            f"FROM news_search WHERE ({PG_SEARCH_VECTOR}) @@ plainto_tsquery('simple', :match)"
+        )
+    matches = (
+        source.bindparams(match=match)
+        .columns(news_id=Integer, rank=Float)
+        .subquery("matches")
+    )
+
+    stmt = select(NewsEvent.id, matches.c.rank).join(matches, matches.c.news_id == NewsEvent.id)
+    if market:
+        stmt = stmt.where(NewsEvent.market == market)
+
+    total = None
+    if include_total:
+        total = db.scalar(select(func.count()).select_from(stmt.subquery()))
+
+    page = db.execute(
+        stmt.order_by(
+            matches.c.rank.desc(),
+            NewsEvent.published_at.desc(),
+            NewsEvent.id.desc(),
+        )
+        .offset(offset)
+        .limit(limit)
+    ).all()
+    if not page:
+        return [], total
+
+    # 페이지 행만 본문과 함께 로드
+    events = {
+        e.id: e
+        for e in db.scalars(
+            select(NewsEvent)
+            .options(selectinload(NewsEvent.body))
+            .where(NewsEvent.id.in_([row.id for row in page]))
+        )
+    }
+    return [(events[row.id], row.rank) for row in page], total
+
+
+def rebuild_search_index(db: Session) -> int:
+    """news_event 전체로부터 news_search 재구성 (SQLite 는 FTS 인덱스도 재생성).
+
+    Returns:
+        색인된 뉴스 수
+    """
+    table = NewsSearchDocument.__table__
+    db.execute(delete(table))
+
+    indexed = 0
+    last_id = 0
+    while True:
+        ids = db.scalars(
+            select(NewsEvent.id)
+            .where(NewsEvent.id > last_id)
+            .order_by(NewsEvent.id)
+            .limit(_REBUILD_BATCH_SIZE)
+        ).all()
+        if not ids:
+            break
+        rows = search_rows(db.execute(search_source_query(ids)))
+        if rows:
+            db.execute(insert(table), rows)
+        indexed += len(rows)
+        last_id = ids[-1]
+
+    if db.get_bind().dialect.name == "sqlite":
+        db.execute(text("INSERT INTO news_search_fts(news_search_fts) VALUES ('rebuild')"))
+    db.commit()
+
+    logger.info("News search index rebuilt: %d documents", indexed)
+    return indexed
@@ -0,0 +1,571 @@
+"""학습 데이터 병렬 백필 — 일자 × 종목 샤드, 가격 일괄 선조회, bulk insert, 체크포인트 재개."""
+
+import json
+import logging
+import multiprocessing
+import os
+import zlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import NamedTuple
+
+import pandas as pd
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.collectors.market_indicator_collector import MarketIndicatorCollector
+from app.collectors.yfinance_middleware import download_with_retry
+from app.core.config import settings
+from app.models.news_event import NewsEvent
+from app.models.training import StockTrainingData
+from app.models.verification import DailyPredictionResult
+from app.processing.parquet_archive import invalidate_archive_days
+from app.processing.price_fetcher import format_ticker
+from app.processing.training_data_builder import (
+    compute_price_features,
+    summarize_news_features,
+    training_snapshot_values,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHARD_DAYS = 14
+PRICE_CHUNK_SIZE = 100  # 다중 티커 다운로드 1회당 종목 수
+INSERT_BATCH_SIZE = 1000
+NEWS_BATCH_SIZE = 10_000
+
+# build_training_snapshot 의 조회 기간과 동일
+PRICE_LOOKBACK_DAYS = 60  # _fetch_price_features
+NEWS_LOOKBACK_DAYS = 30  # _fetch_news_features
+THEME_LOOKBACK_DAYS = 7  # calc_cross_theme_score
+INDEX_LOOKBACK_DAYS = 14  # calc_market_index_change
+INDICATOR_LOOKBACK_DAYS = 10  # MarketIndicatorCollector.fetch_daily_indicators
+
+_ACTUAL_COLUMNS = ("actual_close", "actual_change_pct", "actual_volume", "actual_direction", "is_correct")
+
+
+class BackfillTask(NamedTuple):
+    """백필 대상 예측 결과 1건."""
+
+    prediction_date: date
+    stock_code: str
+    stock_name: str | None
+    predicted_direction: str
+    predicted_score: float
+    confidence: float
+    actual_close_price: float | None
+    actual_change_pct: float | None
+    actual_volume: int | None
+    actual_direction: str | None
+    is_correct: bool | None
+
+
+class NewsRow(NamedTuple):
+    """summarize_news_features 입력 행 (worker 전달용)."""
+
+    stock_code: str
+    news_score: float
+    sentiment_score: float
+    is_disclosure: bool
+    theme: str | None
+    created_at: datetime
+
+
+def shard_key(task_date: date, stock_code: str, start_date: date, shard_days: int, buckets: int) -> str:
+    """샤드 ID — "{블록 시작일}#{종목 버킷}". 같은 시작일/설정이면 재실행해도 동일."""
+    block = start_date + timedelta(days=(task_date - start_date).days // shard_days * shard_days)
+    return f"{block.isoformat()}#{zlib.crc32(stock_code.encode()) % buckets}"
+
+
+class BackfillCheckpoint:
+    """완료 샤드 기록 (JSON, 원자적 교체). path 가 None 이면 메모리에만 유지."""
+
+    def __init__(self, path: str | Path | None, key: dict):
+        self.path = Path(path) if path else None
+        self.key = key
+        self.completed: dict[str, dict] = {}
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            logger.warning("Corrupt backfill checkpoint ignored: %s", self.path)
+            return
+        if data.get("key") != key:
+            logger.info("Backfill settings changed, ignoring checkpoint: %s", self.path)
+            return
+        self.completed = data.get("completed", {})
+
+    def mark(self, shard: str, counts: dict) -> None:
+        self.completed[shard] = counts
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"key": self.key, "completed": self.completed}), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def default_checkpoint_path(market: str, start_date: date, end_date: date) -> Path | None:
+    """BACKFILL_CHECKPOINT_DIR 아래 시장/기간별 체크포인트. 미설정 시 None."""
+    if not settings.backfill_checkpoint_dir:
+        return None
+    return Path(settings.backfill_checkpoint_dir) / f"{market}_{start_date}_{end_date}.json"
+
+
+# ── 일괄 조회 ──
+
+def _load_tasks(db: Session, market: str, start_date: date, end_date: date) -> list[BackfillTask]:
+    rows = db.execute(
+        select(
+            DailyPredictionResult.prediction_date,
+            DailyPredictionResult.stock_code,
+            DailyPredictionResult.stock_name,
+            DailyPredictionResult.predicted_direction,
+            DailyPredictionResult.predicted_score,
+            DailyPredictionResult.confidence,
+            DailyPredictionResult.actual_close_price,
+            DailyPredictionResult.actual_change_pct,
+            DailyPredictionResult.actual_volume,
+            DailyPredictionResult.actual_direction,
+            DailyPredictionResult.is_correct,
+        )
+        .where(
+            DailyPredictionResult.market == market,
+            DailyPredictionResult.prediction_date >= start_date,
+            DailyPredictionResult.prediction_date <= end_date,
+        )
+        .order_by(DailyPredictionResult.prediction_date, DailyPredictionResult.stock_code)
+    ).all()
+    return [BackfillTask(*row) for row in rows]
+
+
+def _existing_keys(db: Session, start_date: date, end_date: date) -> set[tuple[date, str]]:
+    """이미 생성된 (prediction_date, stock_code) — 유니크 인덱스와 같은 키."""
+    rows = db.execute(
+        select(StockTrainingData.prediction_date, StockTrainingData.stock_code).where(
+            StockTrainingData.prediction_date >= start_date,
+            StockTrainingData.prediction_date <= end_date,
+        )
+    ).all()
+    return {(row[0], row[1]) for row in rows}
+
+
+def _naive_utc(value: datetime) -> datetime:
+    return value.astimezone(UTC).replace(tzinfo=None) if value.tzinfo else value
+
+
+def _load_news(
+    db: Session, market: str, start_date: date, end_date: date,
+) -> tuple[dict[str, list[NewsRow]], dict[str, dict[date, tuple[float, int]]]]:
+    """블록 기간 뉴스 1회 조회.
+
+    Returns:
+        (종목별 뉴스 행 (created_at 내림차순), 테마별 일자 (news_score 합, 건수))
+    """
+    stmt = (
+        select(
+            NewsEvent.stock_code,
+            NewsEvent.news_score,
+            NewsEvent.sentiment_score,
+            NewsEvent.is_disclosure,
+            NewsEvent.theme,
+            NewsEvent.created_at,
+        )
+        .where(
+            NewsEvent.market == market,
+            NewsEvent.created_at >= datetime.combine(
+                start_date - timedelta(days=NEWS_LOOKBACK_DAYS), datetime.min.time()
+            ),
+            NewsEvent.created_at <= datetime.combine(end_date, datetime.max.time()),
+        )
+        .order_by(NewsEvent.created_at.desc())
+        .execution_options(yield_per=NEWS_BATCH_SIZE)
+    )
+    by_stock: dict[str, list[NewsRow]] = defaultdict(list)
+    theme_days: dict[str, dict[date, list]] = defaultdict(lambda: defaultdict(lambda: [0.0, 0]))
+    for partition in db.execute(stmt).partitions():
+        for row in partition:
+            news = NewsRow(*row[:5], _naive_utc(row[5]))
+            by_stock[news.stock_code].append(news)
+            if news.theme:
+                bucket = theme_days[news.theme][news.created_at.date()]
+                bucket[0] += news.news_score
+                bucket[1] += 1
+    return by_stock, {
+        theme: {day: (total, count) for day, (total, count) in days.items()}
+        for theme, days in theme_days.items()
+    }
+
+
+def _split_download(df: pd.DataFrame | None, tickers: list[str]) -> dict[str, pd.DataFrame]:
+    """다중 티커 yfinance 결과를 티커별 일봉으로 분리 (group_by 방향 / 단일 티커 모두 처리)."""
+    if df is None or df.empty:
+        return {}
+    frames = {}
+    if isinstance(df.columns, pd.MultiIndex):
+        level = 0 if set(tickers) & set(df.columns.get_level_values(0)) else 1
+        available = set(df.columns.get_level_values(level))
+        for ticker in tickers:
+            if ticker in available:
+                frames[ticker] = df.xs(ticker, axis=1, level=level)
+    elif len(tickers) == 1:
+        frames[tickers[0]] = df
+
+    result = {}
+    for ticker, frame in frames.items():
+        frame = frame.dropna(how="all")
+        if frame.empty:
+            continue
+        if getattr(frame.index, "tz", None) is not None:
+            frame = frame.tz_localize(None)
+        result[ticker] = frame.sort_index()
+    return result
+
+
+def prefetch_prices(
+    stock_codes: list[str], market: str, start_date: date, end_date: date,
+) -> dict[str, pd.DataFrame]:
+    """기간 전체 종목 일봉 (Close, Volume) 을 PRICE_CHUNK_SIZE 단위 다중 티커로 선조회."""
+    tickers = {format_ticker(code, market): code for code in stock_codes}
+    names = sorted(tickers)
+    prices: dict[str, pd.DataFrame] = {}
+    for i in range(0, len(names), PRICE_CHUNK_SIZE):
+        chunk = names[i:i + PRICE_CHUNK_SIZE]
+        df = download_with_retry(
+            chunk if len(chunk) > 1 else chunk[0],
+            start=str(start_date - timedelta(days=PRICE_LOOKBACK_DAYS)),
+            end=str(end_date + timedelta(days=1)),
+            group_by="ticker",
+        )
+        for ticker, frame in _split_download(df, chunk).items():
+            if {"Close", "Volume"} <= set(frame.columns):
+                prices[tickers[ticker]] = frame[["Close", "Volume"]]
+    logger.info("Prefetched prices for %d/%d %s stocks", len(prices), len(stock_codes), market)
+    return prices
+
+
+def _last_change(closes: pd.Series | None, target_date: date, lookback_days: int) -> float | None:
+    """[target - lookback, target] 구간 마지막 두 종가의 등락률 (%)."""
+    if closes is None:
+        return None
+    window = closes.loc[pd.Timestamp(target_date - timedelta(days=lookback_days)):pd.Timestamp(target_date)]
+    if len(window) < 2:
+        return None
+    prev, curr = float(window.iloc[-2]), float(window.iloc[-1])
+    if prev == 0:
+        return None
+    return round(((curr - prev) / prev) * 100, 4)
+
+
+def prefetch_market_features(market: str, dates: list[date]) -> dict[date, tuple[float | None, dict]]:
+    """일자별 (market_index_change, {market_return, vix_change, usd_krw_change}) — 다운로드 1회."""
+    tickers = MarketIndicatorCollector.TICKERS
+    index = tickers["kospi"] if market == "KR" else tickers["sp500"]
+    names = [index, tickers["vix"]] + ([tickers["usd_krw"]] if market == "KR" else [])
+    df = download_with_retry(
+        names,
+        start=str(min(dates) - timedelta(days=INDEX_LOOKBACK_DAYS)),
+        end=str(max(dates) + timedelta(days=1)),
+        group_by="ticker",
+    )
+    closes = {
+        ticker: MarketIndicatorCollector._extract_closes(frame)
+        for ticker, frame in _split_download(df, names).items()
+    }
+
+    features = {}
+    for day in dates:
+        indicators = {
+            "market_return": _last_change(closes.get(index), day, INDICATOR_LOOKBACK_DAYS) or 0.0,
+            "vix_change": _last_change(closes.get(tickers["vix"]), day, INDICATOR_LOOKBACK_DAYS) or 0.0,
+            "usd_krw_change": None,
+        }
+        if market == "KR":
+            indicators["usd_krw_change"] = _last_change(
+                closes.get(tickers["usd_krw"]), day, INDICATOR_LOOKBACK_DAYS
+            )
+        features[day] = (_last_change(closes.get(index), day, INDEX_LOOKBACK_DAYS), indicators)
+    return features
+
+
+# ── worker (순수 계산) ──
+
+def _cross_theme_score(
+    theme: str | None,
+    own_news: list[NewsRow],
+    theme_days: dict[str, dict[date, tuple[float, int]]],
+    target_date: date,
+) -> float:
+    """calc_cross_theme_score 와 같은 값 — 테마 일자 집계에서 자기 종목 뉴스를 뺀 평균."""
+    if not theme:
+        return 0.0
+    days = theme_days.get(theme, {})
+    start = target_date - timedelta(days=THEME_LOOKBACK_DAYS)
+    total = 0.0
+    count = 0
+    for offset in range(THEME_LOOKBACK_DAYS + 1):
+        day_total, day_count = days.get(start + timedelta(days=offset), (0.0, 0))
+        total += day_total
+        count += day_count
+    for news in own_news:
+        if news.theme == theme and start <= news.created_at.date() <= target_date:
+            total -= news.news_score
+            count -= 1
+    if count <= 0:
+        return 0.0
+    return round(total / count, 2)
+
+
+def _build_row(
+    task: BackfillTask,
+    market: str,
+    prices: pd.DataFrame | None,
+    news: list[NewsRow],
+    theme_days: dict,
+    market_features: tuple[float | None, dict],
+) -> dict:
+    target = task.prediction_date
+    news_start = datetime.combine(target - timedelta(days=NEWS_LOOKBACK_DAYS), datetime.min.time())
+    news_end = datetime.combine(target, datetime.max.time())
+    window = [n for n in news if news_start <= n.created_at <= news_end]
+    news_feat = summarize_news_features(window, target)
+
+    price_feat = {}
+    if prices is not None:
+        try:
+            price_feat = compute_price_features(
+                prices.loc[pd.Timestamp(target - timedelta(days=PRICE_LOOKBACK_DAYS)):pd.Timestamp(target)]
+            )
+        except Exception as e:
+            logger.warning("Failed to compute price features for %s: %s", task.stock_code, e)
+
+    market_index_change, market_indicators = market_features
+    values = training_snapshot_values(
+        task.stock_code, task.stock_name, market, target,
+        {"direction": task.predicted_direction, "score": task.predicted_score,
+         "confidence": task.confidence},
+        news_feat, price_feat, market_index_change, market_indicators,
+        _cross_theme_score(news_feat["theme"], window, theme_days, target),
+    )
+    # executemany 는 모든 행의 컬럼 구성이 같아야 하므로 라벨 컬럼은 항상 포함
+    values.update(dict.fromkeys(_ACTUAL_COLUMNS))
+    if task.actual_close_price is not None and task.actual_change_pct is not None:
+        values.update(
+            actual_close=task.actual_close_price,
+            actual_change_pct=task.actual_change_pct,
+            actual_volume=task.actual_volume,
+            actual_direction=task.actual_direction,
+            is_correct=task.is_correct,
+        )
+    return values
+
+
+def _build_shard(
+    market: str,
+    tasks: list[BackfillTask],
+    prices: dict[str, pd.DataFrame],
+    news: dict[str, list[NewsRow]],
+    theme_days: dict,
+    market_features: dict[date, tuple[float | None, dict]],
+) -> dict:
+    """샤드 1개의 StockTrainingData 행 생성.
+
+    Returns:
+        {"rows": [dict, ...], "failed": int}
+    """
+    rows = []
+    failed = 0
+    for task in tasks:
+        try:
+            rows.append(_build_row(
+                task, market, prices.get(task.stock_code), news.get(task.stock_code, []),
+                theme_days, market_features[task.prediction_date],
+            ))
+        except Exception as e:
+            logger.error("Failed to process %s on %s: %s", task.stock_code, task.prediction_date, e)
+            failed += 1
+    return {"rows": rows, "failed": failed}
+
+
+# ── 실행 ──
+
+def _insert_rows(db: Session, rows: list[dict]) -> None:
+    for i in range(0, len(rows), INSERT_BATCH_SIZE):
+        db.execute(insert(StockTrainingData), rows[i:i + INSERT_BATCH_SIZE])
+
+
+def parallel_backfill(
+    db: Session,
+    market: str = "KR",
+    start_date: date | None = None,
+    end_date: date | None = None,
+    workers: int | None = None,
+    shard_days: int = DEFAULT_SHARD_DAYS,
+    buckets: int | None = None,
+    checkpoint_path: str | Path | None = None,
+    dry_run: bool = False,
+) -> dict:
+    """DailyPredictionResult 기반 StockTrainingData 병렬 백필.
+
+    Args:
+        db: Database session
+        market: 시장 (KR/US)
+        start_date / end_date: 백필 기간 (기본: 최근 30일)
+        workers: worker 프로세스 수 (None = BACKFILL_WORKERS, 0 이면 CPU 수; 1 = 현재 프로세스)
+        shard_days: 샤드 일자 블록 길이 (일)
+        buckets: 블록당 종목 버킷 수 (기본: workers)
+        checkpoint_path: 체크포인트 JSON 경로 (기본: BACKFILL_CHECKPOINT_DIR 아래, 미설정 시 미사용)
+        dry_run: True면 생성 대상 건수만 반환
+
+    Returns:
+        {"created": int, "skipped": int, "failed": int, "dates_processed": int,
+         "shards": int, "shards_resumed": int}
+        created / failed 는 체크포인트에 기록된 이전 실행분을 포함하지 않습니다.
+    """
+    end_date = end_date or date.today()
+    start_date = start_date or end_date - timedelta(days=30)
+    if shard_days < 1:
+        raise ValueError("shard_days must be >= 1")
+    n_workers = workers if workers is not None else settings.backfill_workers
+    n_workers = max(1, n_workers or os.cpu_count() or 1)
+    buckets = max(1, buckets or n_workers)
+
+    tasks = _load_tasks(db, market, start_date, end_date)
+    existing = _existing_keys(db, start_date, end_date)
+    pending = [t for t in tasks if (t.prediction_date, t.stock_code) not in existing]
+
+    shards: dict[str, list[BackfillTask]] = defaultdict(list)
+    for task in pending:
+        shards[shard_key(task.prediction_date, task.stock_code, start_date, shard_days, buckets)].append(task)
+
+    if checkpoint_path is None:
+        checkpoint_path = default_checkpoint_path(market, start_date, end_date)
+    checkpoint = BackfillCheckpoint(checkpoint_path, {
+        "market": market, "start_date": start_date.isoformat(), "end_date": end_date.isoformat(),
+        "shard_days": shard_days, "buckets": buckets,
+    })
+    todo = {key: shards[key] for key in sorted(shards) if key not in checkpoint.completed}
+
+    summary = {
+        "created": 0,
+        "skipped": len(tasks) - len(pending),
+        "failed": 0,
+        "dates_processed": len({t.prediction_date for t in tasks}),
+        "shards": len(shards),
+        "shards_resumed": len(shards) - len(todo),
+    }
+    logger.info(
+        "Parallel backfill %s %s~%s: %d tasks, %d existing, %d shards (%d resumed)",
+        market, start_date, end_date, len(tasks), summary["skipped"],
+        summary["shards"], summary["shards_resumed"],
+    )
+    if dry_run:
+        summary["created"] = sum(len(shard) for shard in todo.values())
+        return summary
+    if not todo:
+        return summary
+
+    todo_tasks = [task for shard in todo.values() for task in shard]
+    dates = sorted({t.prediction_date for t in todo_tasks})
+    prices = prefetch_prices(
+        sorted({t.stock_code for t in todo_tasks}), market, dates[0], dates[-1],
+    )
+    market_features = prefetch_market_features(market, dates)
+
+    blocks: dict[str, list[str]] = defaultdict(list)
+    for key in todo:
+        blocks[key.split("#")[0]].append(key)
+
+    written_dates: set[date] = set()
+    pool = None
+    if n_workers > 1 and len(todo) > 1:
+        pool = ProcessPoolExecutor(
+            max_workers=min(n_workers, len(todo)),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    try:
+        for block in sorted(blocks):
+            block_tasks = [task for key in blocks[block] for task in todo[key]]
+            block_start = min(t.prediction_date for t in block_tasks)
+            block_end = max(t.prediction_date for t in block_tasks)
+            news, theme_days = _load_news(db, market, block_start, block_end)
+            price_start = pd.Timestamp(block_start - timedelta(days=PRICE_LOOKBACK_DAYS))
+
+            payloads = {}
+            for key in blocks[block]:
+                codes = {t.stock_code for t in todo[key]}
+                payloads[key] = (
+                    market,
+                    todo[key],
+                    {c: prices[c].loc[price_start:pd.Timestamp(block_end)] for c in codes if c in prices},
+                    {c: news[c] for c in codes if c in news},
+                    theme_days,
+                    {t.prediction_date: market_features[t.prediction_date] for t in todo[key]},
+                )
+
+            if pool is None:
+                results = ((key, _build_shard(*payload)) for key, payload in payloads.items())
+            else:
+                futures = {pool.submit(_build_shard, *payload): key for key, payload in payloads.items()}
+                results = ((futures[f], f.result()) for f in as_completed(futures))
+
+            for key, result in results:
+                rows = result["rows"]
+                try:
+                    _insert_rows(db, rows)
+                    db.commit()
+                except Exception as e:
+                    logger.error("Failed to insert backfill shard %s: %s", key, e)
+                    db.rollback()
+                    summary["failed"] += len(todo[key])
+                    continue
+                written_dates.update(row["prediction_date"] for row in rows)
+                # 실패 행이 있는 샤드는 완료로 기록하지 않음 → 재실행 시 저장된 행은 기존 키로
+                # 건너뛰고 실패한 작업만 다시 계산
+                if result["failed"] == 0:
+                    checkpoint.mark(key, {"created": len(rows)})
+                summary["created"] += len(rows)
+                summary["failed"] += result["failed"]
+            logger.info(
+                "Backfill block %s done (%d/%d shards)",
+                block, len(checkpoint.completed), len(shards),
+            )
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        # 이미 Parquet 아카이브로 내보낸 일자는 다음 야간 내보내기에서 다시 내보냄
+        invalidate_archive_days(["stock_training_data"], written_dates)
+
+    logger.info(
+        "Parallel backfill complete: %d created, %d skipped, %d failed, %d dates",
+        summary["created"], summary["skipped"], summary["failed"], summary["dates_processed"],
+    )
+    return summary
+
+
+def run_parallel_backfill(
+    market: str = "KR",
+    start_date: date | None = None,
+    end_date: date | None = None,
+    **kwargs,
+) -> dict:
+    """Standalone entry point for parallel backfill (creates own DB session).
+
+    Args:
+        market: 시장 (KR/US)
+        start_date / end_date: 백필 기간
+        **kwargs: parallel_backfill 옵션 (workers, shard_days, checkpoint_path, dry_run ...)
+
+    Returns:
+        Summary dict with counts
+    """
+    from app.core.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return parallel_backfill(db, market, start_date, end_date, **kwargs)
+    finally:
+        db.close()
@@ -0,0 +1,283 @@
+"""Parquet 아카이브 — 분석용 테이블을 날짜 파티션 Parquet 파일로 내보내기 (조회는 analytics_engine).
+
+pyarrow는 선택 의존성입니다 (pip install pyarrow>=15.0.0).
+"""
+
+import json
+import logging
+import os
+import shutil
+from datetime import UTC, date, datetime, time, timedelta
+from pathlib import Path
+
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.news_event import NewsEvent
+from app.models.stock_price import StockPrice
+from app.models.training import StockTrainingData
+from app.models.verification import DailyPredictionResult
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "_manifest.json"
+
+# table name → (model, 날짜 파티션 기준 컬럼)
+ARCHIVE_TABLES: dict[str, tuple[type, str]] = {
+    "news_event": (NewsEvent, "published_at"),
+    "stock_price": (StockPrice, "date"),
+    "stock_training_data": (StockTrainingData, "prediction_date"),
+    "daily_prediction_result": (DailyPredictionResult, "prediction_date"),
+}
+
+
+def require_pyarrow():
+    """pyarrow, pyarrow.parquet 모듈 반환 (미설치 시 ImportError)."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as err:
+        raise ImportError("pyarrow is required. Install: pip install pyarrow>=15.0.0") from err
+    return pa, pq
+
+
+def arrow_schema(model: type):
+    """SQLAlchemy 컬럼 타입 → Arrow 스키마 (빈 날/전부 NULL인 날에도 스키마 고정)."""
+    pa, _ = require_pyarrow()
+    fields = []
+    for col in model.__table__.columns:
+        if isinstance(col.type, Boolean):
+            arrow_type = pa.bool_()
+        elif isinstance(col.type, Integer):
+            arrow_type = pa.int64()
+        elif isinstance(col.type, Float):
+            arrow_type = pa.float64()
+        elif isinstance(col.type, DateTime):
+            arrow_type = pa.timestamp("us", tz="UTC")
+        elif isinstance(col.type, Date):
+            arrow_type = pa.date32()
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(col.name, arrow_type))
+    return pa.schema(fields)
+
+
+def _day_filter(model: type, date_column: str, day: date):
+    """해당 일자 필터 (DateTime 컬럼은 인덱스를 타도록 [day, day+1) 범위 조건)."""
+    col = getattr(model, date_column)
+    if isinstance(model.__table__.columns[date_column].type, DateTime):
+        start = datetime.combine(day, time.min, tzinfo=UTC)
+        return (col >= start) & (col < start + timedelta(days=1))
+    return col == day
+
+
+def partition_dir(archive_dir: str | Path, table: str, day: date) -> Path:
+    """일자 파티션 디렉터리 경로."""
+    return Path(archive_dir) / table / f"date={day.isoformat()}"
+
+
+def _load_manifest(archive_dir: str | Path, table: str) -> dict:
+    """manifest 원본 값 (구간/ stale 일자). 없음/손상 시 빈 dict."""
+    path = Path(archive_dir) / table / MANIFEST_FILE
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return {
+            "exported_from": (
+                date.fromisoformat(data["exported_from"]) if data.get("exported_from") else None
+            ),
+            "exported_through": date.fromisoformat(data["exported_through"]),
+            "stale": {date.fromisoformat(day) for day in data.get("stale", [])},
+        }
+    except (ValueError, KeyError, TypeError, json.JSONDecodeError):
+        logger.warning("Corrupt archive manifest: %s", path)
+        return {}
+
+
+def read_manifest(archive_dir: str | Path, table: str) -> date | None:
+    """테이블별 마지막 내보내기 완료 일자."""
+    return _load_manifest(archive_dir, table).get("exported_through")
+
+
+def archive_coverage(
+    archive_dir: str | Path, table: str
+) -> tuple[date, date, set[date]] | None:
+    """(exported_from, exported_through, stale 일자). 구간 정보가 없으면 None.
+
+    exported_from 이 없는 이전 형식 manifest 는 시작일을 알 수 없으므로 None 입니다
+    (scripts/export_parquet_archive.py 로 기간을 다시 내보내면 기록됨).
+    """
+    manifest = _load_manifest(archive_dir, table)
+    if not manifest or manifest["exported_from"] is None:
+        return None
+    return manifest["exported_from"], manifest["exported_through"], manifest["stale"]
+
+
+def _write_manifest(
+    archive_dir: str | Path,
+    table: str,
+    exported_from: date | None,
+    exported_through: date,
+    stale: set[date] | None = None,
+) -> None:
+    path = Path(archive_dir) / table / MANIFEST_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "exported_from": exported_from.isoformat() if exported_from else None,
+        "exported_through": exported_through.isoformat(),
+        "stale": sorted(day.isoformat() for day in stale or ()),
+    }
+    # API worker / 스케줄러 프로세스가 동시에 갱신해도 임시 파일이 겹치지 않도록 pid 포함
+    tmp = path.with_name(f"{MANIFEST_FILE}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def mark_stale(archive_dir: str | Path, table: str, days: list[date] | set[date]) -> int:
+    """이미 내보낸 일자를 재내보내기 대상으로 표시.
+
+    Returns:
+        새로 표시한 일자 수 (아직 내보내지 않은 일자는 무시)
+    """
+    manifest = _load_manifest(archive_dir, table)
+    if not manifest:
+        return 0
+    exported_from = manifest["exported_from"]
+    exported_through = manifest["exported_through"]
+    new = {
+        day for day in days
+        if day <= exported_through and (exported_from is None or day >= exported_from)
+    } - manifest["stale"]
+    if new:
+        _write_manifest(
+            archive_dir, table, exported_from, exported_through, manifest["stale"] | new,
+        )
+    return len(new)
+
+
+def invalidate_archive_days(tables: list[str], days: list[date] | set[date]) -> None:
+    """설정된 아카이브에서 수정된 일자를 stale 로 표시 (검증/백필 후 호출). 미설정 시 무시."""
+    if not settings.analytics_archive_dir or not days:
+        return
+    for table in tables:
+        marked = mark_stale(settings.analytics_archive_dir, table, days)
+        if marked:
+            logger.info("Marked %d archived %s days stale", marked, table)
+
+
+def export_table_day(db: Session, archive_dir: str | Path, table: str, day: date) -> int:
+    """단일 테이블의 하루치 데이터를 Parquet 파티션으로 내보내기 (덮어쓰기).
+
+    Returns:
+        내보낸 행 수
+    """
+    pa, pq = require_pyarrow()
+    model, date_column = ARCHIVE_TABLES[table]
+    schema = arrow_schema(model)
+
+    rows = (
+        db.execute(
+            select(*model.__table__.columns).where(_day_filter(model, date_column, day))
+        )
+        .mappings()
+        .all()
+    )
+
+    target = partition_dir(archive_dir, table, day)
+    if not rows:
+        if target.exists():
+            shutil.rmtree(target)
+        return 0
+
+    arrow_table = pa.Table.from_pylist([dict(r) for r in rows], schema=schema)
+    target.mkdir(parents=True, exist_ok=True)
+    pq.write_table(arrow_table, target / "part-0.parquet", compression="zstd")
+    return len(rows)
+
+
+def _record_export(archive_dir: str | Path, table: str, start: date, end: date) -> None:
+    """내보낸 [start, end] 를 manifest 구간에 병합하고 해당 stale 표시 제거.
+
+    이전 구간과 이어지지 않으면 exported_through 가 더 늦은 구간만 기록합니다
+    (covers() 가 연속 구간만 보장하도록).
+    """
+    manifest = _load_manifest(archive_dir, table)
+    stale = {day for day in manifest.get("stale", set()) if not start <= day <= end}
+    prev_from = manifest.get("exported_from")
+    prev_through = manifest.get("exported_through")
+
+    if prev_through is None:
+        exported_from, exported_through = start, end
+    elif prev_from is not None and start <= prev_through + timedelta(days=1) \
+            and end >= prev_from - timedelta(days=1):
+        exported_from, exported_through = min(prev_from, start), max(prev_through, end)
+    elif end > prev_through:
+        exported_from, exported_through = start, end
+    else:
+        exported_from, exported_through = prev_from, prev_through
+
+    stale = {
+        day for day in stale
+        if exported_from is None or exported_from <= day <= exported_through
+    }
+    _write_manifest(archive_dir, table, exported_from, exported_through, stale)
+
+
+def export_archive(
+    db: Session,
+    archive_dir: str | Path,
+    start: date,
+    end: date,
+    tables: list[str] | None = None,
+) -> dict[str, int]:
+    """[start, end] 기간을 테이블별로 내보내고 manifest 갱신.
+
+    Returns:
+        {table: 내보낸 행 수}
+    """
+    exported: dict[str, int] = {}
+    for table in tables or list(ARCHIVE_TABLES):
+        total = 0
+        day = start
+        while day <= end:
+            total += export_table_day(db, archive_dir, table, day)
+            day += timedelta(days=1)
+
+        _record_export(archive_dir, table, start, end)
+        exported[table] = total
+        logger.info("Archived %s %s~%s: %d rows", table, start, end, total)
+    return exported
+
+
+def run_nightly_export(
+    db: Session, archive_dir: str | Path, today: date | None = None
+) -> dict[str, int]:
+    """stale 일자 재내보내기 + manifest 다음 날부터 어제까지 증분 내보내기.
+
+    최초 실행은 어제 하루만 내보냅니다. 과거 전체 기간은 scripts/export_parquet_archive.py 로
+    백필합니다 (그 전까지 covers() 는 아카이브 이전 기간을 SQL 로 조회).
+    """
+    yesterday = (today or date.today()) - timedelta(days=1)
+    exported: dict[str, int] = {}
+    for table in ARCHIVE_TABLES:
+        manifest = _load_manifest(archive_dir, table)
+        refreshed = 0
+        for day in sorted(manifest.get("stale", ())):
+            refreshed += export_table_day(db, archive_dir, table, day)
+        if manifest.get("stale"):
+            _write_manifest(
+                archive_dir, table, manifest["exported_from"], manifest["exported_through"],
+            )
+            logger.info("Re-exported %d stale %s days", len(manifest["stale"]), table)
+
+        last = manifest.get("exported_through")
+        start = last + timedelta(days=1) if last else yesterday
+        if start > yesterday:
+            exported[table] = refreshed
+            continue
+        exported[table] = refreshed + export_archive(
+            db, archive_dir, start, yesterday, tables=[table],
+        )[table]
+    return exported
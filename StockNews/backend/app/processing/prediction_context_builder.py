@@ -3,6 +3,7 @@
 import json
 import logging
 import os
+from collections import namedtuple
 from datetime import UTC, date, datetime, timedelta
 
 from sqlalchemy import func
@@ -20,18 +21,57 @@ DEFAULT_CONTEXT_PATH = os.path.join(
 )
 
 
-def _get_verified_results(
-    db: Session, days: int, market: str | None = None
-) -> list[DailyPredictionResult]:
-    """Get verified prediction results within the date range."""
+# 분석에 필요한 컬럼만 조회 (아카이브/DB 행 모두 속성 접근)
+_VERIFIED_COLUMNS = (
+    "market", "predicted_direction", "predicted_score", "confidence", "news_count",
+    "actual_direction", "actual_change_pct", "is_correct",
+)
+_SENTIMENT_COLUMNS = ("sentiment_score", "actual_direction")
+_ArchivedRow = {
+    columns: namedtuple("ArchivedRow", columns) for columns in (_VERIFIED_COLUMNS, _SENTIMENT_COLUMNS)
+}
+
+
+def _scan_labeled(
+    db: Session, model, columns: tuple[str, ...], label_column: str, days: int, market: str | None
+) -> list:
+    """최근 days 일 라벨 확정 행 조회.
+
+    Parquet 아카이브가 기간 앞부분을 포함하면 그 구간은 DuckDB 로 읽고,
+    나머지 최근 구간만 DB 에서 조회합니다.
+    """
+    from app.processing.analytics_engine import get_analytics_engine
+
     cutoff = date.today() - timedelta(days=days)
-    query = db.query(DailyPredictionResult).filter(
-        DailyPredictionResult.prediction_date >= cutoff,
-        DailyPredictionResult.is_correct.isnot(None),
+    rows: list = []
+    engine = get_analytics_engine()
+    table = model.__tablename__
+    archived = engine.archived_through(table, cutoff, date.today()) if engine else None
+    if archived is not None:
+        sql = (
+            f"SELECT {', '.join(columns)} FROM {table} "
+            f"WHERE prediction_date BETWEEN ? AND ? AND {label_column} IS NOT NULL"
+        )
+        params: list = [cutoff, archived]
+        if market:
+            sql += " AND market = ?"
+            params.append(market)
+        row_type = _ArchivedRow[columns]
+        rows = [row_type(*row) for row in engine.fetch_rows(sql, params)]
+        cutoff = archived + timedelta(days=1)
+
+    query = db.query(*(getattr(model, c) for c in columns)).filter(
+        model.prediction_date >= cutoff,
+        getattr(model, label_column).isnot(None),
     )
     if market:
-        query = query.filter(DailyPredictionResult.market == market)
-    return query.all()
+        query = query.filter(model.market == market)
+    return rows + query.all()
+
+
+def _get_verified_results(db: Session, days: int, market: str | None = None) -> list:
+    """Get verified prediction results within the date range."""
+    return _scan_labeled(db, DailyPredictionResult, _VERIFIED_COLUMNS, "is_correct", days, market)
 
 
 def _analyze_direction_accuracy(results: list[DailyPredictionResult]) -> list[dict]:
@@ -105,15 +145,9 @@ def _analyze_sentiment_ranges(
     db: Session, days: int, market: str | None = None
 ) -> list[dict]:
     """감성 점수 범위별 실제 방향 분포."""
-    cutoff = date.today() - timedelta(days=days)
-    query = db.query(StockTrainingData).filter(
-        StockTrainingData.prediction_date >= cutoff,
-        StockTrainingData.actual_direction.isnot(None),
+    rows = _scan_labeled(
+        db, StockTrainingData, _SENTIMENT_COLUMNS, "actual_direction", days, market,
     )
-    if market:
-        query = query.filter(StockTrainingData.market == market)
-
-    rows = query.all()
 
     # Define buckets: [-1.0, -0.5), [-0.5, 0.0), [0.0, 0.5), [0.5, 1.0]
     buckets = [
@@ -0,0 +1,184 @@
+"""인메모리 테마 강도 엔진.
+
+테마×마켓×종류(news/impact)×일자 누적합(건수, 스코어 합, 감성 합)을 메모리에 유지하고
+/theme/strength 를 DB 조회 없이 계산합니다.
+
+- 시작 시(또는 최초 조회 시) news_theme_daily_rollup 에서 재생(replay)
+- news_event 커밋 시 롤업 리스너가 계산한 테마 증분(kr_impact_themes JSON 은
+  수집 시점에 한 번만 파싱)을 theme_delta_subscribers 로 전달받아 그대로 누적
+- 다른 프로세스(스케줄러/워커)의 커밋은 theme_strength_resync_seconds 주기의
+  전체 재동기화로 반영
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import date
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.news_rollup import NewsThemeDailyRollup, theme_delta_subscribers
+
+logger = logging.getLogger(__name__)
+
+# (theme, market, kind) → [건수, 스코어 합, 감성 합]
+_Sums = dict[tuple[str, str, str], list[float]]
+
+
+def _new_sums() -> _Sums:
+    return defaultdict(lambda: [0, 0.0, 0.0])
+
+
+def _market_score(agg: list[float]) -> float:
+    count, score_sum, sentiment_sum = agg
+    if not count:
+        return 0.0
+    avg_sent = sentiment_sum / count
+    avg_news = score_sum / count
+    return avg_news * 0.6 + (avg_sent + 1) * 20
+
+
+def calc_rise_index(kr: list[float], us: list[float]) -> float:
+    """rise_index 계산: KR 60% + US 40% 가중 (뉴스 없는 마켓은 0), 0-100."""
+    kr_score = _market_score(kr)
+    us_score = _market_score(us)
+
+    # 가중 배합 (두 마켓 모두 데이터 있으면 KR 60% + US 40%)
+    if kr[0] and us[0]:
+        combined = kr_score * 0.6 + us_score * 0.4
+    elif kr[0]:
+        combined = kr_score
+    else:
+        combined = us_score
+
+    return round(min(100, max(0, combined)), 1)
+
+
+class ThemeStrengthEngine:
+    """테마별 누적합을 증분 유지하는 테마 강도 계산기 (스레드 안전)."""
+
+    def __init__(self, resync_seconds: int = 300):
+        self.resync_seconds = resync_seconds
+        self._lock = threading.Lock()
+        self._by_day: dict[date, _Sums] = {}
+        self._total: _Sums = _new_sums()
+        self._loaded_at: float | None = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def reset(self) -> None:
+        """상태 초기화 (다음 조회 시 재생)."""
+        with self._lock:
+            self._by_day = {}
+            self._total = _new_sums()
+            self._loaded_at = None
+
+    def load(self, db: Session) -> int:
+        """news_theme_daily_rollup 에서 전체 상태 재생. 적재된 (일자, 테마, 마켓, 종류) 수 반환."""
+        rows = (
+            db.query(
+                NewsThemeDailyRollup.date,
+                NewsThemeDailyRollup.theme,
+                NewsThemeDailyRollup.market,
+                NewsThemeDailyRollup.kind,
+                func.sum(NewsThemeDailyRollup.news_count),
+                func.sum(NewsThemeDailyRollup.score_sum),
+                func.sum(NewsThemeDailyRollup.sentiment_sum),
+            )
+            .group_by(
+                NewsThemeDailyRollup.date,
+                NewsThemeDailyRollup.theme,
+                NewsThemeDailyRollup.market,
+                NewsThemeDailyRollup.kind,
+            )
+            .all()
+        )
+
+        by_day: dict[date, _Sums] = defaultdict(_new_sums)
+        total = _new_sums()
+        for day, theme, market, kind, count, score_sum, sentiment_sum in rows:
+            for sums in (by_day[day][(theme, market, kind)], total[(theme, market, kind)]):
+                sums[0] += count or 0
+                sums[1] += score_sum or 0.0
+                sums[2] += sentiment_sum or 0.0
+
+        with self._lock:
+            self._by_day = dict(by_day)
+            self._total = total
+            self._loaded_at = time.monotonic()
+        logger.info("Theme strength engine loaded: %d rollup groups", len(rows))
+        return len(rows)
+
+    def ensure_loaded(self, db: Session) -> None:
+        """미적재 또는 재동기화 주기 경과 시 재생."""
+        loaded_at = self._loaded_at
+        if loaded_at is None or (
+            self.resync_seconds > 0 and time.monotonic() - loaded_at >= self.resync_seconds
+        ):
+            self.load(db)
+
+    def apply(self, deltas: list[tuple[list[dict], int]]) -> None:
+        """커밋된 테마 롤업 증분 반영 ([(theme_rows, sign)], 미적재 상태면 무시)."""
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            for theme_rows, sign in deltas:
+                for row in theme_rows:
+                    key = (row["theme"], row["market"], row["kind"])
+                    day = self._by_day.setdefault(row["date"], _new_sums())
+                    for sums in (day[key], self._total[key]):
+                        sums[0] += sign * row["news_count"]
+                        sums[1] += sign * row["score_sum"]
+                        sums[2] += sign * row["sentiment_sum"]
+
+    def strength(self, market: str | None = None, day: date | None = None) -> list[dict]:
+        """테마 강도 목록 (rise_index 내림차순).
+
+        표시 항목은 market 필터가 적용된 kind="news" 합계이며, rise_index 는 마켓 필터와
+        무관하게 KR(news) / US(news + impact) 를 모두 반영합니다.
+        """
+        with self._lock:
+            source = self._total if day is None else self._by_day.get(day, {})
+            snapshot = [(key, list(sums)) for key, sums in source.items()]
+
+        # 테마별 KR/US 분리 집계 — rise_index 계산용 (market 무관)
+        # US 뉴스의 kr_impact_themes 기여분(kind="impact")은 US 쪽에 합산
+        global_data: dict[str, dict[str, list[float]]] = {}
+        # 마켓 필터 적용된 표시 항목
+        theme_data: dict[str, list[float]] = {}
+        for (theme, row_market, kind), sums in snapshot:
+            key = "US" if kind == "impact" or row_market == "US" else "KR"
+            g = global_data.setdefault(theme, {"KR": [0, 0.0, 0.0], "US": [0, 0.0, 0.0]})[key]
+            for i in range(3):
+                g[i] += sums[i]
+
+            if kind != "news" or (market and row_market != market):
+                continue
+            t = theme_data.setdefault(theme, [0, 0.0, 0.0])
+            for i in range(3):
+                t[i] += sums[i]
+
+        items = []
+        for theme, (news_count, score_sum, sentiment_sum) in theme_data.items():
+            if news_count <= 0:
+                continue
+            items.append({
+                "theme": theme,
+                "strength_score": round(score_sum / news_count, 2),
+                "news_count": int(news_count),
+                "sentiment_avg": round(sentiment_sum / news_count, 3),
+                "rise_index": calc_rise_index(global_data[theme]["KR"], global_data[theme]["US"]),
+            })
+
+        items.sort(key=lambda x: x["rise_index"], reverse=True)
+        return items
+
+
+theme_strength_engine = ThemeStrengthEngine(resync_seconds=settings.theme_strength_resync_seconds)
+
+theme_delta_subscribers.append(theme_strength_engine.apply)
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 
 from app.models.training import StockTrainingData
 from app.models.verification import DailyPredictionResult
+from app.processing.parquet_archive import invalidate_archive_days
 from app.processing.training_data_builder import build_training_snapshot
 
 logger = logging.getLogger(__name__)
@@ -33,6 +34,7 @@ def backfill_training_data(
     skipped = 0
     failed = 0
     dates_processed = 0
+    written_dates: list[date] = []
 
     # 1. Get all unique prediction dates from DailyPredictionResult for the market
     end_date = date.today()
@@ -129,11 +131,15 @@ def backfill_training_data(
         if not dry_run:
             try:
                 db.commit()
+                written_dates.append(target_date)
                 logger.info(f"Committed batch for {target_date}")
             except Exception as e:
                 logger.error(f"Failed to commit batch for {target_date}: {e}")
                 db.rollback()
 
+    # 이미 Parquet 아카이브로 내보낸 일자는 다음 야간 내보내기에서 다시 내보냄
+    invalidate_archive_days(["stock_training_data"], written_dates)
+
     # 7. Log summary
     summary = {
         "created": created,
@@ -3,9 +3,11 @@
 import csv
 import io
 import logging
+from collections.abc import Iterator
 from datetime import date, datetime, timedelta
 
 import pandas as pd
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.collectors.market_indicator_collector import MarketIndicatorCollector
@@ -35,7 +37,13 @@ def _fetch_news_features(
     cutoff_30d = datetime.combine(target_date - timedelta(days=30), datetime.min.time())
 
     news = (
-        db.query(NewsEvent)
+        db.query(
+            NewsEvent.news_score,
+            NewsEvent.sentiment_score,
+            NewsEvent.is_disclosure,
+            NewsEvent.theme,
+            NewsEvent.created_at,
+        )
         .filter(
             NewsEvent.stock_code == stock_code,
             NewsEvent.market == market,
@@ -46,6 +54,14 @@ def _fetch_news_features(
         .all()
     )
 
+    return summarize_news_features(news, target_date)
+
+
+def summarize_news_features(news: list, target_date: date) -> dict:
+    """예측 시점의 뉴스 행 (created_at 내림차순, 최근 30일) 에서 뉴스 피처 계산.
+
+    각 행은 news_score, sentiment_score, is_disclosure, theme, created_at 속성을 가집니다.
+    """
     if not news:
         return {
             "news_score": 0.0,
@@ -104,40 +120,45 @@ def _fetch_price_features(
 
     try:
         df = download_with_retry(ticker, start=str(start), end=str(end))
-        if df.empty or len(df) < 2:
-            return {}
+        return compute_price_features(df)
+    except Exception as e:
+        logger.warning("Failed to fetch price features for %s: %s", stock_code, e)
+        return {}
 
-        closes = df["Close"]
-        if isinstance(closes, pd.DataFrame):
-            closes = closes.iloc[:, 0]
-        closes = closes.dropna()
 
-        volumes = df["Volume"]
-        if isinstance(volumes, pd.DataFrame):
-            volumes = volumes.iloc[:, 0]
-        volumes = volumes.dropna()
+def compute_price_features(df: pd.DataFrame) -> dict:
+    """예측 시점까지의 일봉 (Close/Volume, 최근 60일) 에서 주가 피처 계산."""
+    if df.empty or len(df) < 2:
+        return {}
 
-        # 기본 주가 정보
-        prev_close = float(closes.iloc[-1]) if len(closes) >= 1 else None
-        prev_change_pct = None
-        if len(closes) >= 2:
-            p1, p2 = float(closes.iloc[-2]), float(closes.iloc[-1])
-            prev_change_pct = round(((p2 - p1) / p1) * 100, 4) if p1 != 0 else None
+    closes = df["Close"]
+    if isinstance(closes, pd.DataFrame):
+        closes = closes.iloc[:, 0]
+    closes = closes.dropna()
 
-        prev_volume = int(volumes.iloc[-1]) if len(volumes) >= 1 else None
+    volumes = df["Volume"]
+    if isinstance(volumes, pd.DataFrame):
+        volumes = volumes.iloc[:, 0]
+    volumes = volumes.dropna()
 
-        # 기술적 지표
-        indicators = compute_all_technical_indicators(closes, volumes)
+    # 기본 주가 정보
+    prev_close = float(closes.iloc[-1]) if len(closes) >= 1 else None
+    prev_change_pct = None
+    if len(closes) >= 2:
+        p1, p2 = float(closes.iloc[-2]), float(closes.iloc[-1])
+        prev_change_pct = round(((p2 - p1) / p1) * 100, 4) if p1 != 0 else None
 
-        return {
-            "prev_close": prev_close,
-            "prev_change_pct": prev_change_pct,
-            "prev_volume": prev_volume,
-            **indicators,
-        }
-    except Exception as e:
-        logger.warning("Failed to fetch price features for %s: %s", stock_code, e)
-        return {}
+    prev_volume = int(volumes.iloc[-1]) if len(volumes) >= 1 else None
+
+    # 기술적 지표
+    indicators = compute_all_technical_indicators(closes, volumes)
+
+    return {
+        "prev_close": prev_close,
+        "prev_change_pct": prev_change_pct,
+        "prev_volume": prev_volume,
+        **indicators,
+    }
 
 
 def build_training_snapshot(
@@ -178,7 +199,29 @@ def build_training_snapshot(
         db, news_feat["theme"], stock_code, market, target_date
     )
 
-    record = StockTrainingData(
+    record = StockTrainingData(**training_snapshot_values(
+        stock_code, stock_name, market, target_date, prediction,
+        news_feat, price_feat, market_index_change, market_indicators, cross_theme_score,
+    ))
+
+    db.add(record)
+    return record
+
+
+def training_snapshot_values(
+    stock_code: str,
+    stock_name: str | None,
+    market: str,
+    target_date: date,
+    prediction: dict,
+    news_feat: dict,
+    price_feat: dict,
+    market_index_change: float | None,
+    market_indicators: dict,
+    cross_theme_score: float,
+) -> dict:
+    """수집한 피처로 StockTrainingData 컬럼 값 구성 (bulk insert 에도 사용)."""
+    return dict(
         prediction_date=target_date,
         stock_code=stock_code,
         stock_name=stock_name,
@@ -218,9 +261,6 @@ def build_training_snapshot(
         confidence=prediction["confidence"],
     )
 
-    db.add(record)
-    return record
-
 
 def update_training_actuals(
     db: Session,
@@ -273,6 +313,113 @@ def update_training_actuals(
     return updated
 
 
+# 내보내기 배치 크기 (서버 사이드 커서 fetch / Parquet row group 단위)
+EXPORT_BATCH_SIZE = 5000
+
+# CSV 내보내기 컬럼 순서
+TRAINING_EXPORT_COLUMNS = [
+    "prediction_date", "stock_code", "stock_name", "market",
+    "news_score", "sentiment_score", "news_count", "news_count_3d",
+    "avg_score_3d", "disclosure_ratio", "sentiment_trend", "theme",
+    "prev_close", "prev_change_pct", "prev_volume",
+    "price_change_5d", "volume_change_5d",
+    "ma5_ratio", "ma20_ratio", "volatility_5d", "rsi_14", "bb_position",
+    "market_index_change", "market_return", "vix_change",
+    "usd_krw_change", "has_earnings_disclosure", "cross_theme_score",
+    "day_of_week",
+    "predicted_direction", "predicted_score", "confidence",
+    "actual_close", "actual_change_pct", "actual_direction",
+    "actual_volume", "is_correct",
+]
+
+# 값 그대로 기록하는 컬럼 (NOT NULL)
+_EXPORT_RAW_COLUMNS = {
+    "stock_code", "market", "news_score", "sentiment_score", "news_count",
+    "news_count_3d", "avg_score_3d", "disclosure_ratio", "sentiment_trend",
+    "day_of_week", "predicted_direction", "predicted_score", "confidence",
+}
+# None만 빈 문자열로 바꾸는 nullable boolean 컬럼
+_EXPORT_NULLABLE_BOOL_COLUMNS = {"has_earnings_disclosure", "is_correct"}
+
+
+def _format_export_row(row: tuple) -> list:
+    """DB/아카이브 행 튜플을 CSV 셀 값으로 변환."""
+    cells = []
+    for col, value in zip(TRAINING_EXPORT_COLUMNS, row, strict=True):
+        if col == "prediction_date":
+            cells.append(str(value))
+        elif col in _EXPORT_RAW_COLUMNS:
+            cells.append(value)
+        elif col in _EXPORT_NULLABLE_BOOL_COLUMNS:
+            cells.append(bool(value) if value is not None else "")
+        else:
+            cells.append(value or "")
+    return cells
+
+
+def _iter_training_export_batches(
+    db: Session,
+    market: str,
+    start_date: date,
+    end_date: date,
+    batch_size: int | None = None,
+) -> Iterator[list[tuple]]:
+    """내보내기 대상 행을 batch_size 단위로 스트리밍 조회.
+
+    기간 전체가 Parquet 아카이브에 있으면 DuckDB, 아니면 서버 사이드 커서(yield_per)로
+    DB에서 읽어 전체 결과를 메모리에 올리지 않습니다.
+    """
+    from app.processing.analytics_engine import get_analytics_engine
+
+    batch_size = batch_size or EXPORT_BATCH_SIZE
+    engine = get_analytics_engine()
+    if engine and engine.covers("stock_training_data", start_date, end_date):
+        yield from engine.iter_batches(
+            f"SELECT {', '.join(TRAINING_EXPORT_COLUMNS)} FROM stock_training_data "
+            "WHERE market = ? AND prediction_date BETWEEN ? AND ? "
+            "ORDER BY prediction_date, stock_code",
+            [market, start_date, end_date],
+            batch_size,
+        )
+        return
+
+    columns = [getattr(StockTrainingData, c) for c in TRAINING_EXPORT_COLUMNS]
+    stmt = (
+        select(*columns)
+        .where(
+            StockTrainingData.market == market,
+            StockTrainingData.prediction_date >= start_date,
+            StockTrainingData.prediction_date <= end_date,
+        )
+        .order_by(
+            StockTrainingData.prediction_date,
+            StockTrainingData.stock_code,
+        )
+        .execution_options(yield_per=batch_size)
+    )
+    for partition in db.execute(stmt).partitions():
+        yield [tuple(r) for r in partition]
+
+
+def iter_training_csv(
+    db: Session,
+    market: str,
+    start_date: date,
+    end_date: date,
+) -> Iterator[str]:
+    """학습 데이터 CSV 를 헤더 → 배치 단위 청크로 생성 (StreamingResponse 용)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(TRAINING_EXPORT_COLUMNS)
+    yield buffer.getvalue()
+
+    for batch in _iter_training_export_batches(db, market, start_date, end_date):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(_format_export_row(row) for row in batch)
+        yield buffer.getvalue()
+
+
 def export_training_csv(
     db: Session,
     market: str,
@@ -281,6 +428,8 @@ def export_training_csv(
 ) -> str:
     """학습 데이터를 CSV 문자열로 내보내기.
 
+    대용량 기간은 iter_training_csv 로 스트리밍하세요.
+
     Args:
         db: Database session
         market: 시장 (KR/US)
@@ -290,79 +439,67 @@ def export_training_csv(
     Returns:
         CSV 문자열
     """
-    records = (
-        db.query(StockTrainingData)
-        .filter(
-            StockTrainingData.market == market,
-            StockTrainingData.prediction_date >= start_date,
-            StockTrainingData.prediction_date <= end_date,
-        )
-        .order_by(
-            StockTrainingData.prediction_date,
-            StockTrainingData.stock_code,
-        )
-        .all()
-    )
+    return "".join(iter_training_csv(db, market, start_date, end_date))
+
+
+class _ChunkSink:
+    """pyarrow writer 출력을 모아 두었다가 청크 단위로 넘겨주는 쓰기 전용 버퍼."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self.closed = False
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
 
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Header
-    columns = [
-        "prediction_date", "stock_code", "stock_name", "market",
-        "news_score", "sentiment_score", "news_count", "news_count_3d",
-        "avg_score_3d", "disclosure_ratio", "sentiment_trend", "theme",
-        "prev_close", "prev_change_pct", "prev_volume",
-        "price_change_5d", "volume_change_5d",
-        "ma5_ratio", "ma20_ratio", "volatility_5d", "rsi_14", "bb_position",
-        "market_index_change", "market_return", "vix_change",
-        "usd_krw_change", "has_earnings_disclosure", "cross_theme_score",
-        "day_of_week",
-        "predicted_direction", "predicted_score", "confidence",
-        "actual_close", "actual_change_pct", "actual_direction",
-        "actual_volume", "is_correct",
-    ]
-    writer.writerow(columns)
-
-    for r in records:
-        writer.writerow([
-            str(r.prediction_date),
-            r.stock_code,
-            r.stock_name or "",
-            r.market,
-            r.news_score,
-            r.sentiment_score,
-            r.news_count,
-            r.news_count_3d,
-            r.avg_score_3d,
-            r.disclosure_ratio,
-            r.sentiment_trend,
-            r.theme or "",
-            r.prev_close or "",
-            r.prev_change_pct or "",
-            r.prev_volume or "",
-            r.price_change_5d or "",
-            r.volume_change_5d or "",
-            r.ma5_ratio or "",
-            r.ma20_ratio or "",
-            r.volatility_5d or "",
-            r.rsi_14 or "",
-            r.bb_position or "",
-            r.market_index_change or "",
-            r.market_return or "",
-            r.vix_change or "",
-            r.usd_krw_change or "",
-            r.has_earnings_disclosure if r.has_earnings_disclosure is not None else "",
-            r.cross_theme_score or "",
-            r.day_of_week,
-            r.predicted_direction,
-            r.predicted_score,
-            r.confidence,
-            r.actual_close or "",
-            r.actual_change_pct or "",
-            r.actual_direction or "",
-            r.actual_volume or "",
-            r.is_correct if r.is_correct is not None else "",
-        ])
-
-    return output.getvalue()
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_training_arrow(
+    db: Session,
+    market: str,
+    start_date: date,
+    end_date: date,
+    fmt: str = "parquet",
+) -> Iterator[bytes]:
+    """학습 데이터를 Parquet(fmt="parquet") 또는 Arrow IPC stream(fmt="arrow")으로 생성.
+
+    배치마다 Parquet row group / Arrow record batch 하나를 기록하고 즉시 내보냅니다.
+    pyarrow 선택 의존성이 필요합니다 (pip install pyarrow>=15.0.0).
+    """
+    from app.processing.parquet_archive import arrow_schema, require_pyarrow
+
+    pa, pq = require_pyarrow()
+    table_schema = arrow_schema(StockTrainingData)
+    schema = pa.schema([table_schema.field(c) for c in TRAINING_EXPORT_COLUMNS])
+    sink = _ChunkSink()
+    if fmt == "parquet":
+        writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    elif fmt == "arrow":
+        writer = pa.ipc.new_stream(sink, schema)
+    else:
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    try:
+        for batch in _iter_training_export_batches(db, market, start_date, end_date):
+            columns = list(zip(*batch, strict=True))
+            writer.write_table(pa.Table.from_arrays(
+                [pa.array(col, type=field.type) for col, field in zip(columns, schema, strict=True)],
+                schema=schema,
+            ))
+            if chunk := sink.drain():
+                yield chunk
+    finally:
+        writer.close()
+    if chunk := sink.drain():
+        yield chunk
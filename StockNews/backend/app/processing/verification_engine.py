@@ -6,11 +6,15 @@ from datetime import UTC, date, datetime, timedelta
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from app.core.response_cache import invalidate_tags
 from app.models.news_event import NewsEvent
+from app.models.news_rollup import NewsDailyRollup
 from app.models.verification import (
     DailyPredictionResult,
     VerificationRunLog,
 )
+from app.processing.feature_store import sync_feature_store
+from app.processing.parquet_archive import invalidate_archive_days
 from app.processing.price_fetcher import (
     fetch_prices_batch,
     get_direction_from_change,
@@ -28,19 +32,20 @@ def get_stocks_with_news(
 ) -> list[dict]:
     """Get stocks that have sufficient recent news for prediction."""
     cutoff = target_date - timedelta(days=30)
+    news_count = func.sum(NewsDailyRollup.news_count)
     rows = (
         db.query(
-            NewsEvent.stock_code,
-            NewsEvent.stock_name,
-            func.count(NewsEvent.id).label("news_count"),
+            NewsDailyRollup.stock_code,
+            func.max(NewsDailyRollup.stock_name).label("stock_name"),
+            news_count.label("news_count"),
         )
         .filter(
-            NewsEvent.market == market,
-            NewsEvent.created_at >= datetime.combine(cutoff, datetime.min.time()),
-            NewsEvent.created_at <= datetime.combine(target_date, datetime.max.time()),
+            NewsDailyRollup.market == market,
+            NewsDailyRollup.date >= cutoff,
+            NewsDailyRollup.date <= target_date,
         )
-        .group_by(NewsEvent.stock_code, NewsEvent.stock_name)
-        .having(func.count(NewsEvent.id) >= min_news_count)
+        .group_by(NewsDailyRollup.stock_code)
+        .having(news_count >= min_news_count)
         .all()
     )
     return [
@@ -55,7 +60,11 @@ def calculate_prediction_for_stock(
     """Calculate prediction for a stock (replicates prediction.py logic)."""
     cutoff = datetime.combine(target_date, datetime.max.time())
     news = (
-        db.query(NewsEvent)
+        db.query(
+            NewsEvent.stock_name,
+            NewsEvent.news_score,
+            NewsEvent.sentiment_score,
+        )
         .filter(
             NewsEvent.stock_code == stock_code,
             NewsEvent.market == market,
@@ -201,6 +210,20 @@ async def run_verification(
         except Exception as e:
             logger.warning("Failed to update training actuals: %s", e)
 
+        # 피처 행렬 캐시 증분 갱신 (라벨이 채워진 대상 일자)
+        try:
+            sync_feature_store(db, market, force_dates=[target_date])
+        except Exception as e:
+            logger.warning("Failed to update feature store: %s", e)
+
+        # 재검증 등으로 이미 아카이브된 일자의 라벨이 바뀌면 Parquet 도 다시 내보냄
+        try:
+            invalidate_archive_days(
+                ["daily_prediction_result", "stock_training_data"], [target_date],
+            )
+        except Exception as e:
+            logger.warning("Failed to invalidate parquet archive: %s", e)
+
         # Step 5: Update run log
         duration = (datetime.now(UTC) - start_time).total_seconds()
         run_log.status = "success" if failed == 0 else "partial"
@@ -208,6 +231,9 @@ async def run_verification(
         run_log.stocks_failed = failed
         run_log.duration_seconds = duration
         db.commit()
+
+        # 정확도 응답 캐시 무효화
+        invalidate_tags(["verification"])
         return run_log
 
     except Exception as e:
@@ -26,6 +26,21 @@ class NewsItem(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class NewsSearchItem(NewsItem):
+    """검색 결과 항목 (rank: 클수록 관련도 높음)."""
+
+    rank: float = 0.0
+
+
+class NewsSearchResponse(BaseModel):
+    """뉴스 검색 응답."""
+
+    items: list[NewsSearchItem]
+    total: int | None = None  # include_total=false 면 None
+    offset: int = 0
+    limit: int = 20
+
+
 class NewsScoreResponse(BaseModel):
     """종목별 뉴스 스코어 응답."""
 
@@ -48,9 +63,10 @@ class NewsListResponse(BaseModel):
     """뉴스 리스트 페이지네이션 응답."""
 
     items: list[NewsItem]
-    total: int
+    total: int | None = None  # include_total=false 면 None
     offset: int = 0
     limit: int = 20
+    next_cursor: str | None = None  # keyset 다음 페이지 커서 (마지막 페이지면 None)
 
 
 class NewsTopItem(BaseModel):
@@ -3,7 +3,7 @@
 from datetime import datetime
 from enum import StrEnum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class MessageType(StrEnum):
@@ -35,6 +35,7 @@ class BreakingNewsMessage(BaseModel):
     market: Market = Field(..., description="시장 구분")
     published_at: str | None = Field(default=None, description="발행 시각 ISO format")
     timestamp: str = Field(default_factory=lambda: datetime.now().isoformat(), description="메시지 생성 시각")
+    event_id: str | None = Field(default=None, description="속보 스트림 엔트리 ID (재접속 재생 기준)")
 
     model_config = {"extra": "ignore"}
 
@@ -47,10 +48,43 @@ class ScoreUpdateMessage(BaseModel):
     news_score: float = Field(..., ge=0.0, le=100.0, description="뉴스 점수")
     market: Market = Field(..., description="시장 구분")
     timestamp: str = Field(default_factory=lambda: datetime.now().isoformat(), description="메시지 생성 시각")
+    event_id: str | None = Field(default=None, description="속보 스트림 엔트리 ID (재접속 재생 기준)")
 
     model_config = {"extra": "ignore"}
 
 
+# 구독 필터 항목 최대 수 (종목/테마 각각)
+MAX_SUBSCRIPTION_ITEMS = 300
+
+
+class SubscriptionFilter(BaseModel):
+    """/ws/news 구독 필터 (클라이언트 subscribe 메시지).
+
+    markets, min_score 는 AND 조건이며 stock_codes / themes 는 둘 중 하나라도 일치하면
+    통과합니다. 둘 다 비어 있으면 종목/테마 제한이 없습니다.
+    """
+    markets: list[Market] = Field(default_factory=list, description="수신할 시장 (빈 값 = 전체)")
+    stock_codes: list[str] = Field(
+        default_factory=list, max_length=MAX_SUBSCRIPTION_ITEMS, description="종목 코드"
+    )
+    themes: list[str] = Field(
+        default_factory=list, max_length=MAX_SUBSCRIPTION_ITEMS, description="테마"
+    )
+    min_score: float = Field(default=0.0, ge=0.0, le=100.0, description="최소 뉴스 점수")
+
+    model_config = {"extra": "ignore"}
+
+    @field_validator("stock_codes")
+    @classmethod
+    def normalize_stock_codes(cls, v: list[str]) -> list[str]:
+        return list(dict.fromkeys(code.strip().upper() for code in v if code.strip()))
+
+    @field_validator("themes")
+    @classmethod
+    def normalize_themes(cls, v: list[str]) -> list[str]:
+        return list(dict.fromkeys(theme.strip() for theme in v if theme.strip()))
+
+
 def validate_message(raw_data: dict) -> BreakingNewsMessage | ScoreUpdateMessage | None:
     """수신된 메시지를 타입에 따라 검증.
 
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Parallel training data backfill script.
+
+Rebuilds stock_training_data from daily_prediction_result over a long range.
+Work is sharded by date block x stock bucket across worker processes, prices are
+prefetched in bulk, and rows are bulk-inserted. Progress is checkpointed per shard,
+so an interrupted run resumes where it stopped when re-run with the same arguments.
+
+Usage:
+    cd backend
+    .venv/bin/python scripts/backfill_training_data.py --start-date 2025-10-01
+    .venv/bin/python scripts/backfill_training_data.py --start-date 2025-10-01 --markets KR --workers 8
+"""
+
+import argparse
+import logging
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add backend root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.config import settings
+from app.processing.parallel_backfill import DEFAULT_SHARD_DAYS, run_parallel_backfill
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+)
+logger = logging.getLogger("training_backfill")
+
+
+def main(markets: list[str], start: date, end: date, **options) -> None:
+    for market in markets:
+        result = run_parallel_backfill(market, start, end, **options)
+        logger.info(
+            "%s backfill (%s ~ %s): %d created, %d skipped, %d failed, %d/%d shards resumed",
+            market, start, end, result["created"], result["skipped"], result["failed"],
+            result["shards_resumed"], result["shards"],
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parallel training data backfill")
+    parser.add_argument("--start-date", required=True, help="Start date (YYYY-MM-DD)")
+    parser.add_argument(
+        "--end-date",
+        default=None,
+        help="End date (YYYY-MM-DD), default: yesterday",
+    )
+    parser.add_argument("--markets", nargs="+", choices=["KR", "US"], default=["KR", "US"])
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.backfill_workers,
+        help="Worker processes, default: BACKFILL_WORKERS (0 = CPU count)",
+    )
+    parser.add_argument(
+        "--shard-days",
+        type=int,
+        default=DEFAULT_SHARD_DAYS,
+        help=f"Days per shard block, default: {DEFAULT_SHARD_DAYS}",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Count rows without writing")
+    args = parser.parse_args()
+
+    main(
+        args.markets,
+        date.fromisoformat(args.start_date),
+        date.fromisoformat(args.end_date) if args.end_date else date.today() - timedelta(days=1),
+        workers=args.workers,
+        shard_days=args.shard_days,
+        dry_run=args.dry_run,
+    )
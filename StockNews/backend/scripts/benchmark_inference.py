@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Compiled vs pickled model inference benchmark.
+
+Loads the active model for a market from the registry, compiles it
+(app.processing.compiled_model) and compares per-row and batch
+predict_proba latency on the most recent feature snapshots. With --export
+the compiled model is also written next to the pickle as .npz.
+
+Usage:
+    cd backend
+    .venv/bin/python scripts/benchmark_inference.py --market KR --rows 200
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+# Add backend root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+from sqlalchemy import select
+
+from app.core.database import SessionLocal
+from app.models.training import StockTrainingData
+from app.processing.compiled_model import benchmark, compile_model
+from app.processing.model_registry import ModelRegistry
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+)
+logger = logging.getLogger("benchmark_inference")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--market", default="KR")
+    parser.add_argument("--rows", type=int, default=200, help="feature rows (batch size)")
+    parser.add_argument("--export", action="store_true", help="write compiled .npz artifact")
+    args = parser.parse_args()
+
+    registry = ModelRegistry()
+    db = SessionLocal()
+    try:
+        active = registry.get_active(args.market, db)
+        if active is None:
+            logger.error("No active model for market %s", args.market)
+            sys.exit(1)
+
+        features = json.loads(active.feature_list)
+        rows = db.execute(
+            select(*(getattr(StockTrainingData, col) for col in features))
+            .where(StockTrainingData.market == args.market)
+            .order_by(StockTrainingData.prediction_date.desc(), StockTrainingData.id.desc())
+            .limit(args.rows)
+        ).all()
+        if not rows:
+            logger.error("No feature snapshots for market %s", args.market)
+            sys.exit(1)
+
+        X = np.array([tuple(row) for row in rows], dtype=object).astype(np.float64)
+        X[np.isnan(X)] = 0.0
+
+        model = registry.load(active.id, db)
+        compiled = compile_model(model, X)
+        if compiled is None:
+            logger.error("Model %d could not be compiled; serving uses the pickled model", active.id)
+            sys.exit(1)
+
+        result = benchmark(model, compiled, X)
+        if args.export:
+            result["export"] = registry.export_compiled(active.id, db)
+    finally:
+        db.close()
+
+    print(json.dumps({"model_id": active.id, "model_name": active.model_name, **result}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
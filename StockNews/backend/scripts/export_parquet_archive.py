@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Parquet archive backfill script.
+
+Exports news_event, stock_price, stock_training_data and daily_prediction_result
+into date-partitioned Parquet files for the DuckDB analytics engine. The nightly
+scheduler job only exports new days; use this script for the historical range.
+
+Usage:
+    cd backend
+    .venv/bin/python scripts/export_parquet_archive.py --start-date 2026-01-01
+    .venv/bin/python scripts/export_parquet_archive.py --start-date 2026-01-01 --end-date 2026-02-20 --tables stock_training_data
+"""
+
+import argparse
+import logging
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add backend root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.config import settings
+from app.core.database import ReadSessionLocal
+from app.processing.parquet_archive import ARCHIVE_TABLES, export_archive
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+)
+logger = logging.getLogger("parquet_archive")
+
+
+def main(start: date, end: date, archive_dir: str, tables: list[str] | None) -> None:
+    db = ReadSessionLocal()
+    try:
+        exported = export_archive(db, archive_dir, start, end, tables=tables)
+    finally:
+        db.close()
+
+    logger.info("Export complete (%s ~ %s) → %s", start, end, archive_dir)
+    for table, count in exported.items():
+        logger.info("  %-24s: %d rows", table, count)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parquet archive backfill")
+    parser.add_argument("--start-date", required=True, help="Start date (YYYY-MM-DD)")
+    parser.add_argument(
+        "--end-date",
+        default=None,
+        help="End date (YYYY-MM-DD), default: yesterday",
+    )
+    parser.add_argument(
+        "--archive-dir",
+        default=settings.analytics_archive_dir,
+        help="Archive root directory, default: ANALYTICS_ARCHIVE_DIR",
+    )
+    parser.add_argument(
+        "--tables",
+        nargs="*",
+        choices=sorted(ARCHIVE_TABLES),
+        default=None,
+        help="Tables to export, default: all",
+    )
+    args = parser.parse_args()
+
+    if not args.archive_dir:
+        parser.error("--archive-dir or ANALYTICS_ARCHIVE_DIR is required")
+
+    main(
+        date.fromisoformat(args.start_date),
+        date.fromisoformat(args.end_date) if args.end_date else date.today() - timedelta(days=1),
+        args.archive_dir,
+        args.tables,
+    )
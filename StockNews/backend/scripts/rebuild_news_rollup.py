@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""News daily rollup rebuild script.
+
+Recomputes news_daily_rollup / news_theme_daily_rollup from news_event. Normal
+inserts keep the rollups current in the same transaction; run this after the
+migration that creates the tables, after bulk DML, or to repair drift.
+
+Usage:
+    cd backend
+    .venv/bin/python scripts/rebuild_news_rollup.py
+    .venv/bin/python scripts/rebuild_news_rollup.py --start-date 2026-02-01 --end-date 2026-02-20
+"""
+
+import argparse
+import logging
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add backend root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.database import SessionLocal
+from app.processing.news_rollup import rebuild_news_rollups
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+)
+logger = logging.getLogger("news_rollup")
+
+
+def main(start: date | None, end: date | None) -> None:
+    db = SessionLocal()
+    try:
+        result = rebuild_news_rollups(db, start, end)
+    finally:
+        db.close()
+
+    logger.info("Rebuild complete (%s ~ %s)", start or "begin", end or "end")
+    for key, count in result.items():
+        logger.info("  %-12s: %d", key, count)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="News daily rollup rebuild")
+    parser.add_argument("--start-date", default=None, help="Start date (YYYY-MM-DD), default: all")
+    parser.add_argument("--end-date", default=None, help="End date (YYYY-MM-DD), default: all")
+    args = parser.parse_args()
+
+    main(
+        date.fromisoformat(args.start_date) if args.start_date else None,
+        date.fromisoformat(args.end_date) if args.end_date else None,
+    )
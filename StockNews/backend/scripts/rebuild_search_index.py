@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""News full-text search index rebuild script.
+
+Recomputes news_search token documents from news_event/news_content (and the
+SQLite FTS5 index). Normal inserts keep the index current in the same
+transaction; run this after the migration that creates the table, after bulk
+DML, or to repair drift.
+
+Usage:
+    cd backend
+    .venv/bin/python scripts/rebuild_search_index.py
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+# Add backend root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.database import SessionLocal
+from app.processing.news_search import rebuild_search_index
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+)
+logger = logging.getLogger("news_search")
+
+
+def main() -> None:
+    db = SessionLocal()
+    try:
+        indexed = rebuild_search_index(db)
+    finally:
+        db.close()
+
+    logger.info("Rebuild complete: %d documents indexed", indexed)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,11 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from app.core.database import get_db
+from app.api.news import news_score_cache
+from app.core.config import settings
+from app.core.database import get_db, get_read_db
 from app.main import app as fastapi_app
+from app.processing.theme_strength_engine import theme_strength_engine
 from app.models.base import Base
 import app.models  # noqa: F401
 
@@ -31,8 +34,8 @@ def integration_session_factory(integration_engine):
 
 
 @pytest.fixture(autouse=True)
-def override_get_db(integration_session_factory):
-    """모든 통합 테스트에서 get_db를 테스트 DB로 오버라이드."""
+def override_get_db(integration_session_factory, monkeypatch):
+    """모든 통합 테스트에서 get_db/get_read_db를 테스트 DB로 오버라이드 (Redis 응답 캐시 비활성화, 인메모리 캐시 초기화)."""
 
     def _get_test_db():
         db = integration_session_factory()
@@ -42,5 +45,9 @@ def override_get_db(integration_session_factory):
             db.close()
 
     fastapi_app.dependency_overrides[get_db] = _get_test_db
+    fastapi_app.dependency_overrides[get_read_db] = _get_test_db
+    news_score_cache.clear()
+    theme_strength_engine.reset()
+    monkeypatch.setattr(settings, "response_cache_enabled", False)
     yield
     fastapi_app.dependency_overrides.clear()
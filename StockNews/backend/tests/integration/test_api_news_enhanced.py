@@ -1,7 +1,7 @@
 """RED: 향상된 /news/* 엔드포인트 통합 테스트."""
 
 import pytest
-from datetime import datetime, timezone
+from datetime import UTC, datetime, timezone
 from httpx import ASGITransport, AsyncClient
 
 from app.main import app
@@ -104,6 +104,57 @@ class TestNewsScoreEnhanced:
         data = resp.json()
         assert data["updated_at"] is None
 
+    @pytest.mark.asyncio
+    async def test_news_score_days_window(self, async_client, seed_news_with_themes):
+        """days 지정 시 기간 밖 뉴스는 집계에서 제외."""
+        resp = await async_client.get("/api/v1/news/score", params={"stock": "005930", "days": 7})
+        assert resp.status_code == 200
+        assert resp.json()["news_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_news_score_cache_invalidated_on_insert(
+        self, async_client, integration_session_factory
+    ):
+        """새 뉴스 커밋 시 해당 종목 캐시가 무효화되어 즉시 반영."""
+        params = {"stock": "373220"}
+        first = (await async_client.get("/api/v1/news/score", params=params)).json()
+        assert first["news_count"] == 0
+
+        session = integration_session_factory()
+        session.add(NewsEvent(
+            market="KR", stock_code="373220", stock_name="LG에너지솔루션",
+            title="LG엔솔 수주", sentiment="positive", sentiment_score=0.6,
+            news_score=75.0, source="naver",
+            published_at=datetime.now(UTC),
+        ))
+        session.commit()
+        session.close()
+
+        second = (await async_client.get("/api/v1/news/score", params=params)).json()
+        assert second["news_count"] == 1
+        assert second["recency"] == 75.0
+
+
+    @pytest.mark.asyncio
+    async def test_news_scores_batch_matches_single(self, async_client, seed_news_with_themes):
+        """GET /api/v1/news/scores → 요청 순서대로 단건 /score 와 동일한 결과."""
+        resp = await async_client.get(
+            "/api/v1/news/scores", params={"stocks": "999999,005930,999999"}
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [item["stock_code"] for item in data] == ["999999", "005930"]
+        assert data[0]["news_count"] == 0
+
+        single = (await async_client.get("/api/v1/news/score", params={"stock": "005930"})).json()
+        assert data[1] == single
+
+    @pytest.mark.asyncio
+    async def test_news_scores_rejects_too_many(self, async_client):
+        stocks = ",".join(f"{i:06d}" for i in range(301))
+        resp = await async_client.get("/api/v1/news/scores", params={"stocks": stocks})
+        assert resp.status_code == 400
+
 
 class TestNewsLatestEnhanced:
     @pytest.mark.asyncio
@@ -116,3 +167,57 @@ class TestNewsLatestEnhanced:
         if data["items"]:
             item = data["items"][0]
             assert "summary" in item
+
+    @pytest.mark.asyncio
+    async def test_latest_news_cursor_pagination(self, async_client, integration_session_factory):
+        """next_cursor 를 따라가면 중복/누락 없이 전체 페이지 순회."""
+        session = integration_session_factory()
+        for i in range(5):
+            session.add(NewsEvent(
+                market="KR", stock_code="035720", stock_name="카카오",
+                title=f"카카오 뉴스 {i}", source="naver",
+                # 동일 시각 뉴스는 id 로 순서 결정
+                published_at=datetime(2024, 2, 1, i // 2, tzinfo=UTC),
+            ))
+        session.commit()
+        session.close()
+
+        params = {"stock": "035720", "limit": 2}
+        first = (await async_client.get("/api/v1/news/latest", params=params)).json()
+        assert first["total"] == 5
+        titles = [item["title"] for item in first["items"]]
+
+        cursor = first["next_cursor"]
+        while cursor:
+            resp = await async_client.get(
+                "/api/v1/news/latest",
+                params={**params, "cursor": cursor, "include_total": "false"},
+            )
+            data = resp.json()
+            assert data["total"] is None
+            titles += [item["title"] for item in data["items"]]
+            cursor = data["next_cursor"]
+
+        assert titles == [f"카카오 뉴스 {i}" for i in (4, 3, 2, 1, 0)]
+
+    @pytest.mark.asyncio
+    async def test_latest_news_invalid_cursor(self, async_client):
+        resp = await async_client.get("/api/v1/news/latest", params={"cursor": "not-a-cursor"})
+        assert resp.status_code == 400
+
+
+class TestNewsSearch:
+    @pytest.mark.asyncio
+    async def test_search_by_title_keyword(self, async_client, seed_news_with_themes):
+        """GET /api/v1/news/search?q=공장 → 제목 매칭 뉴스 + rank."""
+        resp = await async_client.get("/api/v1/news/search", params={"q": "공장 증설"})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total"] >= 1
+        assert data["items"][0]["title"] == "삼성전자 반도체 공장 증설"
+        assert "rank" in data["items"][0]
+
+    @pytest.mark.asyncio
+    async def test_search_requires_query(self, async_client):
+        resp = await async_client.get("/api/v1/news/search")
+        assert resp.status_code == 422
@@ -14,6 +14,7 @@ import fakeredis
 import pytest
 
 from app.core.pubsub import (
+    BREAKING_STREAM,
     BREAKING_THRESHOLD,
     get_channel_name,
     publish_breaking_news,
@@ -304,3 +305,34 @@ class TestPublishNewsEvent:
         assert msg is not None
         data = json.loads(msg["data"])
         assert data["stock_code"] == "005930"
+
+
+class TestBreakingStream:
+    """Verify the durable breaking news stream matches contract."""
+
+    def test_stream_key_matches_contract(self, contract):
+        assert contract["streams"]["breaking_news"]["key"] == BREAKING_STREAM
+
+    def test_stream_entry_matches_published_message(self, redis_client, contract):
+        """Stream entry carries the same payload; the published message adds event_id."""
+        pubsub = redis_client.pubsub()
+        pubsub.subscribe("news_breaking_kr")
+        pubsub.get_message()
+
+        publish_breaking_news(
+            redis_client=redis_client,
+            stock_code="005930",
+            title="삼성전자 실적 발표",
+            score=85.0,
+            market="KR",
+        )
+
+        [(entry_id, fields)] = redis_client.xrange(BREAKING_STREAM)
+        published = json.loads(pubsub.get_message()["data"])
+        stored = json.loads(fields["data"])
+
+        assert published.pop("event_id") == entry_id
+        assert stored == {**published, "event_id": None}
+        for field, spec in contract["channels"]["breaking_news"]["payload"].items():
+            if spec["required"]:
+                assert field in stored
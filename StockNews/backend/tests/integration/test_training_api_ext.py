@@ -24,6 +24,14 @@ def client(db_session):
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(autouse=True)
+def _disable_rate_limit():
+    """Rate limiting 비활성화 (/train 5/minute 누적으로 후속 테스트 429 방지)."""
+    app.state.limiter.enabled = False
+    yield
+    app.state.limiter.enabled = True
+
+
 def _seed_training_data(db_session, n=250, market="KR"):
     """Insert n training records with labels."""
     base_date = date(2026, 1, 1)
@@ -100,6 +108,40 @@ class TestTrainEndpoint:
         assert data["model_type"] == "random_forest"
         assert data["features"] == 8
         assert data["train_accuracy"] > 0
+        assert data["tuning"] is None
+
+    def test_train_with_tuning(self, client, db_session):
+        """tune=true records search trials and trains with the best params."""
+        _seed_training_data(db_session, n=250, market="KR")
+
+        resp = client.post(
+            "/api/v1/training/train",
+            params={
+                "market": "KR", "model_type": "random_forest", "feature_tier": 1,
+                "tune": True, "n_trials": 3,
+            },
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["status"] == "trained"
+        tuning = data["tuning"]
+        assert tuning["n_trials_completed"] + tuning["n_trials_pruned"] == 3
+        assert tuning["study_id"]
+
+    def test_concurrent_tuning_rejected(self, client, db_session):
+        """A second tune=true request while a search is running gets 409."""
+        from app.api import training
+
+        _seed_training_data(db_session, n=250, market="KR")
+        training._tuning_lock.acquire()
+        try:
+            resp = client.post(
+                "/api/v1/training/train",
+                params={"market": "KR", "model_type": "random_forest", "tune": True, "n_trials": 3},
+            )
+        finally:
+            training._tuning_lock.release()
+        assert resp.status_code == 409
 
 
 class TestModelsEndpoint:
@@ -152,6 +194,55 @@ class TestActivateEndpoint:
         assert resp.json()["status"] == "activated"
 
 
+class TestPredictEndpoint:
+    """POST /api/v1/training/predict tests."""
+
+    def test_predict_no_active(self, client, db_session):
+        resp = client.post("/api/v1/training/predict", params={"market": "KR"})
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "no_active_model"
+
+    def test_predict_batch(self, client, db_session):
+        """All selected stocks of a day are predicted by the active model."""
+        _seed_training_data(db_session, n=250, market="KR")
+        train_resp = client.post(
+            "/api/v1/training/train",
+            params={"market": "KR", "model_type": "random_forest", "feature_tier": 1},
+        )
+        client.post(f"/api/v1/training/models/{train_resp.json()['model_id']}/activate")
+
+        resp = client.post(
+            "/api/v1/training/predict",
+            params={"market": "KR", "prediction_date": "2026-01-01"},
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["status"] == "predicted"
+        assert len(data["predictions"]) == 10
+        assert {p["direction"] for p in data["predictions"]} <= {"up", "down"}
+
+
+class TestRefreshEndpoint:
+    """POST /api/v1/training/refresh tests."""
+
+    def test_refresh_no_active(self, client, db_session):
+        resp = client.post("/api/v1/training/refresh", params={"market": "KR"})
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "no_active_model"
+
+    def test_refresh_skips_random_forest(self, client, db_session):
+        _seed_training_data(db_session, n=250, market="KR")
+        train_resp = client.post(
+            "/api/v1/training/train",
+            params={"market": "KR", "model_type": "random_forest", "feature_tier": 1},
+        )
+        client.post(f"/api/v1/training/models/{train_resp.json()['model_id']}/activate")
+
+        resp = client.post("/api/v1/training/refresh", params={"market": "KR"})
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "skipped"
+
+
 class TestEvaluateEndpoint:
     """POST /api/v1/training/evaluate tests."""
 
@@ -11,6 +11,12 @@ from app.api.websocket import broadcast, _add_connection, _remove_connection, _a
 from app.core.pubsub import subscribe_and_broadcast
 
 
+async def _drain():
+    """모든 연결의 송신 큐가 비워질 때까지 대기."""
+    for client in list(_active_connections.values()):
+        await asyncio.wait_for(client.queue.join(), timeout=1)
+
+
 class TestWebSocketBroadcast:
     """WebSocket 브로드캐스트 테스트."""
 
@@ -38,24 +44,26 @@ class TestWebSocketBroadcast:
         # 브로드캐스트
         message = {"type": "breaking_news", "data": {"stock_code": "005930"}}
         await broadcast(message)
+        await _drain()
 
-        # 모든 클라이언트가 메시지 수신
-        ws1.send_json.assert_called_once_with(message)
-        ws2.send_json.assert_called_once_with(message)
-        ws3.send_json.assert_called_once_with(message)
+        # 모든 클라이언트가 메시지 수신 (텍스트 프레임)
+        for ws in (ws1, ws2, ws3):
+            ws.send_text.assert_called_once()
+            assert json.loads(ws.send_text.call_args[0][0]) == message
 
     @pytest.mark.asyncio
     async def test_broadcast_removes_disconnected_clients(self):
         """연결 끊긴 클라이언트는 자동 제거."""
         ws1 = AsyncMock()
         ws2 = AsyncMock()
-        ws2.send_json.side_effect = Exception("Connection lost")
+        ws2.send_text.side_effect = Exception("Connection lost")
 
         await _add_connection(ws1)
         await _add_connection(ws2)
 
         message = {"type": "test"}
         await broadcast(message)
+        await _drain()
 
         # ws1은 유지, ws2는 제거
         assert len(_active_connections) == 1
@@ -0,0 +1,74 @@
+"""TTL 캐시 + /news/score 캐시 무효화 테스트."""
+
+import time
+
+from app.core.cache import TTLCache
+
+
+class TestTTLCache:
+    def test_get_set(self):
+        cache = TTLCache(ttl_seconds=60)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+    def test_expiry(self):
+        cache = TTLCache(ttl_seconds=0.05)
+        cache.set("a", 1)
+        time.sleep(0.1)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_disabled_when_ttl_zero(self):
+        cache = TTLCache(ttl_seconds=0)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+
+    def test_maxsize_evicts_lru(self):
+        cache = TTLCache(ttl_seconds=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+    def test_invalidate_predicate(self):
+        cache = TTLCache(ttl_seconds=60)
+        cache.set(("005930", None), 1)
+        cache.set(("005930", 7), 2)
+        cache.set(("000660", None), 3)
+        assert cache.invalidate(lambda key: key[0] == "005930") == 2
+        assert cache.get(("000660", None)) == 3
+
+
+class TestNewsScoreCacheInvalidation:
+    def test_commit_invalidates_stock(self, db_session):
+        """뉴스 커밋 시 해당 종목 키만 삭제."""
+        from app.models.news_event import NewsEvent
+        from app.models.news_rollup import news_score_cache
+
+        news_score_cache.clear()
+        news_score_cache.set(("005930", None), "cached")
+        news_score_cache.set(("000660", None), "cached")
+
+        db_session.add(NewsEvent(market="KR", stock_code="005930", title="뉴스", source="naver"))
+        db_session.commit()
+
+        assert news_score_cache.get(("005930", None)) is None
+        assert news_score_cache.get(("000660", None)) == "cached"
+        news_score_cache.clear()
+
+    def test_rollback_keeps_cache(self, db_session):
+        from app.models.news_event import NewsEvent
+        from app.models.news_rollup import news_score_cache
+
+        news_score_cache.clear()
+        news_score_cache.set(("005930", None), "cached")
+
+        db_session.add(NewsEvent(market="KR", stock_code="005930", title="뉴스", source="naver"))
+        db_session.flush()
+        db_session.rollback()
+
+        assert news_score_cache.get(("005930", None)) == "cached"
+        news_score_cache.clear()
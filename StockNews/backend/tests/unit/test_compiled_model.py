@@ -0,0 +1,116 @@
+"""트리 모델 컴파일 추론 (compiled_model) 테스트."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+
+from app.processing.compiled_model import (
+    ForestArrays,
+    NativeBooster,
+    benchmark,
+    compile_model,
+    export_compiled,
+    load_compiled,
+)
+
+try:
+    import lightgbm as lgb
+    LIGHTGBM_AVAILABLE = True
+except (ImportError, OSError):
+    LIGHTGBM_AVAILABLE = False
+
+COLUMNS = [f"f{i}" for i in range(6)]
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(400, 6)) * 20, columns=COLUMNS)
+    y = np.array(["up", "neutral", "down"])[rng.integers(0, 3, 400)]
+    y[X["f0"] > 10] = "up"
+    return X, y
+
+
+class TestForest:
+    def test_matches_sklearn(self, data):
+        X, y = data
+        model = RandomForestClassifier(n_estimators=15, max_depth=8, random_state=1).fit(X, y)
+
+        compiled = compile_model(model, X.to_numpy())
+
+        assert isinstance(compiled, ForestArrays)
+        np.testing.assert_allclose(compiled.predict_proba(X.to_numpy()), model.predict_proba(X), atol=1e-9)
+        assert list(compiled.classes_) == list(model.classes_)
+
+    def test_single_row(self, data):
+        X, y = data
+        model = RandomForestClassifier(n_estimators=5, random_state=1).fit(X.to_numpy(), y)
+        compiled = compile_model(model)
+        row = X.to_numpy()[:1]
+        np.testing.assert_allclose(compiled.predict_proba(row), model.predict_proba(row), atol=1e-9)
+
+    def test_export_roundtrip(self, data, tmp_path):
+        X, y = data
+        model = RandomForestClassifier(n_estimators=5, random_state=1).fit(X, y)
+        compiled = compile_model(model)
+
+        path = export_compiled(compiled, tmp_path / "rf_KR_t1_1.0")
+        restored = load_compiled(path)
+
+        assert path.suffix == ".npz"
+        np.testing.assert_array_equal(restored.predict_proba(X.to_numpy()), compiled.predict_proba(X.to_numpy()))
+        assert list(restored.classes_) == ["down", "neutral", "up"]
+
+
+@pytest.mark.skipif(not LIGHTGBM_AVAILABLE, reason="LightGBM not available")
+class TestLightGBM:
+    @pytest.mark.parametrize("binary", [False, True])
+    def test_native_booster(self, data, binary, tmp_path):
+        X, y = data
+        if binary:
+            y = np.where(y == "up", "up", "down")
+        model = lgb.LGBMClassifier(n_estimators=20, verbose=-1).fit(X, y)
+
+        compiled = compile_model(model)
+
+        assert isinstance(compiled, NativeBooster)
+        np.testing.assert_allclose(compiled.predict_proba(X.to_numpy()), model.predict_proba(X), atol=1e-9)
+        restored = load_compiled(export_compiled(compiled, tmp_path / "lgb"))
+        np.testing.assert_allclose(restored.predict_proba(X.to_numpy()), model.predict_proba(X), atol=1e-9)
+
+
+class TestFallback:
+    def test_unsupported_model(self, data):
+        X, y = data
+        assert compile_model(LogisticRegression(max_iter=200).fit(X, y)) is None
+
+    def test_disagreement_rejected(self, data, monkeypatch):
+        X, y = data
+        model = RandomForestClassifier(n_estimators=5, random_state=1).fit(X, y)
+        monkeypatch.setattr(
+            ForestArrays, "predict_proba", lambda self, rows: np.zeros((len(rows), 3)),
+        )
+        assert compile_model(model) is None
+
+    def test_conversion_error(self, data, monkeypatch):
+        X, y = data
+        model = RandomForestClassifier(n_estimators=5, random_state=1).fit(X, y)
+
+        def fail(cls, m):
+            raise RuntimeError("unsupported tree")
+
+        monkeypatch.setattr(ForestArrays, "from_sklearn", classmethod(fail))
+        assert compile_model(model) is None
+
+
+def test_benchmark_reports_both(data):
+    X, y = data
+    model = RandomForestClassifier(n_estimators=5, random_state=1).fit(X, y)
+    result = benchmark(model, compile_model(model), X.to_numpy()[:30], single_rows=5, repeats=2)
+
+    assert result["backend"] == "forest"
+    assert result["batch_size"] == 30
+    for key in ("original", "compiled"):
+        assert set(result[key]) == {"row_p50_ms", "row_p99_ms", "batch_ms"}
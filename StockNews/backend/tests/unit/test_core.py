@@ -27,6 +27,43 @@ class TestDatabase:
         except StopIteration:
             pass
 
+    def test_pool_kwargs_skipped_for_sqlite(self):
+        """SQLite URL은 풀 옵션 미적용."""
+        from app.core.database import _pool_kwargs
+        assert _pool_kwargs("sqlite:///./test.db") == {}
+
+    def test_pool_kwargs_from_settings(self, monkeypatch):
+        """PostgreSQL URL은 설정된 풀 옵션 적용."""
+        from app.core.config import settings
+        from app.core.database import _pool_kwargs
+        monkeypatch.setattr(settings, "db_pool_size", 20)
+        monkeypatch.setattr(settings, "db_max_overflow", 5)
+        kwargs = _pool_kwargs("postgresql+psycopg2://u:p@db/stocknews")
+        assert kwargs["pool_size"] == 20
+        assert kwargs["max_overflow"] == 5
+        assert kwargs["pool_recycle"] == settings.db_pool_recycle
+        assert kwargs["pool_timeout"] == settings.db_pool_timeout
+
+    def test_read_engine_defaults_to_primary(self):
+        """replica URL 미설정 시 primary 엔진 공유."""
+        from app.core.database import engine, read_engine
+        assert read_engine is engine
+
+    @pytest.mark.parametrize("method,expected", [
+        ("GET", "read"), ("HEAD", "read"), ("POST", "primary"), ("DELETE", "primary"),
+    ])
+    def test_get_db_routes_by_method(self, monkeypatch, method, expected):
+        """GET/HEAD는 replica, 나머지는 primary 세션."""
+        from types import SimpleNamespace
+
+        import app.core.database as database
+        monkeypatch.setattr(database, "SessionLocal", lambda: SimpleNamespace(name="primary", close=lambda: None))
+        monkeypatch.setattr(database, "ReadSessionLocal", lambda: SimpleNamespace(name="read", close=lambda: None))
+
+        gen = database.get_db(SimpleNamespace(method=method))
+        assert next(gen).name == expected
+        gen.close()
+
 
 class TestRedis:
     def test_redis_client_created(self):
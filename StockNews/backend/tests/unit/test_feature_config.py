@@ -9,6 +9,7 @@ from app.processing.feature_config import (
     get_features_for_tier,
     get_min_samples_for_tier,
     get_feature_count_for_tier,
+    get_feature_config_checksum,
 )
 
 
@@ -85,3 +86,18 @@ class TestFeatureCount:
 
     def test_tier3_count(self):
         assert get_feature_count_for_tier(3) == 20
+
+
+class TestFeatureConfigChecksum:
+    def test_stable_and_order_sensitive(self):
+        assert get_feature_config_checksum() == get_feature_config_checksum(TIER_3_FEATURES)
+        assert get_feature_config_checksum(TIER_1_FEATURES) != get_feature_config_checksum(
+            list(reversed(TIER_1_FEATURES))
+        )
+
+    def test_changes_with_version(self, monkeypatch):
+        from app.processing import feature_config
+
+        before = get_feature_config_checksum()
+        monkeypatch.setattr(feature_config, "FEATURE_CONFIG_VERSION", 2)
+        assert get_feature_config_checksum() != before
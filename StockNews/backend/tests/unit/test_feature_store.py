@@ -0,0 +1,179 @@
+"""피처 행렬 디스크 캐시 (FeatureStore) 테스트."""
+
+import json
+from datetime import date
+
+import numpy as np
+import pytest
+
+from app.core.config import settings
+from app.models.training import StockTrainingData
+from app.processing import feature_config, feature_store
+from app.processing.feature_config import TIER_1_FEATURES, TIER_3_FEATURES
+from app.processing.feature_store import FeatureStore, get_feature_store, sync_feature_store
+
+DAY1 = date(2026, 3, 2)
+DAY2 = date(2026, 3, 3)
+
+
+def _add(db, day, code, direction="up", market="KR", news_score=50.0, **kwargs):
+    record = StockTrainingData(
+        prediction_date=day, stock_code=code, market=market,
+        news_score=news_score, predicted_direction="up", predicted_score=60.0,
+        confidence=0.7, actual_direction=direction, **kwargs,
+    )
+    db.add(record)
+    db.flush()
+    return record
+
+
+@pytest.fixture
+def store(tmp_path):
+    return FeatureStore(tmp_path, "KR")
+
+
+class TestSync:
+    def test_initial_build(self, store, db_session):
+        _add(db_session, DAY1, "005930", news_score=1.0, rsi_14=None)
+        _add(db_session, DAY1, "000660", "down", news_score=2.0)
+        _add(db_session, DAY2, "005930", "neutral", news_score=3.0)
+        _add(db_session, DAY2, "AAPL", market="US")
+        _add(db_session, DAY2, "035720", direction=None)
+
+        assert store.sync(db_session) == 2
+        assert store.partitions() == {DAY1: 2, DAY2: 1}
+
+        X = np.load(store.path / "2026-03-02.X.npy")
+        assert X.shape == (2, len(TIER_3_FEATURES))
+        assert np.isnan(X[0, TIER_3_FEATURES.index("rsi_14")])
+        assert np.load(store.path / "2026-03-02.y.npy").tolist() == ["up", "down"]
+
+    def test_incremental_rewrites_changed_days_only(self, store, db_session, monkeypatch):
+        _add(db_session, DAY1, "005930")
+        store.sync(db_session)
+        written = []
+        real_write = store._write_partitions
+        monkeypatch.setattr(
+            store, "_write_partitions",
+            lambda db, days, all_days: written.append(days) or real_write(db, days, all_days),
+        )
+
+        assert store.sync(db_session) == 0
+        _add(db_session, DAY2, "005930")
+        assert store.sync(db_session) == 1
+        assert store.sync(db_session, force_dates=[DAY1]) == 1
+
+        assert written == [["2026-03-03"], ["2026-03-02"]]
+
+    def test_same_count_changes_detected(self, store, db_session):
+        """행 수가 같아도 라벨 수정 / 삭제 후 재삽입된 일자는 다시 씀."""
+        record = _add(db_session, DAY1, "005930")
+        _add(db_session, DAY2, "005930")
+        store.sync(db_session)
+
+        record.actual_direction = "down"
+        db_session.flush()
+        assert store.sync(db_session) == 1
+        assert np.load(store.path / "2026-03-02.y.npy").tolist() == ["down"]
+
+        db_session.delete(record)
+        _add(db_session, DAY1, "000660", "down", news_score=7.0)
+        assert store.sync(db_session) == 1
+        X, y = store.load(["news_score"])
+        assert X["news_score"].tolist() == [7.0, 50.0]
+        assert store.partitions() == {DAY1: 1, DAY2: 1}
+
+    def test_legacy_count_manifest_rewritten(self, store, db_session):
+        """행 수만 기록된 이전 manifest 는 fingerprint 불일치로 다시 씀."""
+        _add(db_session, DAY1, "005930")
+        store.sync(db_session)
+        manifest_path = store.path / "manifest.json"
+        manifest = json.loads(manifest_path.read_text())
+        manifest["partitions"] = {"2026-03-02": 1}
+        manifest_path.write_text(json.dumps(manifest))
+
+        assert store.partitions() == {DAY1: 1}
+        assert store.sync(db_session) == 1
+        assert store.sync(db_session) == 0
+        assert not list(store.path.glob("*.tmp"))
+
+    def test_removed_day_deleted(self, store, db_session):
+        record = _add(db_session, DAY1, "005930")
+        _add(db_session, DAY2, "005930")
+        store.sync(db_session)
+
+        record.actual_direction = None
+        db_session.flush()
+        store.sync(db_session)
+
+        assert store.partitions() == {DAY2: 1}
+        assert not (store.path / "2026-03-02.X.npy").exists()
+
+    def test_feature_config_change_rebuilds(self, store, db_session, monkeypatch):
+        _add(db_session, DAY1, "005930")
+        store.sync(db_session)
+        (store.path / "2020-01-01.X.npy").write_bytes(b"stale")
+
+        monkeypatch.setattr(feature_config, "FEATURE_CONFIG_VERSION", 99)
+        rebuilt = FeatureStore(store.path.parent, "KR")
+
+        assert rebuilt.partitions() == {}
+        assert rebuilt.sync(db_session) == 1
+        assert not (store.path / "2020-01-01.X.npy").exists()
+        manifest = json.loads((store.path / "manifest.json").read_text())
+        assert manifest["feature_checksum"] == rebuilt.checksum
+
+
+class TestLoad:
+    def test_tier_subset_in_date_order(self, store, db_session):
+        _add(db_session, DAY2, "005930", "down", news_score=3.0)
+        _add(db_session, DAY1, "005930", news_score=1.0, rsi_14=None)
+        _add(db_session, DAY1, "000660", "neutral", news_score=2.0)
+        store.sync(db_session)
+
+        X, y = store.load(TIER_1_FEATURES, dtype=np.float32)
+
+        assert list(X.columns) == TIER_1_FEATURES
+        assert (X.dtypes == np.float32).all()
+        assert X["news_score"].tolist() == [1.0, 2.0, 3.0]
+        assert X["rsi_14"].iloc[0] == 0.0
+        assert y.tolist() == ["up", "neutral", "down"]
+
+    def test_with_dates(self, store, db_session):
+        _add(db_session, DAY2, "005930")
+        _add(db_session, DAY1, "005930")
+        _add(db_session, DAY1, "000660")
+        store.sync(db_session)
+
+        X, y, dates = store.load(TIER_1_FEATURES, with_dates=True)
+
+        assert len(dates) == len(X) == 3
+        assert dates.astype(object).tolist() == [DAY1, DAY1, DAY2]
+
+    def test_empty(self, store):
+        X, y = store.load(TIER_1_FEATURES)
+        assert len(X) == len(y) == 0
+
+    def test_unknown_feature(self, store):
+        with pytest.raises(ValueError, match="not in store"):
+            store.load(["day_of_week"])
+
+    def test_inconsistent_partition(self, store, db_session):
+        _add(db_session, DAY1, "005930")
+        store.sync(db_session)
+        np.save(store.path / "2026-03-02.y.npy", np.array([], dtype="<U8"))
+        with pytest.raises(ValueError, match="inconsistent"):
+            store.load(TIER_1_FEATURES)
+
+
+class TestSettings:
+    def test_disabled_by_default(self, db_session, monkeypatch):
+        monkeypatch.setattr(settings, "feature_store_dir", "")
+        assert get_feature_store("KR") is None
+        assert sync_feature_store(db_session, "KR") == 0
+
+    def test_shared_instance(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "feature_store_dir", str(tmp_path))
+        monkeypatch.setattr(feature_store, "_stores", {})
+        assert get_feature_store("KR") is get_feature_store("KR")
+        assert get_feature_store("KR") is not get_feature_store("US")
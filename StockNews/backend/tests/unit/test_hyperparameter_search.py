@@ -0,0 +1,141 @@
+"""병렬 하이퍼파라미터 탐색 (random search + successive halving) 테스트."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.processing import hyperparameter_search
+from app.processing.hyperparameter_search import rung_resources, search_hyperparameters
+from app.processing.ml_trainer import MLTrainer
+
+try:
+    import lightgbm  # noqa: F401
+    LIGHTGBM_AVAILABLE = True
+except (ImportError, OSError):
+    LIGHTGBM_AVAILABLE = False
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(240, 8))
+    y = np.where(X[:, 0] + rng.normal(scale=0.5, size=240) > 0, "up", "down")
+    return X, y
+
+
+class TestRungResources:
+    def test_geometric_up_to_max(self):
+        assert rung_resources(30, 300, 3) == [33, 100, 300]
+        assert rung_resources(50, 50, 3) == [50]
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            rung_resources(100, 10, 3)
+
+
+class TestSearch:
+    def test_successive_halving_prunes(self, data):
+        X, y = data
+        result = search_hyperparameters(
+            X, y, "random_forest", n_trials=9, n_splits=3, n_jobs=1,
+            min_resource=5, max_resource=45,
+        )
+
+        trials = result["trials"]
+        assert len(trials) == 9
+        # 9 → 3 → 1
+        assert result["n_trials_completed"] == 1
+        assert result["n_trials_pruned"] == 8
+        assert sorted(t["rung"] for t in trials) == [0] * 6 + [1] * 2 + [2]
+        best = trials[result["best_trial"]]
+        assert best["status"] == "complete"
+        assert best["resource"] == 45
+        assert result["best_params"]["n_estimators"] == 45
+        assert all(len(t["cv_scores"]) == 3 for t in trials)
+
+    def test_uses_time_series_folds(self, data, monkeypatch):
+        captured = {}
+        real_init = hyperparameter_search._init_worker
+
+        def init(X, y, folds, n_classes):
+            captured["folds"] = folds
+            real_init(X, y, folds, n_classes)
+
+        monkeypatch.setattr(hyperparameter_search, "_init_worker", init)
+        X, y = data
+        search_hyperparameters(X, y, "random_forest", n_trials=1, n_splits=4, n_jobs=1,
+                               min_resource=5, max_resource=5)
+
+        assert len(captured["folds"]) == 4
+        for train_idx, val_idx in captured["folds"]:
+            assert train_idx.max() < val_idx.min()
+
+    def test_deterministic(self, data):
+        X, y = data
+        kwargs = dict(n_trials=3, n_splits=2, n_jobs=1, min_resource=5, max_resource=15)
+        first = search_hyperparameters(X, y, "random_forest", **kwargs)
+        second = search_hyperparameters(X, y, "random_forest", **kwargs)
+        assert first["best_params"] == second["best_params"]
+        assert first["trials"] == second["trials"]
+
+    def test_process_pool_matches_serial(self, data):
+        X, y = data
+        kwargs = dict(n_trials=4, n_splits=2, min_resource=5, max_resource=15)
+        serial = search_hyperparameters(X, y, "random_forest", n_jobs=1, **kwargs)
+        parallel = search_hyperparameters(X, y, "random_forest", n_jobs=2, **kwargs)
+        assert parallel["trials"] == serial["trials"]
+
+    @pytest.mark.skipif(not LIGHTGBM_AVAILABLE, reason="LightGBM not available")
+    def test_lightgbm_reuses_fold_datasets(self, data, monkeypatch):
+        import lightgbm as lgb
+
+        constructed = []
+        real_construct = lgb.Dataset.construct
+        monkeypatch.setattr(
+            lgb.Dataset, "construct",
+            lambda self: constructed.append(self) or real_construct(self),
+        )
+        X, y = data
+        result = search_hyperparameters(
+            X, y, "lightgbm", n_trials=6, n_splits=3, n_jobs=1, min_resource=10, max_resource=30,
+        )
+
+        assert result["n_trials_completed"] == 2
+        assert 1 <= result["best_params"]["n_estimators"] <= 30
+        assert "learning_rate" in result["best_params"]
+        # fold 당 train/early stopping 1회씩만 구성 (첫 fold 는 내부 검증 구간이 작아 생략)
+        assert len({id(ds) for ds in constructed}) == 5
+
+    def test_early_stopping_uses_inner_slice(self):
+        """early stopping 은 fold 학습 구간 끝부분만 사용 (점수 계산용 검증 fold 와 분리)."""
+        train_idx = np.arange(200)
+        fit_idx, stop_idx = hyperparameter_search._split_early_stopping(train_idx)
+
+        assert len(stop_idx) == 30
+        assert fit_idx.max() < stop_idx.min()
+        assert np.array_equal(np.concatenate([fit_idx, stop_idx]), train_idx)
+        assert hyperparameter_search._split_early_stopping(np.arange(40))[1] is None
+
+    def test_invalid_inputs(self, data):
+        X, y = data
+        with pytest.raises(ValueError, match="model_type"):
+            search_hyperparameters(X, y, "xgboost")
+        with pytest.raises(ValueError, match="two label classes"):
+            search_hyperparameters(X, np.array(["up"] * len(X)), "random_forest", n_jobs=1)
+
+
+class TestTrainerIntegration:
+    def test_best_params_train_final_model(self, data):
+        X, y = data
+        trainer = MLTrainer(market="KR", tier=1)
+        X_df = pd.DataFrame(X, columns=trainer.feature_columns)
+        y_series = pd.Series(y)
+
+        search = trainer.search_hyperparameters(
+            X_df, y_series, model_type="random_forest", n_trials=3, n_splits=2, n_jobs=1,
+            min_resource=5, max_resource=15,
+        )
+        result = trainer.train_random_forest(X_df, y_series, **search["best_params"])
+
+        assert result["model"].n_estimators == 15
+        assert 0 <= result["cv_accuracy"] <= 1
@@ -1,12 +1,15 @@
 """Tests for ml_trainer module."""
 
 import tempfile
+from datetime import date, timedelta
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import pytest
 
+from app.models.training import StockTrainingData
+from app.processing import ml_trainer
 from app.processing.ml_trainer import MLTrainer, DIRECTION_LABELS
 
 # Check if LightGBM is usable
@@ -59,6 +62,78 @@ class TestMLTrainerInit:
         assert t2.min_samples == 500
 
 
+class TestLoadTrainingData:
+    @pytest.fixture
+    def labeled_rows(self, db_session):
+        base = date(2026, 1, 1)
+        for i in range(210):
+            db_session.add(StockTrainingData(
+                prediction_date=base + timedelta(days=209 - i),
+                stock_code="005930",
+                market="KR",
+                news_score=float(i),
+                sentiment_score=0.1,
+                rsi_14=None if i % 2 else 55.0,
+                has_earnings_disclosure=bool(i % 3 == 0),
+                day_of_week=i % 5,
+                predicted_direction="up",
+                predicted_score=60.0,
+                confidence=0.7,
+                actual_direction=DIRECTION_LABELS[i % 3],
+            ))
+        # 라벨 없는 행 / 다른 마켓은 제외
+        db_session.add(StockTrainingData(
+            prediction_date=base, stock_code="000660", market="KR", predicted_direction="up",
+            predicted_score=60.0, confidence=0.7,
+        ))
+        db_session.add(StockTrainingData(
+            prediction_date=base, stock_code="AAPL", market="US", predicted_direction="up",
+            predicted_score=60.0, confidence=0.7, actual_direction="up",
+        ))
+        db_session.flush()
+
+    def test_columns_order_and_nulls(self, trainer, db_session, labeled_rows, monkeypatch):
+        monkeypatch.setattr(ml_trainer, "LOAD_BATCH_SIZE", 64)  # 여러 배치 결합
+
+        X, y = trainer.load_training_data(db_session)
+
+        assert list(X.columns) == trainer.feature_columns
+        assert len(X) == len(y) == 210
+        assert (X.dtypes == np.float64).all()
+        # prediction_date 오름차순 (news_score 는 날짜 역순으로 저장)
+        assert X["news_score"].tolist() == [float(i) for i in range(209, -1, -1)]
+        assert set(X["rsi_14"]) == {0.0, 55.0}
+        assert not X.isna().any().any()
+        assert y.iloc[0] == DIRECTION_LABELS[209 % 3]
+        assert trainer.sample_dates[0] == np.datetime64("2026-01-01")
+        assert (np.diff(trainer.sample_dates) >= np.timedelta64(0, "D")).all()
+
+    def test_dtype(self, db_session, labeled_rows):
+        trainer = MLTrainer(market="KR", tier=2)
+        trainer.min_samples = 10
+        X, _ = trainer.load_training_data(db_session, dtype=np.float32)
+        assert (X.dtypes == np.float32).all()
+        assert set(X["has_earnings_disclosure"]) == {0.0, 1.0}
+
+    def test_insufficient_samples(self, db_session):
+        with pytest.raises(ValueError, match="Insufficient samples: 0"):
+            MLTrainer(market="KR", tier=1).load_training_data(db_session)
+
+    def test_feature_store_matches_db(self, trainer, db_session, labeled_rows, monkeypatch):
+        from app.core.config import settings
+
+        X_db, y_db = trainer.load_training_data(db_session)
+        dates_db = trainer.sample_dates
+        with tempfile.TemporaryDirectory() as tmp:
+            monkeypatch.setattr(settings, "feature_store_dir", tmp)
+            X, y = trainer.load_training_data(db_session)
+            assert (Path(tmp) / "KR" / "manifest.json").exists()
+
+        pd.testing.assert_frame_equal(X, X_db)
+        assert y.tolist() == y_db.tolist()
+        np.testing.assert_array_equal(trainer.sample_dates, dates_db)
+
+
 class TestTrainLightGBM:
     @pytest.mark.skipif(not LIGHTGBM_AVAILABLE, reason="LightGBM not available")
     def test_basic_training(self, trainer, sample_data):
@@ -96,6 +171,83 @@ class TestTrainLightGBM:
             assert p in DIRECTION_LABELS
 
 
+def _regime_data(n: int, flip: bool, seed: int):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(
+        rng.normal(size=(n, 8)),
+        columns=["news_score", "sentiment_score", "rsi_14", "prev_change_pct",
+                 "price_change_5d", "volume_change_5d", "market_return", "vix_change"],
+    )
+    signal = -X["news_score"] if flip else X["news_score"]
+    y = pd.Series(np.where(signal > 0.4, "up", np.where(signal < -0.4, "down", "neutral")))
+    return X, y
+
+
+class TestTrainIncremental:
+    @pytest.mark.skipif(not LIGHTGBM_AVAILABLE, reason="LightGBM not available")
+    def test_warm_start_adapts_to_new_regime(self, trainer):
+        X_old, y_old = _regime_data(300, flip=False, seed=1)
+        base = trainer.train_lightgbm(X_old, y_old, n_estimators=30)["model"]
+        X_new, y_new = _regime_data(300, flip=True, seed=2)
+        X = pd.concat([X_old, X_new], ignore_index=True)
+        y = pd.concat([y_old, y_new], ignore_index=True)
+        new_mask = np.arange(len(X)) >= 300
+
+        result = trainer.train_incremental(X, y, base, new_mask, n_estimators=20)
+
+        assert result["new_samples"] == 300
+        assert result["validation_samples"] == 225
+        assert result["improved"] is True
+        assert result["cv_accuracy"] > result["base_cv_accuracy"]
+        assert result["model"].booster_.current_iteration() == 50
+        # 기존 모델은 변경되지 않음
+        assert base.booster_.current_iteration() == 30
+
+    @pytest.mark.skipif(not LIGHTGBM_AVAILABLE, reason="LightGBM not available")
+    def test_insufficient_new_samples(self, trainer):
+        X, y = _regime_data(200, flip=False, seed=1)
+        base = trainer.train_lightgbm(X, y, n_estimators=10)["model"]
+        new_mask = np.arange(len(X)) >= 190
+
+        with pytest.raises(ValueError, match="Insufficient new samples"):
+            trainer.train_incremental(X, y, base, new_mask)
+
+    @pytest.mark.skipif(not LIGHTGBM_AVAILABLE, reason="LightGBM not available")
+    def test_insufficient_validation_samples(self, trainer):
+        """새 구간이 짧아 walk-forward 검증 행이 부족하면 비교하지 않음."""
+        X_old, y_old = _regime_data(300, flip=False, seed=1)
+        base = trainer.train_lightgbm(X_old, y_old, n_estimators=10)["model"]
+        X_new, y_new = _regime_data(60, flip=True, seed=2)
+        X = pd.concat([X_old, X_new], ignore_index=True)
+        y = pd.concat([y_old, y_new], ignore_index=True)
+
+        with pytest.raises(ValueError, match="Insufficient validation samples"):
+            trainer.train_incremental(X, y, base, np.arange(len(X)) >= 300)
+
+    @pytest.mark.skipif(not LIGHTGBM_AVAILABLE, reason="LightGBM not available")
+    def test_requires_improvement_margin(self, trainer):
+        """같은 분포의 새 데이터로는 향상폭 기준을 넘지 못함."""
+        X_old, y_old = _regime_data(300, flip=False, seed=1)
+        base = trainer.train_lightgbm(X_old, y_old, n_estimators=30)["model"]
+        X_new, y_new = _regime_data(300, flip=False, seed=2)
+        X = pd.concat([X_old, X_new], ignore_index=True)
+        y = pd.concat([y_old, y_new], ignore_index=True)
+
+        result = trainer.train_incremental(
+            X, y, base, np.arange(len(X)) >= 300, n_estimators=20, min_improvement=0.05,
+        )
+
+        assert result["improved"] is False
+        assert result["cv_accuracy"] - result["base_cv_accuracy"] < 0.05
+
+    def test_requires_lightgbm_model(self, trainer, sample_data):
+        X, y = sample_data
+        base = trainer.train_random_forest(X, y, n_estimators=5)["model"]
+
+        with pytest.raises(ValueError, match="LightGBM"):
+            trainer.train_incremental(X, y, base, np.ones(len(X), dtype=bool))
+
+
 class TestTrainRandomForest:
     def test_basic_training(self, trainer, sample_data):
         X, y = sample_data
@@ -0,0 +1,146 @@
+"""활성 모델 warm-start 갱신 (model_refresh) 테스트."""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.base import Base
+from app.models.ml_model import MLModel
+from app.models.training import StockTrainingData
+from app.processing import model_refresh
+from app.processing.feature_config import TIER_1_FEATURES
+from app.processing.ml_trainer import MLTrainer
+from app.processing.model_registry import ModelRegistry
+from app.processing.model_server import ModelServer
+
+pytest.importorskip("lightgbm")
+
+START = date(2026, 1, 5)
+DAYS = 20
+STOCKS = 15
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    server = ModelServer(registry=ModelRegistry(model_dir=str(tmp_path / "models")))
+    monkeypatch.setattr(model_refresh, "get_model_server", lambda: server)
+    return server
+
+
+def _add_rows(db, first_day: date, flip: bool, seed: int) -> None:
+    """news_score 로 방향이 결정되는 일자별 스냅샷 (flip=True 면 관계 반전)."""
+    rng = np.random.default_rng(seed)
+    for d in range(DAYS):
+        for s in range(STOCKS):
+            score = float(rng.normal())
+            signal = -score if flip else score
+            direction = "up" if signal > 0.4 else "down" if signal < -0.4 else "neutral"
+            db.add(StockTrainingData(
+                prediction_date=first_day + timedelta(days=d), stock_code=f"{s:06d}",
+                market="KR", news_score=score, sentiment_score=float(rng.normal()),
+                predicted_direction="up", predicted_score=50.0, confidence=0.5,
+                actual_direction=direction,
+            ))
+    db.commit()
+
+
+def _activate_base(db, server, model_type: str = "lightgbm") -> MLModel:
+    trainer = MLTrainer(market="KR", tier=1)
+    X, y = trainer.load_training_data(db)
+    if model_type == "lightgbm":
+        model = trainer.train_lightgbm(X, y, n_estimators=30)["model"]
+    else:
+        model = trainer.train_random_forest(X, y, n_estimators=5)["model"]
+    model_id = server.registry.save(
+        model,
+        {
+            "model_name": model_type, "model_version": "v1", "model_type": model_type,
+            "market": "KR", "feature_tier": 1, "feature_list": TIER_1_FEATURES,
+            "train_samples": len(X),
+            "train_start_date": START,
+            "train_end_date": START + timedelta(days=DAYS - 1),
+        },
+        db,
+    )
+    server.activate(model_id, db)
+    return db.get(MLModel, model_id)
+
+
+class TestRefreshActiveModel:
+    def test_no_active_model(self, db, server):
+        assert model_refresh.refresh_active_model(db, "KR")["status"] == "no_active_model"
+
+    def test_promotes_when_recent_accuracy_improves(self, db, server):
+        _add_rows(db, START, flip=False, seed=1)
+        base = _activate_base(db, server)
+        _add_rows(db, START + timedelta(days=DAYS), flip=True, seed=2)
+
+        result = model_refresh.refresh_active_model(db, "KR", n_estimators=20)
+
+        assert result["status"] == "promoted"
+        assert result["new_samples"] == DAYS * STOCKS
+        assert result["validation_samples"] >= 100
+        assert result["cv_accuracy"] > result["base_cv_accuracy"]
+        active = server.registry.get_active("KR", db)
+        assert active.id == result["model_id"] != base.id
+        assert active.train_end_date == START + timedelta(days=2 * DAYS - 1)
+        assert active.train_samples == 2 * DAYS * STOCKS
+        # 활성화 시 모델 서버에 선적재
+        assert server.get_active("KR", db).model.booster_.current_iteration() == 50
+
+    def test_rejected_keeps_active_model(self, db, server, monkeypatch):
+        _add_rows(db, START, flip=False, seed=1)
+        base = _activate_base(db, server)
+        _add_rows(db, START + timedelta(days=DAYS), flip=True, seed=2)
+        train_incremental = MLTrainer.train_incremental
+
+        def no_gain(self, *args, **kwargs):
+            return {**train_incremental(self, *args, **kwargs), "improved": False}
+
+        monkeypatch.setattr(MLTrainer, "train_incremental", no_gain)
+        result = model_refresh.refresh_active_model(db, "KR", n_estimators=20)
+
+        assert result["status"] == "rejected"
+        assert server.registry.get_active("KR", db).id == base.id
+        assert db.query(MLModel).count() == 1
+
+    def test_skipped_without_new_rows(self, db, server):
+        _add_rows(db, START, flip=False, seed=1)
+        _activate_base(db, server)
+
+        result = model_refresh.refresh_active_model(db, "KR")
+
+        assert result["status"] == "skipped"
+        assert "Insufficient new samples" in result["reason"]
+
+    def test_skipped_below_min_validation(self, db, server, monkeypatch):
+        _add_rows(db, START, flip=False, seed=1)
+        _activate_base(db, server)
+        _add_rows(db, START + timedelta(days=DAYS), flip=True, seed=2)
+        monkeypatch.setattr(model_refresh.settings, "model_refresh_min_validation", 1000)
+
+        result = model_refresh.refresh_active_model(db, "KR", n_estimators=20)
+
+        assert result["status"] == "skipped"
+        assert "Insufficient validation samples" in result["reason"]
+        assert db.query(MLModel).count() == 1
+
+    def test_skipped_for_non_lightgbm(self, db, server):
+        _add_rows(db, START, flip=False, seed=1)
+        _activate_base(db, server, model_type="random_forest")
+
+        result = model_refresh.refresh_active_model(db, "KR")
+
+        assert result["status"] == "skipped"
@@ -3,6 +3,7 @@
 import json
 from datetime import date
 
+import numpy as np
 import pytest
 from sklearn.ensemble import RandomForestClassifier
 from sqlalchemy import create_engine
@@ -144,3 +145,41 @@ class TestListModels:
         kr_models = registry.list_models("KR", db)
         assert len(kr_models) == 1
         assert kr_models[0].market == "KR"
+
+
+class TestRecordTrials:
+    def test_records_all_trials(self, registry, db):
+        trials = [
+            {"trial": 0, "params": {"max_depth": 3}, "status": "pruned", "rung": 0,
+             "resource": 10, "cv_accuracy": 0.51, "cv_std": 0.02},
+            {"trial": 1, "params": {"max_depth": 7}, "status": "complete", "rung": 1,
+             "resource": 30, "cv_accuracy": 0.58, "cv_std": 0.01},
+        ]
+        study_id = registry.record_trials(
+            trials, {"model_type": "random_forest", "market": "KR", "feature_tier": 1}, db,
+        )
+
+        rows = registry.list_trials(study_id, db)
+        assert [r.trial_number for r in rows] == [1, 0]
+        assert rows[0].status == "complete"
+        assert json.loads(rows[0].params) == {"max_depth": 7}
+        assert registry.list_trials("other", db) == []
+
+
+class TestExportCompiled:
+    def test_export_next_to_pickle(self, registry, db, sample_model):
+        from app.processing.compiled_model import load_compiled
+
+        model_id = registry.save(sample_model, {
+            "model_name": "rf", "model_version": "1.0", "model_type": "random_forest",
+            "market": "KR", "feature_tier": 1, "feature_list": ["a", "b", "c"],
+        }, db)
+
+        result = registry.export_compiled(model_id, db)
+
+        assert result["backend"] == "forest"
+        assert result["path"].endswith("rf_KR_t1_1.0.npz")
+        X = np.random.default_rng(0).random((10, 3))
+        np.testing.assert_allclose(
+            load_compiled(result["path"]).predict_proba(X), sample_model.predict_proba(X), atol=1e-9,
+        )
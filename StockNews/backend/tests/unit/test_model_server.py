@@ -0,0 +1,200 @@
+"""인프로세스 모델 서빙 (ModelServer) 테스트."""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.models.base import Base
+from app.models.training import StockTrainingData
+from app.processing.feature_config import TIER_1_FEATURES
+from app.processing.model_registry import ModelRegistry
+from app.processing.model_server import ModelServer
+
+DAY = date(2026, 3, 2)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return ModelRegistry(model_dir=str(tmp_path / "models"))
+
+
+@pytest.fixture
+def server(registry):
+    return ModelServer(registry=registry, capacity=2)
+
+
+def _train(seed: int) -> RandomForestClassifier:
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(rng.normal(size=(60, len(TIER_1_FEATURES))), columns=TIER_1_FEATURES)
+    y = np.where(X["news_score"] > 0, "up", "down")
+    return RandomForestClassifier(n_estimators=5, random_state=seed).fit(X, y)
+
+
+def _save(registry, db, seed: int, market: str = "KR") -> int:
+    return registry.save(
+        _train(seed),
+        {
+            "model_name": "random_forest", "model_version": f"v{seed}",
+            "model_type": "random_forest", "market": market, "feature_tier": 1,
+            "feature_list": TIER_1_FEATURES,
+        },
+        db,
+    )
+
+
+def _add_snapshot(db, code: str, news_score: float) -> None:
+    db.add(StockTrainingData(
+        prediction_date=DAY, stock_code=code, market="KR", news_score=news_score,
+        rsi_14=None, predicted_direction="up", predicted_score=60.0, confidence=0.7,
+    ))
+    db.commit()
+
+
+class TestCache:
+    def test_active_model_loaded_once(self, server, registry, db):
+        registry.activate(_save(registry, db, 1), db)
+
+        first = server.get_active("KR", db)
+        second = server.get_active("KR", db)
+
+        assert first is second
+        assert server.loads == 1
+
+    def test_no_active(self, server, db):
+        assert server.get_active("KR", db) is None
+        assert server.predict_batch(db, "KR", DAY) is None
+
+    def test_activate_preloads_and_swaps(self, server, registry, db):
+        old_id, new_id = _save(registry, db, 1), _save(registry, db, 2)
+        server.activate(old_id, db)
+        server.activate(new_id, db)
+        loads = server.loads
+
+        assert server.get_active("KR", db).model_id == new_id
+        # 다른 프로세스에서 롤백한 경우도 레코드 기준으로 반영, 캐시 재사용
+        registry.activate(old_id, db)
+        assert server.get_active("KR", db).model_id == old_id
+        assert server.loads == loads
+
+    def test_lru_eviction(self, server, registry, db):
+        ids = [_save(registry, db, seed) for seed in (1, 2, 3)]
+        for model_id in ids:
+            server.activate(model_id, db)
+
+        assert len(server) == 2
+        server.activate(ids[0], db)
+        assert server.loads == 4
+
+    def test_activate_unknown(self, server, db):
+        with pytest.raises(ValueError, match="not found"):
+            server.activate(999, db)
+
+
+class TestPredict:
+    def test_batch_single_inference(self, server, registry, db, monkeypatch):
+        server.activate(_save(registry, db, 1), db)
+        _add_snapshot(db, "000660", -2.0)
+        _add_snapshot(db, "005930", 2.0)
+        _add_snapshot(db, "035720", 2.5)
+        served = server.get_active("KR", db)
+        calls = []
+        real = served.compiled.predict_proba
+        monkeypatch.setattr(served.compiled, "predict_proba", lambda X: calls.append(len(X)) or real(X))
+
+        result = server.predict_batch(db, "KR", DAY, ["005930", "000660"])
+
+        assert calls == [2]
+        preds = result["predictions"]
+        assert [p["stock_code"] for p in preds] == ["000660", "005930"]
+        assert preds[0]["direction"] == "down"
+        assert preds[1]["direction"] == "up"
+        assert set(preds[1]["probabilities"]) == {"down", "up"}
+        assert preds[1]["confidence"] == max(preds[1]["probabilities"].values())
+
+    def test_all_float_frame(self, server, registry, db):
+        """None 없는 float 행렬 — pandas 3.x 는 to_numpy 가 읽기 전용 뷰를 반환할 수 있음."""
+        server.activate(_save(registry, db, 1), db)
+        served = server.get_active("KR", db)
+        X = pd.DataFrame(np.tile([[2.0], [-2.0]], len(TIER_1_FEATURES)), columns=TIER_1_FEATURES)
+        X.loc[1, "rsi_14"] = np.nan
+
+        preds = server.predict_matrix(served, X)
+
+        assert [p["direction"] for p in preds] == ["up", "down"]
+        assert np.isnan(X.loc[1, "rsi_14"])  # 입력 프레임은 변경하지 않음
+
+    def test_predict_one_matches_matrix(self, server, registry, db):
+        server.activate(_save(registry, db, 1), db)
+        served = server.get_active("KR", db)
+        features = {col: 1.5 for col in TIER_1_FEATURES}
+        features["rsi_14"] = float("nan")
+        features["vix_change"] = None
+
+        one = server.predict_one(served, features)
+        matrix = server.predict_matrix(served, pd.DataFrame([features]))[0]
+
+        assert one == matrix
+
+    def test_missing_features(self, server, registry, db):
+        server.activate(_save(registry, db, 1), db)
+        served = server.get_active("KR", db)
+        with pytest.raises(ValueError, match="Missing features"):
+            server.predict_matrix(served, pd.DataFrame({"news_score": [1.0]}))
+
+    def test_empty_day(self, server, registry, db):
+        server.activate(_save(registry, db, 1), db)
+        assert server.predict_batch(db, "KR", DAY)["predictions"] == []
+
+
+class TestCompiledInference:
+    def test_compiled_matches_original(self, server, registry, db):
+        server.activate(_save(registry, db, 1), db)
+        served = server.get_active("KR", db)
+        assert served.compiled is not None
+
+        X = pd.DataFrame(np.random.default_rng(5).normal(size=(20, 8)), columns=TIER_1_FEATURES)
+        expected = served.model.predict_proba(X)
+        actual = served.compiled.predict_proba(X.to_numpy())
+        np.testing.assert_allclose(actual, expected, atol=1e-9)
+
+    def test_falls_back_when_compiled_fails(self, server, registry, db, monkeypatch):
+        server.activate(_save(registry, db, 1), db)
+        served = server.get_active("KR", db)
+
+        def broken(X):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(served.compiled, "predict_proba", broken)
+        pred = server.predict_one(served, {"news_score": 2.0})
+        assert pred["direction"] == "up"
+
+    def test_disabled(self, server, registry, db, monkeypatch):
+        monkeypatch.setattr(settings, "model_compiled_inference", False)
+        server.activate(_save(registry, db, 1), db)
+        assert server.get_active("KR", db).compiled is None
+
+    def test_predict_one_matches_matrix(self, server, registry, db):
+        server.activate(_save(registry, db, 1), db)
+        served = server.get_active("KR", db)
+        features = {"news_score": -1.5, "rsi_14": None, "vix_change": 0.3}
+
+        single = server.predict_one(served, features)
+        matrix = server.predict_matrix(
+            served, pd.DataFrame([{col: features.get(col) for col in TIER_1_FEATURES}]),
+        )
+        assert single == matrix[0]
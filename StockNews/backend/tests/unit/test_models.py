@@ -129,6 +129,57 @@ class TestNewsEventModel:
         assert event.content is None
 
 
+class TestNewsContentModel:
+    def test_body_stored_compressed_in_news_content(self, db_session):
+        """본문/요약은 news_content 에 압축 저장되고 news_event 에는 컬럼이 없음."""
+        from app.models.news_content import NewsContent
+        from app.models.news_event import NewsEvent
+
+        body = "삼성전자가 4분기 매출 80조원을 기록했다. " * 50
+        event = NewsEvent(
+            market="KR", stock_code="005930", title="본문 분리",
+            sentiment="neutral", source="naver", summary="요약", content=body,
+        )
+        db_session.add(event)
+        db_session.commit()
+
+        assert "content" not in NewsEvent.__table__.columns
+        assert "summary" not in NewsEvent.__table__.columns
+        stored = db_session.get(NewsContent, event.id)
+        assert stored.summary == "요약"
+        assert len(stored.content_compressed) < len(body.encode("utf-8"))
+
+        db_session.expire_all()
+        reloaded = db_session.get(NewsEvent, event.id)
+        assert reloaded.content == body
+        assert reloaded.summary == "요약"
+
+    def test_no_body_row_without_text(self, db_session):
+        """본문/요약이 없으면 news_content 행을 만들지 않음."""
+        from app.models.news_content import NewsContent
+        from app.models.news_event import NewsEvent
+
+        event = NewsEvent(market="KR", stock_code="005930", title="제목만", source="dart")
+        db_session.add(event)
+        db_session.commit()
+        assert db_session.get(NewsContent, event.id) is None
+
+    def test_delete_cascades_to_body(self, db_session):
+        from app.models.news_content import NewsContent
+        from app.models.news_event import NewsEvent
+
+        event = NewsEvent(
+            market="KR", stock_code="005930", title="삭제", source="naver", content="본문",
+        )
+        db_session.add(event)
+        db_session.commit()
+        news_id = event.id
+
+        db_session.delete(event)
+        db_session.commit()
+        assert db_session.get(NewsContent, news_id) is None
+
+
 class TestThemeStrengthModel:
     def test_create_theme_strength(self, db_session):
         """theme_strength 레코드 생성."""
@@ -0,0 +1,146 @@
+"""뉴스 일별 롤업 증분 갱신 + 재구성 테스트."""
+
+from datetime import UTC, date, datetime
+
+from app.models.news_event import NewsEvent
+from app.models.news_rollup import (
+    NewsDailyRollup,
+    NewsThemeDailyRollup,
+    event_contributions,
+    parse_impact_themes,
+    rollup_date,
+)
+from app.processing.news_rollup import rebuild_news_rollups
+
+
+def _news(**kwargs) -> NewsEvent:
+    defaults = dict(
+        market="KR", stock_code="005930", stock_name="삼성전자", title="뉴스",
+        source="naver", sentiment="positive", sentiment_score=0.5, news_score=70.0,
+        theme="반도체,AI", published_at=datetime(2026, 2, 3, 1, 0, tzinfo=UTC),
+    )
+    defaults.update(kwargs)
+    return NewsEvent(**defaults)
+
+
+def _stock_rows(db_session):
+    return {
+        (r.stock_code, r.date): (r.news_count, r.positive_count, r.neutral_count,
+                                 r.negative_count, r.disclosure_count,
+                                 round(r.score_sum, 4), round(r.sentiment_sum, 4))
+        for r in db_session.query(NewsDailyRollup).all()
+    }
+
+
+def _theme_rows(db_session):
+    return {
+        (r.stock_code, r.date, r.theme, r.kind): (r.news_count, round(r.score_sum, 4))
+        for r in db_session.query(NewsThemeDailyRollup).all()
+    }
+
+
+class TestContributions:
+    def test_rollup_date_prefers_published_at(self):
+        created = datetime(2026, 2, 5, 0, 0, tzinfo=UTC)
+        assert rollup_date(datetime(2026, 2, 3, 23, 0, tzinfo=UTC), created) == date(2026, 2, 3)
+        assert rollup_date(None, created) == date(2026, 2, 5)
+
+    def test_parse_impact_themes_direction(self):
+        raw = '[{"theme": "반도체", "impact": 0.8, "direction": "up"},' \
+              ' {"theme": "2차전지", "impact": 0.5, "direction": "down"},' \
+              ' {"theme": "", "impact": 0.3, "direction": "up"}]'
+        assert parse_impact_themes(raw) == [("반도체", 0.8, 0.8), ("2차전지", 0.5, -0.5)]
+        assert parse_impact_themes("not json") == []
+
+    def test_us_impact_rows(self):
+        values = {
+            "stock_code": "NVDA", "market": "US", "stock_name": "NVIDIA",
+            "sentiment": "positive", "sentiment_score": 0.6, "news_score": 80.0,
+            "theme": None, "is_disclosure": False,
+            "kr_impact_themes": '[{"theme": "반도체", "impact": 0.5, "direction": "up"}]',
+            "published_at": datetime(2026, 2, 3, tzinfo=UTC), "created_at": None,
+        }
+        stock_row, theme_rows = event_contributions(values)
+        assert stock_row["positive_count"] == 1
+        assert theme_rows == [{
+            "stock_code": "NVDA", "market": "US", "date": date(2026, 2, 3),
+            "theme": "반도체", "kind": "impact", "news_count": 1,
+            "score_sum": 40.0, "sentiment_sum": 0.5,
+        }]
+
+
+class TestIncrementalMaintenance:
+    def test_insert_accumulates(self, db_session):
+        """같은 종목·일자 뉴스가 한 행에 누적."""
+        db_session.add_all([
+            _news(title="a"),
+            _news(title="b", sentiment="negative", sentiment_score=-0.5, news_score=30.0,
+                  theme="반도체", is_disclosure=True),
+        ])
+        db_session.commit()
+
+        row = db_session.query(NewsDailyRollup).one()
+        assert (row.news_count, row.positive_count, row.negative_count, row.neutral_count) == (2, 1, 1, 0)
+        assert row.disclosure_count == 1
+        assert row.score_sum == 100.0
+        assert row.sentiment_sum == 0.0
+        assert row.stock_name == "삼성전자"
+        assert _theme_rows(db_session)[("005930", date(2026, 2, 3), "반도체", "news")] == (2, 100.0)
+
+    def test_update_moves_contribution(self, db_session):
+        """감성/일자 변경 시 이전 기여분 차감 후 새 값 반영."""
+        news = _news()
+        db_session.add(news)
+        db_session.commit()
+
+        news.sentiment = "neutral"
+        news.published_at = datetime(2026, 2, 4, 1, 0, tzinfo=UTC)
+        db_session.commit()
+
+        rows = _stock_rows(db_session)
+        assert list(rows) == [("005930", date(2026, 2, 4))]
+        assert rows[("005930", date(2026, 2, 4))][:4] == (1, 0, 1, 0)
+
+    def test_delete_removes_empty_rows(self, db_session):
+        news = _news()
+        db_session.add(news)
+        db_session.commit()
+
+        db_session.delete(news)
+        db_session.commit()
+
+        assert db_session.query(NewsDailyRollup).count() == 0
+        assert db_session.query(NewsThemeDailyRollup).count() == 0
+
+
+class TestRebuild:
+    def test_rebuild_matches_incremental(self, db_session):
+        """재구성 결과가 증분 갱신 결과와 동일."""
+        db_session.add_all([
+            _news(title="a"),
+            _news(title="b", stock_code="000660", stock_name="SK하이닉스", sentiment="neutral"),
+            _news(title="c", published_at=None, created_at=datetime(2026, 2, 5, tzinfo=UTC)),
+            _news(title="d", market="US", stock_code="NVDA", stock_name="NVIDIA", theme=None,
+                  kr_impact_themes='[{"theme": "반도체", "impact": 0.8, "direction": "up"}]'),
+        ])
+        db_session.commit()
+        incremental = (_stock_rows(db_session), _theme_rows(db_session))
+
+        result = rebuild_news_rollups(db_session)
+
+        assert result["events"] == 4
+        assert (_stock_rows(db_session), _theme_rows(db_session)) == incremental
+
+    def test_rebuild_date_range(self, db_session):
+        """기간 지정 시 해당 일자 롤업만 재계산."""
+        db_session.add_all([
+            _news(title="a"),
+            _news(title="b", published_at=datetime(2026, 2, 10, tzinfo=UTC)),
+        ])
+        db_session.commit()
+        db_session.query(NewsDailyRollup).delete()
+        db_session.commit()
+
+        rebuild_news_rollups(db_session, date(2026, 2, 1), date(2026, 2, 5))
+
+        assert list(_stock_rows(db_session)) == [("005930", date(2026, 2, 3))]
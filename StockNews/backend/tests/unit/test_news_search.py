@@ -0,0 +1,101 @@
+"""뉴스 전문 검색 인덱스 (n-gram 토큰 + FTS5) 테스트."""
+
+from datetime import UTC, datetime
+
+from app.models.news_event import NewsEvent
+from app.models.news_search import NewsSearchDocument, ngram_tokens
+from app.processing.news_search import rebuild_search_index, search_news
+
+
+def _add(db, **kwargs):
+    defaults = {
+        "market": "KR", "stock_code": "005930", "stock_name": "삼성전자",
+        "title": "뉴스", "source": "naver", "news_score": 50.0,
+        "published_at": datetime(2026, 3, 1, tzinfo=UTC),
+    }
+    event = NewsEvent(**{**defaults, **kwargs})
+    db.add(event)
+    db.commit()
+    return event
+
+
+def _titles(db, query, **kwargs):
+    results, _ = search_news(db, query, **kwargs)
+    return [event.title for event, _ in results]
+
+
+class TestNgramTokens:
+    def test_korean_bigrams(self):
+        assert ngram_tokens("삼성전자") == ["삼성", "성전", "전자"]
+
+    def test_latin_words_lowercased(self):
+        assert ngram_tokens("SK하이닉스 HBM3E") == ["sk", "하이", "이닉", "닉스", "hbm3e"]
+
+    def test_short_and_empty(self):
+        assert ngram_tokens("삼 ,") == ["삼"]
+        assert ngram_tokens(None) == []
+
+
+class TestSearchIndexSync:
+    def test_insert_indexed(self, db_session):
+        _add(db_session, title="삼성전자 HBM 공급 확대", summary="엔비디아 공급망 진입")
+        _add(db_session, stock_code="000660", stock_name="SK하이닉스", title="하이닉스 실적 발표")
+
+        assert _titles(db_session, "공급망") == ["삼성전자 HBM 공급 확대"]
+        assert _titles(db_session, "hbm") == ["삼성전자 HBM 공급 확대"]
+        assert _titles(db_session, "SK하이닉스") == ["하이닉스 실적 발표"]
+
+    def test_title_and_summary_update_reindexed(self, db_session):
+        event = _add(db_session, title="기존 제목", summary="기존 요약")
+
+        event.title = "변경된 헤드라인"
+        db_session.commit()
+        assert _titles(db_session, "헤드라인") == ["변경된 헤드라인"]
+        assert _titles(db_session, "기존 제목") == []
+
+        event.summary = "새로운 요약문"
+        db_session.commit()
+        assert _titles(db_session, "요약문") == ["변경된 헤드라인"]
+
+    def test_delete_removes_document(self, db_session):
+        event = _add(db_session, title="삭제될 뉴스")
+        db_session.delete(event)
+        db_session.commit()
+
+        assert _titles(db_session, "삭제될") == []
+        assert db_session.query(NewsSearchDocument).count() == 0
+
+    def test_rebuild(self, db_session):
+        _add(db_session, title="재색인 대상 뉴스")
+        db_session.query(NewsSearchDocument).delete()
+        db_session.commit()
+        assert _titles(db_session, "재색인") == []
+
+        assert rebuild_search_index(db_session) == 1
+        assert _titles(db_session, "재색인") == ["재색인 대상 뉴스"]
+
+
+class TestSearchNews:
+    def test_title_match_ranks_above_summary_match(self, db_session):
+        _add(db_session, title="일반 뉴스", summary="반도체 업황 언급")
+        _add(db_session, title="반도체 수출 급증", summary="수출 통계")
+        _add(db_session, title="무관한 뉴스", summary="날씨")
+
+        assert _titles(db_session, "반도체") == ["반도체 수출 급증", "일반 뉴스"]
+
+    def test_market_filter_and_pagination(self, db_session):
+        for i in range(3):
+            _add(db_session, title=f"배터리 뉴스 {i}", published_at=datetime(2026, 3, i + 1, tzinfo=UTC))
+        _add(db_session, market="US", stock_code="TSLA", stock_name="Tesla", title="배터리 가격")
+
+        results, total = search_news(db_session, "배터리", market="KR", limit=2)
+        assert total == 3
+        assert len(results) == 2
+
+        results, total = search_news(db_session, "배터리", market="KR", offset=2, include_total=False)
+        assert total is None
+        assert len(results) == 1
+
+    def test_query_without_tokens(self, db_session):
+        _add(db_session, title="뉴스")
+        assert search_news(db_session, '"*') == ([], 0)
@@ -0,0 +1,284 @@
+"""학습 데이터 병렬 백필 (parallel_backfill) 테스트."""
+
+import json
+import zlib
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.collectors.market_indicator_collector import MarketIndicatorCollector
+from app.core.config import settings
+from app.models.base import Base
+from app.models.news_event import NewsEvent
+from app.models.training import StockTrainingData
+from app.models.verification import DailyPredictionResult
+from app.processing import parallel_backfill as pb
+from app.processing import training_data_builder
+from app.processing.training_data_builder import build_training_snapshot
+
+START = date(2026, 2, 16)  # 월요일
+END = date(2026, 2, 18)
+STOCKS = ["005930", "000660", "035720"]
+
+COMPARED_COLUMNS = [
+    "prediction_date", "stock_code", "stock_name", "market",
+    "news_score", "sentiment_score", "news_count", "news_count_3d", "avg_score_3d",
+    "disclosure_ratio", "sentiment_trend", "theme",
+    "prev_close", "prev_change_pct", "prev_volume", "price_change_5d", "volume_change_5d",
+    "ma5_ratio", "ma20_ratio", "volatility_5d", "rsi_14", "bb_position",
+    "market_index_change", "market_return", "vix_change", "usd_krw_change",
+    "has_earnings_disclosure", "cross_theme_score", "day_of_week",
+    "predicted_direction", "predicted_score", "confidence",
+]
+
+
+def _prices(ticker: str) -> pd.DataFrame:
+    days = pd.bdate_range("2025-11-03", "2026-03-31")
+    rng = np.random.default_rng(zlib.crc32(ticker.encode()))
+    return pd.DataFrame({
+        "Close": 100 * np.cumprod(1 + rng.normal(0, 0.02, len(days))),
+        "Volume": rng.integers(100_000, 1_000_000, len(days)),
+    }, index=days)
+
+
+@pytest.fixture
+def downloads(monkeypatch, tmp_path):
+    """yfinance 대체 — 단일 티커는 단일 컬럼, 다중 티커는 (ticker, field) MultiIndex."""
+    calls = []
+
+    def fake_download(tickers, start, end, **kwargs):
+        names = [tickers] if isinstance(tickers, str) else list(tickers)
+        calls.append(names)
+        frames = {
+            name: _prices(name).loc[str(start):str(pd.Timestamp(end) - pd.Timedelta(days=1))]
+            for name in names
+        }
+        if isinstance(tickers, str):
+            return frames[tickers]
+        return pd.concat(frames, axis=1)
+
+    monkeypatch.setattr(pb, "download_with_retry", fake_download)
+    monkeypatch.setattr(training_data_builder, "download_with_retry", fake_download)
+    monkeypatch.setattr("app.collectors.market_indicator_collector.download_with_retry", fake_download)
+    monkeypatch.setattr("app.processing.technical_indicators.yf.download", fake_download)
+    monkeypatch.setattr(training_data_builder, "_market_collector", MarketIndicatorCollector())
+    monkeypatch.setattr(settings, "backfill_checkpoint_dir", str(tmp_path / "checkpoints"))
+    return calls
+
+
+@pytest.fixture
+def db():
+    """실제 commit/rollback 이 필요한 재개 테스트용 독립 DB."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _seed(db, labels: bool = False) -> None:
+    for i, code in enumerate(STOCKS):
+        for days_ago in range(0, 12, 2):
+            db.add(NewsEvent(
+                market="KR", stock_code=code, title=f"{code} {days_ago}", sentiment="positive",
+                sentiment_score=0.1 * (i + 1), news_score=40.0 + 10 * i + days_ago,
+                source="test", theme="반도체" if code != "035720" else "플랫폼",
+                is_disclosure=days_ago == 4,
+                created_at=datetime.combine(END - timedelta(days=days_ago), datetime.min.time()),
+            ))
+        for offset in range((END - START).days + 1):
+            db.add(DailyPredictionResult(
+                prediction_date=START + timedelta(days=offset), stock_code=code,
+                stock_name=f"종목{i}", market="KR", predicted_direction="up",
+                predicted_score=60.0 + i, confidence=0.7,
+                actual_close_price=100.0 if labels else None,
+                actual_change_pct=1.5 if labels else None,
+                actual_direction="up" if labels else None,
+                is_correct=True if labels else None,
+            ))
+    db.commit()
+
+
+def _rows(db) -> list[dict]:
+    records = db.query(StockTrainingData).order_by(
+        StockTrainingData.prediction_date, StockTrainingData.stock_code
+    ).all()
+    return [{col: getattr(r, col) for col in COMPARED_COLUMNS} for r in records]
+
+
+class TestParallelBackfill:
+    def test_matches_build_training_snapshot(self, db_session, downloads):
+        _seed(db_session)
+        expected = []
+        with db_session.no_autoflush:
+            for offset in range((END - START).days + 1):
+                for code in sorted(STOCKS):
+                    record = build_training_snapshot(
+                        db_session, code, f"종목{STOCKS.index(code)}", "KR",
+                        START + timedelta(days=offset),
+                        {"direction": "up", "score": 60.0 + STOCKS.index(code), "confidence": 0.7},
+                    )
+                    db_session.expunge(record)
+                    expected.append({col: getattr(record, col) for col in COMPARED_COLUMNS})
+
+        result = pb.parallel_backfill(db_session, "KR", START, END, workers=1)
+
+        assert result["created"] == 9
+        assert result["failed"] == 0
+        assert result["dates_processed"] == 3
+        actual = _rows(db_session)
+        assert len(actual) == len(expected)
+        for got, want in zip(actual, expected, strict=True):
+            for col in COMPARED_COLUMNS:
+                assert got[col] == pytest.approx(want[col]), col
+
+    def test_bulk_queries_and_downloads(self, db_session, downloads):
+        _seed(db_session, labels=True)
+        db_session.add(StockTrainingData(
+            prediction_date=START, stock_code="005930", market="KR",
+            predicted_direction="up", predicted_score=60.0, confidence=0.7,
+        ))
+        db_session.commit()
+
+        result = pb.parallel_backfill(db_session, "KR", START, END, workers=1)
+
+        assert result["created"] == 8
+        assert result["skipped"] == 1
+        # 종목 일봉 다중 티커 1회 + 지수/VIX/환율 1회
+        assert len(downloads) == 2
+        assert sorted(downloads[0]) == sorted(f"{c}.KS" for c in STOCKS)
+        labeled = db_session.query(StockTrainingData).filter(
+            StockTrainingData.actual_direction == "up"
+        ).all()
+        assert len(labeled) == 8
+        assert {r.actual_change_pct for r in labeled} == {1.5}
+
+    def test_dry_run(self, db_session, downloads):
+        _seed(db_session)
+
+        result = pb.parallel_backfill(db_session, "KR", START, END, workers=1, dry_run=True)
+
+        assert result["created"] == 9
+        assert db_session.query(StockTrainingData).count() == 0
+        assert downloads == []
+
+    def test_resume_after_failed_shard(self, db, downloads, monkeypatch, tmp_path):
+        _seed(db)
+        checkpoint = tmp_path / "kr.json"
+        real_insert = pb._insert_rows
+        inserts = []
+
+        def flaky_insert(db, rows):
+            inserts.append(len(rows))
+            if len(inserts) == 2:
+                raise RuntimeError("connection lost")
+            real_insert(db, rows)
+
+        monkeypatch.setattr(pb, "_insert_rows", flaky_insert)
+        first = pb.parallel_backfill(
+            db, "KR", START, END, workers=1, shard_days=1, buckets=1,
+            checkpoint_path=checkpoint,
+        )
+        assert first["shards"] == 3
+        assert first["created"] == 6
+        assert first["failed"] == 3
+        assert len(json.loads(checkpoint.read_text())["completed"]) == 2
+
+        monkeypatch.setattr(pb, "_insert_rows", real_insert)
+        second = pb.parallel_backfill(
+            db, "KR", START, END, workers=1, shard_days=1, buckets=1,
+            checkpoint_path=checkpoint,
+        )
+        assert second["skipped"] == 6
+        assert second["created"] == 3
+        assert db.query(StockTrainingData).count() == 9
+        assert len(json.loads(checkpoint.read_text())["completed"]) == 3
+
+    def test_shard_with_failed_rows_retried(self, db, downloads, monkeypatch, tmp_path):
+        """행 단위 실패가 있는 샤드는 완료로 기록하지 않고 재실행 시 실패 행만 다시 생성."""
+        _seed(db)
+        checkpoint = tmp_path / "kr.json"
+        real_build_row = pb._build_row
+
+        def flaky_build_row(task, *args):
+            if task.stock_code == "035720" and task.prediction_date == START:
+                raise RuntimeError("bad price data")
+            return real_build_row(task, *args)
+
+        monkeypatch.setattr(pb, "_build_row", flaky_build_row)
+        first = pb.parallel_backfill(
+            db, "KR", START, END, workers=1, shard_days=1, buckets=1,
+            checkpoint_path=checkpoint,
+        )
+        assert first["created"] == 8
+        assert first["failed"] == 1
+        assert f"{START.isoformat()}#0" not in json.loads(checkpoint.read_text())["completed"]
+
+        monkeypatch.setattr(pb, "_build_row", real_build_row)
+        second = pb.parallel_backfill(
+            db, "KR", START, END, workers=1, shard_days=1, buckets=1,
+            checkpoint_path=checkpoint,
+        )
+        assert second["shards_resumed"] == 0
+        assert second["skipped"] == 8
+        assert second["created"] == 1
+        assert db.query(StockTrainingData).count() == 9
+        assert len(json.loads(checkpoint.read_text())["completed"]) == 3
+
+    def test_completed_shards_skipped(self, db_session, downloads, tmp_path):
+        _seed(db_session)
+        key = {
+            "market": "KR", "start_date": START.isoformat(), "end_date": END.isoformat(),
+            "shard_days": 1, "buckets": 1,
+        }
+        checkpoint = pb.BackfillCheckpoint(tmp_path / "kr.json", key)
+        checkpoint.mark(f"{START.isoformat()}#0", {"created": 0})
+
+        result = pb.parallel_backfill(
+            db_session, "KR", START, END, workers=1, shard_days=1, buckets=1,
+            checkpoint_path=tmp_path / "kr.json",
+        )
+
+        assert result["shards_resumed"] == 1
+        assert result["created"] == 6
+        dates = {r.prediction_date for r in db_session.query(StockTrainingData).all()}
+        assert START not in dates
+
+    def test_process_pool_matches_serial(self, db_session, downloads, monkeypatch):
+        monkeypatch.setattr(settings, "backfill_checkpoint_dir", "")
+        _seed(db_session)
+        pb.parallel_backfill(db_session, "KR", START, END, workers=1, buckets=2)
+        serial = _rows(db_session)
+        db_session.query(StockTrainingData).delete()
+        db_session.commit()
+
+        result = pb.parallel_backfill(db_session, "KR", START, END, workers=2, buckets=2)
+
+        assert result["created"] == 9
+        assert _rows(db_session) == serial
+
+
+class TestHelpers:
+    def test_shard_key_stable(self):
+        first = pb.shard_key(date(2026, 2, 20), "005930", START, 7, 4)
+        assert first == pb.shard_key(date(2026, 2, 16), "005930", START, 7, 4)
+        assert first.startswith("2026-02-16#")
+        assert pb.shard_key(date(2026, 2, 23), "005930", START, 7, 4).startswith("2026-02-23#")
+
+    @pytest.mark.parametrize("group_by_ticker", [True, False])
+    def test_split_download(self, group_by_ticker):
+        frames = {t: _prices(t).iloc[:5] for t in ("A", "B")}
+        df = pd.concat(frames, axis=1)
+        if not group_by_ticker:
+            df = df.swaplevel(axis=1)
+        df.loc[df.index[0], ("B", "Close") if group_by_ticker else ("Close", "B")] = np.nan
+
+        split = pb._split_download(df, ["A", "B", "C"])
+
+        assert set(split) == {"A", "B"}
+        pd.testing.assert_frame_equal(split["A"], frames["A"], check_names=False)
+        assert np.isnan(split["B"]["Close"].iloc[0])
@@ -0,0 +1,261 @@
+"""Parquet 아카이브 + DuckDB 분석 엔진 테스트."""
+
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("duckdb")
+
+from app.core.config import settings
+from app.models.news_event import NewsEvent
+from app.models.training import StockTrainingData
+from app.models.verification import DailyPredictionResult
+from app.processing.analytics_engine import AnalyticsEngine
+from app.processing.parquet_archive import (
+    archive_coverage,
+    export_archive,
+    export_table_day,
+    invalidate_archive_days,
+    mark_stale,
+    partition_dir,
+    read_manifest,
+    run_nightly_export,
+)
+from app.processing.prediction_context_builder import build_prediction_context
+from app.processing.training_data_builder import export_training_csv
+
+
+def _training_row(day: date, code: str, **kwargs) -> StockTrainingData:
+    defaults = dict(
+        prediction_date=day, stock_code=code, stock_name="삼성전자", market="KR",
+        news_score=70.0, sentiment_score=0.5, news_count=5, news_count_3d=3,
+        avg_score_3d=72.0, disclosure_ratio=0.0, sentiment_trend=0.1, day_of_week=2,
+        predicted_direction="up", predicted_score=75.0, confidence=0.8,
+        actual_close=71500.0, actual_change_pct=2.29, actual_direction="up", is_correct=True,
+    )
+    defaults.update(kwargs)
+    return StockTrainingData(**defaults)
+
+
+@pytest.fixture
+def training_rows(db_session):
+    rows = [
+        _training_row(date(2026, 2, 2), "005930"),
+        _training_row(date(2026, 2, 3), "005930", is_correct=None, actual_direction=None),
+        _training_row(date(2026, 2, 3), "000660", stock_name="SK하이닉스"),
+    ]
+    db_session.add_all(rows)
+    db_session.commit()
+    return rows
+
+
+class TestExport:
+    def test_export_day_writes_partition(self, db_session, training_rows, tmp_path):
+        """하루치 행이 date= 파티션 파일로 저장."""
+        count = export_table_day(db_session, tmp_path, "stock_training_data", date(2026, 2, 3))
+        assert count == 2
+        assert (partition_dir(tmp_path, "stock_training_data", date(2026, 2, 3)) / "part-0.parquet").exists()
+
+    def test_export_empty_day_skips_file(self, db_session, tmp_path):
+        """데이터 없는 날은 파일을 만들지 않음."""
+        count = export_table_day(db_session, tmp_path, "stock_price", date(2026, 2, 3))
+        assert count == 0
+        assert not partition_dir(tmp_path, "stock_price", date(2026, 2, 3)).exists()
+
+    def test_export_datetime_partition(self, db_session, tmp_path):
+        """news_event는 published_at 일자 기준으로 분할."""
+        db_session.add_all([
+            NewsEvent(market="KR", stock_code="005930", title="a", source="naver",
+                      published_at=datetime(2026, 2, 3, 1, 0, tzinfo=UTC)),
+            NewsEvent(market="KR", stock_code="005930", title="b", source="naver",
+                      published_at=datetime(2026, 2, 4, 1, 0, tzinfo=UTC)),
+        ])
+        db_session.commit()
+        assert export_table_day(db_session, tmp_path, "news_event", date(2026, 2, 3)) == 1
+
+    def test_export_archive_updates_manifest(self, db_session, training_rows, tmp_path):
+        """기간 내보내기 후 manifest 갱신."""
+        exported = export_archive(
+            db_session, tmp_path, date(2026, 2, 1), date(2026, 2, 3),
+            tables=["stock_training_data"],
+        )
+        assert exported == {"stock_training_data": 3}
+        assert read_manifest(tmp_path, "stock_training_data") == date(2026, 2, 3)
+
+    def test_nightly_export_is_incremental(self, db_session, training_rows, tmp_path):
+        """manifest 이후 날짜만 내보내기."""
+        export_archive(db_session, tmp_path, date(2026, 2, 2), date(2026, 2, 2),
+                       tables=["stock_training_data"])
+        exported = run_nightly_export(db_session, tmp_path, today=date(2026, 2, 4))
+        assert exported["stock_training_data"] == 2  # 2/3만 추가
+        assert read_manifest(tmp_path, "stock_training_data") == date(2026, 2, 3)
+
+    def test_nightly_first_run_records_range(self, db_session, training_rows, tmp_path):
+        """최초 야간 내보내기는 어제 하루만 구간으로 기록."""
+        run_nightly_export(db_session, tmp_path, today=date(2026, 2, 4))
+        assert archive_coverage(tmp_path, "stock_training_data") == (
+            date(2026, 2, 3), date(2026, 2, 3), set(),
+        )
+
+    def test_export_archive_merges_adjacent_range(self, db_session, training_rows, tmp_path):
+        """이어지는 구간은 병합, 떨어진 과거 구간은 기존 구간 유지."""
+        export_archive(db_session, tmp_path, date(2026, 2, 3), date(2026, 2, 3),
+                       tables=["stock_training_data"])
+        export_archive(db_session, tmp_path, date(2026, 2, 1), date(2026, 2, 2),
+                       tables=["stock_training_data"])
+        assert archive_coverage(tmp_path, "stock_training_data")[:2] == (
+            date(2026, 2, 1), date(2026, 2, 3),
+        )
+
+        export_archive(db_session, tmp_path, date(2026, 1, 10), date(2026, 1, 12),
+                       tables=["stock_training_data"])
+        assert archive_coverage(tmp_path, "stock_training_data")[:2] == (
+            date(2026, 2, 1), date(2026, 2, 3),
+        )
+
+    def test_mark_stale_ignores_unexported_days(self, db_session, training_rows, tmp_path):
+        """내보낸 구간 밖의 일자는 stale 로 표시하지 않음."""
+        export_archive(db_session, tmp_path, date(2026, 2, 2), date(2026, 2, 3),
+                       tables=["stock_training_data"])
+        marked = mark_stale(
+            tmp_path, "stock_training_data",
+            [date(2026, 2, 1), date(2026, 2, 3), date(2026, 2, 4)],
+        )
+        assert marked == 1
+        assert archive_coverage(tmp_path, "stock_training_data")[2] == {date(2026, 2, 3)}
+        assert mark_stale(tmp_path, "news_event", [date(2026, 2, 3)]) == 0
+
+    def test_nightly_reexports_stale_days(self, db_session, training_rows, tmp_path, monkeypatch):
+        """검증으로 라벨이 바뀐 일자는 다음 야간 내보내기에서 다시 내보냄."""
+        export_archive(db_session, tmp_path, date(2026, 2, 2), date(2026, 2, 3),
+                       tables=["stock_training_data"])
+        training_rows[1].actual_direction = "down"
+        training_rows[1].is_correct = False
+        db_session.commit()
+
+        monkeypatch.setattr(settings, "analytics_archive_dir", str(tmp_path))
+        invalidate_archive_days(["stock_training_data"], [date(2026, 2, 3)])
+        engine = AnalyticsEngine(tmp_path)
+        assert engine.covers("stock_training_data", date(2026, 2, 2), date(2026, 2, 3)) is False
+        assert engine.covers("stock_training_data", date(2026, 2, 2), date(2026, 2, 2)) is True
+
+        exported = run_nightly_export(db_session, tmp_path, today=date(2026, 2, 4))
+        assert exported["stock_training_data"] == 2
+        assert archive_coverage(tmp_path, "stock_training_data") == (
+            date(2026, 2, 2), date(2026, 2, 3), set(),
+        )
+        assert engine.covers("stock_training_data", date(2026, 2, 2), date(2026, 2, 3)) is True
+        df = engine.query(
+            "SELECT COUNT(*) AS n FROM stock_training_data WHERE actual_direction = 'down'"
+        )
+        assert df["n"].tolist() == [1]
+
+
+class TestAnalyticsEngine:
+    def test_covers_requires_manifest(self, db_session, training_rows, tmp_path):
+        """manifest 범위를 넘는 기간은 미포함."""
+        engine = AnalyticsEngine(tmp_path)
+        assert engine.covers("stock_training_data", date(2026, 2, 1), date(2026, 2, 3)) is False
+
+        export_archive(db_session, tmp_path, date(2026, 2, 1), date(2026, 2, 3),
+                       tables=["stock_training_data"])
+        assert engine.covers("stock_training_data", date(2026, 2, 1), date(2026, 2, 3)) is True
+        assert engine.covers("stock_training_data", date(2026, 2, 1), date(2026, 2, 4)) is False
+
+    def test_covers_requires_start(self, db_session, training_rows, tmp_path):
+        """내보낸 구간 이전 일자가 포함된 기간은 미포함 (최초 야간 내보내기 이후)."""
+        run_nightly_export(db_session, tmp_path, today=date(2026, 2, 4))
+        engine = AnalyticsEngine(tmp_path)
+        assert engine.covers("stock_training_data", date(2026, 2, 3), date(2026, 2, 3)) is True
+        assert engine.covers("stock_training_data", date(2026, 2, 1), date(2026, 2, 3)) is False
+
+    def test_archived_through_stops_at_stale_day(self, db_session, training_rows, tmp_path):
+        """아카이브 조회 가능 구간은 내보낸 마지막 일자 또는 첫 stale 일자 전날까지."""
+        export_archive(db_session, tmp_path, date(2026, 2, 1), date(2026, 2, 3),
+                       tables=["stock_training_data"])
+        engine = AnalyticsEngine(tmp_path)
+        table = "stock_training_data"
+        assert engine.archived_through(table, date(2026, 2, 1), date(2026, 2, 10)) == date(2026, 2, 3)
+        assert engine.archived_through(table, date(2026, 1, 31), date(2026, 2, 3)) is None
+
+        mark_stale(tmp_path, table, [date(2026, 2, 3)])
+        assert engine.archived_through(table, date(2026, 2, 1), date(2026, 2, 10)) == date(2026, 2, 2)
+        assert engine.archived_through(table, date(2026, 2, 3), date(2026, 2, 10)) is None
+
+    def test_prediction_context_uses_archive(self, db_session, tmp_path, monkeypatch):
+        """예측 컨텍스트는 아카이브 구간을 DuckDB, 최근 미내보내기 구간을 DB 에서 읽음."""
+        today = date.today()
+        for offset, (correct, sentiment) in enumerate([(True, 0.7), (False, -0.7), (True, 0.2)]):
+            day = today - timedelta(days=3 - offset)
+            db_session.add(DailyPredictionResult(
+                prediction_date=day, stock_code="005930", market="KR",
+                predicted_direction="up", predicted_score=75.0, confidence=0.8, news_count=3,
+                actual_direction="up" if correct else "down", actual_change_pct=1.0,
+                is_correct=correct,
+            ))
+            db_session.add(_training_row(
+                day, "005930", sentiment_score=sentiment,
+                actual_direction="up" if correct else "down", is_correct=correct,
+            ))
+        db_session.commit()
+        expected = build_prediction_context(db_session, days=5)
+
+        archive_end = today - timedelta(days=2)
+        export_archive(db_session, tmp_path, today - timedelta(days=5), archive_end,
+                       tables=["daily_prediction_result", "stock_training_data"])
+        engine = AnalyticsEngine(tmp_path)
+        monkeypatch.setattr(
+            "app.processing.analytics_engine.get_analytics_engine", lambda: engine
+        )
+        # 아카이브된 일자의 DB 행을 지워도 결과 동일
+        for model in (DailyPredictionResult, StockTrainingData):
+            db_session.query(model).filter(model.prediction_date <= archive_end).delete()
+        db_session.commit()
+
+        context = build_prediction_context(db_session, days=5)
+        for key in ("total_predictions", "overall_accuracy", "direction_accuracy",
+                    "sentiment_ranges", "score_ranges", "market_conditions"):
+            assert context[key] == expected[key], key
+        assert context["total_predictions"] == 3
+
+    def test_covers_rejects_legacy_manifest(self, db_session, training_rows, tmp_path):
+        """시작일이 없는 이전 형식 manifest 는 SQL 경로로 조회."""
+        export_archive(db_session, tmp_path, date(2026, 2, 1), date(2026, 2, 3),
+                       tables=["stock_training_data"])
+        (tmp_path / "stock_training_data" / "_manifest.json").write_text(
+            '{"exported_through": "2026-02-03"}', encoding="utf-8"
+        )
+        engine = AnalyticsEngine(tmp_path)
+        assert read_manifest(tmp_path, "stock_training_data") == date(2026, 2, 3)
+        assert engine.covers("stock_training_data", date(2026, 2, 2), date(2026, 2, 3)) is False
+
+    def test_query_archive(self, db_session, training_rows, tmp_path):
+        """DuckDB로 아카이브 집계."""
+        export_archive(db_session, tmp_path, date(2026, 2, 1), date(2026, 2, 3),
+                       tables=["stock_training_data"])
+        engine = AnalyticsEngine(tmp_path)
+        assert engine.covers("stock_training_data", date(2026, 2, 1), date(2026, 2, 3))
+
+        df = engine.query(
+            "SELECT prediction_date, COUNT(*) AS n FROM stock_training_data "
+            "GROUP BY prediction_date ORDER BY prediction_date"
+        )
+        assert df["n"].tolist() == [1, 2]
+
+    def test_export_training_csv_uses_archive(self, db_session, training_rows, tmp_path, monkeypatch):
+        """아카이브가 기간을 포함하면 CSV가 DuckDB 결과와 동일."""
+        from_db = export_training_csv(db_session, "KR", date(2026, 2, 1), date(2026, 2, 3))
+
+        export_archive(db_session, tmp_path, date(2026, 2, 1), date(2026, 2, 3),
+                       tables=["stock_training_data"])
+        engine = AnalyticsEngine(tmp_path)
+        monkeypatch.setattr(
+            "app.processing.analytics_engine.get_analytics_engine", lambda: engine
+        )
+        # DB 행을 지워도 아카이브에서 읽어옴
+        db_session.query(StockTrainingData).delete()
+        db_session.commit()
+
+        from_archive = export_training_csv(db_session, "KR", date(2026, 2, 1), date(2026, 2, 3))
+        assert from_archive == from_db
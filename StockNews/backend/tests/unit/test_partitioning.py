@@ -0,0 +1,75 @@
+"""news_event 파티션 관리 테스트."""
+
+from datetime import date
+
+from app.core.partitioning import (
+    add_months,
+    create_partition_sql,
+    detach_expired_partitions,
+    ensure_partitions,
+    expired_partitions,
+    is_partitioned,
+    month_partitions,
+    partition_name,
+    run_partition_maintenance,
+)
+
+
+class TestMonthHelpers:
+    def test_add_months_across_year(self):
+        """연도 경계를 넘는 월 이동."""
+        assert add_months(date(2025, 11, 15), 3) == date(2026, 2, 1)
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+    def test_partition_name(self):
+        """월 파티션명 형식."""
+        assert partition_name(date(2026, 3, 1)) == "news_event_p2026_03"
+
+    def test_month_partitions_range(self):
+        """시작~종료 월 포함 범위."""
+        parts = month_partitions(date(2025, 12, 20), date(2026, 2, 3))
+        assert [p.name for p in parts] == [
+            "news_event_p2025_12",
+            "news_event_p2026_01",
+            "news_event_p2026_02",
+        ]
+        assert parts[0].end == parts[1].start
+
+    def test_create_partition_sql(self):
+        """FROM/TO 범위가 반개구간으로 생성."""
+        (part,) = month_partitions(date(2026, 1, 5), date(2026, 1, 5))
+        sql = create_partition_sql(part)
+        assert "PARTITION OF news_event" in sql
+        assert "FROM ('2026-01-01') TO ('2026-02-01')" in sql
+
+
+class TestExpiredPartitions:
+    NAMES = [
+        "news_event_p2025_01",
+        "news_event_p2025_06",
+        "news_event_p2025_07",
+        "news_event_p2026_01",
+        "news_event_default",
+    ]
+
+    def test_retention_disabled(self):
+        """retention 0이면 만료 없음."""
+        assert expired_partitions(self.NAMES, 0, today=date(2026, 1, 15)) == []
+
+    def test_expired_by_cutoff(self):
+        """cutoff 이전에 끝나는 파티션만 만료, default 파티션 제외."""
+        # cutoff = 2025-07-01 → 2025-06 파티션(상한 07-01)까지 만료
+        expired = expired_partitions(self.NAMES, 6, today=date(2026, 1, 15))
+        assert expired == ["news_event_p2025_01", "news_event_p2025_06"]
+
+
+class TestSqliteNoop:
+    def test_not_partitioned_on_sqlite(self, db_session):
+        """SQLite에서는 파티션 미지원."""
+        assert is_partitioned(db_session) is False
+
+    def test_maintenance_noop_on_sqlite(self, db_session):
+        """SQLite에서는 생성/아카이브 없음."""
+        assert ensure_partitions(db_session, months_ahead=2) == []
+        assert detach_expired_partitions(db_session, retention_months=1) == []
+        assert run_partition_maintenance(db_session, 2, 1) == {"created": [], "archived": []}
@@ -8,7 +8,7 @@ from unittest.mock import patch
 import pytest
 from fastapi.testclient import TestClient
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.main import app
 from app.models.verification import DailyPredictionResult
 
@@ -21,6 +21,7 @@ def client(db_session, monkeypatch):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     yield TestClient(app)
     app.dependency_overrides.clear()
 
@@ -0,0 +1,144 @@
+"""Redis 응답 캐시 데코레이터 + 태그 무효화 테스트."""
+
+from types import SimpleNamespace
+
+import fakeredis
+import pytest
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.core.config import settings
+from app.core.response_cache import (
+    build_cache_key,
+    cached_response,
+    invalidate_tags,
+    news_event_tags,
+)
+
+
+def _metric(route: str, result: str) -> float:
+    return REGISTRY.get_sample_value(
+        "stocknews_response_cache_requests_total", {"route": route, "result": result}
+    ) or 0.0
+
+
+@pytest.fixture
+def redis_server(monkeypatch):
+    """동기/비동기 클라이언트가 같은 데이터를 보는 fakeredis 서버."""
+    server = fakeredis.FakeServer()
+    async_client = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    sync_client = fakeredis.FakeRedis(server=server, decode_responses=True)
+    monkeypatch.setattr("app.core.response_cache._get_async_client", lambda: async_client)
+    monkeypatch.setattr("app.core.response_cache._get_sync_client", lambda: sync_client)
+    monkeypatch.setattr(settings, "response_cache_enabled", True)
+    return sync_client
+
+
+@pytest.fixture
+def app_state():
+    """호출 횟수/실패 여부를 제어하는 테스트 엔드포인트."""
+    state = {"calls": 0, "fail": False}
+    app = FastAPI()
+
+    @app.get("/top")
+    @cached_response("test_top", tags=lambda market, **_: [f"market:{market}"])
+    async def top(request: Request, market: str = Query(...), limit: int = Query(10)):
+        state["calls"] += 1
+        if state["fail"]:
+            raise RuntimeError("db down")
+        if market == "XX":
+            raise HTTPException(status_code=404, detail="unknown market")
+        return {"market": market, "limit": limit, "calls": state["calls"]}
+
+    return TestClient(app, raise_server_exceptions=False), state
+
+
+class _Params:
+    def __init__(self, items):
+        self._items = items
+
+    def multi_items(self):
+        return list(self._items)
+
+
+class TestCacheKey:
+    def test_query_param_order_is_normalized(self):
+        a = SimpleNamespace(path_params={}, query_params=_Params([("b", "2"), ("a", "1")]))
+        b = SimpleNamespace(path_params={}, query_params=_Params([("a", "1"), ("b", "2")]))
+        assert build_cache_key("ns", a) == build_cache_key("ns", b)
+
+    def test_api_key_excluded(self):
+        a = SimpleNamespace(path_params={}, query_params=_Params([("a", "1"), ("api_key", "x")]))
+        b = SimpleNamespace(path_params={}, query_params=_Params([("a", "1")]))
+        assert build_cache_key("ns", a) == build_cache_key("ns", b)
+
+
+class TestCachedResponse:
+    def test_hit_after_miss(self, redis_server, app_state):
+        client, state = app_state
+        hits = _metric("test_top", "hit")
+
+        first = client.get("/top", params={"market": "KR", "limit": 5}).json()
+        second = client.get("/top", params={"limit": 5, "market": "KR"}).json()
+
+        assert first == second
+        assert state["calls"] == 1
+        assert _metric("test_top", "hit") == hits + 1
+
+    def test_invalidate_by_tag(self, redis_server, app_state):
+        client, state = app_state
+        client.get("/top", params={"market": "KR"})
+        client.get("/top", params={"market": "US"})
+
+        assert invalidate_tags(["market:KR"]) == 1
+        client.get("/top", params={"market": "KR"})
+        client.get("/top", params={"market": "US"})
+        assert state["calls"] == 3  # KR만 재계산
+
+    def test_stale_served_on_failure(self, redis_server, app_state, monkeypatch):
+        """신선 기간이 지난 항목은 재계산 실패 시에만 제공."""
+        client, state = app_state
+        monkeypatch.setattr(settings, "response_cache_ttl", 0)
+        client.get("/top", params={"market": "KR"})
+        stale = _metric("test_top", "stale")
+
+        state["fail"] = True
+        resp = client.get("/top", params={"market": "KR"})
+        assert resp.status_code == 200
+        assert resp.json()["calls"] == 1
+        assert _metric("test_top", "stale") == stale + 1
+
+    def test_http_exception_not_masked(self, redis_server, app_state):
+        client, _ = app_state
+        assert client.get("/top", params={"market": "XX"}).status_code == 404
+
+    def test_redis_down_bypasses_cache(self, app_state, monkeypatch):
+        class _Broken:
+            async def get(self, key):
+                raise ConnectionError("redis down")
+
+        monkeypatch.setattr("app.core.response_cache._get_async_client", lambda: _Broken())
+        monkeypatch.setattr(settings, "response_cache_enabled", True)
+        client, state = app_state
+        assert client.get("/top", params={"market": "KR"}).status_code == 200
+        assert client.get("/top", params={"market": "KR"}).status_code == 200
+        assert state["calls"] == 2
+
+
+class TestNewsEventTags:
+    def test_tags_cover_market_stock_theme(self):
+        event = SimpleNamespace(
+            market="US", stock_code="NVDA", theme="AI, 반도체",
+            kr_impact_themes='[{"theme": "HBM", "impact": 0.7, "direction": "up"}]',
+        )
+        assert news_event_tags([event]) == {
+            "market:US", "market:ALL", "stock:NVDA", "theme:AI", "theme:반도체", "theme:HBM",
+        }
+
+    def test_theme_news_invalidated_by_partial_match(self):
+        """/theme/news 는 부분 일치 조회라 다른 이름의 테마 저장에도 무효화."""
+        from app.api.themes import _theme_news_tags
+
+        event = SimpleNamespace(market="KR", stock_code="005930", theme="반도체", kr_impact_themes=None)
+        assert news_event_tags([event]) & set(_theme_news_tags(theme="반도"))
@@ -153,5 +153,6 @@ class TestCreateScheduler:
         assert "kr_news_collection" in job_ids
         assert "dart_disclosure_collection" in job_ids
         assert "us_news_collection" in job_ids
+        assert "news_partition_maintenance" in job_ids
         # RSS jobs are added when scope file has feed URLs
         assert len(jobs) >= 3
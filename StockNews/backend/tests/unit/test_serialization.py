@@ -0,0 +1,69 @@
+"""고속 JSON 직렬화 (orjson / 표준 json 폴백) 테스트."""
+
+import json
+from datetime import UTC, date, datetime, timedelta, timezone
+
+import pytest
+
+from app.core import serialization
+from app.core.serialization import FastJSONResponse, dumps, rows_to_dicts
+from app.schemas.training import TrainingDataItem
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serialization, "_orjson", lambda: None)
+    return request.param
+
+
+def _training_row(**overrides) -> dict:
+    row = {field: None for field in TrainingDataItem.model_fields}
+    row.update(
+        prediction_date=date(2026, 2, 19), stock_code="005930", stock_name="삼성전자",
+        market="KR", news_score=70.5, sentiment_score=-0.25, news_count=5,
+        news_count_3d=3, avg_score_3d=72.0, disclosure_ratio=0.0, sentiment_trend=0.1,
+        day_of_week=2, predicted_direction="up", predicted_score=75.0, confidence=0.8,
+        has_earnings_disclosure=True, is_correct=False,
+    )
+    row.update(overrides)
+    return row
+
+
+class TestDumps:
+    def test_matches_pydantic_json(self, backend):
+        """프로젝션 dict 직렬화 결과가 response_model 직렬화와 동일."""
+        row = _training_row()
+        expected = json.loads(TrainingDataItem(**row).model_dump_json())
+        assert json.loads(dumps(row)) == expected
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (datetime(2026, 3, 1, 9, 0, tzinfo=UTC), "2026-03-01T09:00:00Z"),
+            (datetime(2026, 3, 1, 9, 0, 0, 123), "2026-03-01T09:00:00.000123"),
+            (
+                datetime(2026, 3, 1, 18, 0, tzinfo=timezone(timedelta(hours=9))),
+                "2026-03-01T18:00:00+09:00",
+            ),
+            (date(2026, 3, 1), "2026-03-01"),
+        ],
+    )
+    def test_datetime_format(self, backend, value, expected):
+        assert json.loads(dumps({"v": value}))["v"] == expected
+
+    def test_korean_not_escaped(self, backend):
+        assert "삼성전자".encode() in dumps({"name": "삼성전자"})
+
+
+class TestFastJSONResponse:
+    def test_render(self):
+        response = FastJSONResponse({"items": rows_to_dicts([(1, "a")], ("id", "title"))})
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {"items": [{"id": 1, "title": "a"}]}
+
+    def test_rows_to_dicts_length_mismatch(self):
+        with pytest.raises(ValueError):
+            rows_to_dicts([(1, "a", "extra")], ("id", "title"))
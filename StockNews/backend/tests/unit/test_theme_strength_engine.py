@@ -0,0 +1,112 @@
+"""인메모리 테마 강도 엔진 테스트."""
+
+from datetime import UTC, date, datetime
+
+import pytest
+
+from app.models.news_event import NewsEvent
+from app.processing.theme_strength_engine import ThemeStrengthEngine, calc_rise_index
+from app.processing.theme_strength_engine import theme_strength_engine as global_engine
+
+
+def _add(db, **kwargs):
+    defaults = {
+        "market": "KR", "stock_code": "005930", "title": "뉴스", "source": "naver",
+        "news_score": 80.0, "sentiment_score": 0.5,
+        "published_at": datetime(2026, 3, 2, 9, tzinfo=UTC),
+    }
+    event = NewsEvent(**{**defaults, **kwargs})
+    db.add(event)
+    db.commit()
+    return event
+
+
+@pytest.fixture
+def engine():
+    """전역 엔진 (커밋 증분 구독 대상) — 테스트 간 상태 격리."""
+    global_engine.reset()
+    yield global_engine
+    global_engine.reset()
+
+
+def _by_theme(items):
+    return {item["theme"]: item for item in items}
+
+
+class TestCalcRiseIndex:
+    def test_kr_only(self):
+        assert calc_rise_index([1, 80.0, 0.5], [0, 0.0, 0.0]) == 78.0
+
+    def test_blended(self):
+        # KR 78.0 * 0.6 + US (50*0.6 + 1.0*20 = 50.0) * 0.4
+        assert calc_rise_index([1, 80.0, 0.5], [1, 50.0, 0.0]) == 66.8
+
+
+class TestThemeStrengthEngine:
+    def test_load_replays_rollups(self, db_session):
+        _add(db_session, theme="AI, 반도체")
+        _add(db_session, theme="AI", news_score=60.0)
+
+        engine = ThemeStrengthEngine()
+        engine.load(db_session)
+
+        items = _by_theme(engine.strength())
+        assert items["AI"]["news_count"] == 2
+        assert items["AI"]["strength_score"] == 70.0
+        assert items["반도체"]["news_count"] == 1
+
+    def test_commit_applies_increment(self, db_session, engine):
+        engine.load(db_session)
+        assert engine.strength() == []
+
+        event = _add(db_session, theme="AI")
+        assert _by_theme(engine.strength())["AI"]["news_count"] == 1
+
+        event.theme = "바이오"
+        db_session.commit()
+        items = _by_theme(engine.strength())
+        assert "AI" not in items
+        assert items["바이오"]["news_count"] == 1
+
+        db_session.delete(event)
+        db_session.commit()
+        assert engine.strength() == []
+
+    def test_rollback_not_applied(self, db_session, engine):
+        engine.load(db_session)
+        db_session.add(NewsEvent(market="KR", stock_code="005930", title="t", source="naver", theme="AI"))
+        db_session.flush()
+        db_session.rollback()
+        assert engine.strength() == []
+
+    def test_us_impact_themes_feed_rise_index_only(self, db_session, engine):
+        engine.load(db_session)
+        _add(db_session, theme="반도체")
+        _add(
+            db_session, market="US", stock_code="NVDA", theme="AI", news_score=50.0,
+            sentiment_score=0.0,
+            kr_impact_themes='[{"theme": "반도체", "impact": 1.0, "direction": "down"}]',
+        )
+
+        kr = _by_theme(engine.strength(market="KR"))
+        assert set(kr) == {"반도체"}
+        assert kr["반도체"]["news_count"] == 1
+        # US impact 기여분: score 50*1.0, sentiment -1.0 → 30.0
+        assert kr["반도체"]["rise_index"] == round(78.0 * 0.6 + 30.0 * 0.4, 1)
+
+    def test_date_filter(self, db_session, engine):
+        engine.load(db_session)
+        _add(db_session, theme="AI", published_at=datetime(2026, 3, 1, tzinfo=UTC))
+        _add(db_session, theme="AI", published_at=datetime(2026, 3, 2, tzinfo=UTC))
+
+        assert _by_theme(engine.strength(day=date(2026, 3, 1)))["AI"]["news_count"] == 1
+        assert _by_theme(engine.strength())["AI"]["news_count"] == 2
+        assert engine.strength(day=date(2026, 3, 5)) == []
+
+    def test_unloaded_engine_ignores_deltas(self, db_session, engine):
+        _add(db_session, theme="AI")
+        assert not engine.loaded
+        assert engine.strength() == []
+
+        engine.ensure_loaded(db_session)
+        assert _by_theme(engine.strength())["AI"]["news_count"] == 1
@@ -8,8 +8,11 @@ import pytest
 from app.models.news_event import NewsEvent
 from app.models.training import StockTrainingData
 from app.processing.training_data_builder import (
+    TRAINING_EXPORT_COLUMNS,
     build_training_snapshot,
     export_training_csv,
+    iter_training_arrow,
+    iter_training_csv,
     update_training_actuals,
 )
 
@@ -269,3 +272,69 @@ def test_export_training_csv_empty(db_session):
     csv_str = export_training_csv(db_session, "KR", date(2099, 1, 1), date(2099, 1, 31))
     lines = csv_str.strip().split("\n")
     assert len(lines) == 1  # header only
+
+
+def _insert_training_rows(db_session, count):
+    for i in range(count):
+        db_session.add(StockTrainingData(
+            prediction_date=date(2026, 2, 1) + timedelta(days=i % 5),
+            stock_code=f"{i:06d}",
+            stock_name="종목",
+            market="KR",
+            news_score=70.0,
+            sentiment_score=0.5,
+            news_count=5,
+            predicted_direction="up",
+            predicted_score=75.0,
+            confidence=0.8,
+            is_correct=None if i % 2 else True,
+        ))
+    db_session.commit()
+
+
+def test_iter_training_csv_streams_batches(db_session, monkeypatch):
+    """CSV 는 헤더 + 배치별 청크로 생성."""
+    from app.processing import training_data_builder
+
+    monkeypatch.setattr(training_data_builder, "EXPORT_BATCH_SIZE", 4)
+    _insert_training_rows(db_session, 10)
+
+    chunks = list(iter_training_csv(db_session, "KR", date(2026, 2, 1), date(2026, 2, 28)))
+    assert len(chunks) == 1 + 3  # header + ceil(10 / 4)
+    assert "".join(chunks) == export_training_csv(
+        db_session, "KR", date(2026, 2, 1), date(2026, 2, 28)
+    )
+    assert len("".join(chunks).strip().split("\n")) == 11
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_iter_training_arrow_roundtrip(db_session, fmt):
+    """Parquet / Arrow IPC stream 내보내기 결과를 다시 읽어 검증."""
+    import io
+
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    _insert_training_rows(db_session, 7)
+    data = b"".join(iter_training_arrow(
+        db_session, "KR", date(2026, 2, 1), date(2026, 2, 28), fmt=fmt
+    ))
+
+    if fmt == "parquet":
+        table = pq.read_table(io.BytesIO(data))
+    else:
+        table = pa.ipc.open_stream(data).read_all()
+    assert table.column_names == TRAINING_EXPORT_COLUMNS
+    assert table.num_rows == 7
+    assert table.column("prediction_date")[0].as_py() == date(2026, 2, 1)
+    assert table.column("is_correct").to_pylist().count(None) == 3
+
+
+def test_iter_training_arrow_empty_has_schema(db_session):
+    pq = pytest.importorskip("pyarrow.parquet")
+    import io
+
+    data = b"".join(iter_training_arrow(db_session, "KR", date(2099, 1, 1), date(2099, 1, 31)))
+    table = pq.read_table(io.BytesIO(data))
+    assert table.num_rows == 0
+    assert table.column_names == TRAINING_EXPORT_COLUMNS
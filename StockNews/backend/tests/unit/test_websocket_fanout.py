@@ -0,0 +1,137 @@
+"""WebSocket 팬아웃 (연결별 고정 크기 송신 큐) 테스트."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.api import websocket
+from app.api.websocket import _active_connections, _add_connection, broadcast
+from app.core.config import settings
+
+
+@pytest.fixture(autouse=True)
+async def clear_connections():
+    _active_connections.clear()
+    yield
+    for ws in list(_active_connections):
+        await websocket._remove_connection(ws)
+
+
+async def _drain(*clients):
+    for client in clients:
+        await asyncio.wait_for(client.queue.join(), timeout=1)
+
+
+def _blocking_ws() -> tuple[AsyncMock, asyncio.Event]:
+    """send_text 가 release 될 때까지 멈추는 느린 클라이언트."""
+    release = asyncio.Event()
+    ws = AsyncMock()
+
+    async def send_text(payload):
+        await release.wait()
+
+    ws.send_text.side_effect = send_text
+    return ws, release
+
+
+class TestBroadcast:
+    async def test_serializes_once(self, monkeypatch):
+        calls = []
+        real_dumps = websocket.dumps
+        monkeypatch.setattr(websocket, "dumps", lambda m: calls.append(m) or real_dumps(m))
+
+        clients = [AsyncMock() for _ in range(5)]
+        for ws in clients:
+            await _add_connection(ws)
+        await broadcast({"type": "breaking_news", "title": "삼성전자"})
+        await _drain(*_active_connections.values())
+
+        assert len(calls) == 1
+        for ws in clients:
+            assert json.loads(ws.send_text.call_args[0][0])["title"] == "삼성전자"
+
+    async def test_slow_client_does_not_delay_others(self):
+        slow, release = _blocking_ws()
+        fast = AsyncMock()
+        await _add_connection(slow)
+        await _add_connection(fast)
+
+        await asyncio.wait_for(broadcast({"type": "test"}), timeout=0.5)
+        await _drain(_active_connections[fast])
+
+        fast.send_text.assert_called_once()
+        assert slow in _active_connections
+        release.set()
+
+    async def test_full_queue_drops_oldest(self, monkeypatch):
+        monkeypatch.setattr(settings, "ws_send_queue_size", 2)
+        slow, release = _blocking_ws()
+        await _add_connection(slow)
+        client = _active_connections[slow]
+
+        for i in range(4):
+            await broadcast({"seq": i})
+            await asyncio.sleep(0)
+
+        # seq 0 은 송신 중(블록), 큐에는 최신 2건만 남음
+        assert client.dropped == 1
+        assert [json.loads(p)["seq"] for p in list(client.queue._queue)] == [2, 3]
+        release.set()
+
+    async def test_slow_consumer_disconnected_after_drop_limit(self, monkeypatch):
+        monkeypatch.setattr(settings, "ws_send_queue_size", 1)
+        monkeypatch.setattr(settings, "ws_max_dropped_messages", 3)
+        slow, _ = _blocking_ws()
+        await _add_connection(slow)
+
+        for i in range(6):
+            await broadcast({"seq": i})
+            await asyncio.sleep(0)
+
+        assert slow not in _active_connections
+        await asyncio.wait_for(asyncio.gather(*websocket._disconnect_tasks), timeout=1)
+        slow.close.assert_awaited_once_with(code=websocket.SLOW_CONSUMER_CLOSE_CODE)
+
+    async def test_slow_consumer_close_does_not_block_broadcast(self, monkeypatch):
+        """느린 소비자 소켓 종료가 멈춰도 브로드캐스트는 즉시 반환."""
+        monkeypatch.setattr(settings, "ws_send_queue_size", 1)
+        monkeypatch.setattr(settings, "ws_max_dropped_messages", 1)
+        slow, release = _blocking_ws()
+
+        async def close(code):
+            await release.wait()
+
+        slow.close.side_effect = close
+        fast = AsyncMock()
+        await _add_connection(slow)
+        await _add_connection(fast)
+
+        for i in range(3):
+            await asyncio.wait_for(broadcast({"seq": i}), timeout=0.5)
+            await asyncio.sleep(0)
+
+        assert slow not in _active_connections
+        assert fast in _active_connections
+        assert len(websocket._disconnect_tasks) == 1
+        release.set()
+        await asyncio.wait_for(asyncio.gather(*websocket._disconnect_tasks), timeout=1)
+        assert not websocket._disconnect_tasks
+
+    async def test_send_timeout_disconnects(self, monkeypatch):
+        monkeypatch.setattr(settings, "ws_send_timeout", 0.01)
+        slow, _ = _blocking_ws()
+        await _add_connection(slow)
+
+        await broadcast({"type": "test"})
+        await asyncio.sleep(0.05)
+
+        assert slow not in _active_connections
+        slow.close.assert_awaited_once_with(code=websocket.SLOW_CONSUMER_CLOSE_CODE)
+
+    async def test_max_connections(self, monkeypatch):
+        monkeypatch.setattr(websocket, "MAX_WS_CONNECTIONS", 2)
+        assert await _add_connection(AsyncMock())
+        assert await _add_connection(AsyncMock())
+        assert not await _add_connection(AsyncMock())
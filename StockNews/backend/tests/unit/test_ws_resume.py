@@ -0,0 +1,181 @@
+"""속보 스트림 기록 + WebSocket 재접속 재생 (last_event_id) 테스트."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import fakeredis
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import websocket
+from app.core import pubsub
+from app.core.config import settings
+from app.core.pubsub import BREAKING_STREAM, publish_breaking_news, read_breaking_stream
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def redis_sync(server):
+    return fakeredis.FakeRedis(server=server, decode_responses=True)
+
+
+@pytest.fixture
+def redis_async(server):
+    return fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+
+
+def _publish(redis_sync, stock_code="005930", market="KR", score=85.0) -> str:
+    assert publish_breaking_news(redis_sync, stock_code=stock_code, title="속보", score=score, market=market)
+    return redis_sync.xrevrange(BREAKING_STREAM, count=1)[0][0]
+
+
+class TestStreamAppend:
+    def test_publish_appends_and_includes_event_id(self, redis_sync):
+        pubsub_client = redis_sync.pubsub()
+        pubsub_client.subscribe(pubsub.get_channel_name("KR"))
+        pubsub_client.get_message(timeout=1)
+
+        event_id = _publish(redis_sync)
+
+        message = pubsub_client.get_message(timeout=1)
+        assert json.loads(message["data"])["event_id"] == event_id
+        assert redis_sync.xlen(BREAKING_STREAM) == 1
+
+    def test_stream_disabled(self, redis_sync, monkeypatch):
+        monkeypatch.setattr(settings, "breaking_stream_maxlen", 0)
+        assert publish_breaking_news(
+            redis_sync, stock_code="005930", title="속보", score=85.0, market="KR"
+        )
+        assert redis_sync.xlen(BREAKING_STREAM) == 0
+
+
+class TestReadBreakingStream:
+    async def test_reads_after_id(self, redis_sync, redis_async):
+        ids = [_publish(redis_sync, stock_code=code) for code in ("005930", "000660", "035720")]
+
+        messages, truncated = await read_breaking_stream(redis_async, ids[0], count=100)
+
+        assert [m["stock_code"] for m in messages] == ["000660", "035720"]
+        assert [m["event_id"] for m in messages] == ids[1:]
+        assert truncated is False
+
+    async def test_truncated(self, redis_sync, redis_async):
+        ids = [_publish(redis_sync) for _ in range(3)]
+        _, truncated = await read_breaking_stream(redis_async, ids[0], count=1)
+        assert truncated is True
+
+        redis_sync.xtrim(BREAKING_STREAM, maxlen=1, approximate=False)
+        messages, truncated = await read_breaking_stream(redis_async, ids[0], count=100)
+        assert [m["event_id"] for m in messages] == ids[2:]
+        assert truncated is True
+
+
+class TestReplayMerge:
+    async def test_pending_live_messages_deduplicated(self):
+        client = websocket.ClientConnection(AsyncMock(), queue_size=10)
+        client.begin_replay()
+        client.enqueue('{"seq":2}', "2-0")
+        client.enqueue('{"seq":3}', "3-0")
+
+        client.end_replay([{"seq": 1}, {"seq": 2}], "2-0")
+
+        assert [json.loads(p)["seq"] for p in list(client.queue._queue)] == [1, 2, 3]
+
+    async def test_pending_capped_at_queue_size(self, monkeypatch):
+        monkeypatch.setattr(settings, "ws_max_dropped_messages", 100)
+        client = websocket.ClientConnection(AsyncMock(), queue_size=3)
+        client.begin_replay()
+        for seq in range(1, 6):
+            assert client.enqueue(f'{{"seq":{seq}}}', f"{seq}-0")
+
+        assert len(client._pending) == 3
+        assert client.dropped == 2
+        assert client.end_replay([], "0-0")
+        assert [json.loads(p)["seq"] for p in list(client.queue._queue)] == [3, 4, 5]
+
+    async def test_pending_overflow_reports_slow_consumer(self, monkeypatch):
+        monkeypatch.setattr(settings, "ws_max_dropped_messages", 2)
+        client = websocket.ClientConnection(AsyncMock(), queue_size=2)
+        client.begin_replay()
+        assert client.enqueue('{"seq":1}', "1-0")
+        assert client.enqueue('{"seq":2}', "2-0")
+        assert client.enqueue('{"seq":3}', "3-0")
+        assert not client.enqueue('{"seq":4}', "4-0")
+
+    async def test_replay_overflow_disconnects(self, monkeypatch):
+        """재생분이 큐를 넘쳐 드롭 한도에 도달하면 느린 소비자로 연결 종료."""
+        monkeypatch.setattr(settings, "ws_send_queue_size", 1)
+        monkeypatch.setattr(settings, "ws_max_dropped_messages", 2)
+        monkeypatch.setattr(
+            websocket, "read_breaking_stream",
+            AsyncMock(return_value=([{"seq": i, "event_id": f"{i}-0"} for i in range(1, 5)], False)),
+        )
+        monkeypatch.setattr(websocket, "get_async_redis", lambda: None)
+        ws = AsyncMock()
+
+        async def send_text(payload):
+            await asyncio.Event().wait()
+
+        ws.send_text.side_effect = send_text
+        websocket._active_connections.clear()
+        assert await websocket._add_connection(ws)
+        client = websocket._active_connections[ws]
+        try:
+            await websocket._resume(ws, client, "0-0")
+
+            assert ws not in websocket._active_connections
+            await asyncio.wait_for(asyncio.gather(*websocket._disconnect_tasks), timeout=1)
+            ws.close.assert_awaited_once_with(code=websocket.SLOW_CONSUMER_CLOSE_CODE)
+        finally:
+            await websocket._remove_connection(ws)
+
+
+class TestResume:
+    @pytest.fixture
+    def client(self, redis_async, monkeypatch):
+        monkeypatch.setattr(websocket, "_start_redis_subscriber", AsyncMock())
+        monkeypatch.setattr(websocket, "_stop_redis_subscriber", AsyncMock())
+        monkeypatch.setattr(websocket, "get_async_redis", lambda: redis_async)
+        app = FastAPI()
+        app.include_router(websocket.router)
+        return TestClient(app)
+
+    def test_reconnect_with_last_event_id(self, client, redis_sync):
+        ids = [_publish(redis_sync, stock_code=code) for code in ("005930", "000660")]
+
+        with client.websocket_connect(f"/ws/news?last_event_id={ids[0]}") as ws:
+            assert ws.receive_json()["type"] == "connected"
+            replayed = ws.receive_json()
+            assert replayed["stock_code"] == "000660"
+            assert replayed["event_id"] == ids[1]
+            marker = ws.receive_json()
+            assert marker == {
+                "type": "replayed", "count": 1, "last_event_id": ids[1], "truncated": False,
+            }
+
+    def test_resume_message_applies_filter(self, client, redis_sync):
+        first = _publish(redis_sync)
+        _publish(redis_sync, stock_code="NVDA", market="US")
+        _publish(redis_sync, stock_code="000660")
+
+        with client.websocket_connect("/ws/news") as ws:
+            ws.receive_json()
+            ws.send_json({"type": "subscribe", "markets": ["US"]})
+            ws.receive_json()
+            ws.send_json({"type": "resume", "last_event_id": first})
+
+            assert ws.receive_json()["stock_code"] == "NVDA"
+            marker = ws.receive_json()
+            assert marker["type"] == "replayed"
+            assert marker["count"] == 1
+
+    def test_invalid_last_event_id(self, client):
+        with client.websocket_connect("/ws/news?last_event_id=abc") as ws:
+            ws.receive_json()
+            assert ws.receive_json() == {"type": "error", "message": "invalid last_event_id"}
@@ -0,0 +1,127 @@
+"""WebSocket 구독 필터 (SubscriptionIndex + subscribe 메시지) 테스트."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import websocket
+from app.core.subscriptions import SubscriptionIndex
+from app.schemas.pubsub import SubscriptionFilter
+
+
+def _msg(**kwargs) -> dict:
+    message = {
+        "type": "breaking_news", "stock_code": "005930", "title": "속보",
+        "theme": "반도체, AI", "news_score": 85.0, "market": "KR",
+    }
+    message.update(kwargs)
+    return message
+
+
+class TestSubscriptionFilter:
+    def test_normalizes(self):
+        flt = SubscriptionFilter(stock_codes=[" nvda ", "NVDA", ""], themes=["AI ", "AI"])
+        assert flt.stock_codes == ["NVDA"]
+        assert flt.themes == ["AI"]
+
+    def test_rejects_invalid(self):
+        with pytest.raises(ValueError):
+            SubscriptionFilter(markets=["JP"])
+        with pytest.raises(ValueError):
+            SubscriptionFilter(min_score=150)
+
+
+class TestSubscriptionIndex:
+    def test_unfiltered_receives_all(self):
+        index = SubscriptionIndex()
+        index.assign("a")
+        assert index.match(_msg()) == {"a"}
+        assert index.match({"type": "other"}) == {"a"}
+
+    def test_stock_or_theme(self):
+        index = SubscriptionIndex()
+        index.assign("stock", SubscriptionFilter(stock_codes=["005930"]))
+        index.assign("theme", SubscriptionFilter(themes=["AI"]))
+        index.assign("other", SubscriptionFilter(stock_codes=["000660"], themes=["바이오"]))
+
+        assert index.match(_msg()) == {"stock", "theme"}
+        assert index.match(_msg(stock_code="000660", theme=None)) == {"other"}
+
+    def test_market_and_min_score(self):
+        index = SubscriptionIndex()
+        index.assign("us", SubscriptionFilter(markets=["US"]))
+        index.assign("high", SubscriptionFilter(min_score=90))
+        index.assign("kr_ai", SubscriptionFilter(markets=["KR"], themes=["AI"], min_score=80))
+
+        assert index.match(_msg()) == {"kr_ai"}
+        assert index.match(_msg(news_score=95.0)) == {"high", "kr_ai"}
+        assert index.match(_msg(market="US", stock_code="NVDA")) == {"us"}
+
+    def test_replace_and_remove(self):
+        index = SubscriptionIndex()
+        index.assign("a", SubscriptionFilter(stock_codes=["005930"]))
+        index.assign("a", SubscriptionFilter(stock_codes=["000660"]))
+        assert index.match(_msg()) == set()
+
+        index.remove("a")
+        assert "a" not in index
+        assert index._by_stock == {}
+        assert index.match(_msg(stock_code="000660")) == set()
+
+
+class TestBroadcastRouting:
+    @pytest.fixture(autouse=True)
+    async def clear_connections(self):
+        websocket._active_connections.clear()
+        websocket._subscriptions.clear()
+        yield
+        for ws in list(websocket._active_connections):
+            await websocket._remove_connection(ws)
+
+    async def test_only_matching_clients_receive(self):
+        kr, nvda = AsyncMock(), AsyncMock()
+        await websocket._add_connection(kr)
+        await websocket._add_connection(nvda)
+        websocket._subscriptions.assign(kr, SubscriptionFilter(markets=["KR"]))
+        websocket._subscriptions.assign(nvda, SubscriptionFilter(stock_codes=["NVDA"]))
+
+        await websocket.broadcast(_msg())
+        for client in list(websocket._active_connections.values()):
+            await asyncio.wait_for(client.queue.join(), timeout=1)
+
+        kr.send_text.assert_called_once()
+        nvda.send_text.assert_not_called()
+
+
+class TestSubscribeMessage:
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.setattr(websocket, "_start_redis_subscriber", AsyncMock())
+        monkeypatch.setattr(websocket, "_stop_redis_subscriber", AsyncMock())
+        app = FastAPI()
+        app.include_router(websocket.router)
+        return TestClient(app)
+
+    def test_subscribe_and_unsubscribe(self, client):
+        with client.websocket_connect("/ws/news") as ws:
+            assert ws.receive_json()["type"] == "connected"
+
+            ws.send_json({"type": "subscribe", "markets": ["US"], "stock_codes": ["nvda"]})
+            resp = ws.receive_json()
+            assert resp["type"] == "subscribed"
+            assert resp["filters"]["stock_codes"] == ["NVDA"]
+            assert resp["filters"]["markets"] == ["US"]
+
+            ws.send_json({"type": "unsubscribe"})
+            assert ws.receive_json()["type"] == "unsubscribed"
+
+    def test_invalid_filter(self, client):
+        with client.websocket_connect("/ws/news") as ws:
+            ws.receive_json()
+            ws.send_json({"type": "subscribe", "min_score": "high"})
+            resp = ws.receive_json()
+            assert resp["type"] == "error"
+            assert resp["detail"][0]["loc"] == ["min_score"]
@@ -18,10 +18,16 @@ export function useWebSocket(
   const wsRef = useRef<WebSocket | null>(null);
   const manualClose = useRef(false);
   const connectRef = useRef<() => void>(() => {});
+  const lastEventId = useRef<string | null>(null);
 
   const connect = useCallback(() => {
     manualClose.current = false;
-    const ws = new WebSocket(url);
+    // 재접속 시 마지막 속보 이후 누락분을 서버에서 재생
+    const ws = new WebSocket(
+      lastEventId.current
+        ? `${url}${url.includes('?') ? '&' : '?'}last_event_id=${encodeURIComponent(lastEventId.current)}`
+        : url
+    );
     wsRef.current = ws;
 
     ws.onopen = () => {
@@ -31,6 +37,9 @@ export function useWebSocket(
     ws.onmessage = (event: MessageEvent) => {
       try {
         const msg: WebSocketMessage = JSON.parse(event.data);
+        if (msg.event_id) {
+          lastEventId.current = msg.event_id;
+        }
         if (msg.type === 'ping') {
           ws.send(JSON.stringify({ type: 'pong' }));
           return;
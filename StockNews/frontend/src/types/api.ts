@@ -6,6 +6,7 @@ export interface PaginatedResponse<T> {
   total: number;
   offset: number;
   limit: number;
+  next_cursor?: string | null;
 }
 
 /** 뉴스 리스트 페이지네이션 응답 */
@@ -16,6 +17,8 @@ export interface WebSocketMessage {
   type: string;
   data?: Record<string, unknown>;
   message?: string;
+  /** 속보 스트림 ID — 재접속 시 last_event_id 로 보내 누락분 재생 */
+  event_id?: string;
 }
 
 /** 속보 데이터 */